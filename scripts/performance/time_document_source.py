@@ -0,0 +1,128 @@
+import contextlib
+import io
+import multiprocessing as mp
+import os
+import resource
+import sys
+import tempfile
+import time
+
+from unstructured.partition.auto import partition
+
+INPUT_KINDS = ["filename", "rb", "bytes_io", "spooled", "spooled_on_disk"]
+
+
+def write_padded_pdf(filename, num_pages, padding_mb):
+    """Writes a PDF with a line of text on each page and an unused stream of padding_mb
+    megabytes, which stands in for the images and attachments that make up most of the bytes
+    of large PDFs."""
+    content_streams = [
+        f"BT /F1 12 Tf 72 720 Td (Page {i + 1} of the padded document.) Tj ET".encode()
+        for i in range(num_pages)
+    ]
+    padding = b"0" * int(padding_mb * 1024**2)
+    kids = " ".join(f"{4 + 2 * i} 0 R" for i in range(num_pages))
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {num_pages} >>".encode(),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, content in enumerate(content_streams):
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (5 + 2 * i),
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+    objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(padding), padding))
+
+    with open(filename, "wb") as f:
+        f.write(b"%PDF-1.4\n")
+        offsets = []
+        for i, obj in enumerate(objects, start=1):
+            offsets.append(f.tell())
+            f.write(b"%d 0 obj\n%s\nendobj\n" % (i, obj))
+        xref_offset = f.tell()
+        f.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+        for offset in offsets:
+            f.write(b"%010d 00000 n \n" % offset)
+        f.write(
+            b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+            % (len(objects) + 1, xref_offset),
+        )
+
+
+@contextlib.contextmanager
+def open_document(filename, input_kind):
+    if input_kind == "rb":
+        with open(filename, "rb") as f:
+            yield f
+        return
+
+    with open(filename, "rb") as f:
+        data = f.read()
+    if input_kind == "bytes_io":
+        yield io.BytesIO(data)
+        return
+
+    max_size = 1 if input_kind == "spooled_on_disk" else len(data) + 1
+    with tempfile.SpooledTemporaryFile(max_size=max_size) as spooled_file:
+        spooled_file.write(data)
+        spooled_file.seek(0)
+        yield spooled_file
+
+
+def _measure_in_process(filename, input_kind, strategy, queue):
+    with contextlib.ExitStack() as stack:
+        file = (
+            None
+            if input_kind == "filename"
+            else stack.enter_context(open_document(filename, input_kind))
+        )
+        start_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        start_time = time.time()
+        if file is None:
+            elements = partition(filename=filename, strategy=strategy)
+        else:
+            elements = partition(
+                file=file,
+                file_filename=os.path.basename(filename),
+                strategy=strategy,
+            )
+        end_time = time.time()
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((end_time - start_time, (peak_rss - start_rss) * 1024, len(elements)))
+
+
+def measure_execution_time(filename, input_kind, strategy="fast"):
+    # NOTE(agent) - Each measurement runs in a new process so the growth in the peak resident
+    # set size only reflects the document that is being partitioned
+    queue: mp.Queue = mp.Queue()
+    process = mp.Process(
+        target=_measure_in_process,
+        args=(filename, input_kind, strategy, queue),
+    )
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filenames = sys.argv[1:]
+        if not filenames:
+            filenames = [os.path.join(tmpdir, "padded.pdf")]
+            write_padded_pdf(filenames[0], num_pages=10, padding_mb=100)
+
+        for filename in filenames:
+            size_mb = os.path.getsize(filename) / 1024**2
+            for input_kind in INPUT_KINDS:
+                execution_time, peak_memory, num_elements = measure_execution_time(
+                    filename,
+                    input_kind,
+                )
+                print(
+                    f"{os.path.basename(filename)} ({size_mb:.1f}MB) from {input_kind}: "
+                    f"{num_elements} elements in {execution_time:.2f}s with "
+                    f"{peak_memory / 1024**2:.1f}MB peak memory growth",
+                )
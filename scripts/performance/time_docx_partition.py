@@ -0,0 +1,57 @@
+import sys
+import time
+
+import docx
+
+from unstructured.partition.docx import (
+    NUMBERED_PARAGRAPH_XPATH,
+    PAGE_BREAK_XPATH,
+    partition_docx,
+)
+
+
+def serialized_checks(element):
+    xml = getattr(element, "xml", "")
+    return "<w:numPr>" in xml, ("w:br" in xml and 'type="page"' in xml) or (
+        "lastRenderedPageBreak" in xml
+    )
+
+
+def xpath_checks(element):
+    return NUMBERED_PARAGRAPH_XPATH(element), PAGE_BREAK_XPATH(element)
+
+
+def measure_check_time(filename, check):
+    document = docx.Document(filename)
+    start_time = time.time()
+    for element in document.element.body:
+        check(element)
+    return time.time() - start_time
+
+
+def measure_execution_time(filename, iterations):
+    total_time = 0.0
+
+    for _ in range(iterations):
+        start_time = time.time()
+        elements = partition_docx(filename=filename)
+        end_time = time.time()
+        total_time += end_time - start_time
+
+    return total_time / iterations, len(elements)
+
+
+if __name__ == "__main__":
+    filename = sys.argv[1] if len(sys.argv) > 1 else "example-docs/handbook-872p.docx"
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    serialized_time = measure_check_time(filename, serialized_checks)
+    xpath_time = measure_check_time(filename, xpath_checks)
+    print(
+        f"List and page break checks: {serialized_time:.3f}s with serialized XML, "
+        f"{xpath_time:.3f}s with XPath",
+    )
+
+    partition_docx(filename=filename)
+    average_time, num_elements = measure_execution_time(filename, iterations)
+    print(f"Partitioned {num_elements} elements from {filename} in {average_time:.3f}s on average")
@@ -0,0 +1,42 @@
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+from unstructured.partition.auto import partition
+
+
+def measure_execution_time(filename):
+    tracemalloc.start()
+    start_time = time.time()
+    elements = partition(filename=filename)
+    end_time = time.time()
+    num_elements = len(elements)
+
+    # NOTE(agent) - The memory held by the elements is the memory that is released when they
+    # are deleted, which leaves out caches that were filled while partitioning
+    gc.collect()
+    memory_with_elements, _ = tracemalloc.get_traced_memory()
+    del elements
+    gc.collect()
+    memory_without_elements, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    element_memory = memory_with_elements - memory_without_elements
+    return end_time - start_time, element_memory, num_elements
+
+
+if __name__ == "__main__":
+    filenames = sys.argv[1:] or [
+        os.path.join("example-docs", "book-war-and-peace-1225p.txt"),
+        os.path.join("example-docs", "example-10k.html"),
+        os.path.join("example-docs", "handbook-872p.docx"),
+    ]
+
+    for filename in filenames:
+        execution_time, element_memory, num_elements = measure_execution_time(filename)
+        print(
+            f"{os.path.basename(filename)}: {num_elements} elements in {execution_time:.2f}s "
+            f"holding {element_memory / num_elements:.0f} bytes per element",
+        )
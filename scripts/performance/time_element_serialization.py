@@ -0,0 +1,92 @@
+import json
+import os
+import sys
+import tempfile
+import time
+
+from unstructured.partition.auto import partition
+from unstructured.staging import base
+
+
+def _write_json_stdlib(elements, filename):
+    # NOTE(agent) - The indented json module output that elements_to_json wrote before
+    # json_dumps was added
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write(json.dumps(base.convert_to_dict(elements), indent=4))
+
+
+def _read_json_stdlib(filename):
+    with open(filename, encoding="utf-8") as f:
+        return base.dict_to_elements(json.load(f))
+
+
+FORMATS = {
+    "json (json module, indent=4)": (_write_json_stdlib, _read_json_stdlib),
+    "json (indent=4)": (
+        lambda elements, filename: base.elements_to_json(elements, filename=filename),
+        lambda filename: base.elements_from_json(filename=filename),
+    ),
+    "json (compact)": (
+        lambda elements, filename: base.elements_to_json(elements, filename=filename, indent=None),
+        lambda filename: base.elements_from_json(filename=filename),
+    ),
+    "json (compact, ensure_ascii=False)": (
+        lambda elements, filename: base.elements_to_json(
+            elements,
+            filename=filename,
+            indent=None,
+            ensure_ascii=False,
+        ),
+        lambda filename: base.elements_from_json(filename=filename),
+    ),
+    "jsonl": (
+        lambda elements, filename: base.elements_to_jsonl(elements, filename=filename),
+        lambda filename: base.elements_from_jsonl(filename=filename),
+    ),
+}
+
+
+def measure_execution_time(elements, write, read, number_of_runs):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "elements")
+
+        start_time = time.time()
+        for _ in range(number_of_runs):
+            write(elements, filename)
+        write_time = (time.time() - start_time) / number_of_runs
+        size = os.path.getsize(filename)
+
+        start_time = time.time()
+        for _ in range(number_of_runs):
+            new_elements = read(filename)
+        read_time = (time.time() - start_time) / number_of_runs
+
+    if base.convert_to_dict(new_elements) != base.convert_to_dict(elements):
+        raise ValueError("The elements changed in the round trip.")
+
+    return write_time, read_time, size
+
+
+if __name__ == "__main__":
+    number_of_runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    filenames = sys.argv[2:] or [
+        os.path.join("example-docs", "book-war-and-peace-1225p.txt"),
+        os.path.join("example-docs", "example-10k.html"),
+    ]
+
+    print(f"orjson installed: {base.dependency_exists('orjson')}")
+    for filename in filenames:
+        elements = partition(filename=filename)
+        print(f"{os.path.basename(filename)}: {len(elements)} elements")
+        for name, (write, read) in FORMATS.items():
+            write_time, read_time, size = measure_execution_time(
+                elements,
+                write,
+                read,
+                number_of_runs,
+            )
+            print(
+                f"  {name}: {size / 2**20:.1f}MB, "
+                f"write {size / 2**20 / write_time:.1f}MB/s ({write_time:.3f}s), "
+                f"read {size / 2**20 / read_time:.1f}MB/s ({read_time:.3f}s)",
+            )
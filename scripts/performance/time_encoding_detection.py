@@ -0,0 +1,52 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from unstructured.file_utils.encoding import detect_file_encoding
+
+LINE = "The quick brown fox jumps over the lazy dog. Caf\xe9 cr\xe8me br\xfbl\xe9e.\n"
+
+
+def write_text_file(directory, size_mb, encoding):
+    filename = os.path.join(directory, f"text-{size_mb}mb-{encoding}.txt")
+    num_lines = size_mb * 1024 * 1024 // len(LINE.encode(encoding))
+    with open(filename, "w", encoding=encoding) as f:
+        f.write(LINE * num_lines)
+    return filename
+
+
+def measure_execution_time(filename, iterations):
+    total_time = 0.0
+
+    for _ in range(iterations):
+        start_time = time.time()
+        detected_encoding, _ = detect_file_encoding(filename=filename)
+        end_time = time.time()
+        total_time += end_time - start_time
+
+    return total_time / iterations, detected_encoding
+
+
+def measure_peak_memory(filename):
+    tracemalloc.start()
+    detect_file_encoding(filename=filename)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+if __name__ == "__main__":
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for encoding in ["utf-8", "latin-1", "utf-16"]:
+            filename = write_text_file(tmpdir, size_mb, encoding)
+            average_time, detected_encoding = measure_execution_time(filename, iterations)
+            peak = measure_peak_memory(filename)
+            print(
+                f"{size_mb} MB {encoding} file: detected {detected_encoding} in "
+                f"{average_time:.3f}s, peak memory {peak / 1024 / 1024:.1f} MB",
+            )
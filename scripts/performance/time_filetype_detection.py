@@ -0,0 +1,54 @@
+import logging
+import os
+import sys
+import time
+
+from unstructured.file_utils.filetype import detect_filetype
+
+# NOTE(agent) - Files larger than this are left out, since the point is to measure the
+# overhead of detection on many small files
+MAX_FILE_SIZE = 1024 * 1024
+
+
+def get_filenames(directory):
+    filenames = []
+    for root, _, files in os.walk(directory):
+        for filename in sorted(files):
+            path = os.path.join(root, filename)
+            if os.path.isfile(path) and os.path.getsize(path) <= MAX_FILE_SIZE:
+                filenames.append(path)
+    return filenames
+
+
+def measure_execution_time(filenames, iterations, from_file):
+    total_time = 0.0
+
+    for _ in range(iterations):
+        start_time = time.time()
+        for filename in filenames:
+            if from_file:
+                with open(filename, "rb") as f:
+                    detect_filetype(file=f)
+            else:
+                detect_filetype(filename=filename)
+        end_time = time.time()
+        total_time += end_time - start_time
+
+    return total_time / iterations
+
+
+if __name__ == "__main__":
+    directory = sys.argv[1] if len(sys.argv) > 1 else "example-docs"
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    # NOTE(agent) - Silences the warnings for unsupported file types
+    logging.getLogger("unstructured").setLevel(logging.ERROR)
+
+    filenames = get_filenames(directory)
+    print(f"Detecting the filetypes of {len(filenames)} files in {directory}")
+    for from_file in (False, True):
+        average_time = measure_execution_time(filenames, iterations, from_file)
+        print(
+            f"{'file' if from_file else 'filename'}: {average_time:.3f}s per pass "
+            f"({len(filenames) / average_time:.0f} files/s)",
+        )
@@ -0,0 +1,28 @@
+import sys
+import time
+
+from unstructured.documents.html import HTMLDocument
+
+
+def measure_execution_time(text, iterations):
+    total_time = 0.0
+
+    for _ in range(iterations):
+        document = HTMLDocument.from_string(text)
+        start_time = time.time()
+        document.pages
+        end_time = time.time()
+        total_time += end_time - start_time
+
+    return total_time / iterations, len(document.elements)
+
+
+if __name__ == "__main__":
+    filename = sys.argv[1] if len(sys.argv) > 1 else "example-docs/example-10k.html"
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    with open(filename, encoding="utf-8") as f:
+        text = f.read()
+
+    average_time, num_elements = measure_execution_time(text, iterations)
+    print(f"Read {num_elements} elements from {filename} in {average_time:.3f}s on average")
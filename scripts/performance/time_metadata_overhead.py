@@ -0,0 +1,46 @@
+import inspect
+import sys
+import time
+
+from unstructured.partition.html import partition_html
+from unstructured.partition.text import partition_text
+
+TEXT = "Hi Matt, the meeting is moved to 3pm. Thanks!"
+HTML = f"<html><body><p>{TEXT}</p></body></html>"
+REGEX_METADATA = {"time": r"\d{1,2}(am|pm)"}
+
+PARTITIONS = {
+    "partition_text": (partition_text, {"text": TEXT}),
+    "partition_text (regex_metadata)": (
+        partition_text,
+        {"text": TEXT, "regex_metadata": REGEX_METADATA},
+    ),
+    "partition_html": (partition_html, {"text": HTML}),
+}
+
+
+def measure_execution_time(partition, kwargs, number_of_calls):
+    start_time = time.perf_counter()
+    for _ in range(number_of_calls):
+        partition(**kwargs)
+    return (time.perf_counter() - start_time) / number_of_calls
+
+
+if __name__ == "__main__":
+    number_of_calls = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    for name, (partition, kwargs) in PARTITIONS.items():
+        # NOTE(agent) - The undecorated function doesn't add any metadata, so the difference
+        # is the per-call overhead of the metadata decorators
+        undecorated_partition = inspect.unwrap(partition)
+        measure_execution_time(partition, kwargs, 10)
+        call_time = measure_execution_time(partition, kwargs, number_of_calls)
+        undecorated_call_time = measure_execution_time(
+            undecorated_partition,
+            kwargs,
+            number_of_calls,
+        )
+        print(
+            f"{name}: {call_time * 1e6:.1f}us per call, "
+            f"{(call_time - undecorated_call_time) * 1e6:.1f}us of metadata overhead",
+        )
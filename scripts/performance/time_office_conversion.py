@@ -0,0 +1,94 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from unstructured.partition.common import (
+    convert_office_doc,
+    convert_office_docs,
+    office_listeners,
+)
+
+SAMPLES = [
+    ("docx", "MS Word 2007 XML", os.path.join("example-docs", "fake.doc")),
+    (
+        "pptx",
+        "Impress MS PowerPoint 2007 XML",
+        os.path.join("example-docs", "fake-power-point.ppt"),
+    ),
+]
+MODES = ["soffice", "batch", "listeners"]
+
+
+def copy_documents(filename, num_documents, directory):
+    """Copies the document under a different name for each conversion, since documents that
+    would be converted to the same output filename can't be converted in the same batch."""
+    base_filename, extension = os.path.splitext(os.path.basename(filename))
+    filenames = []
+    for i in range(num_documents):
+        copy_filename = os.path.join(directory, f"{base_filename}-{i}{extension}")
+        shutil.copyfile(filename, copy_filename)
+        filenames.append(copy_filename)
+    return filenames
+
+
+def measure_execution_time(
+    filenames,
+    output_directory,
+    target_format,
+    target_filter,
+    mode,
+    workers,
+):
+    start_time = time.time()
+    if mode == "soffice":
+        for filename in filenames:
+            convert_office_doc(filename, output_directory, target_format, target_filter)
+    elif mode == "batch":
+        convert_office_docs(
+            filenames,
+            output_directory,
+            target_format,
+            target_filter,
+            workers=workers,
+        )
+    else:
+        # NOTE(agent) - The listeners are started before the clock starts, as they would be
+        # for a long-running job
+        with office_listeners(workers=workers):
+            start_time = time.time()
+            convert_office_docs(
+                filenames,
+                output_directory,
+                target_format,
+                target_filter,
+                workers=workers,
+            )
+    return time.time() - start_time
+
+
+if __name__ == "__main__":
+    num_documents = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    modes = sys.argv[3:] or MODES
+
+    for target_format, target_filter, filename in SAMPLES:
+        for mode in modes:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                filenames = copy_documents(filename, num_documents, tmpdir)
+                output_directory = os.path.join(tmpdir, "output")
+                os.mkdir(output_directory)
+                execution_time = measure_execution_time(
+                    filenames,
+                    output_directory,
+                    target_format,
+                    target_filter,
+                    mode,
+                    workers,
+                )
+                num_converted = len(os.listdir(output_directory))
+            print(
+                f"{os.path.basename(filename)} with {mode}: {num_converted}/{num_documents} "
+                f"converted, {num_documents / execution_time:.2f} documents/s",
+            )
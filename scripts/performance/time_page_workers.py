@@ -0,0 +1,43 @@
+import sys
+import time
+
+from unstructured.partition.pdf import partition_pdf
+
+
+def measure_execution_time(filename, iterations, strategy, page_workers):
+    total_time = 0.0
+
+    for _ in range(iterations):
+        start_time = time.time()
+        elements = partition_pdf(filename, strategy=strategy, page_workers=page_workers)
+        end_time = time.time()
+        total_time += end_time - start_time
+
+    return total_time / iterations, elements
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 4:
+        print(
+            "Usage: python -m scripts.performance.time_page_workers <filename> <strategy> "
+            "<page_workers> [<page_workers> ...]",
+        )
+        sys.exit(1)
+
+    filename = sys.argv[1]
+    strategy = sys.argv[2]
+    page_workers_options = [int(page_workers) for page_workers in sys.argv[3:]]
+
+    serial_time, serial_elements = measure_execution_time(filename, 1, strategy, 1)
+    print(f"page_workers=1 average time: {serial_time:.2f}s")
+
+    serial_output = [element.to_dict() for element in serial_elements]
+    for page_workers in page_workers_options:
+        if page_workers == 1:
+            continue
+        average_time, elements = measure_execution_time(filename, 1, strategy, page_workers)
+        identical = [element.to_dict() for element in elements] == serial_output
+        print(
+            f"page_workers={page_workers} average time: {average_time:.2f}s "
+            f"(speedup {serial_time / average_time:.2f}x, identical output: {identical})",
+        )
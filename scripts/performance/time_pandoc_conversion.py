@@ -0,0 +1,69 @@
+import os
+import sys
+import time
+
+from unstructured.file_utils.file_conversion import (
+    convert_file_to_html_text,
+    iter_html_texts_from_files,
+    pandoc_server,
+)
+from unstructured.partition.html import (
+    convert_and_partition_html,
+    iter_convert_and_partition_html,
+)
+
+SAMPLES = [
+    ("epub", os.path.join("example-docs", "winter-sports.epub")),
+    ("rtf", os.path.join("example-docs", "fake-doc.rtf")),
+    ("odt", os.path.join("example-docs", "fake.odt")),
+]
+
+MODES = ["convert", "server", "partition", "batch-partition"]
+
+
+def convert_documents(source_format, filenames, workers):
+    if workers == 1:
+        for filename in filenames:
+            convert_file_to_html_text(source_format, filename=filename)
+    else:
+        for _ in iter_html_texts_from_files(source_format, filenames, workers=workers):
+            pass
+
+
+def measure_execution_time(mode, source_format, filename, num_documents, workers):
+    filenames = [filename] * num_documents
+    start_time = time.time()
+    if mode == "convert":
+        convert_documents(source_format, filenames, workers)
+    elif mode == "server":
+        with pandoc_server():
+            convert_documents(source_format, filenames, workers)
+    elif mode == "partition":
+        for filename in filenames:
+            convert_and_partition_html(source_format, filename=filename)
+    else:
+        for _ in iter_convert_and_partition_html(source_format, filenames, workers=workers):
+            pass
+    return time.time() - start_time
+
+
+if __name__ == "__main__":
+    num_documents = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    modes = sys.argv[3:] or MODES
+
+    for source_format, filename in SAMPLES:
+        for mode in modes:
+            # NOTE(agent) - The unbatched modes always convert one document at a time
+            mode_workers = 1 if mode in ("convert", "partition") else workers
+            execution_time = measure_execution_time(
+                mode,
+                source_format,
+                filename,
+                num_documents,
+                mode_workers,
+            )
+            print(
+                f"{os.path.basename(filename)} {mode} with {mode_workers} workers: "
+                f"{num_documents / execution_time:.1f} documents/s",
+            )
@@ -0,0 +1,47 @@
+import sys
+import time
+
+from unstructured.partition.text import split_by_paragraph
+
+# NOTE(agent) - A page of short paragraphs, so that most of the paragraphs are combined with
+# the paragraphs after them when min_partition is set
+PAGE = "\n\n".join(
+    [
+        "CHAPTER I.",
+        "Well, Prince, so Genoa and Lucca are now just family estates. "
+        "But I warn you, if you don't tell me that this means war, I will have nothing more to "
+        "do with you. You are no longer my friend. " * 3,
+        "Good evening.",
+        "It was in July, 1805.",
+    ]
+    * 6,
+)
+
+
+def measure_execution_time(text, iterations, min_partition, max_partition):
+    total_time = 0.0
+
+    for _ in range(iterations):
+        start_time = time.time()
+        split_by_paragraph(text, min_partition=min_partition, max_partition=max_partition)
+        end_time = time.time()
+        total_time += end_time - start_time
+
+    return total_time / iterations
+
+
+if __name__ == "__main__":
+    max_pages = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    min_partition = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+    max_partition = int(sys.argv[4]) if len(sys.argv) > 4 else 1500
+
+    num_pages = 1
+    while num_pages <= max_pages:
+        text = "\n\n".join([PAGE] * num_pages)
+        average_time = measure_execution_time(text, iterations, min_partition, max_partition)
+        print(
+            f"{num_pages} pages: {average_time:.3f}s "
+            f"({average_time / num_pages * 1000:.2f}ms per page)",
+        )
+        num_pages *= 10
@@ -0,0 +1,88 @@
+import os
+import sys
+import time
+
+from unstructured.documents.elements import NarrativeText, Title
+from unstructured.nlp import tokenize
+from unstructured.partition.auto import partition
+from unstructured.partition.text_type import (
+    TextTypeConfig,
+    contains_verbs,
+    get_text_types,
+)
+
+MAX_DISAGREEMENTS_SHOWN = 20
+
+
+def get_texts(directory):
+    """Partitions each document in the directory, skipping documents that fail to partition
+    (e.g. because of a missing dependency), and returns the texts of the elements."""
+    texts = []
+    for root, _, filenames in os.walk(directory):
+        for filename in sorted(filenames):
+            try:
+                elements = partition(filename=os.path.join(root, filename), strategy="fast")
+            except Exception as e:
+                print(f"Skipping {filename}: {e.__class__.__name__}")
+                continue
+            texts.extend(element.text for element in elements if element.text.strip())
+    return texts
+
+
+def measure_execution_time(texts, iterations, verb_detector):
+    total_time = 0.0
+
+    for _ in range(iterations):
+        tokenize.clear_caches()
+        start_time = time.time()
+        has_verbs = contains_verbs(texts, verb_detector=verb_detector)
+        end_time = time.time()
+        total_time += end_time - start_time
+
+    return total_time / iterations, has_verbs
+
+
+if __name__ == "__main__":
+    directory = sys.argv[1] if len(sys.argv) > 1 else "example-docs"
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    texts = get_texts(directory)
+    print(f"Collected {len(texts)} texts from {directory}")
+
+    nltk_time, nltk_verbs = measure_execution_time(texts, iterations, "nltk")
+    heuristic_time, heuristic_verbs = measure_execution_time(texts, iterations, "heuristic")
+    print(f"nltk: {nltk_time:.3f}s ({len(texts) / nltk_time:.0f} texts/s)")
+    print(
+        f"heuristic: {heuristic_time:.3f}s ({len(texts) / heuristic_time:.0f} texts/s, "
+        f"speedup {nltk_time / heuristic_time:.1f}x)",
+    )
+
+    disagreements = [
+        (text, nltk_verb)
+        for text, nltk_verb, heuristic_verb in zip(texts, nltk_verbs, heuristic_verbs)
+        if nltk_verb != heuristic_verb
+    ]
+    missed = sum(nltk_verb for _, nltk_verb in disagreements)
+    print(
+        f"Verb detection agreement: {1 - len(disagreements) / len(texts):.2%} "
+        f"({missed} verbs missed, {len(disagreements) - missed} extra verbs)",
+    )
+
+    nltk_types = get_text_types(texts, config=TextTypeConfig(verb_detector="nltk"))
+    heuristic_types = get_text_types(texts, config=TextTypeConfig(verb_detector="heuristic"))
+    type_agreement = sum(a == b for a, b in zip(nltk_types, heuristic_types)) / len(texts)
+    print(f"Text type agreement: {type_agreement:.2%}")
+    for text_type in (NarrativeText, Title):
+        nltk_count = sum(nltk_type is text_type for nltk_type in nltk_types)
+        heuristic_count = sum(heuristic_type is text_type for heuristic_type in heuristic_types)
+        agreement = sum(
+            (nltk_type is text_type) == (heuristic_type is text_type)
+            for nltk_type, heuristic_type in zip(nltk_types, heuristic_types)
+        ) / len(texts)
+        print(
+            f"{text_type.__name__} agreement: {agreement:.2%} "
+            f"(nltk {nltk_count}, heuristic {heuristic_count})",
+        )
+
+    for text, nltk_verb in disagreements[:MAX_DISAGREEMENTS_SHOWN]:
+        print(f"  nltk={nltk_verb} heuristic={not nltk_verb}: {text[:100]!r}")
@@ -0,0 +1,51 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from unstructured.partition.xml import iter_partition_xml
+
+
+def write_xml(filename, num_records):
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n<records>\n')
+        for i in range(num_records):
+            f.write(
+                f"  <record><name>Record {i}</name>"
+                f"<description>The fox number {i} met a bear at the end of the lane."
+                "</description></record>\n",
+            )
+        f.write("</records>\n")
+
+
+def measure_execution_time(filename, xml_keep_tags):
+    tracemalloc.start()
+    start_time = time.time()
+    num_elements = 0
+    for _ in iter_partition_xml(filename=filename, xml_keep_tags=xml_keep_tags):
+        num_elements += 1
+    end_time = time.time()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return end_time - start_time, peak_memory, num_elements
+
+
+if __name__ == "__main__":
+    record_counts = [int(arg) for arg in sys.argv[1:]] or [10000, 50000]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for num_records in record_counts:
+            filename = os.path.join(tmpdir, f"records-{num_records}.xml")
+            write_xml(filename, num_records)
+            size_mb = os.path.getsize(filename) / 1024**2
+            for xml_keep_tags in (False, True):
+                execution_time, peak_memory, num_elements = measure_execution_time(
+                    filename,
+                    xml_keep_tags,
+                )
+                print(
+                    f"{size_mb:.1f}MB, xml_keep_tags={xml_keep_tags}: {num_elements} elements in "
+                    f"{execution_time:.2f}s with {peak_memory / 1024**2:.1f}MB peak memory",
+                )
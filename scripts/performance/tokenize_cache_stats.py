@@ -0,0 +1,42 @@
+import os
+import sys
+
+from unstructured.nlp import tokenize
+from unstructured.partition.auto import partition
+
+
+def partition_directory(directory):
+    """Partitions each document in the directory, skipping documents that fail to partition
+    (e.g. because of a missing dependency)."""
+    for root, _, filenames in os.walk(directory):
+        for filename in sorted(filenames):
+            try:
+                partition(filename=os.path.join(root, filename), strategy="fast")
+            except Exception as e:
+                print(f"Skipping {filename}: {e.__class__.__name__}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print(
+            "Usage: python -m scripts.performance.tokenize_cache_stats <directory> "
+            "<cache_size> [<cache_size> ...]",
+        )
+        sys.exit(1)
+
+    directory = sys.argv[1]
+    cache_sizes = [int(cache_size) for cache_size in sys.argv[2:]]
+
+    for cache_size in cache_sizes:
+        tokenize.set_cache_size(cache_size)
+        tokenize.clear_caches()
+        partition_directory(directory)
+
+        print(f"cache size {cache_size}:")
+        for name, info in tokenize.get_cache_info().items():
+            lookups = info.hits + info.misses
+            hit_rate = info.hits / lookups if lookups else 0.0
+            print(
+                f"  {name}: {hit_rate:.1%} hit rate ({info.hits} hits, {info.misses} misses, "
+                f"{info.evictions} evictions)",
+            )
@@ -122,6 +122,8 @@ setup(
         "rst": rst_reqs,
         "tsv": tsv_reqs,
         "xlsx": xlsx_reqs,
+        # Converts .doc and .ppt files with long-lived LibreOffice listeners
+        "unoserver": load_requirements("requirements/extra-unoserver.in"),
         # Extra requirements for data connectors
         "s3": load_requirements("requirements/ingest-s3.in"),
         "azure": load_requirements("requirements/ingest-azure.in"),
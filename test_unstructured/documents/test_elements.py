@@ -1,3 +1,6 @@
+import os
+import pickle
+from copy import deepcopy
 from functools import partial
 
 import pytest
@@ -9,7 +12,17 @@ from unstructured.documents.coordinates import (
     Orientation,
     RelativeCoordinateSystem,
 )
-from unstructured.documents.elements import CoordinatesMetadata, Element, NoID, Text
+from unstructured.documents.elements import (
+    CheckBox,
+    CoordinatesMetadata,
+    DataSourceMetadata,
+    Element,
+    ElementMetadata,
+    NoID,
+    Text,
+    Title,
+    _get_params_function,
+)
 
 
 def test_text_id():
@@ -166,3 +179,80 @@ def test_element_to_dict():
         "element_id": "awt32t1",
     }
     assert element.to_dict() == expected
+
+
+@pytest.mark.parametrize(
+    "element",
+    [
+        Text(text="Some lovely text"),
+        Title(text="A lovely title"),
+        CheckBox(checked=True),
+        Element(),
+    ],
+)
+def test_elements_and_metadata_are_slotted(element):
+    element.metadata.data_source = DataSourceMetadata(url="https://example.com")
+    element.metadata.coordinates = CoordinatesMetadata(
+        points=((1, 2), (1, 4), (3, 4), (3, 2)),
+        system=RelativeCoordinateSystem(),
+    )
+    for obj in (
+        element,
+        element.metadata,
+        element.metadata.data_source,
+        element.metadata.coordinates,
+    ):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_slotted_metadata_round_trips():
+    metadata = ElementMetadata(
+        filename="example-docs/fake-text.txt",
+        page_number=2,
+        data_source=DataSourceMetadata(url="https://example.com"),
+    )
+    assert metadata.to_dict() == {
+        "data_source": {"url": "https://example.com"},
+        "filename": "fake-text.txt",
+        "file_directory": "example-docs",
+        "page_number": 2,
+    }
+    assert pickle.loads(pickle.dumps(metadata)) == metadata
+    assert deepcopy(metadata) == metadata
+
+
+def test_element_metadata_shares_filename_strings():
+    filename = os.path.join("example-docs", "fake-text.txt")
+    first = ElementMetadata(filename=filename)
+    second = ElementMetadata(filename=filename)
+    assert first.filename is second.filename
+    assert first.file_directory is second.file_directory
+
+
+@pytest.mark.parametrize("copy", [True, False])
+def test_element_metadata_from_dict_keeps_file_directory(copy):
+    metadata = ElementMetadata(filename="example-docs/fake-text.txt", sent_to=["a@example.com"])
+    metadata_dict = metadata.to_dict()
+
+    new_metadata = ElementMetadata.from_dict(metadata_dict, copy=copy)
+    assert new_metadata == metadata
+    assert new_metadata.file_directory == "example-docs"
+    assert (new_metadata.sent_to is metadata_dict["sent_to"]) is not copy
+
+
+def test_get_params_function_includes_defaults():
+    def partition(filename, file=None, *, include_metadata=True, **kwargs):
+        pass
+
+    get_params = _get_params_function(partition)
+    assert get_params(("fake.txt",), {"languages": ["eng"]}) == {
+        "filename": "fake.txt",
+        "file": None,
+        "include_metadata": True,
+        "languages": ["eng"],
+    }
+    assert get_params((), {"filename": "fake.txt", "include_metadata": False}) == {
+        "filename": "fake.txt",
+        "file": None,
+        "include_metadata": False,
+    }
@@ -106,7 +106,11 @@ def test_has_no_table_ancestor():
 
 
 def test_read_without_skipping_table(monkeypatch):
-    monkeypatch.setattr(html, "is_possible_narrative_text", lambda *args: True)
+    monkeypatch.setattr(
+        html,
+        "get_text_types",
+        lambda texts, **kwargs: [NarrativeText] * len(texts),
+    )
     doc = """<html>
     <body>
         <table>
@@ -177,6 +181,41 @@ def test_get_emphasized_texts_from_tag(doc, expected, root):
     assert emphasized_texts == expected
 
 
+def test_get_links_and_emphasized_texts():
+    doc = """<p>Read <a href="https://example.com"><b>the docs</b></a> or <i>not</i>.</p>"""
+    document_tree = etree.fromstring(doc, etree.HTMLParser())
+    el = document_tree.find(".//p")
+    links, emphasized_texts = html._get_links_and_emphasized_texts(el)
+    assert links == html._get_links_from_tag(el)
+    assert links == [{"text": None, "url": "https://example.com"}]
+    assert emphasized_texts == html._get_emphasized_texts_from_tag(el)
+    assert emphasized_texts == [
+        {"text": "the docs", "tag": "b"},
+        {"text": "not", "tag": "i"},
+    ]
+
+
+def test_parse_tag_uses_passed_ancestortags():
+    doc = """<div><p>This is a test sentence.</p></div>"""
+    document_tree = etree.fromstring(doc, etree.HTMLParser())
+    el = document_tree.find(".//p")
+    assert html._parse_tag(el).ancestortags == ("html", "body", "div")
+    assert html._parse_tag(el, ancestortags=("body",)).ancestortags == ("body",)
+
+
+def test_read_skips_descendants_of_parsed_tags():
+    doc = """<html><body>
+    <div><p>This is the <span>first</span> paragraph.</p><span>This is a span.</span></div>
+    <p>This is the second paragraph.</p>
+    </body></html>"""
+    html_document = HTMLDocument.from_string(doc)
+    assert [(el.text, el.tag, el.ancestortags) for el in html_document.elements] == [
+        ("This is the first paragraph.", "p", ("html", "body", "div")),
+        ("This is a span.", "span", ("html", "body", "div")),
+        ("This is the second paragraph.", "p", ("html", "body")),
+    ]
+
+
 def test_parse_nothing():
     doc = """<p></p>"""
     document_tree = etree.fromstring(doc, etree.HTMLParser())
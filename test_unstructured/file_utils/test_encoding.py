@@ -0,0 +1,98 @@
+import os
+import pathlib
+
+import pytest
+
+from unstructured.file_utils import encoding
+from unstructured.file_utils.encoding import (
+    detect_file_encoding,
+    iter_txt_file,
+    read_txt_file,
+)
+
+DIRECTORY = pathlib.Path(__file__).parent.resolve()
+EXAMPLE_DOCS_DIRECTORY = os.path.join(DIRECTORY, "..", "..", "example-docs")
+
+
+@pytest.mark.parametrize(
+    ("filename", "expected"),
+    [
+        ("fake-text.txt", "ascii"),
+        ("fake-text-utf-16.txt", "utf-16"),
+        ("fake-text-utf-16-le.txt", "utf-16-le"),
+        ("fake-text-utf-32.txt", "utf-32"),
+    ],
+)
+def test_detect_file_encoding(filename, expected):
+    filename = os.path.join(EXAMPLE_DOCS_DIRECTORY, filename)
+    detected_encoding, file_text = detect_file_encoding(filename=filename)
+    assert detected_encoding == expected
+    assert "This is a test document to use for unit tests." in file_text
+
+    with open(filename, "rb") as f:
+        assert detect_file_encoding(file=f) == (detected_encoding, file_text)
+
+
+def test_detect_file_encoding_only_reads_sample(tmpdir, monkeypatch):
+    monkeypatch.setattr(encoding, "DETECTION_CHUNK_SIZE", 16)
+    monkeypatch.setattr(encoding, "DETECTION_MAX_BYTES", 64)
+    fed_bytes = []
+
+    class MockUniversalDetector(encoding.UniversalDetector):
+        def feed(self, byte_str):
+            fed_bytes.append(len(byte_str))
+            return super().feed(byte_str)
+
+    monkeypatch.setattr(encoding, "UniversalDetector", MockUniversalDetector)
+    filename = os.path.join(tmpdir, "ascii-then-utf-8.txt")
+    text = "Plain ASCII text. " * 20 + "Caf\xe9 cr\xe8me br\xfbl\xe9e."
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write(text)
+
+    assert detect_file_encoding(filename=filename) == ("utf-8", text)
+    assert sum(fed_bytes) <= 64
+
+
+def test_detect_file_encoding_falls_back_when_rest_of_file_does_not_decode(tmpdir, monkeypatch):
+    monkeypatch.setattr(encoding, "DETECTION_MAX_BYTES", 64)
+    filename = os.path.join(tmpdir, "ascii-then-latin-1.txt")
+    text = "Plain ASCII text. " * 20 + "Caf\xe9 cr\xe8me br\xfbl\xe9e."
+    with open(filename, "w", encoding="latin-1") as f:
+        f.write(text)
+
+    assert detect_file_encoding(filename=filename) == ("iso-8859-1", text)
+    with open(filename, "rb") as f:
+        assert detect_file_encoding(file=f.read()) == ("iso-8859-1", text)
+
+
+@pytest.mark.parametrize(
+    "filename",
+    ["fake-text.txt", "fake-text-utf-16.txt", "fake-text-utf-16-le.txt", "fake-text-utf-32.txt"],
+)
+def test_iter_txt_file_matches_read_txt_file(filename):
+    filename = os.path.join(EXAMPLE_DOCS_DIRECTORY, filename)
+    _, file_text = read_txt_file(filename=filename)
+
+    assert "".join(iter_txt_file(filename=filename, chunk_size=7)) == file_text
+    with open(filename, "rb") as f:
+        assert "".join(iter_txt_file(file=f, chunk_size=7)) == file_text
+    with open(filename, "rb") as f:
+        assert "".join(iter_txt_file(file=f.read(), chunk_size=7)) == file_text
+
+
+@pytest.mark.parametrize("chunk_size", [7, 1024])
+def test_iter_txt_file_falls_back_when_rest_of_file_does_not_decode(
+    tmpdir,
+    monkeypatch,
+    chunk_size,
+):
+    monkeypatch.setattr(encoding, "DETECTION_MAX_BYTES", 64)
+    filename = os.path.join(tmpdir, "ascii-then-latin-1.txt")
+    text = "Plain ASCII text.\n" * 20 + "Caf\xe9 cr\xe8me br\xfbl\xe9e."
+    with open(filename, "w", encoding="latin-1") as f:
+        f.write(text)
+
+    assert "".join(iter_txt_file(filename=filename, chunk_size=chunk_size)) == text
+    with open(filename, "rb") as f:
+        assert "".join(iter_txt_file(file=f, chunk_size=chunk_size)) == text
+        assert "".join(iter_txt_file(file=f.read(), chunk_size=chunk_size)) == text
@@ -1,11 +1,21 @@
+import base64
 import os
 import pathlib
-from unittest.mock import patch
+import subprocess
+from unittest.mock import Mock, patch
 
 import pypandoc
 import pytest
+import requests
 
-from unstructured.file_utils.file_conversion import convert_file_to_text
+from unstructured.file_utils import file_conversion
+from unstructured.file_utils.file_conversion import (
+    convert_file_to_html_text,
+    convert_file_to_text,
+    convert_text_to_text,
+    iter_html_texts_from_files,
+    pandoc_server,
+)
 
 DIRECTORY = pathlib.Path(__file__).parent.resolve()
 
@@ -21,3 +31,160 @@ def test_convert_to_file_raises_if_pandoc_not_available():
     with patch.object(pypandoc, "convert_file", side_effect=FileNotFoundError):
         with pytest.raises(FileNotFoundError):
             convert_file_to_text(filename, source_format="epub", target_format="html")
+
+
+def test_convert_file_to_html_text_pipes_text_formats_through_stdin():
+    filename = os.path.join(DIRECTORY, "..", "..", "example-docs", "README.rst")
+    with patch.object(pypandoc, "convert_file") as convert_file, patch.object(
+        pypandoc,
+        "convert_text",
+        return_value="<p>README</p>",
+    ) as convert_text:
+        with open(filename, "rb") as f:
+            html_text = convert_file_to_html_text(source_format="rst", file=f)
+
+    assert html_text == "<p>README</p>"
+    convert_file.assert_not_called()
+    with open(filename, "rb") as f:
+        convert_text.assert_called_once_with(f.read(), "html", format="rst")
+
+
+def test_convert_file_to_html_text_removes_temporary_files_for_binary_formats():
+    filename = os.path.join(DIRECTORY, "..", "..", "example-docs", "winter-sports.epub")
+    tmp_filenames = []
+
+    def convert_file(tmp_filename, *args, **kwargs):
+        tmp_filenames.append(tmp_filename)
+        assert os.path.exists(tmp_filename)
+        return "<p>Winter Sports</p>"
+
+    with patch.object(pypandoc, "convert_file", side_effect=convert_file):
+        with open(filename, "rb") as f:
+            html_text = convert_file_to_html_text(source_format="epub", file=f)
+
+    assert html_text == "<p>Winter Sports</p>"
+    assert len(tmp_filenames) == 1
+    assert not os.path.exists(tmp_filenames[0])
+
+
+def test_iter_html_texts_from_files_keeps_the_order_of_filenames():
+    filenames = [f"document-{i}.epub" for i in range(10)]
+    with patch.object(
+        pypandoc,
+        "convert_file",
+        side_effect=lambda filename, *args, **kwargs: f"<p>{filename}</p>",
+    ):
+        html_texts = list(iter_html_texts_from_files("epub", filenames, workers=3))
+
+    assert html_texts == [f"<p>{filename}</p>" for filename in filenames]
+
+
+@pytest.fixture()
+def mock_pandoc_server(monkeypatch):
+    requests_sent = []
+
+    def post(url, json, headers, timeout):
+        requests_sent.append(json)
+        if json["text"] == "not a document":
+            return Mock(ok=True, json=lambda: {"error": "Unknown input"})
+        output = base64.b64encode(b"<p>Converted</p>").decode()
+        return Mock(ok=True, json=lambda: {"output": output, "base64": True, "messages": []})
+
+    monkeypatch.setattr(
+        subprocess,
+        "Popen",
+        Mock(return_value=Mock(pid=0, **{"poll.return_value": None})),
+    )
+    monkeypatch.setattr(os, "killpg", lambda pid, sig: None)
+    monkeypatch.setattr(file_conversion, "_is_port_open", lambda port: True)
+    monkeypatch.setattr(requests, "post", post)
+    return requests_sent
+
+
+def test_pandoc_server_converts_documents_without_starting_pandoc(mock_pandoc_server):
+    epub_filename = os.path.join(DIRECTORY, "..", "..", "example-docs", "winter-sports.epub")
+    rst_filename = os.path.join(DIRECTORY, "..", "..", "example-docs", "README.rst")
+    with patch.object(pypandoc, "convert_file") as convert_file, patch.object(
+        pypandoc,
+        "convert_text",
+    ) as convert_text, pandoc_server():
+        html_texts = [
+            convert_file_to_html_text(source_format="epub", filename=epub_filename),
+            convert_file_to_text(rst_filename, source_format="rst", target_format="html"),
+        ]
+        with open(epub_filename, "rb") as f:
+            html_texts.append(convert_file_to_html_text(source_format="epub", file=f))
+
+    assert html_texts == ["<p>Converted</p>\n"] * 3
+    convert_file.assert_not_called()
+    convert_text.assert_not_called()
+    with open(epub_filename, "rb") as f:
+        epub_text = base64.b64encode(f.read()).decode()
+    with open(rst_filename, encoding="utf-8") as f:
+        rst_text = f.read()
+    assert mock_pandoc_server == [
+        {"text": text, "from": source_format, "to": "html", "highlight-style": "pygments"}
+        for text, source_format in [
+            ("", "markdown"),
+            (epub_text, "epub"),
+            (rst_text, "rst"),
+            (epub_text, "epub"),
+        ]
+    ]
+    assert file_conversion._pandoc_server is None
+
+
+def test_pandoc_server_raises_conversion_errors(mock_pandoc_server):
+    with pytest.raises(RuntimeError, match="Unknown input"), pandoc_server():
+        convert_text_to_text("not a document", source_format="rst", target_format="html")
+
+
+def test_pandoc_server_cannot_be_nested(mock_pandoc_server):
+    with pytest.raises(ValueError, match="already running"), pandoc_server():
+        with pandoc_server():
+            pass
+
+
+def test_pandoc_server_raises_if_the_server_does_not_respond(mock_pandoc_server, monkeypatch):
+    def post(url, json, headers, timeout):
+        raise requests.ConnectionError("Remote end closed connection without response")
+
+    monkeypatch.setattr(requests, "post", post)
+    with pytest.raises(RuntimeError, match="does not respond"), pandoc_server():
+        pass
+    assert file_conversion._pandoc_server is None
+
+
+def test_pandoc_server_raises_on_timeouts(mock_pandoc_server, monkeypatch):
+    with pandoc_server(timeout=5):
+        monkeypatch.setattr(requests, "post", lambda *args, **kwargs: Mock(status_code=503))
+        with pytest.raises(RuntimeError, match="within 5 seconds"):
+            convert_text_to_text("slow document", source_format="rst", target_format="html")
+
+
+def _pandoc_server_is_available():
+    try:
+        with pandoc_server():
+            return True
+    except (OSError, RuntimeError):
+        return False
+
+
+@pytest.mark.skipif(not _pandoc_server_is_available(), reason="pandoc server is not available")
+@pytest.mark.parametrize(
+    ("source_format", "filename"),
+    [
+        ("epub", "winter-sports.epub"),
+        ("odt", "fake.odt"),
+        ("rst", "README.rst"),
+        ("org", "README.org"),
+        ("rtf", "fake-doc.rtf"),
+    ],
+)
+@pytest.mark.parametrize("target_format", ["html", "plain"])
+def test_pandoc_server_output_matches_pandoc(source_format, filename, target_format):
+    filename = os.path.join(DIRECTORY, "..", "..", "example-docs", filename)
+    expected = convert_file_to_text(filename, source_format, target_format)
+
+    with pandoc_server():
+        assert convert_file_to_text(filename, source_format, target_format) == expected
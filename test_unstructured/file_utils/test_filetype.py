@@ -1,3 +1,4 @@
+import io
 import os
 import pathlib
 import zipfile
@@ -479,3 +480,68 @@ def test_get_page_image_metadata_and_coordinate_system():
     doc = MockDocumentLayout()
     metadata = _get_page_image_metadata(doc.pages[0])
     assert isinstance(metadata, dict)
+
+
+class CountingBytesIO(io.BytesIO):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.num_reads = 0
+
+    def read(self, *args, **kwargs):
+        self.num_reads += 1
+        return super().read(*args, **kwargs)
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        (b"column1,column2,column3\nvalue1,value2,value3\n", FileType.CSV),
+        (b'[{"key": "value"}]', FileType.JSON),
+        (b"From: Sender <sender@example.com>\nTo: Receiver <receiver@example.com>\n", None),
+    ],
+)
+def test_detect_filetype_reads_text_file_once(content, expected):
+    file = CountingBytesIO(content)
+    filetype = detect_filetype(file=file)
+    if expected is not None:
+        assert filetype == expected
+    assert file.num_reads == 1
+    assert file.tell() == 0
+
+
+def test_detect_filetype_reads_small_zip_file_once():
+    with open(os.path.join(EXAMPLE_DOCS_DIRECTORY, "fake.docx"), "rb") as f:
+        content = f.read()
+    # NOTE(agent) - a minimal .docx that fits in the header buffer
+    with zipfile.ZipFile(io.BytesIO(content)) as archive, io.BytesIO() as buffer:
+        with zipfile.ZipFile(buffer, "w") as small_archive:
+            for name in filetype.EXPECTED_DOCX_FILES:
+                small_archive.writestr(name, archive.read(name))
+        small_content = buffer.getvalue()
+    assert len(small_content) < filetype.HEADER_BUFFER_SIZE
+
+    file = CountingBytesIO(small_content)
+    assert detect_filetype(file=file) == FileType.DOCX
+    assert file.num_reads == 1
+
+
+def test_detect_filetype_detects_encoding_from_header(tmpdir, monkeypatch):
+    filename = os.path.join(tmpdir, "latin-1.txt")
+    with open(filename, "w", encoding="latin-1") as f:
+        f.write("Caf\xe9 cr\xe8me br\xfbl\xe9e s'il vous pla\xeet.\n" * 5000)
+
+    detected_lengths = []
+    detect = filetype.detect_prefix_encoding
+
+    def mock_detect_prefix_encoding(byte_data):
+        detected_lengths.append(len(byte_data))
+        return detect(byte_data)
+
+    monkeypatch.setattr(filetype, "detect_prefix_encoding", mock_detect_prefix_encoding)
+    assert detect_filetype(filename=filename) == FileType.TXT
+    assert detected_lengths == [filetype.HEADER_BUFFER_SIZE]
+
+
+def test_detect_xls_file_from_file():
+    with open(os.path.join(EXAMPLE_DOCS_DIRECTORY, "tests-example.xls"), "rb") as f:
+        assert detect_filetype(file=f) == FileType.XLS
@@ -75,3 +75,69 @@ def test_tokenizers_functions_run():
     tokenize.sent_tokenize(sentence)
     tokenize.word_tokenize(sentence)
     tokenize.pos_tag(sentence)
+
+
+def test_pos_tag_texts_matches_pos_tag():
+    texts = ["I am a big brown bear. What are you?", "ITEM 2A. PROPERTIES", ""]
+    assert tokenize.pos_tag_texts(texts) == [tokenize.pos_tag(text) for text in texts]
+
+
+def test_tokenizer_cache_counts_hits_misses_and_evictions():
+    cache = tokenize.TokenizerCache(str.split, maxsize=2)
+    cache("a b")
+    cache("a b")
+    cache("c d")
+    cache("e f")
+
+    assert cache.cache_info() == tokenize.CacheInfo(
+        hits=1,
+        misses=3,
+        evictions=1,
+        maxsize=2,
+        currsize=2,
+    )
+
+
+def test_set_cache_size_evicts_entries(monkeypatch):
+    monkeypatch.setattr(tokenize, "_word_tokenize", mock_word_tokenize)
+    tokenize.word_tokenize.cache_clear()
+    for text in ["Greetings!", "I am from", "outer space."]:
+        tokenize.word_tokenize(text)
+
+    tokenize.set_cache_size(1, "word_tokenize")
+    try:
+        info = tokenize.get_cache_info()["word_tokenize"]
+        assert (info.maxsize, info.currsize, info.evictions) == (1, 1, 2)
+        assert tokenize.get_cache_info()["sent_tokenize"].maxsize == tokenize.CACHE_MAX_SIZE
+    finally:
+        tokenize.set_cache_size(tokenize.CACHE_MAX_SIZE)
+
+
+def test_nltk_packages_are_resolved_once(monkeypatch):
+    monkeypatch.setattr(tokenize, "_word_tokenize", mock_word_tokenize)
+    tokenize._ensure_nltk_package.cache_clear()
+    try:
+        with patch.object(tokenize, "_download_nltk_package_if_not_present") as mock_download:
+            tokenize.word_tokenize("Greetings! I am from outer space.")
+            tokenize.word_tokenize("Take me to your leader.")
+    finally:
+        # NOTE(agent) - Otherwise later tests would see punkt as resolved without checking
+        tokenize._ensure_nltk_package.cache_clear()
+
+    mock_download.assert_called_once_with(package_name="punkt", package_category="tokenizers")
+
+
+def test_pos_tag_reuses_cached_sentences_and_tokens(monkeypatch):
+    monkeypatch.setattr(tokenize, "_sent_tokenize", mock_sent_tokenize)
+    monkeypatch.setattr(tokenize, "_word_tokenize", mock_word_tokenize)
+    monkeypatch.setattr(tokenize, "_pos_tag", mock_pos_tag)
+    tokenize.clear_caches()
+    text = "Ask me a question. I am from outer space."
+    for sentence in tokenize.sent_tokenize(text):
+        tokenize.word_tokenize(sentence)
+
+    tokenize.pos_tag(text)
+
+    cache_info = tokenize.get_cache_info()
+    assert (cache_info["sent_tokenize"].hits, cache_info["sent_tokenize"].misses) == (1, 1)
+    assert (cache_info["word_tokenize"].hits, cache_info["word_tokenize"].misses) == (2, 2)
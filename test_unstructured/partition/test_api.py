@@ -2,12 +2,20 @@ import contextlib
 import json
 import os
 import pathlib
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
 import requests
 
 from unstructured.documents.elements import NarrativeText
-from unstructured.partition.api import partition_multiple_via_api, partition_via_api
+from unstructured.partition.api import (
+    PartitionAPIClient,
+    partition_multiple_via_api,
+    partition_via_api,
+)
 
 DIRECTORY = pathlib.Path(__file__).parent.resolve()
 
@@ -221,7 +229,7 @@ class MockMultipleResponse:
 
 def test_partition_multiple_via_api_with_single_filename(monkeypatch):
     monkeypatch.setattr(
-        requests,
+        requests.Session,
         "post",
         lambda *args, **kwargs: MockResponse(status_code=200),
     )
@@ -234,7 +242,7 @@ def test_partition_multiple_via_api_with_single_filename(monkeypatch):
 
 def test_partition_multiple_via_api_from_filenames(monkeypatch):
     monkeypatch.setattr(
-        requests,
+        requests.Session,
         "post",
         lambda *args, **kwargs: MockMultipleResponse(status_code=200),
     )
@@ -252,7 +260,7 @@ def test_partition_multiple_via_api_from_filenames(monkeypatch):
 
 def test_partition_multiple_via_api_from_files(monkeypatch):
     monkeypatch.setattr(
-        requests,
+        requests.Session,
         "post",
         lambda *args, **kwargs: MockMultipleResponse(status_code=200),
     )
@@ -275,7 +283,7 @@ def test_partition_multiple_via_api_from_files(monkeypatch):
 
 def test_partition_multiple_via_api_raises_with_bad_response(monkeypatch):
     monkeypatch.setattr(
-        requests,
+        requests.Session,
         "post",
         lambda *args, **kwargs: MockMultipleResponse(status_code=500),
     )
@@ -291,7 +299,7 @@ def test_partition_multiple_via_api_raises_with_bad_response(monkeypatch):
 
 def test_partition_multiple_via_api_raises_with_content_types_size_mismatch(monkeypatch):
     monkeypatch.setattr(
-        requests,
+        requests.Session,
         "post",
         lambda *args, **kwargs: MockMultipleResponse(status_code=500),
     )
@@ -310,7 +318,7 @@ def test_partition_multiple_via_api_raises_with_content_types_size_mismatch(monk
 
 def test_partition_multiple_via_api_from_files_raises_with_size_mismatch(monkeypatch):
     monkeypatch.setattr(
-        requests,
+        requests.Session,
         "post",
         lambda *args, **kwargs: MockMultipleResponse(status_code=200),
     )
@@ -332,7 +340,7 @@ def test_partition_multiple_via_api_from_files_raises_with_size_mismatch(monkeyp
 
 def test_partition_multiple_via_api_from_files_raises_without_filenames(monkeypatch):
     monkeypatch.setattr(
-        requests,
+        requests.Session,
         "post",
         lambda *args, **kwargs: MockMultipleResponse(status_code=200),
     )
@@ -385,3 +393,127 @@ def test_partition_multiple_via_api_invalid_request_data_kwargs():
             strategy="not_a_strategy",
             api_key=get_api_key(),
         )
+
+
+class StubAPIHandler(BaseHTTPRequestHandler):
+    """Stands in for the Unstructured API. Returns one NarrativeText element per file, with the
+    filename as the text, after replying with any status codes queued on the server."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        filenames = [
+            os.path.basename(name.decode()) for name in re.findall(rb'filename="([^"]+)"', body)
+        ]
+        server = self.server
+        with server.lock:  # type: ignore
+            server.batches.append(filenames)  # type: ignore
+            status_code = server.status_codes.pop(0) if server.status_codes else 200  # type: ignore
+
+        if any(filename.startswith("slow") for filename in filenames):
+            time.sleep(0.2)
+
+        documents = [
+            [{"type": "NarrativeText", "text": filename, "metadata": {}}] for filename in filenames
+        ]
+        content = json.dumps(documents[0] if len(documents) == 1 else documents).encode()
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def stub_api():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubAPIHandler)
+    server.lock = threading.Lock()  # type: ignore
+    server.batches = []  # type: ignore
+    server.status_codes = []  # type: ignore
+    server.url = f"http://127.0.0.1:{server.server_port}/general/v0/general"  # type: ignore
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _write_files(directory, names, content=b"fake content"):
+    filenames = []
+    for name in names:
+        filename = os.path.join(directory, name)
+        with open(filename, "wb") as f:
+            f.write(content)
+        filenames.append(filename)
+    return filenames
+
+
+def test_partition_multiple_via_api_batches_requests_and_keeps_order(stub_api, tmpdir):
+    names = ["slow-0.txt", "1.txt", "2.txt", "3.txt", "4.txt"]
+    filenames = _write_files(tmpdir, names)
+
+    documents = partition_multiple_via_api(
+        filenames=filenames,
+        api_url=stub_api.url,
+        max_batch_files=2,
+        max_in_flight=3,
+    )
+
+    assert [elements[0].text for elements in documents] == names
+    assert sorted(stub_api.batches) == [["2.txt", "3.txt"], ["4.txt"], ["slow-0.txt", "1.txt"]]
+
+
+def test_partition_multiple_via_api_batches_by_size(stub_api, tmpdir):
+    names = ["0.txt", "1.txt", "2.txt"]
+    filenames = _write_files(tmpdir, names, content=b"x" * 10)
+
+    with contextlib.ExitStack() as stack:
+        files = [stack.enter_context(open(filename, "rb")) for filename in filenames]
+        documents = partition_multiple_via_api(
+            files=files,
+            file_filenames=names,
+            api_url=stub_api.url,
+            max_batch_bytes=15,
+        )
+
+    assert [elements[0].text for elements in documents] == names
+    assert len(stub_api.batches) == 3
+
+
+def test_partition_api_client_retries_rate_limits_and_server_errors(stub_api, tmpdir):
+    filenames = _write_files(tmpdir, ["0.txt"])
+    stub_api.status_codes = [429, 503]
+
+    with PartitionAPIClient(api_url=stub_api.url, backoff_factor=0) as client:
+        documents = list(client.partition_multiple(filenames=filenames))
+
+    assert documents[0][0] == NarrativeText("0.txt")
+    assert len(stub_api.batches) == 3
+
+
+def test_partition_api_client_raises_when_retries_are_exhausted(stub_api, tmpdir):
+    filenames = _write_files(tmpdir, ["0.txt"])
+    stub_api.status_codes = [500] * 5
+
+    with PartitionAPIClient(
+        api_url=stub_api.url,
+        max_retries=2,
+        backoff_factor=0,
+    ) as client, pytest.raises(ValueError):
+        list(client.partition_multiple(filenames=filenames))
+
+    assert len(stub_api.batches) == 3
+
+
+def test_partition_api_client_streams_documents(stub_api, tmpdir):
+    names = ["0.txt", "1.txt", "slow-2.txt"]
+    filenames = _write_files(tmpdir, names)
+
+    with PartitionAPIClient(api_url=stub_api.url, max_batch_files=1) as client:
+        documents = client.partition_multiple(filenames=filenames)
+        assert next(documents)[0].text == "0.txt"
+        assert [elements[0].text for elements in documents] == names[1:]
@@ -12,6 +12,7 @@ from test_unstructured.partition.test_constants import EXPECTED_TABLE, EXPECTED_
 from unstructured.cleaners.core import clean_extra_whitespace
 from unstructured.documents.elements import (
     Address,
+    DataSourceMetadata,
     ElementMetadata,
     ListItem,
     NarrativeText,
@@ -21,7 +22,7 @@ from unstructured.documents.elements import (
 )
 from unstructured.file_utils.filetype import FILETYPE_TO_MIMETYPE, FileType
 from unstructured.partition import auto
-from unstructured.partition.auto import partition
+from unstructured.partition.auto import iter_partition, partition
 from unstructured.partition.common import convert_office_doc
 from unstructured.staging.base import elements_to_json
 
@@ -867,3 +868,38 @@ def test_auto_partition_metadata_file_filename():
     with open(filename) as f:
         elements = partition(file=f, file_filename=filename)
     assert elements[0].metadata.filename == os.path.split(filename)[-1]
+
+
+@pytest.mark.parametrize(
+    "filename",
+    [
+        "fake-text.txt",
+        "example-10k.html",
+        "handbook-1p.docx",
+        "fake-power-point.pptx",
+        "stanley-cups.xlsx",
+        "stanley-cups.csv",
+        "factbook.xml",
+        "eml/fake-email.eml",
+    ],
+)
+def test_auto_iter_partition_matches_partition(filename):
+    filename = os.path.join(EXAMPLE_DOCS_DIRECTORY, filename)
+    data_source_metadata = DataSourceMetadata(url="https://example.com", version="1")
+
+    elements = iter_partition(filename=filename, data_source_metadata=data_source_metadata)
+    assert not isinstance(elements, list)
+    assert [element.to_dict() for element in elements] == [
+        element.to_dict()
+        for element in partition(filename=filename, data_source_metadata=data_source_metadata)
+    ]
+
+
+def test_auto_iter_partition_with_file_filename():
+    filename = os.path.join(EXAMPLE_DOCS_DIRECTORY, "fake-text.txt")
+    with open(filename, "rb") as f:
+        elements = list(iter_partition(file=f, file_filename="fake-text.txt"))
+
+    assert len(elements) > 0
+    assert all(element.metadata.filename == "fake-text.txt" for element in elements)
+    assert all(element.metadata.filetype == "text/plain" for element in elements)
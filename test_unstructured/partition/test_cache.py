@@ -0,0 +1,167 @@
+import os
+import pathlib
+import shutil
+from typing import Dict, Optional
+
+import pytest
+
+from unstructured.documents.elements import DataSourceMetadata
+from unstructured.partition import cache as partition_cache
+from unstructured.partition.auto import partition
+from unstructured.partition.cache import (
+    DiskPartitionCacheBackend,
+    PartitionCache,
+    PartitionCacheBackend,
+)
+
+DIRECTORY = pathlib.Path(__file__).parent.resolve()
+EXAMPLE_DOCS_DIRECTORY = os.path.join(DIRECTORY, "..", "..", "example-docs")
+
+
+class MemoryPartitionCacheBackend(PartitionCacheBackend):
+    def __init__(self):
+        self.entries: Dict[str, bytes] = {}
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.entries.get(key)
+
+    def set(self, key: str, value: bytes):
+        self.entries[key] = value
+
+
+def test_partition_cache_returns_cached_elements_on_hit(tmpdir, monkeypatch):
+    filename = os.path.join(EXAMPLE_DOCS_DIRECTORY, "fake-text.txt")
+    cache = PartitionCache(DiskPartitionCacheBackend(directory=str(tmpdir)))
+
+    elements = cache.partition(filename=filename)
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    monkeypatch.setattr(
+        partition_cache,
+        "partition",
+        lambda *args, **kwargs: pytest.fail("partitioned on a cache hit"),
+    )
+    cached_elements = cache.partition(filename=filename)
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert [element.to_dict() for element in cached_elements] == [
+        element.to_dict() for element in elements
+    ]
+
+
+def test_partition_cache_hit_uses_metadata_of_new_source(tmpdir):
+    filename = os.path.join(EXAMPLE_DOCS_DIRECTORY, "fake-text.txt")
+    copy_filename = os.path.join(tmpdir, "copy-of-fake-text.txt")
+    shutil.copy(filename, copy_filename)
+    data_source_metadata = DataSourceMetadata(url="https://example.com", version="2")
+    cache = PartitionCache(MemoryPartitionCacheBackend())
+
+    cache.partition(filename=filename)
+    elements = cache.partition(filename=copy_filename, data_source_metadata=data_source_metadata)
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert [element.to_dict() for element in elements] == [
+        element.to_dict()
+        for element in partition(
+            filename=copy_filename,
+            data_source_metadata=data_source_metadata,
+        )
+    ]
+
+
+def test_partition_cache_hit_with_file(tmpdir):
+    filename = os.path.join(EXAMPLE_DOCS_DIRECTORY, "fake-text.txt")
+    cache = PartitionCache(MemoryPartitionCacheBackend())
+
+    cache.partition(filename=filename)
+    with open(filename, "rb") as f:
+        elements = cache.partition(file=f, file_filename="attachment.txt")
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert all(element.metadata.filename == "attachment.txt" for element in elements)
+    assert all(element.metadata.file_directory is None for element in elements)
+
+
+def test_partition_cache_hit_keeps_last_modified_from_content(tmpdir):
+    filename = os.path.join(EXAMPLE_DOCS_DIRECTORY, "eml", "fake-email.eml")
+    copy_filename = os.path.join(tmpdir, "copy-of-fake-email.eml")
+    shutil.copy(filename, copy_filename)
+    cache = PartitionCache(MemoryPartitionCacheBackend())
+
+    cache.partition(filename=filename)
+    elements = cache.partition(filename=copy_filename)
+
+    assert cache.hits == 1
+    assert [element.metadata.last_modified for element in elements] == [
+        element.metadata.last_modified for element in partition(filename=copy_filename)
+    ]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"strategy": "fast"},
+        {"encoding": "utf-16"},
+        {"ocr_languages": "eng+swe"},
+        {"pdf_infer_table_structure": True},
+        {"metadata_filename": "fake-text.md"},
+    ],
+)
+def test_partition_cache_key_depends_on_partition_kwargs(kwargs):
+    filename = os.path.join(EXAMPLE_DOCS_DIRECTORY, "fake-text.txt")
+    cache = PartitionCache(MemoryPartitionCacheBackend())
+    assert cache.get_key(filename=filename) != cache.get_key(filename=filename, **kwargs)
+
+
+def test_partition_cache_key_ignores_source_and_default_kwargs():
+    filename = os.path.join(EXAMPLE_DOCS_DIRECTORY, "fake-text.txt")
+    cache = PartitionCache(MemoryPartitionCacheBackend())
+    key = cache.get_key(filename=filename)
+
+    assert cache.get_key(filename=filename, strategy="auto") == key
+    assert cache.get_key(filename=filename, data_source_metadata=DataSourceMetadata()) == key
+    with open(filename, "rb") as f:
+        assert cache.get_key(file=f, file_filename="fake-text.txt") == key
+        assert f.tell() == 0
+
+
+def test_partition_cache_key_depends_on_version(monkeypatch):
+    filename = os.path.join(EXAMPLE_DOCS_DIRECTORY, "fake-text.txt")
+    cache = PartitionCache(MemoryPartitionCacheBackend())
+    key = cache.get_key(filename=filename)
+
+    monkeypatch.setattr(partition_cache, "__version__", "0.0.0")
+    assert cache.get_key(filename=filename) != key
+
+
+def test_disk_partition_cache_backend_evicts_least_recently_used(tmpdir):
+    backend = DiskPartitionCacheBackend(directory=str(tmpdir), max_size_bytes=25)
+    backend.set("a", b"a" * 10)
+    backend.set("b", b"b" * 10)
+    assert backend.get("a") == b"a" * 10
+
+    backend.set("c", b"c" * 10)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == b"a" * 10
+    assert backend.get("c") == b"c" * 10
+    assert sorted(os.listdir(tmpdir)) == ["a.json", "c.json"]
+
+
+def test_disk_partition_cache_backend_skips_oversized_entries(tmpdir):
+    backend = DiskPartitionCacheBackend(directory=str(tmpdir), max_size_bytes=5)
+    backend.set("a", b"a" * 10)
+    assert backend.get("a") is None
+    assert os.listdir(tmpdir) == []
+
+
+def test_disk_partition_cache_backend_restores_entries(tmpdir):
+    backend = DiskPartitionCacheBackend(directory=str(tmpdir), max_size_bytes=25)
+    backend.set("a", b"a" * 10)
+    backend.set("b", b"b" * 10)
+
+    restored_backend = DiskPartitionCacheBackend(directory=str(tmpdir), max_size_bytes=25)
+    restored_backend.set("c", b"c" * 10)
+
+    assert restored_backend.get("a") is None
+    assert restored_backend.get("b") == b"b" * 10
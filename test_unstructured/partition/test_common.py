@@ -1,3 +1,12 @@
+import io
+import os
+import pathlib
+import shutil
+import subprocess
+import tempfile
+import threading
+
+import pytest
 from unstructured_inference.inference.layout import LayoutElement
 
 from unstructured.documents.coordinates import PixelSpace
@@ -10,6 +19,10 @@ from unstructured.documents.elements import (
     Title,
 )
 from unstructured.partition import common
+from unstructured.partition.doc import partition_doc
+
+DIRECTORY = pathlib.Path(__file__).parent.resolve()
+EXAMPLE_DOCS_DIRECTORY = os.path.join(DIRECTORY, "..", "..", "example-docs")
 
 
 def test_normalize_layout_element_dict():
@@ -221,6 +234,216 @@ def test_convert_office_doc_captures_errors(monkeypatch, caplog):
     assert "an error occurred" in caplog.text
 
 
+class MockSofficePopen:
+    calls: list = []
+    hung_filenames: set = set()
+
+    def __init__(self, command, *args, **kwargs):
+        self.command = command
+        self.pid = 0
+        self.timed_out = False
+        self.calls.append(command)
+
+    def communicate(self, timeout=None):
+        if self.timed_out:
+            return b"", b""
+        output_directory = self.command[self.command.index("--outdir") + 1]
+        input_filenames = self.command[self.command.index("--outdir") + 2 :]  # noqa: E203
+        target_format = self.command[self.command.index("--convert-to") + 1].split(":")[0]
+        for input_filename in input_filenames:
+            if timeout is not None and input_filename in self.hung_filenames:
+                self.timed_out = True
+                raise subprocess.TimeoutExpired(self.command, timeout)
+            base_filename, _ = os.path.splitext(os.path.basename(input_filename))
+            with open(os.path.join(output_directory, f"{base_filename}.{target_format}"), "w"):
+                pass
+        return b"", b""
+
+
+@pytest.fixture()
+def mock_soffice(monkeypatch):
+    monkeypatch.setattr(MockSofficePopen, "calls", [])
+    monkeypatch.setattr(MockSofficePopen, "hung_filenames", set())
+    monkeypatch.setattr(subprocess, "Popen", MockSofficePopen)
+    monkeypatch.setattr(os, "killpg", lambda pid, sig: None)
+    return MockSofficePopen
+
+
+def test_convert_office_docs_converts_in_batches(mock_soffice, tmp_path):
+    input_filenames = [f"document-{i}.doc" for i in range(5)]
+    output_filenames = common.convert_office_docs(
+        input_filenames,
+        str(tmp_path),
+        target_filter="MS Word 2007 XML",
+        batch_size=2,
+        workers=2,
+    )
+    assert output_filenames == [str(tmp_path / f"document-{i}.docx") for i in range(5)]
+    assert len(mock_soffice.calls) == 3
+    for command in mock_soffice.calls:
+        assert "docx:MS Word 2007 XML" in command
+        assert any(arg.startswith("-env:UserInstallation=file://") for arg in command)
+
+
+def test_convert_office_docs_retries_timed_out_batches_one_at_a_time(mock_soffice, tmp_path):
+    mock_soffice.hung_filenames = {"document-1.doc"}
+    input_filenames = [f"document-{i}.doc" for i in range(3)]
+    output_filenames = common.convert_office_docs(input_filenames, str(tmp_path), timeout=1)
+    assert output_filenames == [
+        str(tmp_path / "document-0.docx"),
+        None,
+        str(tmp_path / "document-2.docx"),
+    ]
+    # NOTE(agent) - The batch converted document-0 before it hung, so only the other two
+    # documents are retried
+    assert [command[-1] for command in mock_soffice.calls[1:]] == [
+        "document-1.doc",
+        "document-2.doc",
+    ]
+
+
+def test_convert_office_docs_raises_with_duplicate_output_filenames(mock_soffice, tmp_path):
+    with pytest.raises(ValueError):
+        common.convert_office_docs(["a/document.doc", "b/document.doc"], str(tmp_path))
+    assert mock_soffice.calls == []
+
+
+class MockUnoserverPopen:
+    calls: list = []
+    exit_code = None
+
+    def __init__(self, command, *args, **kwargs):
+        self.command = command
+        self.pid = 0
+        self.calls.append(command)
+
+    def poll(self):
+        return self.exit_code
+
+    def wait(self):
+        return self.exit_code
+
+
+class MockUnoClient:
+    conversions: list = []
+    hung_filenames: set = set()
+    release_hung_conversions = threading.Event()
+    example_filename = os.path.join(EXAMPLE_DOCS_DIRECTORY, "fake.docx")
+
+    def __init__(self, server, port):
+        self.port = port
+
+    def convert(self, inpath, outpath, convert_to, filtername):
+        if os.path.basename(inpath) in self.hung_filenames:
+            self.release_hung_conversions.wait(timeout=10)
+            raise ConnectionError("The listener was stopped")
+        self.conversions.append((self.port, os.path.basename(inpath), convert_to, filtername))
+        shutil.copyfile(self.example_filename, outpath)
+
+
+@pytest.fixture()
+def mock_unoserver(monkeypatch):
+    monkeypatch.setattr(MockUnoserverPopen, "calls", [])
+    monkeypatch.setattr(MockUnoserverPopen, "exit_code", None)
+    monkeypatch.setattr(MockUnoClient, "conversions", [])
+    monkeypatch.setattr(MockUnoClient, "hung_filenames", set())
+    monkeypatch.setattr(MockUnoClient, "release_hung_conversions", threading.Event())
+    monkeypatch.setattr(subprocess, "Popen", MockUnoserverPopen)
+    monkeypatch.setattr(os, "killpg", lambda pid, sig: MockUnoClient.release_hung_conversions.set())
+    monkeypatch.setattr(common, "UnoClient", MockUnoClient, raising=False)
+    monkeypatch.setattr(common, "_is_port_open", lambda port: True)
+    return MockUnoClient
+
+
+def test_office_listeners_convert_documents_without_starting_soffice(mock_unoserver, tmp_path):
+    with common.office_listeners(workers=2) as listeners:
+        assert len(MockUnoserverPopen.calls) == 2
+        assert all(command[0] == "unoserver" for command in MockUnoserverPopen.calls)
+        common.convert_office_doc(
+            "document.doc",
+            str(tmp_path),
+            target_format="docx",
+            target_filter="MS Word 2007 XML",
+        )
+        output_filenames = common.convert_office_docs(
+            [f"document-{i}.doc" for i in range(4)],
+            str(tmp_path),
+            workers=2,
+        )
+
+    assert len(MockUnoserverPopen.calls) == 2
+    assert (tmp_path / "document.docx").exists()
+    assert output_filenames == [str(tmp_path / f"document-{i}.docx") for i in range(4)]
+    assert mock_unoserver.conversions[0][1:] == ("document.doc", "docx", "MS Word 2007 XML")
+    assert len(mock_unoserver.conversions) == 5
+    assert all(not os.path.exists(listener.profile_directory) for listener in listeners)
+
+
+def test_office_listeners_restart_after_a_hung_conversion(mock_unoserver, tmp_path):
+    mock_unoserver.hung_filenames = {"document-1.doc"}
+    with common.office_listeners(workers=1):
+        output_filenames = common.convert_office_docs(
+            [f"document-{i}.doc" for i in range(3)],
+            str(tmp_path),
+            timeout=0.1,
+        )
+
+    assert output_filenames == [
+        str(tmp_path / "document-0.docx"),
+        None,
+        str(tmp_path / "document-2.docx"),
+    ]
+    # NOTE(agent) - The listener was started once and restarted once after the hung document
+    assert len(MockUnoserverPopen.calls) == 2
+
+
+def test_office_listeners_raise_if_the_listener_does_not_start(mock_unoserver, monkeypatch):
+    MockUnoserverPopen.exit_code = 1
+    monkeypatch.setattr(common, "_is_port_open", lambda port: False)
+    with pytest.raises(RuntimeError, match="did not start"), common.office_listeners():
+        pass
+    assert common._office_listeners is None
+
+
+def test_office_listeners_cannot_be_nested(mock_unoserver):
+    with pytest.raises(ValueError, match="already running"), common.office_listeners():
+        with common.office_listeners():
+            pass
+
+
+def test_partition_doc_converts_with_office_listeners(mock_unoserver):
+    with common.office_listeners():
+        elements = partition_doc(filename=os.path.join(EXAMPLE_DOCS_DIRECTORY, "fake.doc"))
+
+    assert elements[0].text == "Lorem ipsum dolor sit amet."
+    assert [conversion[1:] for conversion in mock_unoserver.conversions] == [
+        ("fake.doc", "docx", "MS Word 2007 XML"),
+    ]
+    assert all(command[0] == "unoserver" for command in MockUnoserverPopen.calls)
+
+
+@pytest.mark.skipif(shutil.which("unoserver") is None, reason="unoserver is not installed")
+def test_office_listeners_convert_with_libreoffice():
+    with common.office_listeners():
+        elements = partition_doc(filename=os.path.join(EXAMPLE_DOCS_DIRECTORY, "fake.doc"))
+
+    assert elements[0].text == "Lorem ipsum dolor sit amet."
+
+
+@pytest.mark.skipif(shutil.which("unoserver") is None, reason="unoserver is not installed")
+def test_office_listeners_restart_libreoffice_after_a_hung_conversion(tmp_path):
+    input_filename = os.path.join(EXAMPLE_DOCS_DIRECTORY, "fake.doc")
+    output_filename = str(tmp_path / "fake.docx")
+    with common.office_listeners() as (listener,):
+        process = listener.process
+        assert not listener.convert(input_filename, output_filename, "docx", timeout=0.01)
+        assert listener.process is not process
+        assert process.poll() is not None
+
+        assert listener.convert(input_filename, output_filename, "docx", "MS Word 2007 XML")
+    assert os.path.getsize(output_filename)
+
+
 class MockDocxEmptyTable:
     def __init__(self):
         self.rows = []
@@ -230,3 +453,78 @@ def test_convert_ms_office_table_to_text_works_with_empty_tables():
     table = MockDocxEmptyTable()
     assert common.convert_ms_office_table_to_text(table, as_html=True) == ""
     assert common.convert_ms_office_table_to_text(table, as_html=False) == ""
+
+
+def test_document_source_reads_and_seeks():
+    source = common.DocumentSource(memoryview(b"first line\nsecond line\nlast"))
+    assert source.readline() == b"first line\n"
+    assert source.read(6) == b"second"
+    assert source.tell() == 17
+    source.seek(-4, 2)
+    assert source.read() == b"last"
+    assert source.read() == b""
+    source.seek(0)
+    assert source.readlines() == [b"first line\n", b"second line\n", b"last"]
+
+
+def test_document_source_view_shares_buffer():
+    source = common.DocumentSource(memoryview(b"Some lovely text"), name="lovely.txt")
+    source.read(5)
+    view = source.view()
+    assert view.tell() == 0
+    assert view.name == "lovely.txt"
+    assert view.read() == b"Some lovely text"
+    assert view.getbuffer().obj is source.getbuffer().obj
+
+
+def test_convert_to_bytes_does_not_copy_document_sources_over_bytes():
+    data = b"Some lovely text"
+    assert common.convert_to_bytes(common.as_document_source(data)) is data
+
+
+@pytest.mark.parametrize(
+    "file",
+    [b"Some lovely text", io.BytesIO(b"Some lovely text")],
+)
+def test_as_document_source_wraps_in_memory_documents(file):
+    source = common.as_document_source(file)
+    assert isinstance(source, common.DocumentSource)
+    assert source.filename == ""
+    assert source.read() == b"Some lovely text"
+
+
+@pytest.mark.parametrize("max_size", [1, 1024])
+def test_as_document_source_wraps_spooled_temporary_files(max_size):
+    with tempfile.SpooledTemporaryFile(max_size=max_size) as spooled_file:
+        spooled_file.write(b"Some lovely text")
+        spooled_file.seek(0)
+        source = common.as_document_source(spooled_file)
+        assert isinstance(source, common.DocumentSource)
+        assert source.read() == b"Some lovely text"
+
+
+def test_as_document_source_does_not_lock_in_memory_files():
+    file = io.BytesIO(b"Some lovely text")
+    source = common.as_document_source(file)
+    file.write(b"Some")
+    file.close()
+    assert source.read() == b"Some lovely text"
+
+
+def test_as_document_source_maps_files_on_disk(tmp_path):
+    filename = str(tmp_path / "lovely.txt")
+    with open(filename, "wb") as f:
+        f.write(b"Some lovely text")
+
+    with open(filename, "rb") as f:
+        source = common.as_document_source(f)
+        assert isinstance(source, common.DocumentSource)
+        assert source.name == filename
+        assert source.filename == filename
+        assert source.read() == b"Some lovely text"
+        assert common.convert_to_bytes(source) == b"Some lovely text"
+
+
+def test_as_document_source_leaves_text_streams_alone():
+    file = io.StringIO("Some lovely text")
+    assert common.as_document_source(file) is file
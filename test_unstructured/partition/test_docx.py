@@ -3,6 +3,8 @@ from tempfile import SpooledTemporaryFile
 
 import docx
 import pytest
+from docx.enum.text import WD_BREAK
+from docx.oxml import OxmlElement
 
 from unstructured.documents.elements import (
     Address,
@@ -16,8 +18,11 @@ from unstructured.documents.elements import (
 )
 from unstructured.partition.doc import partition_doc
 from unstructured.partition.docx import (
+    _element_contains_pagebreak,
     _get_emphasized_texts_from_paragraph,
     _get_emphasized_texts_from_table,
+    _get_text_and_emphasized_texts_from_paragraph,
+    iter_partition_docx,
     partition_docx,
 )
 
@@ -318,6 +323,36 @@ def test_get_emphasized_texts_from_paragraph(
     assert emphasized_texts == []
 
 
+def test_get_text_and_emphasized_texts_from_paragraph(
+    filename="example-docs/fake-doc-emphasized-text.docx",
+):
+    document = docx.Document(filename)
+    for paragraph in document.paragraphs:
+        text, emphasized_texts = _get_text_and_emphasized_texts_from_paragraph(paragraph)
+        assert text == paragraph.text
+        assert emphasized_texts == _get_emphasized_texts_from_paragraph(paragraph)
+
+
+@pytest.mark.parametrize(
+    ("break_type", "expected"),
+    [
+        (WD_BREAK.PAGE, True),
+        (WD_BREAK.LINE, False),
+        ("lastRenderedPageBreak", True),
+        (None, False),
+    ],
+)
+def test_element_contains_pagebreak(break_type, expected):
+    document = docx.Document()
+    run = document.add_paragraph("Some text").runs[0]
+    if break_type == "lastRenderedPageBreak":
+        run._r.append(OxmlElement("w:lastRenderedPageBreak"))
+    elif break_type is not None:
+        run.add_break(break_type)
+
+    assert _element_contains_pagebreak(document.paragraphs[0]._element) is expected
+
+
 def test_get_emphasized_texts_from_table(
     filename="example-docs/fake-doc-emphasized-text.docx",
 ):
@@ -361,3 +396,11 @@ def test_partition_docx_grabs_emphasized_texts(filename, partition_func):
 
     assert elements[2] == NarrativeText("I am a normal text.")
     assert elements[2].metadata.emphasized_texts is None
+
+
+def test_iter_partition_docx_matches_partition_docx(filename="example-docs/handbook-1p.docx"):
+    elements = iter_partition_docx(filename=filename, include_page_breaks=True)
+    assert not isinstance(elements, list)
+    assert [element.to_dict() for element in elements] == [
+        element.to_dict() for element in partition_docx(filename=filename, include_page_breaks=True)
+    ]
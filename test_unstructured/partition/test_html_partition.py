@@ -2,13 +2,19 @@ import os
 import pathlib
 from unittest.mock import patch
 
+import pypandoc
 import pytest
 import requests
 from requests.models import Response
 
 from unstructured.cleaners.core import clean_extra_whitespace
 from unstructured.documents.elements import ListItem, NarrativeText, Title
-from unstructured.partition.html import partition_html
+from unstructured.partition.epub import partition_epub
+from unstructured.partition.html import (
+    iter_convert_and_partition_html,
+    iter_partition_html,
+    partition_html,
+)
 
 DIRECTORY = pathlib.Path(__file__).parent.resolve()
 
@@ -590,3 +596,34 @@ def test_partition_html_grabs_emphasized_texts():
     assert elements[4].metadata.emphasized_texts == [
         {"text": "A lone span text!", "tag": "span"},
     ]
+
+
+def test_iter_partition_html_matches_partition_html():
+    filename = os.path.join(DIRECTORY, "..", "..", "example-docs", "example-10k.html")
+    elements = iter_partition_html(filename=filename)
+    assert not isinstance(elements, list)
+    assert [element.to_dict() for element in elements] == [
+        element.to_dict() for element in partition_html(filename=filename)
+    ]
+
+
+def test_iter_convert_and_partition_html_matches_partition_epub(tmp_path):
+    def convert_file(filename, to, format):
+        name = os.path.basename(filename)
+        return f"<h1>{name}</h1><p>This is the text of {name}, which was converted by pandoc.</p>"
+
+    filenames = []
+    for name in ("winter-sports.epub", "summer-sports.epub", "spring-sports.epub"):
+        filename = str(tmp_path / name)
+        pathlib.Path(filename).write_bytes(b"")
+        filenames.append(filename)
+
+    with patch.object(pypandoc, "convert_file", side_effect=convert_file):
+        batches = list(iter_convert_and_partition_html("epub", filenames, workers=2))
+        expected_batches = [partition_epub(filename=filename) for filename in filenames]
+
+    assert [[element.to_dict() for element in elements] for elements in batches] == [
+        [element.to_dict() for element in elements] for elements in expected_batches
+    ]
+    assert batches[1][0].text == "summer-sports.epub"
+    assert batches[1][0].metadata.filetype == "application/epub"
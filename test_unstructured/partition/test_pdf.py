@@ -11,6 +11,7 @@ from unstructured.documents.elements import (
     CoordinatesMetadata,
     ElementMetadata,
     NarrativeText,
+    PageBreak,
     Text,
     Title,
 )
@@ -166,7 +167,7 @@ def test_partition_pdf_with_model_name_env_var(
     monkeypatch,
     filename="example-docs/layout-parser-paper-fast.pdf",
 ):
-    monkeypatch.setattr(pdf, "extractable_elements", lambda *args, **kwargs: [])
+    monkeypatch.setattr(pdf, "is_pdf_text_extractable", lambda *args, **kwargs: False)
     with mock.patch.object(
         layout,
         "process_file_with_model",
@@ -186,7 +187,7 @@ def test_partition_pdf_with_model_name(
     monkeypatch,
     filename="example-docs/layout-parser-paper-fast.pdf",
 ):
-    monkeypatch.setattr(pdf, "extractable_elements", lambda *args, **kwargs: [])
+    monkeypatch.setattr(pdf, "is_pdf_text_extractable", lambda *args, **kwargs: False)
     with mock.patch.object(
         layout,
         "process_file_with_model",
@@ -299,7 +300,7 @@ def test_partition_pdf_falls_back_to_fast(
     mock_return = [Text("Hello there!")]
     with mock.patch.object(
         pdf,
-        "extractable_elements",
+        "iter_extractable_elements",
         return_value=mock_return,
     ) as mock_partition:
         pdf.partition_pdf(filename=filename, url=None, strategy="hi_res")
@@ -321,7 +322,7 @@ def test_partition_pdf_falls_back_to_fast_from_ocr_only(
     mock_return = [Text("Hello there!")]
     with mock.patch.object(
         pdf,
-        "extractable_elements",
+        "iter_extractable_elements",
         return_value=mock_return,
     ) as mock_partition:
         pdf.partition_pdf(filename=filename, url=None, strategy="ocr_only")
@@ -339,7 +340,7 @@ def test_partition_pdf_falls_back_to_hi_res_from_ocr_only(
         return dep not in ["pytesseract"]
 
     monkeypatch.setattr(strategies, "dependency_exists", mock_exists)
-    monkeypatch.setattr(pdf, "extractable_elements", lambda *args, **kwargs: [])
+    monkeypatch.setattr(pdf, "is_pdf_text_extractable", lambda *args, **kwargs: False)
 
     mock_return = [Text("Hello there!")]
     with mock.patch.object(
@@ -432,7 +433,7 @@ def test_partition_pdf_fails_if_pdf_not_processable(
         return dep not in ["unstructured_inference", "pytesseract"]
 
     monkeypatch.setattr(strategies, "dependency_exists", mock_exists)
-    monkeypatch.setattr(pdf, "extractable_elements", lambda *args, **kwargs: [])
+    monkeypatch.setattr(pdf, "is_pdf_text_extractable", lambda *args, **kwargs: False)
 
     with pytest.raises(ValueError):
         pdf.partition_pdf(filename=filename)
@@ -761,3 +762,81 @@ def test_partition_pdf_from_file_with_hi_res_strategy_custom_metadata_date(
         )
 
     assert elements[0].metadata.last_modified == expected_last_modification_date
+
+
+@pytest.mark.parametrize(
+    ("total_pages", "page_workers", "expected"),
+    [
+        (0, 2, []),
+        (3, 1, [(1, 1), (2, 2), (3, 3)]),
+        (10, 2, [(1, 2), (3, 4), (5, 6), (7, 8), (9, 10)]),
+        (17, 2, [(1, 3), (4, 6), (7, 9), (10, 12), (13, 15), (16, 17)]),
+    ],
+)
+def test_split_page_ranges(total_pages, page_workers, expected):
+    assert pdf._split_page_ranges(total_pages, page_workers) == expected
+
+
+@pytest.mark.parametrize("file_mode", ["filename", "rb"])
+def test_partition_pdf_with_page_workers_matches_serial(
+    file_mode,
+    filename="example-docs/layout-parser-paper-fast.pdf",
+):
+    if file_mode == "filename":
+        serial_elements = pdf.partition_pdf(filename=filename, strategy="fast")
+        parallel_elements = pdf.partition_pdf(filename=filename, strategy="fast", page_workers=2)
+    else:
+        with open(filename, "rb") as f:
+            serial_elements = pdf.partition_pdf(file=f, strategy="fast")
+        with open(filename, "rb") as f:
+            parallel_elements = pdf.partition_pdf(file=f, strategy="fast", page_workers=2)
+
+    assert [el.to_dict() for el in parallel_elements] == [el.to_dict() for el in serial_elements]
+    assert {el.metadata.page_number for el in parallel_elements} == {1, 2}
+
+
+def test_partition_pdf_with_page_workers_includes_page_breaks(
+    filename="example-docs/layout-parser-paper-fast.pdf",
+):
+    elements = pdf.partition_pdf(
+        filename=filename,
+        strategy="fast",
+        include_page_breaks=True,
+        page_workers=2,
+    )
+    assert [el.category for el in elements].count("PageBreak") == 2
+    assert isinstance(elements[-1], PageBreak)
+
+
+def test_partition_pdf_with_page_workers_in_daemonic_process_is_serial(
+    caplog,
+    filename="example-docs/layout-parser-paper-fast.pdf",
+):
+    serial_elements = pdf.partition_pdf(filename=filename, strategy="fast")
+    with mock.patch.object(pdf.mp, "current_process") as current_process, mock.patch.object(
+        pdf.mp,
+        "Pool",
+        side_effect=AssertionError("daemonic processes are not allowed to have children"),
+    ):
+        current_process.return_value.daemon = True
+        elements = pdf.partition_pdf(filename=filename, strategy="fast", page_workers=2)
+
+    assert [el.to_dict() for el in elements] == [el.to_dict() for el in serial_elements]
+    assert "daemonic process" in caplog.text
+
+
+def test_iter_partition_pdf_matches_partition_pdf(
+    filename="example-docs/layout-parser-paper-fast.pdf",
+):
+    elements = pdf.iter_partition_pdf(filename=filename, strategy="fast", include_page_breaks=True)
+
+    first_element = next(elements)
+    assert first_element.metadata.page_number == 1
+    assert [first_element.to_dict()] + [element.to_dict() for element in elements] == [
+        element.to_dict()
+        for element in pdf.partition_pdf(
+            filename=filename,
+            strategy="fast",
+            include_page_breaks=True,
+        )
+    ]
@@ -11,7 +11,7 @@ from unstructured.documents.elements import (
     Text,
     Title,
 )
-from unstructured.partition.pptx import partition_pptx
+from unstructured.partition.pptx import iter_partition_pptx, partition_pptx
 
 DIRECTORY = pathlib.Path(__file__).parent.resolve()
 EXAMPLE_DOCS_DIRECTORY = os.path.join(DIRECTORY, "..", "..", "example-docs")
@@ -322,3 +322,12 @@ def test_partition_pptx_from_file_with_custom_metadata_date(
         elements = partition_pptx(file=f, metadata_last_modified=expected_last_modification_date)
 
     assert elements[0].metadata.last_modified == expected_last_modification_date
+
+
+def test_iter_partition_pptx_matches_partition_pptx():
+    filename = os.path.join(EXAMPLE_DOCS_DIRECTORY, "fake-power-point-many-pages.pptx")
+    elements = iter_partition_pptx(filename=filename)
+    assert not isinstance(elements, list)
+    assert [element.to_dict() for element in elements] == [
+        element.to_dict() for element in partition_pptx(filename=filename)
+    ]
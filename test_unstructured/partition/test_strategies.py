@@ -1,4 +1,6 @@
 import os
+from tempfile import SpooledTemporaryFile
+from unittest import mock
 
 import pytest
 
@@ -43,6 +45,64 @@ def test_is_pdf_text_extractable(filename, from_file, expected):
     assert bool(extractable) is expected
 
 
+@pytest.mark.parametrize(
+    ("filename", "from_file", "expected"),
+    [
+        ("layout-parser-paper-fast.pdf", True, True),
+        ("copy-protected.pdf", True, True),
+        ("loremipsum-flat.pdf", True, False),
+        ("layout-parser-paper-fast.pdf", False, True),
+        ("copy-protected.pdf", False, True),
+        ("loremipsum-flat.pdf", False, False),
+    ],
+)
+def test_is_pdf_text_extractable_probe(filename, from_file, expected):
+    filename = os.path.join("example-docs", filename)
+
+    if from_file:
+        with open(filename, "rb") as f:
+            extractable = pdf.is_pdf_text_extractable(file=f)
+    else:
+        extractable = pdf.is_pdf_text_extractable(filename=filename)
+
+    assert extractable is expected
+
+
+def test_is_pdf_text_extractable_probe_with_spooled_file():
+    filename = os.path.join("example-docs", "layout-parser-paper-fast.pdf")
+    with open(filename, "rb") as f:
+        spooled_temp_file = SpooledTemporaryFile()
+        spooled_temp_file.write(f.read())
+    spooled_temp_file.seek(0)
+
+    assert pdf.is_pdf_text_extractable(file=spooled_temp_file) is True
+
+
+def test_is_pdf_text_extractable_probe_respects_env_var(monkeypatch):
+    filename = os.path.join("example-docs", "loremipsum-flat.pdf")
+    monkeypatch.setenv("UNSTRUCTURED_PDF_EXTRACTABLE_MAX_PAGES", "1")
+    assert pdf.is_pdf_text_extractable(filename=filename) is False
+
+
+def test_partition_pdf_skips_pdfminer_elements_unless_fast(monkeypatch):
+    def mock_exists(dep):
+        return dep not in ["unstructured_inference"]
+
+    monkeypatch.setattr(strategies, "dependency_exists", mock_exists)
+    monkeypatch.setattr(pdf, "is_pdf_text_extractable", lambda *args, **kwargs: False)
+    mock_ocr = mock.MagicMock(return_value=[])
+    monkeypatch.setattr(pdf, "_partition_pdf_or_image_with_ocr", mock_ocr)
+
+    with mock.patch.object(pdf, "iter_extractable_elements") as mock_extractable:
+        pdf.partition_pdf_or_image(
+            filename=os.path.join("example-docs", "loremipsum-flat.pdf"),
+            strategy="ocr_only",
+        )
+
+    mock_extractable.assert_not_called()
+    mock_ocr.assert_called_once()
+
+
 def test_determine_image_auto_strategy():
     strategy = strategies._determine_image_auto_strategy()
     assert strategy == "hi_res"
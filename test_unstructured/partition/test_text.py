@@ -4,9 +4,20 @@ import pathlib
 import pytest
 
 from unstructured.cleaners.core import group_broken_paragraphs
-from unstructured.documents.elements import Address, ListItem, NarrativeText, Title
+from unstructured.documents.elements import (
+    Address,
+    EmailAddress,
+    ListItem,
+    NarrativeText,
+    Text,
+    Title,
+)
+from unstructured.partition import text as text_module
 from unstructured.partition.text import (
+    classify_texts,
     combine_paragraphs_less_than_min,
+    iter_elements_from_lines,
+    iter_partition_text,
     partition_text,
     split_content_to_fit_max,
 )
@@ -231,6 +242,24 @@ def test_partition_text_extract_regex_metadata():
         assert element.metadata.filename is None
 
 
+def test_partition_text_inspects_signature_once(mocker):
+    mocker.patch("inspect.signature", side_effect=AssertionError("signature inspected on call"))
+    text = "SPEAKER 1: It is my turn to speak now!"
+
+    for partition in (partition_text, lambda **kwargs: list(iter_partition_text(**kwargs))):
+        elements = partition(
+            text=text,
+            metadata_filename="speeches/speech.txt",
+            regex_metadata={"speaker": r"SPEAKER \d{1,3}"},
+        )
+        assert elements[0].metadata.regex_metadata == {
+            "speaker": [{"text": "SPEAKER 1", "start": 0, "end": 9}],
+        }
+        assert elements[0].metadata.filename == "speech.txt"
+        assert elements[0].metadata.file_directory == "speeches"
+        assert elements[0].metadata.filetype == "text/plain"
+
+
 def test_partition_text_splits_long_text(filename="example-docs/norwich-city.txt"):
     elements = partition_text(filename=filename)
     assert len(elements) > 0
@@ -331,6 +360,24 @@ def test_combine_paragraphs_less_than_min():
     assert len(segments) < len(SHORT_PARAGRAPHS)
 
 
+def test_combine_paragraphs_less_than_min_respects_max_partition():
+    segments = combine_paragraphs_less_than_min(
+        ["Hi.", "Hello there.", "A long enough paragraph.", "Bye.", "See you."],
+        max_partition=20,
+        min_partition=10,
+    )
+    assert segments == ["Hi. Hello there.", "A long enough paragraph.", "Bye. See you."]
+
+
+def test_combine_paragraphs_less_than_min_without_max_partition():
+    segments = combine_paragraphs_less_than_min(
+        ["A long enough paragraph.", "Hi.", "Hello there.", "Another long paragraph."],
+        max_partition=None,
+        min_partition=10,
+    )
+    assert segments == ["A long enough paragraph.", "Hi. Hello there. Another long paragraph."]
+
+
 def test_partition_text_doesnt_get_page_breaks():
     text = "--------------------"
     elements = partition_text(text=text)
@@ -464,3 +511,74 @@ def test_partition_text_from_text_with_custom_metadata_date(
     elements = partition_text(text=text, metadata_last_modified=expected_last_modification_date)
 
     assert elements[0].metadata.last_modified == expected_last_modification_date
+
+
+def test_iter_partition_text_matches_partition_text(filename="example-docs/norwich-city.txt"):
+    elements = iter_partition_text(filename=filename, regex_metadata={"city": r"Norwich"})
+    assert not isinstance(elements, list)
+    assert [element.to_dict() for element in elements] == [
+        element.to_dict()
+        for element in partition_text(filename=filename, regex_metadata={"city": r"Norwich"})
+    ]
+
+
+def test_iter_partition_text_classifies_paragraphs_in_batches(monkeypatch):
+    monkeypatch.setattr(text_module, "STREAMING_BATCH_SIZE", 2)
+    batch_sizes = []
+    elements_from_texts = text_module.elements_from_texts
+
+    def record_elements_from_texts(texts):
+        batch_sizes.append(len(texts))
+        return elements_from_texts(texts)
+
+    monkeypatch.setattr(text_module, "elements_from_texts", record_elements_from_texts)
+    text = "\n\n".join(f"This is paragraph number {i}." for i in range(5))
+
+    elements = iter_partition_text(text=text)
+    assert next(elements).text == "This is paragraph number 0."
+    assert batch_sizes == [2]
+    assert [element.text for element in elements][-1] == "This is paragraph number 4."
+    assert batch_sizes == [2, 2, 1]
+
+
+def test_iter_partition_text_works_with_empty_string():
+    assert list(iter_partition_text(text="")) == []
+
+
+@pytest.mark.parametrize(
+    "line_break",
+    ["\n", "\n\n"],
+)
+def test_iter_elements_from_lines_matches_partition_text(line_break):
+    # NOTE(agent) - The document is long enough that its lines are grouped as they are read
+    lines = []
+    for i in range(1500):
+        lines.extend(
+            [
+                f"Section {i}",
+                f"  The big red fox number {i} is walking down the lane.",
+                "the fox met a bear. ",
+                "• Hamburgers are delicious",
+            ],
+        )
+        lines.extend(line_break.split("\n")[1:])
+    text = "\n".join(lines)
+
+    elements = iter_elements_from_lines(lines, max_partition=200, min_partition=20)
+    assert not isinstance(elements, list)
+    assert [(element.category, element.text) for element in elements] == [
+        (element.category, element.text)
+        for element in partition_text(text=text, max_partition=200, min_partition=20)
+    ]
+
+
+def test_classify_texts():
+    texts = [
+        "● An excellent point!",
+        "fake@gmail.com",
+        "Doylestown, PA 18901",
+        "Jane kicked the ball.",
+        "Intellectual Property",
+        "7",
+    ]
+    assert classify_texts(texts) == [ListItem, EmailAddress, Address, NarrativeText, Title, Text]
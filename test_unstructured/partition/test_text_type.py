@@ -7,6 +7,7 @@ from test_unstructured.nlp.mock_nltk import (
     mock_sent_tokenize,
     mock_word_tokenize,
 )
+from unstructured.documents.elements import NarrativeText, Text, Title
 from unstructured.partition import text_type
 
 
@@ -185,6 +186,45 @@ def test_contains_verb(text, expected, monkeypatch):
     assert has_verb is expected
 
 
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Ask the teacher for an apple", True),
+        ("Intellectual property", False),
+        ("THIS MESSAGE WAS APPROVED", True),
+        ("I am going to run to the store to pick up some milk.", True),
+        ("A friendly dog", False),
+        ("The company provides services to its customers.", True),
+        ("The annual reports of the company", False),
+        ("Revenue increased by 10 percent", True),
+        ("It's a nice day", True),
+        ("John's car", False),
+        ("I can't go", True),
+        ("Let's work together", True),
+        ("The morning in the city", False),
+        ("ITEM 1A. RISK FACTORS", False),
+    ],
+)
+def test_contains_verb_with_heuristic_verb_detector(text, expected):
+    assert text_type.contains_verb(text, verb_detector="heuristic") is expected
+
+
+def test_contains_verbs_uses_verb_detector_from_environment(monkeypatch):
+    monkeypatch.setenv("UNSTRUCTURED_VERB_DETECTOR", "heuristic")
+    monkeypatch.setattr(
+        text_type,
+        "pos_tag_texts",
+        lambda texts: pytest.fail("the POS tagger was used"),
+    )
+    assert text_type.contains_verbs(["Jane kicked the ball.", "A friendly dog"]) == [True, False]
+    assert text_type.TextTypeConfig.from_environment().verb_detector == "heuristic"
+
+
+def test_contains_verb_raises_with_unknown_verb_detector():
+    with pytest.raises(ValueError):
+        text_type.contains_verb("Jane kicked the ball.", verb_detector="not-a-detector")
+
+
 @pytest.mark.parametrize(
     ("text", "expected"),
     [
@@ -230,10 +270,12 @@ def test_set_caps_ratio_with_environment_variable(monkeypatch):
     monkeypatch.setenv("UNSTRUCTURED_NARRATIVE_TEXT_CAP_THRESHOLD", 0.8)
 
     text = "All The King's Horses. And All The King's Men."
-    with patch.object(text_type, "exceeds_cap_ratio", return_value=False) as mock_exceeds:
+    with patch.object(text_type, "_exceeds_cap_ratio", return_value=False) as mock_exceeds:
         text_type.is_possible_narrative_text(text)
 
-    mock_exceeds.assert_called_once_with(text, threshold=0.8)
+    mock_exceeds.assert_called_once()
+    assert mock_exceeds.call_args.args[0].text == text
+    assert mock_exceeds.call_args.kwargs == {"threshold": 0.8}
 
 
 def test_set_title_non_alpha_threshold_with_environment_variable(monkeypatch):
@@ -280,6 +322,82 @@ def test_item_titles():
     assert text_type.sentence_count(text, 3) < 2
 
 
+TEXT_TYPE_EXAMPLES = [
+    "Ask the teacher for an apple.",
+    "Ask Me About Intellectual Property",
+    "7",
+    "intellectual property",
+    "Intellectual Property",
+    "Ask the teacher for an apple. You might a gold star.",
+    "ITEM 1A. RISK FACTORS",
+    "To My Dearest Friends,",
+    "/--------BREAK-------/",
+    "1. Unstructured Technologies",
+    "LOOK AT THIS IT IS CAPS BUT NOT A TITLE.",
+    "Я говорю по-русски. Вы тоже?",
+    "",
+]
+
+
+def test_get_text_types_matches_single_text_checks():
+    expected = []
+    for text in TEXT_TYPE_EXAMPLES:
+        if text_type.is_possible_narrative_text(text):
+            expected.append(NarrativeText)
+        elif text_type.is_possible_title(text):
+            expected.append(Title)
+        else:
+            expected.append(Text)
+
+    assert text_type.get_text_types(TEXT_TYPE_EXAMPLES) == expected
+
+
+def test_get_text_types_tags_parts_of_speech_once(monkeypatch):
+    calls = []
+
+    def mock_pos_tag_texts(texts):
+        calls.append(texts)
+        return [mock_pos_tag(text) for text in texts]
+
+    monkeypatch.setattr(text_type, "pos_tag_texts", mock_pos_tag_texts)
+    texts = ["Ask the teacher for an apple.", "intellectual property", "Ask for a gold star."]
+
+    assert text_type.get_text_types(texts) == [NarrativeText, Title, NarrativeText]
+    assert calls == [texts]
+
+
+def test_get_text_types_with_narrative_not_allowed():
+    texts = ["Jane kicked the ball.", "Jane kicked the ball."]
+    assert text_type.get_text_types(texts, narrative_allowed=[False, True]) == [
+        Title,
+        NarrativeText,
+    ]
+
+
+def test_get_text_types_with_heuristic_verb_detector(monkeypatch):
+    monkeypatch.setattr(
+        text_type,
+        "pos_tag_texts",
+        lambda texts: pytest.fail("the POS tagger was used"),
+    )
+    config = text_type.TextTypeConfig(verb_detector="heuristic")
+    texts = ["Ask the teacher for an apple.", "intellectual property", "7"]
+    assert text_type.get_text_types(texts, config=config) == [NarrativeText, Title, Text]
+
+
+def test_text_type_config_reads_environment(monkeypatch):
+    monkeypatch.setenv("UNSTRUCTURED_LANGUAGE", "")
+    monkeypatch.setenv("UNSTRUCTURED_LANGUAGE_CHECKS", "true")
+    monkeypatch.setenv("UNSTRUCTURED_TITLE_MAX_WORD_LENGTH", "3")
+
+    config = text_type.TextTypeConfig.from_environment(title_max_word_length=12)
+
+    assert config.language == ""
+    assert config.language_checks is True
+    assert config.title_max_word_length == 3
+    assert text_type.get_text_types(["A Title With Five Words"], config=config) == [Text]
+
+
 @pytest.mark.parametrize(
     ("text", "expected"),
     [
@@ -1,7 +1,7 @@
 from test_unstructured.partition.test_constants import EXPECTED_TABLE, EXPECTED_TEXT
 from unstructured.cleaners.core import clean_extra_whitespace
 from unstructured.documents.elements import Table
-from unstructured.partition.xlsx import partition_xlsx
+from unstructured.partition.xlsx import iter_partition_xlsx, partition_xlsx
 from unstructured.utils import dependency_exists
 
 EXPECTED_FILETYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
@@ -167,3 +167,14 @@ def test_partition_xlsx_from_file_with_custom_metadata_date(
         elements = partition_xlsx(file=f, metadata_last_modified=expected_last_modification_date)
 
     assert elements[0].metadata.last_modified == expected_last_modification_date
+
+
+def test_iter_partition_xlsx_yields_one_table_per_sheet(filename="example-docs/stanley-cups.xlsx"):
+    elements = iter_partition_xlsx(filename=filename)
+
+    first_element = next(elements)
+    assert first_element.metadata.page_number == 1
+    assert first_element.metadata.filetype == EXPECTED_FILETYPE
+    assert [first_element.to_dict()] + [element.to_dict() for element in elements] == [
+        element.to_dict() for element in partition_xlsx(filename=filename)
+    ]
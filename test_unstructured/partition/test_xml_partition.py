@@ -3,7 +3,12 @@ import pathlib
 
 import pytest
 
-from unstructured.partition.xml import partition_xml
+from unstructured.partition.text import partition_text
+from unstructured.partition.xml import (
+    get_leaf_elements,
+    iter_partition_xml,
+    partition_xml,
+)
 
 DIRECTORY = pathlib.Path(__file__).parent.resolve()
 
@@ -231,3 +236,82 @@ def test_partition_xml_from_file_with_custom_metadata_date(
         elements = partition_xml(file=f, metadata_last_modified=expected_last_modification_date)
 
     assert elements[0].metadata.last_modified == expected_last_modification_date
+
+
+@pytest.mark.parametrize(
+    "xml_keep_tags",
+    [True, False],
+)
+def test_iter_partition_xml_matches_partition_xml(xml_keep_tags, filename="factbook.xml"):
+    file_path = os.path.join(DIRECTORY, "..", "..", "example-docs", filename)
+    elements = iter_partition_xml(filename=file_path, xml_keep_tags=xml_keep_tags)
+    assert not isinstance(elements, list)
+    assert [element.to_dict() for element in elements] == [
+        element.to_dict()
+        for element in partition_xml(filename=file_path, xml_keep_tags=xml_keep_tags)
+    ]
+
+
+def _write_large_xml(path, record_count=2500):
+    with open(path, "w") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n<records>\n')
+        for i in range(record_count):
+            f.write(
+                f"  <record><name>Record {i}</name><empty/>"
+                f"<notes><note>The fox number {i} met a bear.</note></notes></record>\n",
+            )
+        f.write("</records>\n")
+
+
+@pytest.mark.parametrize(
+    "xml_keep_tags",
+    [True, False],
+)
+def test_partition_xml_streams_large_document(tmp_path, xml_keep_tags):
+    filename = str(tmp_path / "records.xml")
+    _write_large_xml(filename)
+    if xml_keep_tags:
+        with open(filename) as f:
+            text = f.read()
+    else:
+        text = "\n".join(f"Record {i}\nThe fox number {i} met a bear." for i in range(2500))
+
+    elements = partition_xml(filename=filename, xml_keep_tags=xml_keep_tags)
+
+    assert [(element.category, element.text) for element in elements] == [
+        (element.category, element.text) for element in partition_text(text=text)
+    ]
+
+
+@pytest.mark.parametrize(
+    "xml_keep_tags",
+    [True, False],
+)
+def test_partition_xml_with_non_utf_8_text_after_the_detection_sample(tmp_path, xml_keep_tags):
+    filename = str(tmp_path / "records.xml")
+    with open(filename, "w", encoding="latin-1") as f:
+        f.write('<?xml version="1.0"?>\n<records>\n')
+        for i in range(4000):
+            f.write(f"  <record><name>Record {i}</name><padding>{'-' * 300}</padding></record>\n")
+        f.write("  <record><name>Caf\xe9</name></record>\n</records>\n")
+    assert os.path.getsize(filename) > 1024 * 1024
+
+    elements = partition_xml(filename=filename, xml_keep_tags=xml_keep_tags)
+    assert any("Caf\xe9" in element.text for element in elements[-2:])
+    with open(filename, "rb") as f:
+        assert partition_xml(file=f, xml_keep_tags=xml_keep_tags) == elements
+
+
+@pytest.mark.parametrize(
+    ("xml_path", "expected"),
+    [
+        (".", "Record 0\nThe fox number 0 met a bear.\nRecord 1\nThe fox number 1 met a bear."),
+        ("./record[2]", "Record 1\nThe fox number 1 met a bear."),
+        ("./record/notes", "The fox number 0 met a bear.\nThe fox number 1 met a bear."),
+    ],
+)
+def test_get_leaf_elements_with_xml_path(tmp_path, xml_path, expected):
+    filename = str(tmp_path / "records.xml")
+    _write_large_xml(filename, record_count=2)
+
+    assert get_leaf_elements(filename=filename, xml_path=xml_path) == expected
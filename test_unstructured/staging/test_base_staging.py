@@ -1,5 +1,6 @@
 import csv
 import json
+import math
 import os
 import pathlib
 import platform
@@ -172,6 +173,117 @@ def test_read_and_write_json_with_encoding(
     assert elements == new_elements_filename
 
 
+def test_elements_to_json_compact_round_trip():
+    metadata = ElementMetadata(filename="fake-file.txt", page_number=2)
+    elements = [
+        Title(text="Café", metadata=metadata, element_id="1"),
+        NarrativeText(text="narrative", metadata=metadata, element_id="2"),
+    ]
+
+    elements_str = base.elements_to_json(elements, indent=None)
+    assert "\n" not in elements_str
+    assert elements_str == json.dumps(base.convert_to_dict(elements), separators=(",", ":"))
+    assert base.elements_from_json(text=elements_str) == elements
+
+    elements_str = base.elements_to_json(elements, indent=None, ensure_ascii=False)
+    assert "Café" in elements_str
+    assert base.elements_from_json(text=elements_str) == elements
+
+
+@pytest.mark.parametrize("orjson_installed", [True, False])
+def test_elements_to_json_escapes_non_ascii_characters(tmpdir, monkeypatch, orjson_installed):
+    if not orjson_installed:
+        monkeypatch.setattr(base, "dependency_exists", lambda dependency: False)
+    filename = os.path.join(tmpdir, "fake-elements.json")
+    elements = [Title(text="Café", element_id="1")]
+
+    base.elements_to_json(elements, filename=filename, indent=2, encoding="ascii")
+    with open(filename, encoding="ascii") as f:
+        assert f.read() == json.dumps(base.convert_to_dict(elements), indent=2)
+    assert base.elements_from_json(filename=filename, encoding="ascii") == elements
+
+    with pytest.raises(UnicodeEncodeError):
+        base.elements_to_json(
+            elements,
+            filename=filename,
+            indent=2,
+            encoding="ascii",
+            ensure_ascii=False,
+        )
+
+
+@pytest.mark.parametrize("orjson_installed", [True, False])
+def test_json_dumps_matches_json_module(monkeypatch, orjson_installed):
+    if not orjson_installed:
+        monkeypatch.setattr(base, "dependency_exists", lambda dependency: False)
+    obj = [{"text": "naïve", "page_number": 1, "coordinates": None}]
+
+    assert base.json_dumps(obj) == json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    assert base.json_dumps(obj, indent=2) == json.dumps(obj, ensure_ascii=False, indent=2)
+    assert base.json_dumps(obj, indent=4) == json.dumps(obj, ensure_ascii=False, indent=4)
+    assert base.json_loads(base.json_dumps(obj)) == obj
+    for indent in (None, 2, 4):
+        assert base.json_dumps(obj, indent=indent, ensure_ascii=True) == json.dumps(
+            obj,
+            indent=indent,
+            separators=(",", ":") if indent is None else None,
+        )
+    obj = [{"text": "delete\x7f"}]
+    assert base.json_dumps(obj, ensure_ascii=True) == json.dumps(obj, separators=(",", ":"))
+
+
+@pytest.mark.parametrize("orjson_installed", [True, False])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_json_dumps_writes_non_finite_floats_like_json(monkeypatch, orjson_installed, indent):
+    if not orjson_installed:
+        monkeypatch.setattr(base, "dependency_exists", lambda dependency: False)
+    separators = (",", ":") if indent is None else None
+    for obj in ([math.nan], {"x": [1.0, math.inf]}, [None, -math.inf]):
+        assert base.json_dumps(obj, indent=indent) == json.dumps(
+            obj,
+            indent=indent,
+            separators=separators,
+        )
+    obj = [None, "null", 1.5]
+    assert base.json_dumps(obj, indent=indent) == json.dumps(
+        obj,
+        indent=indent,
+        separators=separators,
+    )
+
+
+@pytest.mark.parametrize("orjson_installed", [True, False])
+def test_json_dumps_round_trips_floats_with_exponents(monkeypatch, orjson_installed):
+    if not orjson_installed:
+        monkeypatch.setattr(base, "dependency_exists", lambda dependency: False)
+    obj = [1e-07, 1e16, 2.5e-300]
+
+    assert base.json_loads(base.json_dumps(obj)) == obj
+
+
+def test_json_loads_falls_back_for_nan():
+    assert math.isnan(base.json_loads('{"x": NaN}')["x"])
+
+
+def test_elements_to_jsonl_round_trip(tmpdir):
+    filename = os.path.join(tmpdir, "fake-elements.jsonl")
+    metadata = ElementMetadata(filename="fake-file.txt")
+    elements = [
+        Title(text="title", metadata=metadata, element_id="1"),
+        CheckBox(checked=True, metadata=metadata, element_id="2"),
+        Text(text="multiple\nlines", metadata=metadata, element_id="3"),
+    ]
+
+    base.elements_to_jsonl(iter(elements), filename=filename)
+    with open(filename) as f:
+        assert len(f.readlines()) == len(elements)
+    assert base.elements_from_jsonl(filename=filename) == elements
+
+    elements_str = base.elements_to_jsonl(elements)
+    assert base.elements_from_jsonl(text=elements_str + "\n") == elements
+    assert list(base.iter_elements_from_jsonl(text=elements_str)) == elements
+
+
 def test_filter_element_types_with_include_element_type(
     filename="example-docs/fake-text.txt",
 ):
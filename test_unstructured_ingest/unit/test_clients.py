@@ -0,0 +1,109 @@
+import logging
+import threading
+
+import pytest
+
+from unstructured.ingest import clients
+from unstructured.ingest.clients import create_pooled_session, get_client, reset_clients
+from unstructured.ingest.processor import init_worker
+
+
+@pytest.fixture(autouse=True)
+def _reset_clients():
+    reset_clients()
+    yield
+    reset_clients()
+
+
+class ClientFactory:
+    def __init__(self):
+        self.num_created = 0
+
+    def __call__(self):
+        self.num_created += 1
+        return object()
+
+
+def test_get_client_reuses_clients_with_the_same_key():
+    create_client = ClientFactory()
+
+    client = get_client(("test", "token-1"), create_client)
+    assert get_client(("test", "token-1"), create_client) is client
+    assert create_client.num_created == 1
+
+    assert get_client(("test", "token-2"), create_client) is not client
+    assert get_client(("other", "token-1"), create_client) is not client
+    assert create_client.num_created == 3
+
+
+def test_get_client_creates_a_shared_client_once_across_threads():
+    create_client = ClientFactory()
+    barrier = threading.Barrier(8)
+    thread_clients = []
+
+    def get_test_client():
+        barrier.wait()
+        thread_clients.append(get_client(("test",), create_client))
+
+    threads = [threading.Thread(target=get_test_client) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert create_client.num_created == 1
+    assert len({id(client) for client in thread_clients}) == 1
+
+
+def test_get_client_per_thread_creates_a_client_for_each_thread():
+    create_client = ClientFactory()
+    thread_clients = {}
+    # NOTE(agent) - Both threads stay alive until both have their clients, since the ident of
+    # a thread that has exited can be reused
+    barrier = threading.Barrier(2)
+
+    def get_test_clients(name):
+        thread_clients[name] = [
+            get_client(("test",), create_client, per_thread=True) for _ in range(2)
+        ]
+        barrier.wait()
+
+    threads = [threading.Thread(target=get_test_clients, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert thread_clients["a"][0] is thread_clients["a"][1]
+    assert thread_clients["b"][0] is thread_clients["b"][1]
+    assert thread_clients["a"][0] is not thread_clients["b"][0]
+    # NOTE(agent) - The per thread clients do not replace the shared client for the same key
+    assert get_client(("test",), create_client) is not thread_clients["a"][0]
+    assert create_client.num_created == 3
+
+
+def test_reset_clients_forgets_clients():
+    create_client = ClientFactory()
+    client = get_client(("test",), create_client)
+
+    reset_clients()
+    assert clients._clients == {}
+    assert get_client(("test",), create_client) is not client
+    assert create_client.num_created == 2
+
+
+def test_init_worker_resets_clients_inherited_from_the_parent_process():
+    create_client = ClientFactory()
+    client = get_client(("test",), create_client)
+
+    init_worker(logging.INFO)
+    assert get_client(("test",), create_client) is not client
+    assert create_client.num_created == 2
+
+
+def test_create_pooled_session():
+    session = create_pooled_session(pool_maxsize=4)
+    for prefix in ("https://", "http://"):
+        adapter = session.get_adapter(f"{prefix}example.com")
+        assert adapter._pool_maxsize == 4
+        assert adapter._pool_connections == 4
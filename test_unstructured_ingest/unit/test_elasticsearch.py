@@ -0,0 +1,245 @@
+import json
+import threading
+from unittest import mock
+
+import pytest
+
+from unstructured.ingest.clients import HTTP_POOL_MAXSIZE, reset_clients
+from unstructured.ingest.connector import elasticsearch
+from unstructured.ingest.connector.elasticsearch import (
+    ElasticsearchConnector,
+    ElasticsearchFileMeta,
+    ElasticsearchIngestDoc,
+    SimpleElasticsearchConfig,
+    compile_jq_query,
+)
+from unstructured.ingest.interfaces import StandardConnectorConfig
+
+INDEX_NAME = "movies"
+DOC_SOURCES = {str(i): {"title": f"Movie {i}", "year": 2000 + i} for i in range(10)}
+
+
+class FakeScan:
+    """Stands in for elasticsearch.helpers.scan, yielding a hit for each document in the
+    slice, with the _source fields requested by the query."""
+
+    def __init__(self, error_slice_id=None):
+        self.queries = []
+        self.scrolls = []
+        self.num_hits = 0
+        self.error_slice_id = error_slice_id
+        self._lock = threading.Lock()
+
+    def __call__(self, es, query, scroll, size, index):
+        assert index == INDEX_NAME
+        with self._lock:
+            self.queries.append(query)
+            self.scrolls.append(scroll)
+        slice_ = query.get("slice")
+        for i, (id, source) in enumerate(DOC_SOURCES.items()):
+            if slice_ is not None and i % slice_["max"] != slice_["id"]:
+                continue
+            if slice_ is not None and slice_["id"] == self.error_slice_id:
+                raise ConnectionError("Scroll failed")
+            hit = {"_id": id}
+            if query["_source"] is True:
+                hit["_source"] = source
+            elif query["_source"]:
+                hit["_source"] = {field: source[field] for field in query["_source"]}
+            with self._lock:
+                self.num_hits += 1
+            yield hit
+
+
+def mget(index, ids, source_includes):
+    docs = []
+    for id in ids:
+        if id == "3":
+            docs.append({"_id": id, "found": False})
+        else:
+            docs.append({"_id": id, "found": True, "_source": DOC_SOURCES[id]})
+    return mock.Mock(body={"docs": docs})
+
+
+@pytest.fixture()
+def es_client(monkeypatch):
+    reset_clients()
+    es_client = mock.Mock()
+    es_client.mget.side_effect = mget
+    monkeypatch.setattr(elasticsearch, "Elasticsearch", mock.Mock(return_value=es_client))
+    return es_client
+
+
+def get_connector(tmp_path, **kwargs):
+    connector = ElasticsearchConnector(
+        standard_config=StandardConnectorConfig(
+            download_dir=str(tmp_path / "download"),
+            output_dir=str(tmp_path / "output"),
+        ),
+        config=SimpleElasticsearchConfig(
+            url="http://localhost:9200",
+            index_name=INDEX_NAME,
+            jq_query=None,
+            **kwargs,
+        ),
+    )
+    connector.initialize()
+    return connector
+
+
+def test_config_rejects_unknown_fetch_modes():
+    with pytest.raises(ValueError, match="fetch_mode must be one of get, scan, mget"):
+        SimpleElasticsearchConfig(
+            url="http://localhost:9200",
+            index_name=INDEX_NAME,
+            jq_query=None,
+            fetch_mode="bulk",
+        )
+
+
+def test_parse_fields():
+    assert SimpleElasticsearchConfig.parse_fields(" title, year,,") == ["title", "year"]
+
+
+def test_compile_jq_query_compiles_each_query_once():
+    query = compile_jq_query("{title: .title}")
+    assert compile_jq_query("{title: .title}") is query
+    assert json.loads(query.input(DOC_SOURCES["1"]).text()) == {"title": "Movie 1"}
+
+
+def test_get_ingest_docs_in_get_mode_only_scans_ids(tmp_path, es_client, monkeypatch):
+    fake_scan = FakeScan()
+    monkeypatch.setattr(elasticsearch, "scan", fake_scan)
+    connector = get_connector(tmp_path)
+
+    docs = list(connector.get_ingest_docs())
+    assert [doc.file_meta.document_id for doc in docs] == list(DOC_SOURCES)
+    assert all(doc.document_source is None for doc in docs)
+    assert [query["_source"] for query in fake_scan.queries] == [False]
+    assert fake_scan.scrolls == ["30m"]
+    es_client.mget.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("fetch_mode", "expected_num_hits"),
+    [("get", 1), ("scan", 1), ("mget", 4)],
+)
+def test_get_ingest_docs_yields_docs_as_they_are_scanned(
+    tmp_path,
+    es_client,
+    monkeypatch,
+    fetch_mode,
+    expected_num_hits,
+):
+    fake_scan = FakeScan()
+    monkeypatch.setattr(elasticsearch, "scan", fake_scan)
+    connector = get_connector(tmp_path, fetch_mode=fetch_mode, batch_size=4)
+
+    docs = connector.get_ingest_docs()
+    assert next(docs).file_meta.document_id == "0"
+    # NOTE(agent) - In mget mode the first batch of ids is scanned before it is fetched
+    assert fake_scan.num_hits == expected_num_hits
+    assert len(list(docs)) == len(DOC_SOURCES) - (2 if fetch_mode == "mget" else 1)
+
+
+@pytest.mark.parametrize(
+    ("fields", "expected_source"),
+    [
+        (None, DOC_SOURCES["1"]),
+        (["title"], {"title": "Movie 1"}),
+    ],
+)
+def test_get_ingest_docs_in_scan_mode_carries_sources(
+    tmp_path,
+    es_client,
+    monkeypatch,
+    fields,
+    expected_source,
+):
+    monkeypatch.setattr(elasticsearch, "scan", FakeScan())
+    connector = get_connector(tmp_path, fetch_mode="scan", fields=fields)
+
+    docs = list(connector.get_ingest_docs())
+    assert len(docs) == len(DOC_SOURCES)
+    assert docs[1].document_source == expected_source
+    es_client.mget.assert_not_called()
+
+
+def test_get_ingest_docs_in_mget_mode_fetches_batches(tmp_path, es_client, monkeypatch):
+    monkeypatch.setattr(elasticsearch, "scan", FakeScan())
+    connector = get_connector(tmp_path, fetch_mode="mget", batch_size=4, fields=["title"])
+
+    docs = list(connector.get_ingest_docs())
+    # NOTE(agent) - Doc 3 was deleted between the scan and the mget
+    assert [doc.file_meta.document_id for doc in docs] == [id for id in DOC_SOURCES if id != "3"]
+    assert docs[0].document_source == DOC_SOURCES["0"]
+    assert [call.kwargs["ids"] for call in es_client.mget.call_args_list] == [
+        ["0", "1", "2", "3"],
+        ["4", "5", "6", "7"],
+        ["8", "9"],
+    ]
+    assert all(
+        call.kwargs["source_includes"] == ["title"] for call in es_client.mget.call_args_list
+    )
+
+
+def test_get_ingest_docs_with_sliced_scans(tmp_path, es_client, monkeypatch):
+    fake_scan = FakeScan()
+    monkeypatch.setattr(elasticsearch, "scan", fake_scan)
+    connector = get_connector(tmp_path, fetch_mode="scan", num_slices=3, batch_size=2)
+
+    docs = list(connector.get_ingest_docs())
+    assert sorted(doc.file_meta.document_id for doc in docs) == sorted(DOC_SOURCES)
+    assert all(doc.document_source == DOC_SOURCES[doc.file_meta.document_id] for doc in docs)
+    assert sorted(query["slice"]["id"] for query in fake_scan.queries) == [0, 1, 2]
+    assert all(query["slice"]["max"] == 3 for query in fake_scan.queries)
+
+
+def test_get_ingest_docs_raises_if_a_slice_fails(tmp_path, es_client, monkeypatch):
+    monkeypatch.setattr(elasticsearch, "scan", FakeScan(error_slice_id=1))
+    connector = get_connector(tmp_path, num_slices=3)
+
+    with pytest.raises(ConnectionError, match="Scroll failed"):
+        list(connector.get_ingest_docs())
+
+
+def get_doc(tmp_path, jq_query=None, document_source=None):
+    return ElasticsearchIngestDoc(
+        StandardConnectorConfig(
+            download_dir=str(tmp_path / "download"),
+            output_dir=str(tmp_path / "output"),
+        ),
+        SimpleElasticsearchConfig(
+            url="http://localhost:9200",
+            index_name=INDEX_NAME,
+            jq_query=jq_query,
+            fields=["title", "year"],
+        ),
+        ElasticsearchFileMeta(INDEX_NAME, "1"),
+        document_source=document_source,
+    )
+
+
+def test_get_file_fetches_the_document_with_the_client(tmp_path, es_client):
+    es_client.get.return_value = mock.Mock(body={"_source": DOC_SOURCES["1"]})
+    doc = get_doc(tmp_path, jq_query="{title: .title}")
+
+    doc.get_file()
+    es_client.get.assert_called_once_with(
+        index=INDEX_NAME,
+        id="1",
+        source_includes=["title", "year"],
+    )
+    elasticsearch.Elasticsearch.assert_called_once_with(
+        "http://localhost:9200",
+        connections_per_node=HTTP_POOL_MAXSIZE,
+    )
+    assert doc.filename.read_text() == "Movie 1"
+
+
+def test_get_file_uses_the_bulk_fetched_source(tmp_path, es_client):
+    doc = get_doc(tmp_path, document_source=DOC_SOURCES["1"])
+
+    doc.get_file()
+    es_client.get.assert_not_called()
+    assert doc.filename.read_text() == "Movie 1\n2001"
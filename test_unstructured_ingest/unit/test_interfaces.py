@@ -1,3 +1,4 @@
+import json
 import os
 import pathlib
 from dataclasses import dataclass
@@ -238,3 +239,43 @@ def test_process_file_flatten_metadata(mocker, partition_test_results):
     expected_keys = {"element_id", "text", "type", "filename", "data_source"}
     for elem in isd_elems:
         assert expected_keys == set(elem.keys())
+
+
+@pytest.mark.parametrize(("compact_output", "expected_lines"), [(False, 5), (True, 1)])
+def test_serialize_result_compact_output(compact_output, expected_lines):
+    test_ingest_doc = TestIngestDoc(
+        config=TEST_CONFIG,
+        standard_config=StandardConnectorConfig(
+            download_dir=TEST_DOWNLOAD_DIR,
+            output_dir=TEST_OUTPUT_DIR,
+            compact_output=compact_output,
+        ),
+    )
+    test_ingest_doc.isd_elems_no_filename = [{"text": "Café"}]
+    serialized = test_ingest_doc._serialize_result()
+    assert len(serialized.splitlines()) == expected_lines
+    assert "Café" in serialized
+
+
+@pytest.mark.parametrize("jsonl_output", [False, True])
+def test_write_result_jsonl_output(tmp_path, monkeypatch, jsonl_output):
+    output_filename = tmp_path / "output" / "test.json"
+    monkeypatch.setattr(TestIngestDoc, "_output_filename", output_filename)
+    test_ingest_doc = TestIngestDoc(
+        config=TEST_CONFIG,
+        standard_config=StandardConnectorConfig(
+            download_dir=TEST_DOWNLOAD_DIR,
+            output_dir=str(tmp_path),
+            jsonl_output=jsonl_output,
+        ),
+    )
+    isd_elems = [{"text": "Café", "type": "Title"}, {"text": "narrative", "type": "Text"}]
+    test_ingest_doc.isd_elems_no_filename = isd_elems
+    BaseIngestDoc.write_result(test_ingest_doc)
+
+    with open(output_filename, encoding="utf8") as f:
+        output = f.read()
+    if jsonl_output:
+        assert [json.loads(line) for line in output.splitlines()] == isd_elems
+    else:
+        assert json.loads(output) == isd_elems
@@ -0,0 +1,321 @@
+import os
+import time
+from multiprocessing.pool import ThreadPool
+
+import pytest
+
+from unstructured.ingest import processor
+from unstructured.ingest.connector.local import (
+    LocalConnector,
+    LocalIngestDoc,
+    SimpleLocalConfig,
+)
+from unstructured.ingest.interfaces import ProcessorConfigs, StandardConnectorConfig
+from unstructured.ingest.manifest import (
+    MANIFEST_FILENAME,
+    IngestManifest,
+    ManifestEntry,
+    get_file_content_hash,
+)
+
+
+@pytest.fixture()
+def output_dir(tmp_path):
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+    return output_dir
+
+
+def write_output(output_dir, name):
+    output_path = output_dir / f"{name}.json"
+    output_path.write_text("[]")
+    return str(output_path)
+
+
+def next_run(manifest):
+    # NOTE(agent) - Each run marks docs as seen with its start time, so runs need distinct times
+    manifest.close()
+    time.sleep(0.01)
+    return IngestManifest(manifest.path)
+
+
+def test_manifest_entries_persist_across_runs(output_dir):
+    manifest = IngestManifest.for_output_dir(str(output_dir))
+    entry = ManifestEntry(
+        output_path=str(output_dir / "a.json"),
+        version="etag-1",
+        date_modified="2023-01-01T00:00:00",
+        content_hash="abc",
+        record_locator='{"path": "a"}',
+        source_url="s3://bucket/a",
+    )
+    manifest.record(entry)
+
+    manifest = next_run(manifest)
+    assert manifest.path == str(output_dir / MANIFEST_FILENAME)
+    assert manifest.get(entry.output_path) == entry
+    assert manifest.get(str(output_dir / "b.json")) is None
+    manifest.close()
+
+
+@pytest.mark.parametrize(
+    ("version", "date_modified", "other_version", "other_date_modified", "expected"),
+    [
+        ("1", None, "1", None, True),
+        (None, "2023-01-01", None, "2023-01-01", True),
+        ("1", "2023-01-01", "2", "2023-01-01", False),
+        ("1", "2023-01-01", "1", "2023-01-02", False),
+        (None, None, None, None, False),
+    ],
+)
+def test_has_same_source_version(
+    version,
+    date_modified,
+    other_version,
+    other_date_modified,
+    expected,
+):
+    entry = ManifestEntry(output_path="a.json", version=version, date_modified=date_modified)
+    other = ManifestEntry(
+        output_path="a.json",
+        version=other_version,
+        date_modified=other_date_modified,
+    )
+    assert entry.has_same_source_version(other) is expected
+
+
+def test_get_file_content_hash(tmp_path):
+    filename = tmp_path / "a.txt"
+    filename.write_text("Hello")
+    content_hash = get_file_content_hash(filename)
+
+    assert content_hash == get_file_content_hash(filename)
+    filename.write_text("Hello!")
+    assert content_hash != get_file_content_hash(filename)
+
+
+def test_delete_removed_outputs_only_deletes_docs_not_seen(output_dir):
+    manifest = IngestManifest.for_output_dir(str(output_dir))
+    output_paths = {name: write_output(output_dir, name) for name in ("seen", "new", "removed")}
+    for name in ("seen", "removed"):
+        manifest.record(ManifestEntry(output_path=output_paths[name], version="1"))
+
+    manifest = next_run(manifest)
+    manifest.mark_seen(output_paths["seen"])
+    manifest.record(ManifestEntry(output_path=output_paths["new"], version="1"))
+
+    assert manifest.delete_removed_outputs() == [output_paths["removed"]]
+    assert os.path.exists(output_paths["seen"])
+    assert os.path.exists(output_paths["new"])
+    assert not os.path.exists(output_paths["removed"])
+    assert manifest.get(output_paths["removed"]) is None
+    assert manifest.get(output_paths["seen"]) is not None
+    manifest.close()
+
+
+def test_delete_removed_outputs_tolerates_missing_outputs(output_dir):
+    manifest = IngestManifest.for_output_dir(str(output_dir))
+    output_path = str(output_dir / "missing.json")
+    manifest.record(ManifestEntry(output_path=output_path, version="1"))
+
+    manifest = next_run(manifest)
+    assert manifest.delete_removed_outputs() == [output_path]
+    assert manifest.get(output_path) is None
+    manifest.close()
+
+
+def test_delete_removed_outputs_keeps_outputs_outside_the_output_dir(tmp_path, output_dir):
+    manifest = IngestManifest.for_output_dir(str(output_dir))
+    outside_path = tmp_path / "not-an-output.json"
+    outside_path.write_text("[]")
+    manifest.record(ManifestEntry(output_path=str(outside_path), version="1"))
+    manifest.record(
+        ManifestEntry(output_path=str(output_dir / ".." / "not-an-output.json"), version="1"),
+    )
+
+    manifest = next_run(manifest)
+    assert manifest.delete_removed_outputs() == []
+    assert outside_path.exists()
+    manifest.close()
+
+
+@pytest.fixture()
+def input_dir(tmp_path):
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    for name in ("a", "b", "c"):
+        (input_dir / f"{name}.txt").write_text(f"This is document {name}.")
+    return input_dir
+
+
+@pytest.fixture()
+def partitioned_files(monkeypatch):
+    """Runs the processor in threads and records which files are partitioned."""
+    partitioned_files = []
+    process_file = LocalIngestDoc.process_file
+
+    def record_process_file(self, **partition_kwargs):
+        partitioned_files.append(os.path.basename(self.path))
+        return process_file(self, **partition_kwargs)
+
+    monkeypatch.setattr(LocalIngestDoc, "process_file", record_process_file)
+    monkeypatch.setattr(processor.mp, "Pool", lambda processes, **kwargs: ThreadPool(processes))
+    return partitioned_files
+
+
+def run_incremental(input_dir, output_dir, **kwargs):
+    connector = LocalConnector(
+        standard_config=StandardConnectorConfig(
+            download_dir=str(input_dir),
+            output_dir=str(output_dir),
+        ),
+        config=SimpleLocalConfig(input_path=str(input_dir)),
+    )
+    processor_config = ProcessorConfigs(
+        partition_strategy="fast",
+        partition_ocr_languages="eng",
+        partition_pdf_infer_table_structure=False,
+        partition_encoding=None,
+        num_processes=2,
+        reprocess=False,
+        max_docs=None,
+        incremental=True,
+        **kwargs,
+    )
+    processor.process_documents(connector, processor_config, verbose=False)
+    # NOTE(agent) - Each run marks docs as seen with its start time, so runs need distinct times
+    time.sleep(0.01)
+
+
+def touch(path, content=None):
+    if content is not None:
+        path.write_text(content)
+    mtime = os.path.getmtime(path) + 10
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.mark.parametrize("download_workers", [0, 2])
+def test_incremental_run_only_partitions_new_and_changed_docs(
+    input_dir,
+    output_dir,
+    partitioned_files,
+    download_workers,
+):
+    run_incremental(input_dir, output_dir, download_workers=download_workers)
+    assert sorted(partitioned_files) == ["a.txt", "b.txt", "c.txt"]
+    assert sorted(os.listdir(output_dir)) == [
+        MANIFEST_FILENAME,
+        "a.txt.json",
+        "b.txt.json",
+        "c.txt.json",
+    ]
+
+    partitioned_files.clear()
+    run_incremental(input_dir, output_dir, download_workers=download_workers)
+    assert partitioned_files == []
+
+    partitioned_files.clear()
+    touch(input_dir / "b.txt", content="This document has changed.")
+    touch(input_dir / "c.txt")
+    (input_dir / "d.txt").write_text("This is a new document.")
+    run_incremental(input_dir, output_dir, download_workers=download_workers)
+    # NOTE(agent) - c.txt has a new mtime but the same content, so it is fetched and skipped
+    assert sorted(partitioned_files) == ["b.txt", "d.txt"]
+    assert "This document has changed." in (output_dir / "b.txt.json").read_text()
+
+
+def test_incremental_run_reprocesses_docs_with_missing_outputs(
+    input_dir,
+    output_dir,
+    partitioned_files,
+):
+    run_incremental(input_dir, output_dir)
+    (output_dir / "a.txt.json").unlink()
+
+    partitioned_files.clear()
+    run_incremental(input_dir, output_dir)
+    assert partitioned_files == ["a.txt"]
+    assert (output_dir / "a.txt.json").exists()
+
+
+def test_incremental_run_deletes_outputs_of_removed_docs(input_dir, output_dir, partitioned_files):
+    run_incremental(input_dir, output_dir)
+    (input_dir / "a.txt").unlink()
+
+    run_incremental(input_dir, output_dir)
+    assert (output_dir / "a.txt.json").exists()
+
+    run_incremental(input_dir, output_dir, delete_removed_outputs=True)
+    assert sorted(os.listdir(output_dir)) == [MANIFEST_FILENAME, "b.txt.json", "c.txt.json"]
+
+
+def test_incremental_run_does_not_delete_outputs_if_no_docs_are_listed(
+    input_dir,
+    output_dir,
+    partitioned_files,
+):
+    run_incremental(input_dir, output_dir)
+    for name in ("a", "b", "c"):
+        (input_dir / f"{name}.txt").unlink()
+
+    run_incremental(input_dir, output_dir, delete_removed_outputs=True)
+    assert sorted(os.listdir(output_dir)) == [
+        MANIFEST_FILENAME,
+        "a.txt.json",
+        "b.txt.json",
+        "c.txt.json",
+    ]
+
+
+def test_incremental_run_does_not_delete_outputs_with_max_docs(
+    input_dir,
+    output_dir,
+    partitioned_files,
+):
+    run_incremental(input_dir, output_dir)
+    (input_dir / "a.txt").unlink()
+    manifest = IngestManifest.for_output_dir(str(output_dir))
+    processor_ = processor.Processor(
+        doc_connector=None,
+        doc_processor_fn=None,
+        num_processes=1,
+        reprocess=False,
+        verbose=False,
+        max_docs=1,
+        manifest=manifest,
+        delete_removed_outputs=True,
+    )
+    processor_.num_docs_listed = 1
+
+    processor_._delete_removed_outputs()
+    manifest.close()
+    assert (output_dir / "a.txt.json").exists()
+
+
+@pytest.mark.parametrize("download_workers", [0, 2])
+def test_incremental_run_does_not_delete_outputs_if_listing_fails(
+    input_dir,
+    output_dir,
+    partitioned_files,
+    monkeypatch,
+    download_workers,
+):
+    run_incremental(input_dir, output_dir)
+    # NOTE(agent) - The first doc has changed, so the listing error is hit in the download stage
+    for name in ("a", "b", "c"):
+        touch(input_dir / f"{name}.txt", content=f"Document {name} has changed.")
+    get_ingest_docs = LocalConnector.get_ingest_docs
+
+    def fail_after_first_doc(self):
+        yield next(iter(get_ingest_docs(self)))
+        raise PermissionError("Failed to list docs")
+
+    monkeypatch.setattr(LocalConnector, "get_ingest_docs", fail_after_first_doc)
+    with pytest.raises(PermissionError, match="Failed to list docs"):
+        run_incremental(
+            input_dir,
+            output_dir,
+            download_workers=download_workers,
+            delete_removed_outputs=True,
+        )
+    assert sorted(os.listdir(output_dir))[-3:] == ["a.txt.json", "b.txt.json", "c.txt.json"]
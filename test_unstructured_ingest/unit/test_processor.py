@@ -0,0 +1,340 @@
+import threading
+import time
+from multiprocessing.pool import ThreadPool
+
+import pytest
+
+from unstructured.ingest import processor
+from unstructured.ingest.doc_processor.generalized import process_document
+from unstructured.ingest.processor import (
+    MAX_PENDING_DOCS_PER_PROCESS,
+    DocProcessingError,
+    DocTimeoutError,
+    Processor,
+    StageMetrics,
+    doc_time_limit,
+)
+
+
+class FakeDoc:
+    def __init__(self, name, events):
+        self.name = name
+        self.events = events
+        self._output_filename = f"/tmp/{name}.json"
+        self.filename = f"/tmp/{name}"
+
+    def __repr__(self):
+        return self.name
+
+    def get_file(self):
+        self.events.append((self.name, "get_file"))
+
+    def has_output(self):
+        return False
+
+    def write_result(self):
+        self.events.append((self.name, "write_result"))
+
+    def cleanup_file(self):
+        self.events.append((self.name, "cleanup_file"))
+
+    def process_file(self):
+        self.events.append((self.name, "process_file"))
+        if self.name == "bad":
+            raise ValueError("Failed to partition")
+        return []
+
+
+def get_processor(num_processes=1, **kwargs):
+    return Processor(
+        doc_connector=None,
+        doc_processor_fn=None,
+        num_processes=num_processes,
+        reprocess=False,
+        verbose=False,
+        max_docs=None,
+        **kwargs,
+    )
+
+
+def partition_doc(doc):
+    doc.events.append((doc.name, "partition"))
+    if doc.name == "bad":
+        raise ValueError("Failed to partition")
+    return doc
+
+
+def test_schedule_docs_bounds_pending_docs():
+    test_processor = get_processor(num_processes=1)
+    release = threading.Event()
+    pulled_docs = []
+
+    def docs():
+        for i in range(10):
+            pulled_docs.append(i)
+            yield i
+
+    def process_doc(doc):
+        release.wait(timeout=10)
+
+    with ThreadPool(processes=1) as pool:
+        scheduler = threading.Thread(
+            target=test_processor._schedule_docs,
+            args=(pool, docs(), process_doc),
+        )
+        scheduler.start()
+        time.sleep(0.2)
+        # NOTE(agent) - The scheduler has pulled the doc that waits for a free slot
+        assert len(pulled_docs) == MAX_PENDING_DOCS_PER_PROCESS + 1
+        release.set()
+        scheduler.join(timeout=10)
+        pool.close()
+        pool.join()
+
+    assert len(pulled_docs) == 10
+
+
+def test_schedule_docs_collects_worker_errors():
+    test_processor = get_processor()
+    results = []
+    errors = []
+
+    def process_doc(doc):
+        if doc == 2:
+            raise ValueError("Worker error")
+        return doc * 10
+
+    with ThreadPool(processes=2) as pool:
+        num_docs = test_processor._schedule_docs(
+            pool,
+            iter(range(4)),
+            process_doc,
+            on_result=lambda doc, result: results.append(result),
+            on_error=lambda doc, error: errors.append(doc),
+        )
+        pool.close()
+        pool.join()
+
+    assert num_docs == 4
+    assert sorted(results) == [0, 10, 30]
+    assert errors == [2]
+    assert [str(error) for error in test_processor.worker_errors] == ["Worker error"]
+
+
+@pytest.mark.parametrize("download_workers", [0, 2])
+def test_process_docs_raises_once_pool_drains(monkeypatch, download_workers):
+    events = []
+    docs = [FakeDoc(name, events) for name in ("a", "b", "c")]
+    test_processor = get_processor(
+        num_processes=2,
+        doc_partition_fn=partition_doc,
+        download_workers=download_workers,
+    )
+    test_processor.doc_processor_fn = lambda doc: doc.events.append((doc.name, "processed"))
+    process_doc_with_time_limit = processor.process_doc_with_time_limit
+    partition_doc_with_time_limit = processor.partition_doc_with_time_limit
+
+    def fail_for_b(fn, doc_timeout, doc):
+        if doc.name == "b":
+            raise RuntimeError("Worker died")
+        return process_doc_with_time_limit(fn, doc_timeout, doc)
+
+    def partition_or_fail_for_b(fn, doc_timeout, doc):
+        if doc.name == "b":
+            raise RuntimeError("Worker died")
+        return partition_doc_with_time_limit(fn, doc_timeout, doc)
+
+    monkeypatch.setattr(processor, "process_doc_with_time_limit", fail_for_b)
+    monkeypatch.setattr(processor, "partition_doc_with_time_limit", partition_or_fail_for_b)
+    monkeypatch.setattr(processor.mp, "Pool", lambda processes, **kwargs: ThreadPool(processes))
+
+    with pytest.raises(DocProcessingError, match="1 of 3 docs failed"):
+        test_processor._process_docs(iter(docs))
+
+    # NOTE(agent) - The other docs are still processed before the run fails
+    if download_workers:
+        assert ("a", "write_result") in events
+        assert ("c", "write_result") in events
+        assert ("b", "write_result") not in events
+        assert ("b", "cleanup_file") in events
+    else:
+        assert {name for name, _ in events} == {"a", "c"}
+
+
+def test_process_docs_passes_max_tasks_per_child(monkeypatch):
+    pool_kwargs = {}
+
+    def fake_pool(processes, **kwargs):
+        pool_kwargs.update(kwargs)
+        return ThreadPool(processes)
+
+    monkeypatch.setattr(processor.mp, "Pool", fake_pool)
+    test_processor = get_processor(max_tasks_per_child=5)
+    test_processor.doc_processor_fn = lambda doc: None
+
+    assert test_processor._process_docs(iter(range(3))) == 3
+    assert pool_kwargs["maxtasksperchild"] == 5
+    assert pool_kwargs["initializer"] is processor.init_worker
+
+
+def test_doc_time_limit_raises_for_slow_docs():
+    with pytest.raises(DocTimeoutError), doc_time_limit(0.1):
+        time.sleep(1)
+
+    with doc_time_limit(1):
+        time.sleep(0.01)
+
+
+def test_process_doc_with_time_limit_stops_slow_docs():
+    with pytest.raises(DocTimeoutError):
+        processor.process_doc_with_time_limit(lambda doc: time.sleep(doc), 0.1, 1)
+
+    processor.process_doc_with_time_limit(lambda doc: time.sleep(doc), None, 0.01)
+
+
+def test_partition_doc_with_time_limit_reports_timeouts_as_failed():
+    doc, error, seconds = processor.partition_doc_with_time_limit(
+        lambda doc: time.sleep(1),
+        0.1,
+        "doc",
+    )
+    assert doc == "doc"
+    assert isinstance(error, DocTimeoutError)
+    assert seconds < 1
+
+
+def test_process_document_reraises_errors_after_cleaning_up():
+    events = []
+
+    with pytest.raises(ValueError, match="Failed to partition"):
+        process_document(FakeDoc("bad", events))
+    assert events == [("bad", "get_file"), ("bad", "process_file"), ("bad", "cleanup_file")]
+
+
+@pytest.mark.parametrize("download_workers", [0, 2])
+def test_process_docs_raises_if_a_doc_fails_to_process(monkeypatch, download_workers):
+    events = []
+    docs = [FakeDoc(name, events) for name in ("a", "bad", "c")]
+    test_processor = get_processor(
+        num_processes=2,
+        doc_partition_fn=partition_doc,
+        download_workers=download_workers,
+    )
+    test_processor.doc_processor_fn = process_document
+    monkeypatch.setattr(processor.mp, "Pool", lambda processes, **kwargs: ThreadPool(processes))
+
+    with pytest.raises(DocProcessingError, match="1 of 3 docs failed") as exc_info:
+        test_processor._process_docs(iter(docs))
+
+    assert str(exc_info.value.__cause__) == "Failed to partition"
+    for name in ("a", "c"):
+        assert (name, "write_result") in events
+
+
+def test_run_pipeline_runs_stages_in_order():
+    events = []
+    docs = [FakeDoc(name, events) for name in ("a", "bad", "c")]
+    test_processor = get_processor(
+        num_processes=2,
+        doc_partition_fn=partition_doc,
+        download_workers=2,
+    )
+
+    with ThreadPool(processes=2) as pool:
+        num_docs = test_processor._run_pipeline(pool, iter(docs))
+
+    assert num_docs == 3
+    for name in ("a", "c"):
+        doc_events = [event for doc_name, event in events if doc_name == name]
+        assert doc_events == ["get_file", "partition", "write_result", "cleanup_file"]
+    assert [event for doc_name, event in events if doc_name == "bad"] == [
+        "get_file",
+        "partition",
+        "cleanup_file",
+    ]
+    metrics = test_processor.stage_metrics
+    assert (metrics["download"].num_docs, metrics["download"].num_failed) == (3, 0)
+    assert (metrics["partition"].num_docs, metrics["partition"].num_failed) == (3, 1)
+    assert (metrics["write"].num_docs, metrics["write"].num_failed) == (3, 1)
+    assert [str(error) for error in test_processor.worker_errors] == ["Failed to partition"]
+
+
+def test_run_pipeline_reraises_errors_listing_docs():
+    events = []
+
+    def docs():
+        yield FakeDoc("a", events)
+        raise ConnectionError("Failed to list docs")
+
+    test_processor = get_processor(
+        num_processes=2,
+        doc_partition_fn=partition_doc,
+        download_workers=2,
+    )
+
+    with ThreadPool(processes=2) as pool, pytest.raises(
+        ConnectionError,
+        match="Failed to list docs",
+    ):
+        test_processor._run_pipeline(pool, docs())
+
+    # NOTE(agent) - The docs listed before the error are still processed
+    assert ("a", "write_result") in events
+
+
+def test_run_pipeline_keeps_handling_results_while_writer_is_blocked():
+    events = []
+    release_writer = threading.Event()
+    pulled_docs = []
+
+    class SlowWriteDoc(FakeDoc):
+        def write_result(self):
+            release_writer.wait(timeout=10)
+            super().write_result()
+
+    def docs():
+        for i in range(20):
+            pulled_docs.append(i)
+            yield SlowWriteDoc(str(i), events)
+
+    test_processor = get_processor(
+        num_processes=1,
+        doc_partition_fn=partition_doc,
+        download_workers=1,
+        download_queue_depth=1,
+        write_queue_depth=1,
+    )
+
+    with ThreadPool(processes=1) as pool:
+        pipeline = threading.Thread(target=test_processor._run_pipeline, args=(pool, docs()))
+        pipeline.start()
+        time.sleep(0.5)
+        num_write_slots = test_processor.write_queue_depth + MAX_PENDING_DOCS_PER_PROCESS
+        # NOTE(agent) - Every doc that holds a write slot has been partitioned, even though
+        # the writer is stuck on the first one, and the connector is held back
+        assert test_processor.stage_metrics["partition"].num_docs == num_write_slots
+        assert len(pulled_docs) < 20
+        release_writer.set()
+        pipeline.join(timeout=10)
+
+    assert not pipeline.is_alive()
+    assert test_processor.stage_metrics["write"].num_docs == 20
+
+
+def test_stage_metrics():
+    metrics = StageMetrics(name="partition", start_time=10.0)
+    metrics.record(2.0)
+    metrics.record(1.0, failed=True)
+    metrics.end_time = 14.0
+
+    assert (metrics.num_docs, metrics.num_failed) == (2, 1)
+    assert metrics.busy_seconds == 3.0
+    assert metrics.elapsed_seconds == 4.0
+    assert metrics.docs_per_second == 0.5
+    assert str(metrics) == "partition stage: 2 docs (1 failed) in 4.0s, 0.50 docs/s, 3.0s busy"
+
+
+def test_stage_metrics_without_docs():
+    metrics = StageMetrics(name="write")
+    assert metrics.elapsed_seconds == 0.0
+    assert metrics.docs_per_second == 0.0
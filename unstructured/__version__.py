@@ -1 +1 @@
-__version__ = "0.9.1"  # pragma: no cover
+__version__ = "0.9.2-dev24"  # pragma: no cover
@@ -154,10 +154,35 @@ def blank_line_grouper(
     return group_broken_paragraphs(text)
 
 
+# NOTE(agent) - The number of lines at the start of a document that are used to decide how
+# its paragraphs are grouped
+PARAGRAPH_GROUPER_MAX_LINE_COUNT = 2000
+
+
+def is_blank_line_grouped(
+    text: str,
+    line_split: re.Pattern = LINE_BREAK_RE,
+    max_line_count: int = PARAGRAPH_GROUPER_MAX_LINE_COUNT,
+    threshold: float = 0.1,
+) -> bool:
+    """Checks if the ratio of empty lines in the first max_line_count lines of the text is
+    greater than or equal to the threshold, in which case the document is considered a
+    blank-line grouping type."""
+    lines = line_split.split(text)
+    max_line_count = min(len(lines), max_line_count)
+    line_count, empty_line_count = 0, 0
+    for line in lines[:max_line_count]:
+        line_count += 1
+        if not line.strip():
+            empty_line_count += 1
+    ratio = empty_line_count / line_count
+    return ratio >= threshold
+
+
 def auto_paragraph_grouper(
     text: str,
     line_split: re.Pattern = LINE_BREAK_RE,
-    max_line_count: int = 2000,
+    max_line_count: int = PARAGRAPH_GROUPER_MAX_LINE_COUNT,
     threshold: float = 0.1,
 ) -> str:
     """
@@ -171,21 +196,12 @@ def auto_paragraph_grouper(
     the document is considered a blank-line grouping type
     and passed on to blank_line_grouper function
     """
-    lines = line_split.split(text)
-    max_line_count = min(len(lines), max_line_count)
-    line_count, empty_line_count = 0, 0
-    for line in lines[:max_line_count]:
-        line_count += 1
-        if not line.strip():
-            empty_line_count += 1
-    ratio = empty_line_count / line_count
-
     # NOTE(klaijan) - for ratio < threshold, we pass to new-line grouper,
     # otherwise to blank-line grouper
-    if ratio < threshold:
-        return new_line_grouper(text)
-    else:
+    if is_blank_line_grouped(text, line_split, max_line_count, threshold):
         return blank_line_grouper(text)
+    else:
+        return new_line_grouper(text)
 
 
 # TODO(robinson) - There's likely a cleaner was to accomplish this and get all of the
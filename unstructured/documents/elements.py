@@ -8,9 +8,20 @@ import pathlib
 import re
 from abc import ABC
 from copy import deepcopy
-from dataclasses import dataclass
-from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Tuple, TypedDict, Union, cast
+from dataclasses import dataclass, fields
+from functools import lru_cache, wraps
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    TypedDict,
+    Union,
+    cast,
+)
 
 from unstructured.documents.coordinates import (
     TYPE_TO_COORDINATE_SYSTEM_MAP,
@@ -25,6 +36,25 @@ class NoID(ABC):
     pass
 
 
+def _slotted(cls):
+    """Class decorator that recreates a dataclass with __slots__ for its fields, so instances
+    don't carry a __dict__. The decorator must be applied after @dataclass. This does what
+    @dataclass(slots=True) does, which is only available from Python 3.10."""
+    field_names = tuple(field.name for field in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    # NOTE(agent) - dataclass keeps the field defaults as class attributes, which would
+    # conflict with the slots. The generated __init__ has its own copy of the defaults.
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    cls_dict["__slots__"] = field_names
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
+
+
+@_slotted
 @dataclass
 class DataSourceMetadata:
     """Metadata fields that pertain to the data source of the document."""
@@ -37,9 +67,14 @@ class DataSourceMetadata:
     date_processed: Optional[str] = None
 
     def to_dict(self):
-        return {key: value for key, value in self.__dict__.items() if value is not None}
+        return {
+            name: getattr(self, name)
+            for name in self.__slots__  # type: ignore
+            if getattr(self, name) is not None
+        }
 
 
+@_slotted
 @dataclass
 class CoordinatesMetadata:
     """Metadata fields that pertain to the coordinates of the element."""
@@ -118,6 +153,7 @@ class Link(TypedDict):
     url: str
 
 
+@_slotted
 @dataclass
 class ElementMetadata:
     coordinates: Optional[CoordinatesMetadata] = None
@@ -160,12 +196,20 @@ class ElementMetadata:
             self.filename = str(self.filename)
 
         if self.filename is not None:
-            file_directory, filename = os.path.split(self.filename)
-            self.file_directory = file_directory or None
+            file_directory, filename = _split_filename(self.filename)
+            # NOTE(agent) - Keeps a file_directory that was passed in alongside a filename
+            # without a directory, e.g. when elements are loaded back from their to_dict output
+            self.file_directory = file_directory or self.file_directory
             self.filename = filename
 
     def to_dict(self):
-        _dict = {key: value for key, value in self.__dict__.items() if value is not None}
+        # NOTE(agent) - The slots are the dataclass fields. Looking them up with fields() is
+        # much slower, which adds up when serializing every element of a document.
+        _dict = {
+            name: getattr(self, name)
+            for name in self.__slots__  # type: ignore
+            if getattr(self, name) is not None
+        }
         if "regex_metadata" in _dict and not _dict["regex_metadata"]:
             _dict.pop("regex_metadata")
         if self.data_source:
@@ -175,8 +219,11 @@ class ElementMetadata:
         return _dict
 
     @classmethod
-    def from_dict(cls, input_dict):
-        constructor_args = deepcopy(input_dict)
+    def from_dict(cls, input_dict, copy: bool = True):
+        """Creates metadata from the output of to_dict. Pass copy=False when nothing else holds
+        on to input_dict, e.g. a dict that was just parsed from JSON, to share its values rather
+        than deep copying them."""
+        constructor_args = deepcopy(input_dict) if copy else dict(input_dict)
         if constructor_args.get("coordinates", None) is not None:
             constructor_args["coordinates"] = CoordinatesMetadata.from_dict(
                 constructor_args["coordinates"],
@@ -184,9 +231,9 @@ class ElementMetadata:
         return cls(**constructor_args)
 
     def merge(self, other: ElementMetadata):
-        for k in self.__dict__:
-            if getattr(self, k) is None:
-                setattr(self, k, getattr(other, k))
+        for name in self.__slots__:  # type: ignore
+            if getattr(self, name) is None:
+                setattr(self, name, getattr(other, name))
         return self
 
     def get_last_modified(self) -> Optional[datetime.datetime]:
@@ -197,8 +244,37 @@ class ElementMetadata:
         return dt
 
 
+@lru_cache(maxsize=128)
+def _split_filename(filename: str) -> Tuple[str, str]:
+    # NOTE(agent) - Every element of a document gets the same filename, so the split is
+    # cached to share the same strings between the elements rather than a copy for each one
+    return os.path.split(filename)
+
+
+def _get_params_function(func: Callable) -> Callable[[tuple, dict], Dict[str, Any]]:
+    """Returns a function that maps the arguments of a call to func to the value of each of its
+    parameters, including the defaults of parameters that weren't passed. The signature of func
+    is only inspected here, once, because inspecting it on every call takes as long as
+    partitioning a short document."""
+    parameters = inspect.signature(func).parameters.values()
+    names = tuple(param.name for param in parameters)
+    defaults = {
+        param.name: param.default for param in parameters if param.default is not param.empty
+    }
+
+    def get_params(args: tuple, kwargs: dict) -> Dict[str, Any]:
+        params = dict(defaults)
+        params.update(zip(names, args))
+        params.update(kwargs)
+        return params
+
+    return get_params
+
+
 def process_metadata():
-    """Decorator for processing metadata for document elements."""
+    """Decorator for processing metadata for document elements. When the decorated function is
+    itself decorated with add_metadata_with_filetype, the two are fused into a single wrapper
+    that binds the arguments once and then adds the filetype and regex metadata."""
 
     def decorator(func: Callable):
         if func.__doc__:
@@ -220,32 +296,63 @@ def process_metadata():
                     attribute on the elements in the output."""
                 )
 
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            elements = func(*args, **kwargs)
-            sig = inspect.signature(func)
-            params = dict(**dict(zip(sig.parameters, args)), **kwargs)
-            for param in sig.parameters.values():
-                if param.name not in params and param.default is not param.empty:
-                    params[param.name] = param.default
+        # NOTE(agent) - add_metadata_with_filetype leaves the function it wraps and its
+        # add_metadata step on its wrapper, so they can be called from here directly
+        partition_func, add_metadata = getattr(func, "_add_metadata_with_filetype", (func, None))
+        get_params = _get_params_function(partition_func)
+
+        def finalize_metadata(elements: List[Element], params: Dict[str, Any], regex_metadata):
+            if add_metadata is not None:
+                elements = add_metadata(elements, params)
+            return _add_regex_metadata(elements, regex_metadata)
+
+        # NOTE(agent) - Generator functions (the iter_partition_* variants) are wrapped
+        # in a generator so that metadata is processed as each element is yielded
+        if inspect.isgeneratorfunction(partition_func):
 
-            regex_metadata: Dict["str", "str"] = params.get("regex_metadata", {})
-            elements = _add_regex_metadata(elements, regex_metadata)
+            @wraps(func)
+            def iter_wrapper(*args, **kwargs):
+                params = get_params(args, kwargs)
+                regex_metadata = _compile_regex_metadata(params.get("regex_metadata"))
+                for element in partition_func(*args, **kwargs):
+                    yield from finalize_metadata([element], params, regex_metadata)
 
-            return elements
+            return iter_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            elements = partition_func(*args, **kwargs)
+            params = get_params(args, kwargs)
+            regex_metadata = _compile_regex_metadata(params.get("regex_metadata"))
+            return finalize_metadata(elements, params, regex_metadata)
 
         return wrapper
 
     return decorator
 
 
+def _compile_regex_metadata(
+    regex_metadata: Optional[Dict[str, Union[str, Pattern]]],
+) -> Dict[str, Pattern]:
+    """Compiles the regex_metadata patterns once for a call, rather than looking each pattern up
+    in the re module cache for every element."""
+    if not regex_metadata:
+        return {}
+    return {field_name: re.compile(pattern) for field_name, pattern in regex_metadata.items()}
+
+
 def _add_regex_metadata(
     elements: List[Element],
-    regex_metadata: Dict[str, str] = {},
+    regex_metadata: Dict[str, Union[str, Pattern]] = {},
 ) -> List[Element]:
     """Adds metadata based on a user provided regular expression.
     The additional metadata will be added to the regex_metadata
     attrbuted in the element metadata."""
+    # NOTE(agent) - Without any patterns there is nothing to add, and an empty dict for every
+    # element would only take up memory. Empty regex_metadata is left out of to_dict either way.
+    if not regex_metadata:
+        return elements
+
     for element in elements:
         if isinstance(element, Text):
             _regex_metadata: Dict["str", List[RegexMetadata]] = {}
@@ -271,6 +378,10 @@ def _add_regex_metadata(
 class Element(ABC):
     """An element is a section of a page in the document."""
 
+    # NOTE(agent) - Elements are slotted so that documents with millions of elements don't
+    # carry a __dict__ for each of them. Subclasses that don't declare __slots__ still get one.
+    __slots__ = ("id", "metadata")
+
     def __init__(
         self,
         element_id: Union[str, NoID] = NoID(),
@@ -281,17 +392,15 @@ class Element(ABC):
         if metadata is None:
             metadata = ElementMetadata()
         self.id: Union[str, NoID] = element_id
-        coordinates_metadata = (
-            None
-            if coordinates is None and coordinate_system is None
-            else (
-                CoordinatesMetadata(
-                    points=coordinates,
-                    system=coordinate_system,
-                )
+        # NOTE(agent) - Coordinates only fill in metadata that doesn't already have them
+        if coordinates is not None or coordinate_system is not None:
+            coordinates_metadata = CoordinatesMetadata(
+                points=coordinates,
+                system=coordinate_system,
             )
-        )
-        self.metadata = metadata.merge(ElementMetadata(coordinates=coordinates_metadata))
+            if metadata.coordinates is None:
+                metadata.coordinates = coordinates_metadata
+        self.metadata = metadata
 
     def to_dict(self) -> dict:
         return {
@@ -327,6 +436,8 @@ class CheckBox(Element):
     """A checkbox with an attribute indicating whether its checked or not. Primarily used
     in documents that are forms"""
 
+    __slots__ = ("checked",)
+
     def __init__(
         self,
         element_id: Union[str, NoID] = NoID(),
@@ -335,7 +446,6 @@ class CheckBox(Element):
         checked: bool = False,
         metadata: Optional[ElementMetadata] = None,
     ):
-        metadata = metadata if metadata else ElementMetadata()
         super().__init__(
             element_id=element_id,
             coordinates=coordinates,
@@ -362,6 +472,8 @@ class Text(Element):
 
     category = "UncategorizedText"
 
+    __slots__ = ("text",)
+
     def __init__(
         self,
         text: str,
@@ -370,7 +482,6 @@ class Text(Element):
         coordinate_system: Optional[CoordinateSystem] = None,
         metadata: Optional[ElementMetadata] = None,
     ):
-        metadata = metadata if metadata else ElementMetadata()
         self.text: str = text
 
         if isinstance(element_id, NoID):
@@ -421,7 +532,7 @@ class FigureCaption(Text):
 
     category = "FigureCaption"
 
-    pass
+    __slots__ = ()
 
 
 class NarrativeText(Text):
@@ -430,7 +541,7 @@ class NarrativeText(Text):
 
     category = "NarrativeText"
 
-    pass
+    __slots__ = ()
 
 
 class ListItem(Text):
@@ -438,7 +549,7 @@ class ListItem(Text):
 
     category = "ListItem"
 
-    pass
+    __slots__ = ()
 
 
 class Title(Text):
@@ -446,7 +557,7 @@ class Title(Text):
 
     category = "Title"
 
-    pass
+    __slots__ = ()
 
 
 class Address(Text):
@@ -454,14 +565,15 @@ class Address(Text):
 
     category = "Address"
 
-    pass
+    __slots__ = ()
 
 
 class EmailAddress(Text):
     """A text element for capturing addresses"""
 
     category = "EmailAddress"
-    pass
+
+    __slots__ = ()
 
 
 class Image(Text):
@@ -469,7 +581,7 @@ class Image(Text):
 
     category = "Image"
 
-    pass
+    __slots__ = ()
 
 
 class PageBreak(Text):
@@ -477,13 +589,15 @@ class PageBreak(Text):
 
     category = "PageBreak"
 
+    __slots__ = ()
+
 
 class Table(Text):
     """An element for capturing tables."""
 
     category = "Table"
 
-    pass
+    __slots__ = ()
 
 
 class Header(Text):
@@ -491,7 +605,7 @@ class Header(Text):
 
     category = "Header"
 
-    pass
+    __slots__ = ()
 
 
 class Footer(Text):
@@ -499,7 +613,7 @@ class Footer(Text):
 
     category = "Footer"
 
-    pass
+    __slots__ = ()
 
 
 TYPE_TO_TEXT_ELEMENT_MAP: Dict[str, Any] = {
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import sys
-from typing import List, Optional, Sequence, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Type, Union
 
 if sys.version_info < (3, 8):
     from typing_extensions import Final
@@ -25,6 +25,7 @@ from unstructured.documents.elements import (
 from unstructured.documents.xml import VALID_PARSERS, XMLDocument
 from unstructured.logger import logger
 from unstructured.partition.text_type import (
+    get_text_types,
     is_bulleted_text,
     is_email_address,
     is_possible_narrative_text,
@@ -39,6 +40,7 @@ TABLE_TAGS: Final[List[str]] = ["table", "tbody", "td", "tr"]
 PAGEBREAK_TAGS: Final[List[str]] = ["hr"]
 HEADER_OR_FOOTER_TAGS: Final[List[str]] = ["header", "footer"]
 EMPTY_TAGS: Final[List[str]] = ["br", "hr"]
+EMPHASIS_TAGS: Final[List[str]] = ["strong", "em", "span", "b", "i"]
 
 
 class TagsMixin:
@@ -99,6 +101,41 @@ class HTMLListItem(TagsMixin, ListItem):
     pass
 
 
+HTML_TEXT_TYPES: Dict[Type[Text], type] = {
+    NarrativeText: HTMLNarrativeText,
+    Title: HTMLTitle,
+    Text: HTMLText,
+}
+
+
+class _UnclassifiedText:
+    """Placeholder for text that still needs to be classified as narrative text, a title or
+    plain text. The texts of a document are classified together once it has been read."""
+
+    def __init__(
+        self,
+        text: str,
+        tag: str,
+        ancestortags: Tuple[str, ...],
+        links: List[Link],
+        emphasized_texts: List[dict],
+    ):
+        self.text = text
+        self.tag = tag
+        self.ancestortags = ancestortags
+        self.links = links
+        self.emphasized_texts = emphasized_texts
+
+    def to_element(self, text_type: Type[Text]) -> Element:
+        return HTML_TEXT_TYPES[text_type](
+            self.text,
+            tag=self.tag,
+            ancestortags=self.ancestortags,
+            links=self.links,
+            emphasized_texts=self.emphasized_texts,
+        )
+
+
 class HTMLDocument(XMLDocument):
     """Class for handling HTML documents. Uses rules based parsing to identify sections
     of interest within the document."""
@@ -126,48 +163,82 @@ class HTMLDocument(XMLDocument):
         articles = _find_articles(root, assemble_articles=self.assembled_articles)
         page_number = 0
         page = Page(number=page_number)
+        unclassified_texts: List[Tuple[Page, int, _UnclassifiedText]] = []
+
+        def add_element(element: Union[Element, _UnclassifiedText]):
+            if isinstance(element, _UnclassifiedText):
+                unclassified_texts.append((page, len(page.elements), element))
+            page.elements.append(element)  # type: ignore
+
         for article in articles:
-            descendanttag_elems: Tuple[etree.Element, ...] = ()
-            for tag_elem in article.iter():
-                if tag_elem in descendanttag_elems:
-                    # Prevent repeating something that's been flagged as text as we chase it
-                    # down a chain
-                    continue
+            # NOTE(agent) - The article is walked depth first with the tags of the ancestors
+            # of the current element. The descendants of the most recent element that was
+            # converted to a document element are skipped, so that text that has been flagged
+            # is not repeated as we chase it down a chain.
+            ancestortags: List[str] = [el.tag for el in article.iterancestors()][::-1]
+            skip_descendants_of: Optional[etree.Element] = None
+            stack: List[Tuple[etree.Element, int]] = [(article, len(ancestortags))]
+            while stack:
+                tag_elem, depth = stack.pop()
+                del ancestortags[depth:]
 
                 if _is_text_tag(tag_elem):
-                    element = _parse_tag(tag_elem)
+                    element = _parse_tag(
+                        tag_elem,
+                        defer_classification=True,
+                        ancestortags=tuple(ancestortags),
+                    )
                     if element is not None:
-                        page.elements.append(element)
-                        descendanttag_elems = tuple(tag_elem.iterdescendants())
+                        add_element(element)
+                        skip_descendants_of = tag_elem
 
                 elif _is_container_with_text(tag_elem):
-                    links = _get_links_from_tag(tag_elem)
-                    emphasized_texts = _get_emphasized_texts_from_tag(tag_elem)
-                    element = _text_to_element(tag_elem.text, "div", (), links, emphasized_texts)
+                    links, emphasized_texts = _get_links_and_emphasized_texts(tag_elem)
+                    element = _text_to_element(
+                        tag_elem.text,
+                        "div",
+                        (),
+                        links,
+                        emphasized_texts,
+                        defer_classification=True,
+                    )
                     if element is not None:
-                        page.elements.append(element)
+                        add_element(element)
 
                 elif _is_bulleted_table(tag_elem):
                     bulleted_text = _bulleted_text_from_table(tag_elem)
                     page.elements.extend(bulleted_text)
-                    descendanttag_elems = tuple(tag_elem.iterdescendants())
+                    skip_descendants_of = tag_elem
 
                 elif is_list_item_tag(tag_elem):
                     element, next_element = _process_list_item(tag_elem)
                     if element is not None:
                         page.elements.append(element)
-                        descendanttag_elems = _get_bullet_descendants(tag_elem, next_element)
+                        skip_descendants_of = next_element
 
                 elif tag_elem.tag in PAGEBREAK_TAGS and len(page.elements) > 0:
                     pages.append(page)
                     page_number += 1
                     page = Page(number=page_number)
 
+                if tag_elem is not skip_descendants_of:
+                    ancestortags.append(tag_elem.tag)
+                    stack.extend((child, depth + 1) for child in reversed(tag_elem))
+
             if len(page.elements) > 0:
                 pages.append(page)
                 page_number += 1
                 page = Page(number=page_number)
 
+        text_types = get_text_types(
+            [element.text for _, _, element in unclassified_texts],
+            narrative_allowed=[
+                element.tag not in HEADING_TAGS for _, _, element in unclassified_texts
+            ],
+        )
+        for (text_page, index, element), text_type in zip(unclassified_texts, text_types):
+            text_page.elements[index] = element.to_element(text_type)
+
         return pages
 
     def doc_after_cleaners(
@@ -247,16 +318,15 @@ def _get_emphasized_texts_from_tag(tag_elem: etree.Element) -> List[dict]:
     """Get emphasized texts enclosed in <strong>, <em>, <span>, <b>, <i> tags
     from a tag element in HTML"""
     emphasized_texts = []
-    tags_to_track = ["strong", "em", "span", "b", "i"]
     if tag_elem is None:
         return []
 
-    if tag_elem.tag in tags_to_track:
+    if tag_elem.tag in EMPHASIS_TAGS:
         text = _construct_text(tag_elem, False)
         if text:
             emphasized_texts.append({"text": text, "tag": tag_elem.tag})
 
-    for descendant_tag_elem in tag_elem.iterdescendants(*tags_to_track):
+    for descendant_tag_elem in tag_elem.iterdescendants(*EMPHASIS_TAGS):
         text = _construct_text(descendant_tag_elem, False)
         if text:
             emphasized_texts.append({"text": text, "tag": descendant_tag_elem.tag})
@@ -266,26 +336,30 @@ def _get_emphasized_texts_from_tag(tag_elem: etree.Element) -> List[dict]:
 
 def _parse_tag(
     tag_elem: etree.Element,
-) -> Optional[Element]:
+    defer_classification: bool = False,
+    ancestortags: Optional[Tuple[str, ...]] = None,
+) -> Optional[Union[Element, _UnclassifiedText]]:
     """Converts an etree element to a Text element if there is applicable text in the element.
     Ancestor tags are kept so they can be used for filtering or classification without
     processing the document tree again. In the future we might want to keep descendants too,
-    but we don't have a use for them at the moment."""
-    ancestortags: Tuple[str, ...] = tuple(el.tag for el in tag_elem.iterancestors())[::-1]
-    links = _get_links_from_tag(tag_elem)
-    emphasized_texts = _get_emphasized_texts_from_tag(tag_elem)
-
+    but we don't have a use for them at the moment. With defer_classification, text that
+    needs to be classified as narrative text or a title is returned as an _UnclassifiedText.
+    The ancestor tags are looked up from the tree if they are not passed in."""
     if tag_elem.tag == "script":
         return None
     text = _construct_text(tag_elem)
     if not text:
         return None
+    links, emphasized_texts = _get_links_and_emphasized_texts(tag_elem)
+    if ancestortags is None:
+        ancestortags = tuple(el.tag for el in tag_elem.iterancestors())[::-1]
     return _text_to_element(
         text,
         tag_elem.tag,
         ancestortags,
         links=links,
         emphasized_texts=emphasized_texts,
+        defer_classification=defer_classification,
     )
 
 
@@ -295,7 +369,8 @@ def _text_to_element(
     ancestortags: Tuple[str, ...],
     links: List[Link] = [],
     emphasized_texts: List[dict] = [],
-) -> Optional[Element]:
+    defer_classification: bool = False,
+) -> Optional[Union[Element, _UnclassifiedText]]:
     """Given the text of an element, the tag type and the ancestor tags, produces the appropriate
     HTML element."""
     if is_bulleted_text(text):
@@ -321,6 +396,8 @@ def _text_to_element(
 
     if len(text) < 2:
         return None
+    elif defer_classification:
+        return _UnclassifiedText(text, tag, ancestortags, links, emphasized_texts)
     elif is_narrative_tag(text, tag):
         return HTMLNarrativeText(
             text,
@@ -372,18 +449,36 @@ def is_narrative_tag(text: str, tag: str) -> bool:
 
 def _construct_text(tag_elem: etree.Element, include_tail_text: bool = True) -> str:
     """Extracts text from a text tag element."""
-    text = ""
-    for item in tag_elem.itertext():
-        if item:
-            text += item
+    text = "".join(tag_elem.itertext())
 
     if include_tail_text and tag_elem.tail:
         text = text + tag_elem.tail
 
+    # NOTE(agent) - Most text tags in a document have no text, so skip cleaning those
+    if not text or text.isspace():
+        return ""
+
     text = replace_unicode_quotes(text)
     return text.strip()
 
 
+def _get_links_and_emphasized_texts(tag_elem: etree.Element) -> Tuple[List[Link], List[dict]]:
+    """Gets the links and emphasized texts of a tag element in a single walk over the element
+    and its descendants. The results are the same as those of _get_links_from_tag and
+    _get_emphasized_texts_from_tag."""
+    links: List[Link] = []
+    emphasized_texts: List[dict] = []
+    for elem in tag_elem.iter():
+        href = elem.get("href")
+        if href:
+            links.append({"text": elem.text, "url": href})
+        if elem.tag in EMPHASIS_TAGS:
+            text = _construct_text(elem, False)
+            if text:
+                emphasized_texts.append({"text": text, "tag": elem.tag})
+    return links, emphasized_texts
+
+
 def _is_text_tag(tag_elem: etree.Element, max_predecessor_len: int = 5) -> bool:
     """Deteremines if a tag potentially contains narrative text."""
     # NOTE(robinson) - Only consider elements with limited depth. Otherwise,
@@ -417,8 +512,7 @@ def _process_list_item(
     we can skip processing if bullets are found in a div element."""
     if tag_elem.tag in LIST_ITEM_TAGS:
         text = _construct_text(tag_elem)
-        links = _get_links_from_tag(tag_elem)
-        emphasized_texts = _get_emphasized_texts_from_tag(tag_elem)
+        links, emphasized_texts = _get_links_and_emphasized_texts(tag_elem)
         return (
             HTMLListItem(
                 text=text,
@@ -430,7 +524,6 @@ def _process_list_item(
         )
 
     elif tag_elem.tag == "div":
-        text = _construct_text(tag_elem)
         next_element = tag_elem.getnext()
         if next_element is None:
             return None, None
@@ -78,7 +78,10 @@ class XMLDocument(Document):
             #     Please use  bytes input or XML fragments without declaration.
             except ValueError:
                 document_tree = etree.fromstring(content.encode(), self.parser)
-            if "<pre>" and "</pre>" in content:
+            # NOTE(agent) - Only the closing tag is checked, which also matches <pre> tags
+            # that have attributes. The document is parsed again to find the <pre> tags only if
+            # one is there.
+            if "</pre>" in content:
                 tree = etree.HTML(content)
                 for element in tree.xpath("//pre"):
                     if not element.text:
@@ -1,11 +1,23 @@
-from typing import IO, Optional, Tuple, Union
+import codecs
+from io import BytesIO
+from typing import IO, Iterator, Optional, Tuple, Union
 
 import chardet
+from chardet import UniversalDetector
 
-from unstructured.partition.common import convert_to_bytes
+from unstructured.partition.common import convert_to_bytes, open_binary_stream
 
 ENCODE_REC_THRESHOLD = 0.8
 
+# NOTE(agent) - The encoding is detected from at most the first DETECTION_MAX_BYTES of a
+# file, which is fed to the detector DETECTION_CHUNK_SIZE bytes at a time
+DETECTION_CHUNK_SIZE = 64 * 1024
+DETECTION_MAX_BYTES = 1024 * 1024
+
+# NOTE(agent) - The number of bytes or characters read at a time when a document is streamed
+# with iter_txt_file
+STREAM_CHUNK_SIZE = 64 * 1024
+
 # popular encodings from https://en.wikipedia.org/wiki/Popularity_of_text_encodings
 COMMON_ENCODINGS = [
     "utf_8",
@@ -62,47 +74,112 @@ def detect_file_encoding(
     filename: str = "",
     file: Optional[Union[bytes, IO[bytes]]] = None,
 ) -> Tuple[str, str]:
+    """Detects the encoding of a file and returns the encoding along with the decoded text.
+    The encoding is detected from at most the first DETECTION_MAX_BYTES of the file, and the
+    file is decoded in full once the encoding is chosen."""
+    sample: Union[bytes, memoryview]
     if filename:
         with open(filename, "rb") as f:
-            byte_data = f.read()
+            sample = f.read(DETECTION_MAX_BYTES)
+            is_complete = not f.read(1)
+        byte_data = None
     elif file:
         byte_data = convert_to_bytes(file)
+        sample = memoryview(byte_data)[:DETECTION_MAX_BYTES]
+        is_complete = len(byte_data) <= DETECTION_MAX_BYTES
     else:
         raise FileNotFoundError("No filename nor file were specified")
 
-    result = chardet.detect(byte_data)
-    encoding = result["encoding"]
-    confidence = result["confidence"]
+    def decode(encoding: str, translate_newlines: bool = False) -> str:
+        if byte_data is not None:
+            return byte_data.decode(encoding)
+        # NOTE(agent) - Decoding while reading the file, rather than holding on to the bytes
+        # of the whole file for the detection
+        with open(filename, encoding=encoding, newline=None if translate_newlines else "") as f:
+            return f.read()
 
-    if encoding is None or confidence < ENCODE_REC_THRESHOLD:
-        # Encoding detection failed, fallback to predefined encodings
-        for enc in COMMON_ENCODINGS:
-            try:
-                if filename:
-                    with open(filename, encoding=enc) as f:
-                        file_text = f.read()
-                else:
-                    file_text = byte_data.decode(enc)
-                encoding = enc
-                break
-            except (UnicodeDecodeError, UnicodeError):
-                continue
-        else:
-            raise UnicodeDecodeError(
-                "Unable to determine the encoding of the file or match it with any "
-                "of the specified encodings.",
-                byte_data,
-                0,
-                len(byte_data),
-                "Invalid encoding",
-            )
+    for encoding, translate_newlines in _iter_candidate_encodings(sample, is_complete):
+        try:
+            file_text = decode(encoding, translate_newlines=translate_newlines)
+        except (UnicodeDecodeError, UnicodeError):
+            continue
+        return format_encoding_str(encoding), file_text
 
-    else:
-        file_text = byte_data.decode(encoding)
+    raise _undetected_encoding_error(bytes(sample))
 
-    formatted_encoding = format_encoding_str(encoding)
 
-    return formatted_encoding, file_text
+def _iter_candidate_encodings(
+    sample: Union[bytes, memoryview],
+    is_complete: bool,
+) -> Iterator[Tuple[str, bool]]:
+    """Yields the encodings to decode a document with, in the order they should be tried, along
+    with whether newlines are translated when the document is read from a file with that
+    encoding. The encoding detected from the sample comes first, followed by the fallback
+    encodings that can decode the sample."""
+    encoding, confidence = _detect_sample_encoding(sample)
+    if encoding is not None and confidence >= ENCODE_REC_THRESHOLD:
+        # NOTE(agent) - A sample that is all ASCII says nothing about the rest of the file, so
+        # use UTF-8, which decodes ASCII the same way
+        if encoding.lower() == "ascii" and not is_complete:
+            encoding = "utf_8"
+        yield encoding, False
+
+    # Encoding detection failed, fallback to predefined encodings. Each encoding is first
+    # checked against the sample, and the whole file is only decoded with the encodings that
+    # can decode the sample
+    for enc in COMMON_ENCODINGS:
+        if _can_decode(sample, enc, final=is_complete):
+            yield enc, True
+
+
+def _undetected_encoding_error(byte_data: bytes) -> UnicodeDecodeError:
+    return UnicodeDecodeError(
+        "Unable to determine the encoding of the file or match it with any "
+        "of the specified encodings.",
+        byte_data,
+        0,
+        len(byte_data),
+        "Invalid encoding",
+    )
+
+
+def _detect_sample_encoding(sample: Union[bytes, memoryview]) -> Tuple[Optional[str], float]:
+    """Runs the chardet detector over the sample in chunks, stopping as soon as the detector is
+    confident in the encoding. Returns the encoding and the confidence of the detector."""
+    detector = UniversalDetector()
+    for start in range(0, len(sample), DETECTION_CHUNK_SIZE):
+        end = start + DETECTION_CHUNK_SIZE
+        detector.feed(bytes(sample[start:end]))
+        if detector.done:
+            break
+    result = detector.close()
+    return result["encoding"], result["confidence"]
+
+
+def _can_decode(sample: Union[bytes, memoryview], encoding: str, final: bool = True) -> bool:
+    """Checks if the sample decodes with the encoding. If final is False, a multibyte character
+    that is cut off at the end of the sample is not an error."""
+    try:
+        codecs.getincrementaldecoder(encoding)().decode(sample, final=final)
+    except (UnicodeDecodeError, UnicodeError):
+        return False
+    return True
+
+
+def detect_prefix_encoding(byte_data: bytes) -> str:
+    """Detects the encoding of the start of a file, such as the buffer read for file type
+    detection. Unlike detect_file_encoding, a multibyte character that is cut off at the end of
+    the data does not cause the fallback encodings to fail."""
+    result = chardet.detect(byte_data)
+    encoding = result["encoding"]
+    if encoding is not None and result["confidence"] >= ENCODE_REC_THRESHOLD:
+        return format_encoding_str(encoding)
+
+    for enc in COMMON_ENCODINGS:
+        if _can_decode(byte_data, enc, final=False):
+            return format_encoding_str(enc)
+
+    raise _undetected_encoding_error(byte_data)
 
 
 def read_txt_file(
@@ -138,3 +215,89 @@ def read_txt_file(
         raise FileNotFoundError("No filename was specified")
 
     return formatted_encoding, file_text
+
+
+def iter_txt_file(
+    filename: str = "",
+    file: Optional[Union[bytes, IO[bytes]]] = None,
+    encoding: Optional[str] = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Reads a plain text document the same way as read_txt_file, but yields the text in chunks
+    as it is decoded instead of reading the whole document into memory. If the encoding is
+    detected, documents longer than the detection sample are read an extra time to check the
+    encoding against the whole document, so it is the same as the one read_txt_file picks."""
+    if filename:
+        if encoding:
+            yield from _iter_text_chunks(filename, format_encoding_str(encoding), chunk_size)
+            return
+        with open(filename, "rb") as f:
+            encoding, translate_newlines = _choose_stream_encoding(f)
+            if not translate_newlines:
+                yield from _iter_decoded_chunks(f, encoding, chunk_size)
+                return
+        yield from _iter_text_chunks(filename, encoding, chunk_size)
+    elif file:
+        if encoding:
+            # NOTE(agent) - Like read_txt_file, the file is read from its current position and
+            # file objects that return text are not decoded again
+            stream = BytesIO(file) if isinstance(file, bytes) else file
+            yield from _iter_decoded_chunks(stream, format_encoding_str(encoding), chunk_size)
+            return
+        with open_binary_stream(file) as stream:
+            encoding, _ = _choose_stream_encoding(stream)
+            yield from _iter_decoded_chunks(stream, encoding, chunk_size)
+    else:
+        raise FileNotFoundError("No filename was specified")
+
+
+def _choose_stream_encoding(stream: IO[bytes]) -> Tuple[str, bool]:
+    """Chooses the encoding of a binary stream like detect_file_encoding, trying the candidates
+    for a sample at the start of the stream in turn. Unless the sample is the whole stream, each
+    candidate is checked against the whole stream before it is chosen, so decoding can't fail
+    after some of the text has been yielded. The stream is rewound."""
+    sample = stream.read(DETECTION_MAX_BYTES)
+    is_complete = not stream.read(1)
+    stream.seek(0)
+    checked_encodings = set()
+    for encoding, translate_newlines in _iter_candidate_encodings(sample, is_complete):
+        if codecs.lookup(encoding).name in checked_encodings:
+            continue
+        checked_encodings.add(codecs.lookup(encoding).name)
+        if _can_decode(sample, encoding) if is_complete else _can_decode_stream(stream, encoding):
+            return encoding, translate_newlines
+    raise _undetected_encoding_error(sample)
+
+
+def _can_decode_stream(stream: IO[bytes], encoding: str) -> bool:
+    """Checks if the whole binary stream decodes with the encoding, reading it a chunk at a
+    time. The stream is rewound."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    try:
+        for chunk in iter(lambda: stream.read(STREAM_CHUNK_SIZE), b""):
+            decoder.decode(chunk)
+        decoder.decode(b"", final=True)
+    except (UnicodeDecodeError, UnicodeError):
+        return False
+    finally:
+        stream.seek(0)
+    return True
+
+
+def _iter_text_chunks(filename: str, encoding: str, chunk_size: int) -> Iterator[str]:
+    with open(filename, encoding=encoding) as f:
+        yield from iter(lambda: f.read(chunk_size), "")
+
+
+def _iter_decoded_chunks(stream: IO, encoding: str, chunk_size: int) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder(encoding)()
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        text = decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        if text:
+            yield text
+    text = decoder.decode(b"", final=True)
+    if text:
+        yield text
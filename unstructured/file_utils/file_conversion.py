@@ -1,30 +1,202 @@
+import base64
+import os
+import subprocess
 import tempfile
-from typing import IO, Optional
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import IO, Deque, Iterator, List, Optional, Union
 
-from unstructured.partition.common import exactly_one
+import requests
+
+from unstructured.partition.common import (
+    _get_free_port,
+    _is_port_open,
+    _kill_process_group,
+    exactly_one,
+)
 from unstructured.utils import dependency_exists, requires_dependencies
 
 if dependency_exists("pypandoc"):
     import pypandoc
 
+# NOTE(agent) - pandoc reads these formats as zip archives, which it can only open from a
+# file. Documents in other formats are piped to pandoc through stdin.
+PANDOC_BINARY_FORMATS = {"docx", "epub", "odt"}
+# NOTE(agent) - The number of pandoc processes that iter_html_texts_from_files runs at a time
+PANDOC_WORKERS = 4
+# NOTE(agent) - The number of seconds pandoc server gets to start accepting conversions, and
+# for each conversion before it is stopped
+PANDOC_SERVER_STARTUP_TIMEOUT = 30.0
+PANDOC_SERVER_TIMEOUT = 120
+
+
+def _pandoc_not_found_error(err: Exception) -> FileNotFoundError:
+    msg = (
+        "Error converting the file to text. Ensure you have the pandoc "
+        "package installed on your system. Install instructions are available at "
+        "https://pandoc.org/installing.html. The original exception text was:\n"
+        f"{err}"
+    )
+    return FileNotFoundError(msg)
+
+
+class PandocServer:
+    """A pandoc process kept running in server mode. Documents are sent to it over a local
+    HTTP socket, so a conversion doesn't pay for starting a pandoc process."""
+
+    def __init__(
+        self,
+        timeout: int = PANDOC_SERVER_TIMEOUT,
+        startup_timeout: float = PANDOC_SERVER_STARTUP_TIMEOUT,
+    ):
+        self.timeout = timeout
+        self.startup_timeout = startup_timeout
+        self.port: Optional[int] = None
+        self.process: Optional[subprocess.Popen] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self):
+        self.port = _get_free_port()
+        command = ["pandoc", "server", "--port", str(self.port), "--timeout", str(self.timeout)]
+        try:
+            self.process = subprocess.Popen(
+                command,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+        except FileNotFoundError as err:
+            raise _pandoc_not_found_error(err)
+
+        deadline = time.monotonic() + self.startup_timeout
+        while not _is_port_open(self.port):
+            if self.process.poll() is not None or time.monotonic() > deadline:
+                self.stop()
+                raise RuntimeError(
+                    f"pandoc server on port {self.port} did not start. pandoc server needs "
+                    "pandoc 3.0 or later.",
+                )
+            time.sleep(0.1)
+
+        # NOTE(agent) - pandoc builds without the threaded GHC runtime start the server but
+        # drop every request, so a first conversion checks that the server works
+        try:
+            self.convert("", "markdown", "html")
+        except (requests.RequestException, RuntimeError) as err:
+            self.stop()
+            raise RuntimeError(
+                f"pandoc server on port {self.port} does not respond to conversions. pandoc "
+                "server needs a pandoc build with the threaded runtime.",
+            ) from err
+
+    def stop(self):
+        if self.process is not None and self.process.poll() is None:
+            _kill_process_group(self.process)
+            self.process.wait()
+        self.process = None
+
+    def convert(self, text: Union[str, bytes], source_format: str, target_format: str) -> str:
+        """Converts the contents of a document, with the same output as the pandoc command.
+        pandoc server stops conversions that take longer than its timeout, and they fail like
+        any other conversion."""
+        if source_format in PANDOC_BINARY_FORMATS:
+            # NOTE(agent) - pandoc server takes the contents of binary formats base64 encoded
+            text = base64.b64encode(text if isinstance(text, bytes) else text.encode()).decode()
+        elif isinstance(text, bytes):
+            text = text.decode("utf-8")
+
+        # NOTE(agent) - Unlike the pandoc command, pandoc server doesn't highlight code blocks
+        # unless it is given a highlight style
+        response = requests.post(
+            self.url,
+            json={
+                "text": text,
+                "from": source_format,
+                "to": target_format,
+                "highlight-style": "pygments",
+            },
+            headers={"Accept": "application/json"},
+            timeout=self.timeout + 10,
+        )
+        if response.status_code == 503:
+            raise RuntimeError(
+                f"pandoc failed to convert the document within {self.timeout} seconds.",
+            )
+        result = response.json() if response.ok else {"error": response.text}
+        if "error" in result:
+            raise RuntimeError(f"pandoc failed to convert the document: {result['error']}")
+        output = result["output"]
+        if result.get("base64"):
+            output = base64.b64decode(output).decode("utf-8")
+        # NOTE(agent) - The pandoc command ends its output with a newline, the server doesn't
+        return output if output.endswith("\n") else output + "\n"
+
+
+_pandoc_server: Optional[PandocServer] = None
+
+
+@contextmanager
+def pandoc_server(
+    timeout: int = PANDOC_SERVER_TIMEOUT,
+    startup_timeout: float = PANDOC_SERVER_STARTUP_TIMEOUT,
+) -> Iterator[PandocServer]:
+    """Keeps a pandoc server running while the context is open. In the meantime the pandoc
+    conversions to HTML and text, and so partition_epub, partition_rtf, partition_rst and
+    partition_org, go to the server instead of starting a pandoc process for each document.
+    Requires pandoc 3.0 or later. The server is only used in the current process."""
+    global _pandoc_server
+    if _pandoc_server is not None:
+        raise ValueError("A pandoc server is already running in this process.")
+
+    server = PandocServer(timeout=timeout, startup_timeout=startup_timeout)
+    try:
+        server.start()
+        _pandoc_server = server
+        yield server
+    finally:
+        _pandoc_server = None
+        server.stop()
+
 
 @requires_dependencies(["pypandoc"])
 def convert_file_to_text(filename: str, source_format: str, target_format: str) -> str:
     """Uses pandoc to convert the source document to a raw text string."""
+    if _pandoc_server is not None:
+        with open(filename, "rb") as f:
+            return _pandoc_server.convert(f.read(), source_format, target_format)
+
     try:
         text = pypandoc.convert_file(filename, target_format, format=source_format)
     except FileNotFoundError as err:
-        msg = (
-            "Error converting the file to text. Ensure you have the pandoc "
-            "package installed on your system. Install instructions are available at "
-            "https://pandoc.org/installing.html. The original exception text was:\n"
-            f"{err}"
-        )
-        raise FileNotFoundError(msg)
+        raise _pandoc_not_found_error(err)
 
     return text
 
 
+@requires_dependencies(["pypandoc"])
+def convert_text_to_text(
+    text: Union[str, bytes],
+    source_format: str,
+    target_format: str,
+) -> str:
+    """Uses pandoc to convert the contents of a source document to a raw text string. The
+    contents are piped to pandoc through stdin, so they don't need to be written to a file."""
+    if _pandoc_server is not None:
+        return _pandoc_server.convert(text, source_format, target_format)
+
+    try:
+        converted_text = pypandoc.convert_text(text, target_format, format=source_format)
+    except FileNotFoundError as err:
+        raise _pandoc_not_found_error(err)
+
+    return converted_text
+
+
 def convert_file_to_html_text(
     source_format: str,
     filename: Optional[str] = None,
@@ -34,15 +206,26 @@ def convert_file_to_html_text(
     processed using the partition_html function."""
     exactly_one(filename=filename, file=file)
 
-    if file is not None:
-        tmp = tempfile.NamedTemporaryFile(delete=False)
-        tmp.write(file.read())
-        tmp.close()
-        html_text = convert_file_to_text(
-            filename=tmp.name,
+    # NOTE(agent) - pandoc server takes binary formats in the request, so they don't need to be
+    # written to a file either
+    if file is not None and (
+        source_format not in PANDOC_BINARY_FORMATS or _pandoc_server is not None
+    ):
+        html_text = convert_text_to_text(
+            file.read(),
             source_format=source_format,
             target_format="html",
         )
+    elif file is not None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_filename = os.path.join(tmpdir, f"document.{source_format}")
+            with open(tmp_filename, "wb") as tmp:
+                tmp.write(file.read())
+            html_text = convert_file_to_text(
+                filename=tmp_filename,
+                source_format=source_format,
+                target_format="html",
+            )
     elif filename is not None:
         html_text = convert_file_to_text(
             filename=filename,
@@ -51,3 +234,25 @@ def convert_file_to_html_text(
         )
 
     return html_text
+
+
+def iter_html_texts_from_files(
+    source_format: str,
+    filenames: List[str],
+    workers: int = PANDOC_WORKERS,
+) -> Iterator[str]:
+    """Converts a batch of documents to HTML raw text, running up to workers pandoc processes
+    at a time so the start-up and I/O of each conversion overlaps with the others. The HTML
+    texts are yielded in the order of filenames. Conversions only run a few documents ahead of
+    the caller, so the HTML texts of a large batch don't pile up in memory."""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: Deque[Future] = deque()
+        for filename in filenames:
+            pending.append(
+                executor.submit(convert_file_to_html_text, source_format, filename=filename),
+            )
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
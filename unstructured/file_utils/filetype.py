@@ -1,17 +1,30 @@
 from __future__ import annotations
 
+import codecs
 import inspect
+import io
 import json
 import os
 import re
 import zipfile
 from enum import Enum
 from functools import wraps
-from typing import IO, TYPE_CHECKING, Callable, List, Optional
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Union,
+)
 
 from unstructured.documents.coordinates import PixelSpace
-from unstructured.documents.elements import Element, PageBreak
-from unstructured.file_utils.encoding import detect_file_encoding, format_encoding_str
+from unstructured.documents.elements import Element, PageBreak, _get_params_function
+from unstructured.file_utils.encoding import detect_prefix_encoding, format_encoding_str
 from unstructured.nlp.patterns import LIST_OF_DICTS_PATTERN
 from unstructured.partition.common import (
     _add_element_metadata,
@@ -55,6 +68,22 @@ EXPECTED_PPTX_FILES = [
     "ppt/presentation.xml",
 ]
 
+# NOTE(agent) - The file type checks share a single read of the start of the file. The
+# python-magic docs recommend passing at least the first 2048 bytes to libmagic. Increased to
+# 4096 because otherwise .xlsx files get detected as a zip file. The JSON and CSV checks look at
+# the first 4096 characters, which take up to 4 bytes each in UTF-8.
+# ref: https://github.com/ahupp/python-magic#usage
+MAGIC_BUFFER_SIZE = 4096
+TEXT_CHECK_NUM_CHARS = 4096
+HEADER_BUFFER_SIZE = 4 * TEXT_CHECK_NUM_CHARS
+
+# NOTE(agent) - MIME types that libmagic can only narrow down (e.g. to .doc, .xls or .msg)
+# by reading further into the file. libmagic is run again on the whole header buffer and then,
+# if there is a filename, on the whole file
+MAGIC_FULL_FILE_MIME_TYPES = [
+    "application/x-ole-storage",
+]
+
 
 class FileType(Enum):
     UNK = 0
@@ -246,15 +275,10 @@ def detect_filetype(
         _filename = filename or file_filename or ""
         _, extension = os.path.splitext(_filename)
         extension = extension.lower()
-        if os.path.isfile(_filename) and LIBMAGIC_AVAILABLE:
-            mime_type = magic.from_file(
-                _resolve_symlink(filename or file_filename),
-                mime=True,
-            )  # type: ignore
-        elif os.path.isfile(_filename):
-            import filetype as ft
-
-            mime_type = ft.guess_mime(filename)
+        if not os.path.isfile(_filename):
+            return EXT_TO_FILETYPE.get(extension, FileType.UNK)
+        header = _FileHeader(filename=filename, file=file, encoding=encoding)
+        mime_type = header.get_mime_type(full_file_filename=_resolve_symlink(_filename))
         if mime_type is None:
             return EXT_TO_FILETYPE.get(extension, FileType.UNK)
 
@@ -264,15 +288,8 @@ def detect_filetype(
         else:
             extension = ""
         extension = extension.lower()
-        # NOTE(robinson) - the python-magic docs recommend reading at least the first 2048 bytes
-        # Increased to 4096 because otherwise .xlsx files get detected as a zip file
-        # ref: https://github.com/ahupp/python-magic#usage
-        if LIBMAGIC_AVAILABLE:
-            mime_type = magic.from_buffer(file.read(4096), mime=True)
-        else:
-            import filetype as ft
-
-            mime_type = ft.guess_mime(file.read(4096))
+        header = _FileHeader(file=file, encoding=encoding)
+        mime_type = header.get_mime_type()
         if mime_type is None:
             logger.warning(
                 "libmagic is unavailable but assists in filetype detection on file-like objects. "
@@ -297,10 +314,6 @@ def detect_filetype(
             return FileType.XML
 
     elif mime_type in TXT_MIME_TYPES or mime_type.startswith("text"):
-        if not encoding:
-            encoding = "utf-8"
-        formatted_encoding = format_encoding_str(encoding)
-
         if extension in [
             ".eml",
             ".md",
@@ -317,21 +330,14 @@ def detect_filetype(
         # NOTE(crag): for older versions of the OS libmagic package, such as is currently
         # installed on the Unstructured docker image, .json files resolve to "text/plain"
         # rather than "application/json". this corrects for that case.
-        if _is_text_file_a_json(
-            file=file,
-            filename=filename,
-            encoding=formatted_encoding,
-        ):
+        file_text = header.text
+        if _is_json_text(file_text):
             return FileType.JSON
 
-        if _is_text_file_a_csv(
-            file=file,
-            filename=filename,
-            encoding=formatted_encoding,
-        ):
+        if _is_csv_text(file_text):
             return FileType.CSV
 
-        if file and _check_eml_from_buffer(file=file) is True:
+        if file and _is_eml_text(file_text):
             return FileType.EML
 
         if extension in PLAIN_TEXT_EXTENSIONS:
@@ -347,17 +353,12 @@ def detect_filetype(
         if extension == ".docx":
             return FileType.DOCX
         elif file:
-            return _detect_filetype_from_octet_stream(file=file)
+            return _detect_filetype_from_zip_filenames(header.get_zip_filenames())
         else:
             return EXT_TO_FILETYPE.get(extension, FileType.UNK)
 
     elif mime_type == "application/zip":
-        filetype = FileType.UNK
-        if file:
-            filetype = _detect_filetype_from_octet_stream(file=file)
-        elif filename is not None:
-            with open(filename, "rb") as f:
-                filetype = _detect_filetype_from_octet_stream(file=f)
+        filetype = _detect_filetype_from_zip_filenames(header.get_zip_filenames())
 
         extension = extension if extension else ""
         if filetype == FileType.UNK:
@@ -385,14 +386,103 @@ def detect_filetype(
     return EXT_TO_FILETYPE.get(extension, FileType.UNK)
 
 
-def _detect_filetype_from_octet_stream(file: IO) -> FileType:
-    """Detects the filetype, given a file with an application/octet-stream MIME type."""
-    file.seek(0)
-    if zipfile.is_zipfile(file):
-        file.seek(0)
-        archive = zipfile.ZipFile(file)
+class _FileHeader:
+    """The start of a file, read once and shared by all of the file type checks: libmagic, the
+    JSON, CSV and EML checks on the text and listing the contents of zip archives. If a file is
+    passed, the header is read from the file and the file is rewound to the start."""
+
+    def __init__(
+        self,
+        filename: Optional[str] = None,
+        file: Optional[IO[bytes]] = None,
+        encoding: Optional[str] = "utf-8",
+    ):
+        exactly_one(filename=filename, file=file)
+        self.filename = filename
+        self.file = file
+        self.encoding = format_encoding_str(encoding or "utf-8")
+        self._text: Optional[str] = None
+
+        self.data: Union[bytes, str]
+        if file is not None:
+            file.seek(0)
+            self.data = file.read(HEADER_BUFFER_SIZE)
+            file.seek(0)
+        else:
+            with open(filename, "rb") as f:  # type: ignore
+                self.data = f.read(HEADER_BUFFER_SIZE)
+        # NOTE(agent) - For files smaller than the buffer, the header is the whole file
+        self.is_complete = len(self.data) < HEADER_BUFFER_SIZE
+
+    def get_mime_type(self, full_file_filename: Optional[str] = None) -> Optional[str]:
+        """Detects the MIME type from the header with libmagic, or with the filetype package if
+        libmagic is not installed. If full_file_filename is given, libmagic reads the file
+        itself for the MIME types that it cannot narrow down from the header alone."""
+        if not LIBMAGIC_AVAILABLE:
+            import filetype as ft
+
+            return ft.guess_mime(self.data)
+
+        mime_type = magic.from_buffer(self.data[:MAGIC_BUFFER_SIZE], mime=True)
+        if mime_type in MAGIC_FULL_FILE_MIME_TYPES and len(self.data) > MAGIC_BUFFER_SIZE:
+            mime_type = magic.from_buffer(self.data, mime=True)
+        if (
+            mime_type in MAGIC_FULL_FILE_MIME_TYPES
+            and full_file_filename is not None
+            and not self.is_complete
+        ):
+            mime_type = magic.from_file(full_file_filename, mime=True)
+        return mime_type
+
+    @property
+    def text(self) -> str:
+        """The first TEXT_CHECK_NUM_CHARS characters of the file. Files are decoded as UTF-8,
+        ignoring errors. Filenames are decoded with the encoding, falling back on the encoding
+        detected from the header if the header is not valid in that encoding."""
+        if self._text is None:
+            if isinstance(self.data, str):
+                text = self.data
+            elif self.file is not None:
+                text = self.data.decode(errors="ignore")
+            else:
+                try:
+                    text = self._decode(self.encoding)
+                except UnicodeDecodeError:
+                    text = self._decode(detect_prefix_encoding(self.data))
+            self._text = text[:TEXT_CHECK_NUM_CHARS]
+        return self._text
+
+    def _decode(self, encoding: str) -> str:
+        # NOTE(agent) - An incremental decoder so that a multibyte character that is cut off
+        # at the end of the header is not a decoding error
+        decoder = codecs.getincrementaldecoder(encoding)()
+        return decoder.decode(self.data, final=self.is_complete)  # type: ignore
+
+    def get_zip_filenames(self) -> Optional[Set[str]]:
+        """Returns the filenames in the zip archive, or None if the file is not a zip archive.
+        Only reads from the file again if the file is larger than the header."""
+        source: Union[str, IO[bytes]]
+        if self.is_complete and isinstance(self.data, bytes):
+            source = io.BytesIO(self.data)
+        elif self.file is not None:
+            source = self.file
+        else:
+            source = self.filename  # type: ignore
 
-        archive_filenames = [f.filename for f in archive.filelist]
+        try:
+            with zipfile.ZipFile(source) as archive:
+                return set(archive.namelist())
+        except zipfile.BadZipFile:
+            return None
+        finally:
+            if self.file is not None:
+                self.file.seek(0)
+
+
+def _detect_filetype_from_zip_filenames(archive_filenames: Optional[Set[str]]) -> FileType:
+    """Detects the filetype of a zip based document (e.g. .docx), given the filenames in the
+    archive."""
+    if archive_filenames is not None:
         if all(f in archive_filenames for f in EXPECTED_DOCX_FILES):
             return FileType.DOCX
         elif all(f in archive_filenames for f in EXPECTED_XLSX_FILES):
@@ -412,24 +502,15 @@ def _read_file_start_for_type_check(
     encoding: Optional[str] = "utf-8",
 ) -> str:
     """Reads the start of the file and returns the text content."""
-    exactly_one(filename=filename, file=file)
-    if file is not None:
-        file.seek(0)
-        file_content = file.read(4096)
-        if isinstance(file_content, str):
-            file_text = file_content
-        else:
-            file_text = file_content.decode(errors="ignore")
-        file.seek(0)
-    if filename is not None:
-        try:
-            with open(filename, encoding=encoding) as f:
-                file_text = f.read(4096)
-        except UnicodeDecodeError:
-            formatted_encoding, _ = detect_file_encoding(filename=filename)
-            with open(filename, encoding=formatted_encoding) as f:
-                file_text = f.read(4096)
-    return file_text
+    return _FileHeader(filename=filename, file=file, encoding=encoding).text
+
+
+def _is_json_text(file_text: str) -> bool:
+    try:
+        json.loads(file_text)
+        return True
+    except json.JSONDecodeError:
+        return False
 
 
 def _is_text_file_a_json(
@@ -439,11 +520,7 @@ def _is_text_file_a_json(
 ):
     """Detects if a file that has a text/plain MIME type is a JSON file."""
     file_text = _read_file_start_for_type_check(file=file, filename=filename, encoding=encoding)
-    try:
-        json.loads(file_text)
-        return True
-    except json.JSONDecodeError:
-        return False
+    return _is_json_text(file_text)
 
 
 def is_json_processable(
@@ -465,6 +542,17 @@ def _count_commas(text: str):
     return len(matches)
 
 
+def _is_csv_text(file_text: str) -> bool:
+    lines = file_text.strip().splitlines()
+    if len(lines) < 2:
+        return False
+    lines = lines[: len(lines)] if len(lines) < 10 else lines[:10]
+    header_count = _count_commas(lines[0])
+    if any("," not in line for line in lines):
+        return False
+    return all(_count_commas(line) == header_count for line in lines[:1])
+
+
 def _is_text_file_a_csv(
     filename: Optional[str] = None,
     file: Optional[IO[bytes]] = None,
@@ -476,26 +564,17 @@ def _is_text_file_a_csv(
         filename=filename,
         encoding=encoding,
     )
-    lines = file_text.strip().splitlines()
-    if len(lines) < 2:
-        return False
-    lines = lines[: len(lines)] if len(lines) < 10 else lines[:10]
-    header_count = _count_commas(lines[0])
-    if any("," not in line for line in lines):
-        return False
-    return all(_count_commas(line) == header_count for line in lines[:1])
+    return _is_csv_text(file_text)
+
+
+def _is_eml_text(file_text: str) -> bool:
+    return EMAIL_HEAD_RE.match(file_text) is not None
 
 
 def _check_eml_from_buffer(file: IO) -> bool:
     """Checks if a text/plain file is actually a .eml file. Uses a regex pattern to see if the
     start of the file matches the typical pattern for a .eml file."""
-    file.seek(0)
-    file_content = file.read(4096)
-    if isinstance(file_content, bytes):
-        file_head = file_content.decode("utf-8", errors="ignore")
-    else:
-        file_head = file_content
-    return EMAIL_HEAD_RE.match(file_head) is not None
+    return _is_eml_text(_read_file_start_for_type_check(file=file))
 
 
 def document_to_element_list(
@@ -505,7 +584,24 @@ def document_to_element_list(
     last_modification_date: Optional[str] = None,
 ) -> List[Element]:
     """Converts a DocumentLayout object to a list of unstructured elements."""
-    elements: List[Element] = []
+    return list(
+        document_to_element_iter(
+            document,
+            include_page_breaks=include_page_breaks,
+            sort=sort,
+            last_modification_date=last_modification_date,
+        ),
+    )
+
+
+def document_to_element_iter(
+    document: "DocumentLayout",
+    include_page_breaks: bool = False,
+    sort: bool = False,
+    last_modification_date: Optional[str] = None,
+) -> Iterator[Element]:
+    """Converts a DocumentLayout object to unstructured elements, yielding the elements one
+    page at a time."""
     num_pages = len(document.pages)
     for i, page in enumerate(document.pages):
         page_elements: List[Element] = []
@@ -562,9 +658,7 @@ def document_to_element_list(
             )
         if include_page_breaks and i < num_pages - 1:
             page_elements.append(PageBreak(text=""))
-        elements.extend(page_elements)
-
-    return elements
+        yield from page_elements
 
 
 def _get_page_image_metadata(
@@ -622,23 +716,19 @@ def _is_code_mime_type(mime_type: str) -> bool:
 
 
 def add_metadata_with_filetype(filetype: FileType):
+    mimetype = FILETYPE_TO_MIMETYPE[filetype]
+
     def decorator(func: Callable):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            elements = func(*args, **kwargs)
-            sig = inspect.signature(func)
-            params = dict(**dict(zip(sig.parameters, args)), **kwargs)
-            for param in sig.parameters.values():
-                if param.name not in params and param.default is not param.empty:
-                    params[param.name] = param.default
+        get_params = _get_params_function(func)
+
+        def add_metadata(elements: List[Element], params: Dict[str, Any]) -> List[Element]:
             include_metadata = params.get("include_metadata", True)
             if include_metadata:
-                if params.get("metadata_filename"):
-                    params["filename"] = params.get("metadata_filename")
-
                 metadata_kwargs = {
                     kwarg: params.get(kwarg) for kwarg in ("filename", "url", "text_as_html")
                 }
+                if params.get("metadata_filename"):
+                    metadata_kwargs["filename"] = params.get("metadata_filename")
 
                 for element in elements:
                     # NOTE(robinson) - Attached files have already run through this logic
@@ -646,7 +736,7 @@ def add_metadata_with_filetype(filetype: FileType):
                     if element.metadata.attached_to_filename is None:
                         _add_element_metadata(
                             element,
-                            filetype=FILETYPE_TO_MIMETYPE[filetype],
+                            filetype=mimetype,
                             **metadata_kwargs,  # type: ignore
                         )
 
@@ -656,6 +746,30 @@ def add_metadata_with_filetype(filetype: FileType):
                     elements,
                 )
 
-        return wrapper
+        # NOTE(agent) - Generator functions (the iter_partition_* variants) are wrapped
+        # in a generator so that metadata is added as each element is yielded
+        if inspect.isgeneratorfunction(func):
+
+            @wraps(func)
+            def iter_wrapper(*args, **kwargs):
+                params = get_params(args, kwargs)
+                for element in func(*args, **kwargs):
+                    yield from add_metadata([element], params)
+
+            wrapped: Callable = iter_wrapper
+        else:
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                elements = func(*args, **kwargs)
+                return add_metadata(elements, get_params(args, kwargs))
+
+            wrapped = wrapper
+
+        # NOTE(agent) - process_metadata is stacked on top of this decorator for most
+        # partitioners. It calls func and add_metadata itself, so the arguments of a call are
+        # only bound once.
+        setattr(wrapped, "_add_metadata_with_filetype", (func, add_metadata))
+        return wrapped
 
     return decorator
@@ -27,6 +27,42 @@ from unstructured.ingest.runner import elasticsearch as elasticsearch_fn
     "Currently only supported for the Elasticsearch connector. "
     "Example: --jq-query '{meta, body}'",
 )
+@click.option(
+    "--fields",
+    default=None,
+    help="Comma separated list of fields to fetch from the _source of each document. "
+    "By default all fields are fetched.",
+)
+@click.option(
+    "--fetch-mode",
+    type=click.Choice(["get", "scan", "mget"]),
+    default="get",
+    show_default=True,
+    help="How documents are fetched. 'get' fetches each document with a separate request "
+    "from the worker processes, 'scan' carries the document sources through the scan of the "
+    "index, and 'mget' fetches the sources of --batch-size documents per request.",
+)
+@click.option(
+    "--batch-size",
+    type=int,
+    default=100,
+    show_default=True,
+    help="Number of documents per page of the index scan, and per request in mget mode.",
+)
+@click.option(
+    "--num-slices",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Number of slices the index scan is split into, which are scanned in parallel.",
+)
+@click.option(
+    "--scroll-keep-alive",
+    default="30m",
+    show_default=True,
+    help="How long the index scan is kept alive on the cluster between pages. Documents are "
+    "scanned as they are processed, so this needs to cover processing --batch-size documents.",
+)
 @click.option(
     "--url",
     required=True,
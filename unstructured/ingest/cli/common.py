@@ -96,6 +96,8 @@ def map_to_standard_config(options: dict) -> StandardConnectorConfig:
         partition_endpoint=options["partition_endpoint"],
         preserve_downloads=options["preserve_downloads"],
         re_download=options["re_download"],
+        compact_output=options["compact_output"],
+        jsonl_output=options["jsonl_output"],
         api_key=options["api_key"],
     )
 
@@ -109,6 +111,13 @@ def map_to_processor_config(options: dict) -> ProcessorConfigs:
         num_processes=options["num_processes"],
         reprocess=options["reprocess"],
         max_docs=options["max_docs"],
+        max_tasks_per_child=options["max_tasks_per_child"],
+        doc_timeout=options["doc_timeout"],
+        download_workers=options["download_workers"],
+        download_queue_depth=options["download_queue_depth"],
+        write_queue_depth=options["write_queue_depth"],
+        incremental=options["incremental"],
+        delete_removed_outputs=options["delete_removed_outputs"],
     )
 
 
@@ -151,6 +160,20 @@ def add_shared_options(cmd: Command):
             "Specifically, the metadata key values are brought to the top-level of the element, "
             "and the `metadata` key itself is removed.",
         ),
+        Option(
+            ["--compact-output"],
+            is_flag=True,
+            default=False,
+            help="Write the structured output json without indentation, which makes the "
+            "files smaller and faster to write.",
+        ),
+        Option(
+            ["--jsonl-output"],
+            is_flag=True,
+            default=False,
+            help="Write the structured output as JSON Lines, one element per line, so that "
+            "it can be read an element at a time. The output files keep their names.",
+        ),
         Option(
             ["--fields-include"],
             default="element_id,text,type,metadata",
@@ -267,12 +290,67 @@ def add_shared_options(cmd: Command):
             help="Reprocess a downloaded file even if the relevant structured output .json file "
             "in --structured-output-dir already exists.",
         ),
+        Option(
+            ["--incremental"],
+            is_flag=True,
+            default=False,
+            help="Keep a manifest of processed docs in --structured-output-dir and on reruns "
+            "only fetch and process docs that are new or whose source version, modified date "
+            "or content has changed.",
+        ),
+        Option(
+            ["--delete-removed-outputs"],
+            is_flag=True,
+            default=False,
+            help="With --incremental, delete the structured outputs of docs that are no longer "
+            "listed by the source.",
+        ),
         Option(
             ["--num-processes"],
             default=2,
             show_default=True,
             help="Number of parallel processes to process docs in.",
         ),
+        Option(
+            ["--max-tasks-per-child"],
+            default=None,
+            type=int,
+            help="If specified, each worker process is replaced after processing this many docs, "
+            "which releases memory held by the partitioners.",
+        ),
+        Option(
+            ["--doc-timeout"],
+            default=None,
+            type=float,
+            help="If specified, stop processing a doc after this many seconds and move on to "
+            "the next one.",
+        ),
+        Option(
+            ["--download-workers"],
+            default=0,
+            show_default=True,
+            type=int,
+            help="If greater than 0, docs are downloaded by this many threads ahead of being "
+            "partitioned, and structured outputs are written by a separate thread, so that "
+            "downloads, partitioning and writes overlap. Otherwise each process downloads, "
+            "partitions and writes one doc at a time.",
+        ),
+        Option(
+            ["--download-queue-depth"],
+            default=4,
+            show_default=True,
+            type=int,
+            help="With --download-workers, the number of downloaded docs that may wait to be "
+            "partitioned before downloads pause.",
+        ),
+        Option(
+            ["--write-queue-depth"],
+            default=4,
+            show_default=True,
+            type=int,
+            help="With --download-workers, the number of partitioned docs that may wait to be "
+            "written before partitioning pauses.",
+        ),
         Option(["-v", "--verbose"], is_flag=True, default=False),
     ]
     cmd.params.extend(options)
@@ -0,0 +1,60 @@
+"""A per-process registry of the clients and sessions connectors use to fetch docs, so that
+each worker process creates a client once and reuses it, along with its pooled keep-alive
+connections, for every doc it handles."""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from unstructured.ingest.logger import logger
+
+ClientT = TypeVar("ClientT")
+
+# NOTE(agent) - The number of keep-alive connections kept open per host by the pooled
+# requests sessions. Sized for the download threads of a pipelined run.
+HTTP_POOL_MAXSIZE = 16
+
+_clients: Dict[Tuple[Hashable, ...], Any] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(
+    key: Tuple[Hashable, ...],
+    create_client: Callable[[], ClientT],
+    per_thread: bool = False,
+) -> ClientT:
+    """Returns the client registered under key in the current process, calling create_client
+    to create it the first time. key is a tuple of the client name followed by the settings
+    the client is created with. Use per_thread for clients that are not thread safe, which
+    then get one client per thread."""
+    client_name = key[0]
+    if per_thread:
+        key = (*key, threading.get_ident())
+
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                logger.debug(f"Creating {client_name} client")
+                client = create_client()
+                _clients[key] = client
+    return client
+
+
+def reset_clients():
+    """Forgets the clients of the current process. Called in the initializer of each worker
+    process so that a worker never reuses connections inherited from its parent process."""
+    with _clients_lock:
+        _clients.clear()
+
+
+def create_pooled_session(pool_maxsize: int = HTTP_POOL_MAXSIZE) -> requests.Session:
+    """Creates a requests session that keeps up to pool_maxsize connections per host alive."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
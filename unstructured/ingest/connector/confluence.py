@@ -6,6 +6,7 @@ from typing import Optional
 
 from atlassian import Confluence
 
+from unstructured.ingest.clients import create_pooled_session, get_client
 from unstructured.ingest.interfaces import (
     BaseConnector,
     BaseConnectorConfig,
@@ -106,12 +107,14 @@ class ConfluenceIngestDoc(IngestDocCleanupMixin, BaseIngestDoc):
     def get_file(self):
         logger.debug(f"Fetching {self} - PID: {os.getpid()}")
 
-        # TODO: instead of having a separate connection object for each doc,
-        # have a separate connection object for each process
-        confluence = Confluence(
-            self.config.url,
-            username=self.config.user_email,
-            password=self.config.api_token,
+        confluence = get_client(
+            ("confluence", self.config.url, self.config.user_email, self.config.api_token),
+            lambda: Confluence(
+                self.config.url,
+                username=self.config.user_email,
+                password=self.config.api_token,
+                session=create_pooled_session(),
+            ),
         )
 
         result = confluence.get_page_by_id(page_id=self.file_meta.document_id, expand="body.view")
@@ -104,7 +104,7 @@ class DropboxConnector(FsspecConnector):
             # directories that are listed in cloud storage can cause problems because they are seen
             # as 0byte files
             return [
-                x.get("name")
+                self._add_file_version(x.get("name"), x)
                 for x in self.fs.ls(
                     f"/{self.config.path_without_protocol}",
                     detail=True,
@@ -115,7 +115,7 @@ class DropboxConnector(FsspecConnector):
             # fs.find will recursively walk directories
             # "size" is a common key for all the cloud protocols with fs
             return [
-                k
+                self._add_file_version(k, v)
                 for k, v in self.fs.find(
                     f"/{self.config.path_without_protocol}",
                     detail=True,
@@ -1,14 +1,18 @@
 import hashlib
 import json
 import os
+import queue
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, List, Optional
 
 import jq
 from elasticsearch import Elasticsearch
 from elasticsearch.helpers import scan
 
+from unstructured.ingest.clients import HTTP_POOL_MAXSIZE, get_client
 from unstructured.ingest.interfaces import (
     BaseConnector,
     BaseConnectorConfig,
@@ -20,6 +24,18 @@ from unstructured.ingest.interfaces import (
 from unstructured.ingest.logger import logger
 from unstructured.utils import requires_dependencies
 
+FETCH_MODES = ("get", "scan", "mget")
+
+# NOTE(agent) - How long the scroll context of the index scan is kept alive between pages. The
+# docs are consumed as workers free up, so a page can wait on a whole batch being processed.
+SCROLL_KEEP_ALIVE = "30m"
+
+
+@lru_cache(maxsize=None)
+def compile_jq_query(jq_query: str):
+    """Compiles a jq query once per process, rather than once per document."""
+    return jq.compile(jq_query)
+
 
 @dataclass
 class SimpleElasticsearchConfig(BaseConnectorConfig):
@@ -29,11 +45,35 @@ class SimpleElasticsearchConfig(BaseConnectorConfig):
 
     and jq_query is a query to get specific fields from each document that is reached,
     rather than getting and processing all fields in a document.
+
+    fields restricts the _source fields that are fetched from the cluster. fetch_mode is one of
+    "get", which fetches each document with its own request from the worker processes, "scan",
+    which carries the _source of each document through the scan of the index, or "mget", which
+    fetches the _source of batch_size documents per request. batch_size is also the page size
+    of the scan, and num_slices splits the scan into that many parallel sliced scans.
+    scroll_keep_alive is how long the scan waits for its next page to be requested before the
+    cluster drops it, which needs to cover processing batch_size documents.
     """
 
     url: str
     index_name: str
     jq_query: Optional[str]
+    fields: Optional[List[str]] = None
+    fetch_mode: str = "get"
+    batch_size: int = 100
+    num_slices: int = 1
+    scroll_keep_alive: str = SCROLL_KEEP_ALIVE
+
+    def __post_init__(self):
+        if self.fetch_mode not in FETCH_MODES:
+            raise ValueError(
+                f"fetch_mode must be one of {', '.join(FETCH_MODES)}, got {self.fetch_mode}.",
+            )
+
+    @staticmethod
+    def parse_fields(fields_str: str) -> List[str]:
+        """Parses a comma separated list of fields into a list of field names."""
+        return [field.strip() for field in fields_str.split(",") if field.strip()]
 
 
 @dataclass
@@ -52,12 +92,14 @@ class ElasticsearchIngestDoc(IngestDocCleanupMixin, BaseIngestDoc):
     """Class encapsulating fetching a doc and writing processed results (but not
     doing the processing!).
 
-    Current implementation creates a python Elasticsearch client to fetch each doc,
-    rather than creating a client for each thread.
+    If the connector fetched the _source of the document in bulk, it is passed in as
+    document_source and no request is made to fetch the doc. Otherwise the doc is fetched with
+    the Elasticsearch client of the worker process.
     """
 
     config: SimpleElasticsearchConfig
     file_meta: ElasticsearchFileMeta
+    document_source: Optional[dict] = None
 
     # TODO: remove one of filename or _tmp_download_file, using a wrapper
     @property
@@ -73,7 +115,10 @@ class ElasticsearchIngestDoc(IngestDocCleanupMixin, BaseIngestDoc):
         """Create filename document id combined with a hash of the query to uniquely identify
         the output file."""
         # Generate SHA256 hash and take the first 8 characters
-        query_hash = hashlib.sha256((self.config.jq_query or "").encode()).hexdigest()[:8]
+        query = self.config.jq_query or ""
+        if self.config.fields:
+            query += f"_{','.join(self.config.fields)}"
+        query_hash = hashlib.sha256(query.encode()).hexdigest()[:8]
         output_file = f"{self.file_meta.document_id}-{query_hash}.json"
         return Path(self.standard_config.output_dir) / self.config.index_name / output_file
 
@@ -108,16 +153,22 @@ class ElasticsearchIngestDoc(IngestDocCleanupMixin, BaseIngestDoc):
     @requires_dependencies(["elasticsearch"])
     @BaseIngestDoc.skip_if_file_exists
     def get_file(self):
-        logger.debug(f"Fetching {self} - PID: {os.getpid()}")
-        # TODO: instead of having a separate client for each doc,
-        # have a separate client for each process
-        es = Elasticsearch(self.config.url)
-        document_dict = es.get(
-            index=self.config.index_name,
-            id=self.file_meta.document_id,
-        ).body["_source"]
+        document_dict = self.document_source
+        if document_dict is None:
+            logger.debug(f"Fetching {self} - PID: {os.getpid()}")
+            es = get_client(
+                ("elasticsearch", self.config.url),
+                lambda: Elasticsearch(self.config.url, connections_per_node=HTTP_POOL_MAXSIZE),
+            )
+            document_dict = es.get(
+                index=self.config.index_name,
+                id=self.file_meta.document_id,
+                source_includes=self.config.fields,
+            ).body["_source"]
         if self.config.jq_query:
-            document_dict = json.loads(jq.compile(self.config.jq_query).input(document_dict).text())
+            document_dict = json.loads(
+                compile_jq_query(self.config.jq_query).input(document_dict).text(),
+            )
         self.document = self._concatenate_dict_fields(document_dict)
         self.filename.parent.mkdir(parents=True, exist_ok=True)
         with open(self.filename, "w", encoding="utf8") as f:
@@ -139,31 +190,108 @@ class ElasticsearchConnector(ConnectorCleanupMixin, BaseConnector):
         super().__init__(standard_config, config)
 
     def initialize(self):
-        self.es = Elasticsearch(self.config.url)
+        # NOTE(agent) - The slices are scanned in parallel, so the client keeps a connection
+        # per slice and download thread alive rather than the default of 10
+        self.es = Elasticsearch(self.config.url, connections_per_node=HTTP_POOL_MAXSIZE)
         self.scan_query: dict = {"query": {"match_all": {}}}
         self.search_query: dict = {"match_all": {}}
         self.es.search(index=self.config.index_name, query=self.search_query, size=1)
 
     @requires_dependencies(["elasticsearch"])
-    def _get_doc_ids(self):
-        """Fetches all document ids in an index"""
-        hits = scan(
+    def _scan_slice(self, slice_id: Optional[int] = None) -> Iterator[dict]:
+        """Scans the hits of one slice of the index, or of the whole index if slice_id is None.
+        The _source of each hit is only included when documents are fetched with the scan."""
+        query = dict(self.scan_query)
+        if self.config.fetch_mode == "scan":
+            query["_source"] = self.config.fields or True
+        else:
+            query["_source"] = False
+        if slice_id is not None:
+            query["slice"] = {"id": slice_id, "max": self.config.num_slices}
+
+        return scan(
             self.es,
-            query=self.scan_query,
-            scroll="1m",
+            query=query,
+            scroll=self.config.scroll_keep_alive,
+            size=self.config.batch_size,
             index=self.config.index_name,
         )
 
-        return [hit["_id"] for hit in hits]
+    def _scan_hits(self) -> Iterator[dict]:
+        """Scans the hits of all documents in the index. With more than one slice, the slices
+        are scanned in parallel threads and their hits are yielded as they arrive."""
+        if self.config.num_slices <= 1:
+            yield from self._scan_slice()
+            return
+
+        # NOTE(agent) - Each slice puts its hits on the queue, followed by None or the
+        # exception that ended the scan. The queue is bounded so that slices do not run far
+        # ahead of the docs that are consumed.
+        hits: queue.Queue = queue.Queue(maxsize=self.config.num_slices * self.config.batch_size)
+
+        def scan_slice(slice_id: int):
+            try:
+                for hit in self._scan_slice(slice_id):
+                    hits.put(hit)
+            except Exception as e:
+                hits.put(e)
+            else:
+                hits.put(None)
+
+        for slice_id in range(self.config.num_slices):
+            threading.Thread(target=scan_slice, args=(slice_id,), daemon=True).start()
+
+        num_running_slices = self.config.num_slices
+        while num_running_slices:
+            hit = hits.get()
+            if hit is None:
+                num_running_slices -= 1
+            elif isinstance(hit, Exception):
+                raise hit
+            else:
+                yield hit
+
+    def _get_doc_sources(self, hits: Iterator[dict]) -> Iterator[tuple]:
+        """Yields the id and _source of each hit. In mget mode the _source of batch_size hits
+        at a time is fetched with a single request."""
+        if self.config.fetch_mode == "scan":
+            for hit in hits:
+                yield hit["_id"], hit.get("_source", {})
+        elif self.config.fetch_mode == "mget":
+            ids: List[str] = []
+            for hit in hits:
+                ids.append(hit["_id"])
+                if len(ids) >= self.config.batch_size:
+                    yield from self._mget(ids)
+                    ids = []
+            if ids:
+                yield from self._mget(ids)
+        else:
+            for hit in hits:
+                yield hit["_id"], None
+
+    def _mget(self, ids: List[str]) -> Iterator[tuple]:
+        response = self.es.mget(
+            index=self.config.index_name,
+            ids=ids,
+            source_includes=self.config.fields,
+        )
+        for doc in response.body["docs"]:
+            if doc.get("found"):
+                yield doc["_id"], doc.get("_source", {})
+            else:
+                logger.warning(f"Document {doc['_id']} was removed before it could be fetched")
 
-    def get_ingest_docs(self):
-        """Fetches all documents in an index, using ids that are fetched with _get_doc_ids"""
-        ids = self._get_doc_ids()
-        return [
-            ElasticsearchIngestDoc(
+    def get_ingest_docs(self) -> Iterator[ElasticsearchIngestDoc]:
+        """Yields all documents in an index, using ids that are fetched with a scan of the
+        index. Depending on the fetch mode, the _source of each document is fetched in bulk
+        here rather than per document in the worker processes. The docs are yielded a page of
+        the scan, or an mget batch, at a time as they are consumed, so only the sources of the
+        docs waiting to be processed are held in memory."""
+        for id, document_source in self._get_doc_sources(self._scan_hits()):
+            yield ElasticsearchIngestDoc(
                 self.standard_config,
                 self.config,
                 ElasticsearchFileMeta(self.config.index_name, id),
+                document_source=document_source,
             )
-            for id in ids
-        ]
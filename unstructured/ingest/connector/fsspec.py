@@ -1,9 +1,11 @@
+import json
 import os
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Type
+from typing import Dict, Optional, Type
 
+from unstructured.ingest.clients import get_client
 from unstructured.ingest.interfaces import (
     BaseConnector,
     BaseConnectorConfig,
@@ -14,6 +16,10 @@ from unstructured.ingest.interfaces import (
 )
 from unstructured.ingest.logger import logger
 
+# NOTE(agent) - Keys in fsspec file details that change whenever the file content changes,
+# in order of preference. They differ between the fsspec implementations.
+FILE_VERSION_KEYS = ["ETag", "etag", "md5", "content_hash", "generation", "version_id"]
+
 SUPPORTED_REMOTE_FSSPEC_PROTOCOLS = [
     "s3",
     "s3a",
@@ -80,6 +86,7 @@ class FsspecIngestDoc(IngestDocCleanupMixin, BaseIngestDoc):
 
     config: SimpleFsspecConfig
     remote_file_path: str
+    remote_file_version: Optional[str] = None
 
     def _tmp_download_file(self):
         return Path(self.standard_config.download_dir) / self.remote_file_path.replace(
@@ -104,8 +111,13 @@ class FsspecIngestDoc(IngestDocCleanupMixin, BaseIngestDoc):
         from fsspec import AbstractFileSystem, get_filesystem_class
 
         self._create_full_tmp_dir_path()
-        fs: AbstractFileSystem = get_filesystem_class(self.config.protocol)(
-            **self.config.access_kwargs,
+        fs: AbstractFileSystem = get_client(
+            (
+                "fsspec",
+                self.config.protocol,
+                json.dumps(self.config.access_kwargs, sort_keys=True, default=str),
+            ),
+            lambda: get_filesystem_class(self.config.protocol)(**self.config.access_kwargs),
         )
         logger.debug(f"Fetching {self} - PID: {os.getpid()}")
         fs.get(rpath=self.remote_file_path, lpath=self._tmp_download_file().as_posix())
@@ -115,6 +127,10 @@ class FsspecIngestDoc(IngestDocCleanupMixin, BaseIngestDoc):
         """The filename of the file after downloading from cloud"""
         return self._tmp_download_file()
 
+    @property
+    def source_version(self) -> Optional[str]:
+        return self.remote_file_version
+
 
 class FsspecConnector(ConnectorCleanupMixin, BaseConnector):
     """Objects of this class support fetching document(s) from"""
@@ -133,6 +149,7 @@ class FsspecConnector(ConnectorCleanupMixin, BaseConnector):
         self.fs: AbstractFileSystem = get_filesystem_class(self.config.protocol)(
             **self.config.access_kwargs,
         )
+        self._file_versions: Dict[str, str] = {}
 
     def initialize(self):
         """Verify that can get metadata for an object, validates connections info."""
@@ -148,7 +165,7 @@ class FsspecConnector(ConnectorCleanupMixin, BaseConnector):
             # directories that are listed in cloud storage can cause problems
             # because they are seen as 0 byte files
             return [
-                x.get("name")
+                self._add_file_version(x.get("name"), x)
                 for x in self.fs.ls(self.config.path_without_protocol, detail=True)
                 if x.get("size") > 0
             ]
@@ -156,7 +173,7 @@ class FsspecConnector(ConnectorCleanupMixin, BaseConnector):
             # fs.find will recursively walk directories
             # "size" is a common key for all the cloud protocols with fs
             return [
-                k
+                self._add_file_version(k, v)
                 for k, v in self.fs.find(
                     self.config.path_without_protocol,
                     detail=True,
@@ -164,12 +181,22 @@ class FsspecConnector(ConnectorCleanupMixin, BaseConnector):
                 if v.get("size") > 0
             ]
 
+    def _add_file_version(self, name: str, details: dict) -> str:
+        """Remembers the version of the file from the listing details, if the filesystem
+        reports one, so docs can be compared against the ingest manifest without fetching."""
+        for key in FILE_VERSION_KEYS:
+            if details.get(key) is not None:
+                self._file_versions[name] = str(details[key])
+                break
+        return name
+
     def get_ingest_docs(self):
         return [
             self.ingest_doc_cls(
                 standard_config=self.standard_config,
                 config=self.config,
                 remote_file_path=file,
+                remote_file_version=self._file_versions.get(file),
             )
             for file in self._list_files()
         ]
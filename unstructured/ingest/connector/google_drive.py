@@ -1,5 +1,4 @@
 import io
-import json
 import os
 from dataclasses import dataclass
 from mimetypes import guess_extension
@@ -8,6 +7,7 @@ from typing import Dict, Optional
 
 from unstructured.file_utils.filetype import EXT_TO_FILETYPE
 from unstructured.file_utils.google_filetype import GOOGLE_DRIVE_EXPORT_TYPES
+from unstructured.ingest.clients import get_client
 from unstructured.ingest.interfaces import (
     BaseConnector,
     BaseConnectorConfig,
@@ -103,7 +103,13 @@ class GoogleDriveIngestDoc(IngestDocCleanupMixin, BaseIngestDoc):
         from googleapiclient.errors import HttpError
         from googleapiclient.http import MediaIoBaseDownload
 
-        self.config.service = create_service_account_object(self.config.service_account_key)
+        # NOTE(agent) - The service object is not thread safe, so each download thread
+        # gets its own
+        service = get_client(
+            ("google_drive", self.config.service_account_key),
+            lambda: create_service_account_object(self.config.service_account_key),
+            per_thread=True,
+        )
 
         if self.file_meta.get("mimeType", "").startswith("application/vnd.google-apps"):
             export_mime = GOOGLE_DRIVE_EXPORT_TYPES.get(
@@ -117,12 +123,12 @@ class GoogleDriveIngestDoc(IngestDocCleanupMixin, BaseIngestDoc):
                 )
                 return
 
-            request = self.config.service.files().export_media(
+            request = service.files().export_media(
                 fileId=self.file_meta.get("id"),
                 mimeType=export_mime,
             )
         else:
-            request = self.config.service.files().get_media(fileId=self.file_meta.get("id"))
+            request = service.files().get_media(fileId=self.file_meta.get("id"))
         file = io.BytesIO()
         downloader = MediaIoBaseDownload(file, request)
         downloaded = False
@@ -156,7 +162,7 @@ class GoogleDriveIngestDoc(IngestDocCleanupMixin, BaseIngestDoc):
             return
         self._output_filename.parent.mkdir(parents=True, exist_ok=True)
         with open(self._output_filename, "w") as output_f:
-            output_f.write(json.dumps(self.isd_elems_no_filename, ensure_ascii=False, indent=2))
+            output_f.write(self._serialize_result())
         logger.info(f"Wrote {self._output_filename}")
 
 
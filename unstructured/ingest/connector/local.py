@@ -2,6 +2,7 @@ import fnmatch
 import glob
 import os
 from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 from typing import Optional, Type
 
@@ -42,6 +43,12 @@ class LocalIngestDoc(BaseIngestDoc):
         """The filename of the local file to be processed"""
         return Path(self.path)
 
+    @property
+    def source_date_modified(self) -> Optional[str]:
+        """The mtime of the file, only recorded in the ingest manifest since it is not stable
+        across checkouts or copies of the same file."""
+        return datetime.fromtimestamp(os.path.getmtime(self.path)).isoformat()
+
     def cleanup_file(self):
         """Not applicable to local file system"""
         pass
@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import List, Optional
 from uuid import UUID
 
+from unstructured.ingest.clients import get_client
 from unstructured.ingest.connector.notion.types.database import Database
 from unstructured.ingest.connector.notion.types.page import Page
 from unstructured.ingest.interfaces import (
@@ -43,6 +44,16 @@ class SimpleNotionConfig(BaseConnectorConfig):
         return make_default_logger(logging.DEBUG if self.verbose else logging.INFO)
 
 
+def get_notion_client(api_key: str, config: SimpleNotionConfig):
+    """Returns the Notion client for api_key, shared by the docs handled in a worker process."""
+    from unstructured.ingest.connector.notion.client import Client as NotionClient
+
+    return get_client(
+        ("notion", api_key),
+        lambda: NotionClient(auth=api_key, logger=config.get_logger()),
+    )
+
+
 @dataclass
 class NotionPageIngestDoc(IngestDocCleanupMixin, BaseIngestDoc):
     """Class encapsulating fetching a doc and writing processed results (but not
@@ -76,14 +87,13 @@ class NotionPageIngestDoc(IngestDocCleanupMixin, BaseIngestDoc):
     def get_file(self):
         from notion_client import APIErrorCode, APIResponseError
 
-        from unstructured.ingest.connector.notion.client import Client as NotionClient
         from unstructured.ingest.connector.notion.helpers import extract_page_text
 
         self._create_full_tmp_dir_path()
 
         self.config.get_logger().debug(f"fetching page {self.page_id} - PID: {os.getpid()}")
 
-        client = NotionClient(auth=self.api_key, logger=self.config.get_logger())
+        client = get_notion_client(self.api_key, self.config)
 
         try:
             text_extraction = extract_page_text(
@@ -108,9 +118,7 @@ class NotionPageIngestDoc(IngestDocCleanupMixin, BaseIngestDoc):
     def get_file_metadata(self):
         from notion_client import APIErrorCode, APIResponseError
 
-        from unstructured.ingest.connector.notion.client import Client as NotionClient
-
-        client = NotionClient(auth=self.api_key, logger=self.config.get_logger())
+        client = get_notion_client(self.api_key, self.config)
 
         # The Notion block endpoint gives more hierarchical information (parent,child relationships)
         # than the pages endpoint so choosing to use that one to get metadata about the page
@@ -190,14 +198,13 @@ class NotionDatabaseIngestDoc(IngestDocCleanupMixin, BaseIngestDoc):
     def get_file(self):
         from notion_client import APIErrorCode, APIResponseError
 
-        from unstructured.ingest.connector.notion.client import Client as NotionClient
         from unstructured.ingest.connector.notion.helpers import extract_database_text
 
         self._create_full_tmp_dir_path()
 
         self.config.get_logger().debug(f"fetching database {self.database_id} - PID: {os.getpid()}")
 
-        client = NotionClient(auth=self.api_key, logger=self.config.get_logger())
+        client = get_notion_client(self.api_key, self.config)
 
         try:
             text_extraction = extract_database_text(
@@ -222,9 +229,7 @@ class NotionDatabaseIngestDoc(IngestDocCleanupMixin, BaseIngestDoc):
     def get_file_metadata(self):
         from notion_client import APIErrorCode, APIResponseError
 
-        from unstructured.ingest.connector.notion.client import Client as NotionClient
-
-        client = NotionClient(auth=self.api_key, logger=self.config.get_logger())
+        client = get_notion_client(self.api_key, self.config)
 
         # The Notion block endpoint gives more hierarchical information (parent,child relationships)
         # than the pages endpoint so choosing to use that one to get metadata about the page
@@ -3,6 +3,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, List, Optional
 
 from unstructured.file_utils.filetype import EXT_TO_FILETYPE
+from unstructured.ingest.clients import get_client
 from unstructured.ingest.interfaces import (
     BaseConnector,
     BaseConnectorConfig,
@@ -43,10 +44,21 @@ class SimpleOneDriveConfig(BaseConnectorConfig):
         from msal import ConfidentialClientApplication
 
         try:
-            app = ConfidentialClientApplication(
-                authority=f"{self.authority_url}/{self.tenant}",
-                client_id=self.client_id,
-                client_credential=self.client_credential,
+            # NOTE(agent) - The app caches the access token, so reusing it across docs
+            # only requests a new token once the cached one expires
+            app = get_client(
+                (
+                    "onedrive",
+                    self.authority_url,
+                    self.tenant,
+                    self.client_id,
+                    self.client_credential,
+                ),
+                lambda: ConfidentialClientApplication(
+                    authority=f"{self.authority_url}/{self.tenant}",
+                    client_id=self.client_id,
+                    client_credential=self.client_credential,
+                ),
             )
             token = app.acquire_token_for_client(scopes=["https://graph.microsoft.com/.default"])
         except ValueError as exc:
@@ -4,6 +4,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
+from unstructured.ingest.clients import get_client
 from unstructured.ingest.interfaces import (
     BaseConnector,
     BaseConnectorConfig,
@@ -100,7 +101,7 @@ class SlackIngestDoc(IngestDocCleanupMixin, BaseIngestDoc):
             logger.debug(f"fetching channel {self.channel} - PID: {os.getpid()}")
 
         messages = []
-        self.client = WebClient(token=self.token)
+        client = get_client(("slack", self.token), lambda: WebClient(token=self.token))
 
         try:
             oldest = "0"
@@ -111,14 +112,14 @@ class SlackIngestDoc(IngestDocCleanupMixin, BaseIngestDoc):
             if self.latest:
                 latest = self.convert_datetime(self.latest)
 
-            result = self.client.conversations_history(
+            result = client.conversations_history(
                 channel=self.channel,
                 oldest=oldest,
                 latest=latest,
             )
             messages.extend(result["messages"])
             while result["has_more"]:
-                result = self.client.conversations_history(
+                result = client.conversations_history(
                     channel=self.channel,
                     oldest=oldest,
                     latest=latest,
@@ -7,6 +7,7 @@ from unstructured_inference.models.base import get_model
 
 from unstructured.ingest.interfaces import BaseIngestDoc as IngestDoc
 from unstructured.ingest.logger import logger
+from unstructured.ingest.manifest import get_file_content_hash
 
 
 def initialize():
@@ -24,6 +25,8 @@ def initialize():
 
 def process_document(doc: "IngestDoc", **partition_kwargs) -> Optional[List[Dict[str, Any]]]:
     """Process any IngestDoc-like class of document with chosen Unstructured's partition logic.
+    Errors are logged and re-raised, so the processor can fail the run once every doc has been
+    processed.
 
     Parameters
     ----------
@@ -43,8 +46,57 @@ def process_document(doc: "IngestDoc", **partition_kwargs) -> Optional[List[Dict
         # results across all docs in memory.
         doc.write_result()
     except Exception:
-        # TODO(crag) save the exception instead of print?
         logger.error(f"Failed to process {doc}", exc_info=True)
+        raise
     finally:
         doc.cleanup_file()
-        return isd_elems_no_filename
+    return isd_elems_no_filename
+
+
+def process_document_if_changed(
+    doc: "IngestDoc",
+    previous_content_hash: Optional[str] = None,
+    **partition_kwargs,
+) -> str:
+    """Process an IngestDoc like process_document, but skip partitioning if the fetched file
+    has the same content hash as when it was last processed and its output still exists.
+
+    Returns the content hash of the fetched file. Errors are logged and re-raised, like in
+    process_document.
+
+    Parameters
+    ----------
+    previous_content_hash
+        the content hash recorded in the ingest manifest the last time the doc was processed
+    partition_kwargs
+        ultimately the parameters passed to partition()
+    """
+    try:
+        doc.get_file()
+        content_hash = get_file_content_hash(doc.filename)
+        if content_hash == previous_content_hash and doc.has_output():
+            logger.info(f"Skipping {doc}, its content has not changed")
+            return content_hash
+
+        doc.process_file(**partition_kwargs)
+        doc.write_result()
+    except Exception:
+        logger.error(f"Failed to process {doc}", exc_info=True)
+        raise
+    finally:
+        doc.cleanup_file()
+    return content_hash
+
+
+def partition_document(doc: "IngestDoc", **partition_kwargs) -> "IngestDoc":
+    """Partition an IngestDoc that has already been fetched with get_file(). Used by the
+    pipelined processor, where downloading and writing results happen in separate stages.
+    The results are stored on the doc for write_result().
+
+    Parameters
+    ----------
+    partition_kwargs
+        ultimately the parameters passed to partition()
+    """
+    doc.process_file(**partition_kwargs)
+    return doc
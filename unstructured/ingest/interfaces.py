@@ -2,7 +2,6 @@
 through Unstructured."""
 
 import functools
-import json
 import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
@@ -10,12 +9,12 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import requests
-
 from unstructured.documents.elements import DataSourceMetadata
+from unstructured.ingest.clients import get_client
 from unstructured.ingest.logger import logger
+from unstructured.partition.api import PartitionAPIClient
 from unstructured.partition.auto import partition
-from unstructured.staging.base import convert_to_dict
+from unstructured.staging.base import convert_to_dict, elements_to_jsonl, json_dumps
 
 
 @dataclass
@@ -29,6 +28,13 @@ class ProcessorConfigs:
     num_processes: int
     reprocess: bool
     max_docs: int
+    max_tasks_per_child: Optional[int] = None
+    doc_timeout: Optional[float] = None
+    download_workers: int = 0
+    download_queue_depth: int = 4
+    write_queue_depth: int = 4
+    incremental: bool = False
+    delete_removed_outputs: bool = False
 
 
 @dataclass
@@ -49,6 +55,11 @@ class StandardConnectorConfig:
     api_key: str = ""
     preserve_downloads: bool = False
     re_download: bool = False
+    # write structured outputs without indentation, which is smaller and faster to write
+    compact_output: bool = False
+    # write structured outputs as JSON Lines, one element per line, which can be read a line at
+    # a time
+    jsonl_output: bool = False
 
 
 class BaseConnectorConfig(ABC):
@@ -157,6 +168,18 @@ class BaseIngestDoc(ABC):
         the version of the document."""
         return None
 
+    @property
+    def source_version(self) -> Optional[str]:
+        """The version of the source document recorded in the ingest manifest to detect changes
+        between incremental runs. Defaults to version."""
+        return self.version
+
+    @property
+    def source_date_modified(self) -> Optional[str]:
+        """The modified date of the source document recorded in the ingest manifest to detect
+        changes between incremental runs. Defaults to date_modified."""
+        return self.date_modified
+
     @abstractmethod
     def cleanup_file(self):
         """Removes the local copy the file (or anything else) after successful processing."""
@@ -191,13 +214,25 @@ class BaseIngestDoc(ABC):
         """Determine if structured output for this doc already exists."""
         return self._output_filename.is_file() and self._output_filename.stat().st_size
 
+    def _serialize_result(self) -> str:
+        indent = None if self.standard_config.compact_output else 2
+        return json_dumps(self.isd_elems_no_filename, indent=indent)
+
     def write_result(self):
-        """Write the structured json result for this doc. result must be json serializable."""
+        """Write the structured json result for this doc. result must be json serializable.
+        With jsonl_output the elements are written as JSON Lines, to the same output filename."""
         if self.standard_config.download_only:
             return
         self._output_filename.parent.mkdir(parents=True, exist_ok=True)
-        with open(self._output_filename, "w", encoding="utf8") as output_f:
-            json.dump(self.isd_elems_no_filename, output_f, ensure_ascii=False, indent=2)
+        if self.standard_config.jsonl_output:
+            elements_to_jsonl(
+                self.isd_elems_no_filename,
+                filename=str(self._output_filename),
+                encoding="utf8",
+            )
+        else:
+            with open(self._output_filename, "w", encoding="utf8") as output_f:
+                output_f.write(self._serialize_result())
         logger.info(f"Wrote {self._output_filename}")
 
     def partition_file(self, **partition_kwargs) -> List[Dict[str, Any]]:
@@ -222,14 +257,16 @@ class BaseIngestDoc(ABC):
 
             logger.debug(f"Using remote partition ({endpoint})")
 
+            client = get_client(
+                ("partition_api", endpoint, self.standard_config.api_key),
+                lambda: PartitionAPIClient(
+                    api_url=endpoint,
+                    api_key=self.standard_config.api_key,
+                ),
+            )
             with open(self.filename, "rb") as f:
-                headers_dict = {}
-                if len(self.standard_config.api_key) > 0:
-                    headers_dict["UNSTRUCTURED-API-KEY"] = self.standard_config.api_key
-                response = requests.post(
-                    f"{endpoint}",
-                    files={"files": (str(self.filename), f)},
-                    headers=headers_dict,
+                response = client.post(
+                    files=[("files", (str(self.filename), f))],
                     # TODO: add m_data_source_metadata to unstructured-api pipeline_api and then
                     # pass the stringified json here
                 )
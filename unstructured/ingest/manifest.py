@@ -0,0 +1,182 @@
+"""A persistent record of the docs ingested into an output dir, used to only fetch and
+partition docs that are new or have changed at the source since the last run."""
+
+import contextlib
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from unstructured.ingest.logger import logger
+
+MANIFEST_FILENAME = ".ingest-manifest.sqlite3"
+
+# NOTE(agent) - Pending writes are committed in batches since each commit is an fsync,
+# which would dominate the run time when marking millions of unchanged docs as seen
+COMMIT_EVERY = 1000
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class ManifestEntry:
+    """The source identity and version of a doc the last time it was processed."""
+
+    output_path: str
+    version: Optional[str] = None
+    date_modified: Optional[str] = None
+    content_hash: Optional[str] = None
+    record_locator: Optional[str] = None
+    source_url: Optional[str] = None
+
+    @classmethod
+    def from_doc(cls, doc, content_hash: Optional[str] = None) -> "ManifestEntry":
+        return cls(
+            output_path=str(doc._output_filename),
+            version=doc.source_version,
+            date_modified=doc.source_date_modified,
+            content_hash=content_hash,
+            record_locator=(
+                json.dumps(doc.record_locator, sort_keys=True)
+                if doc.record_locator is not None
+                else None
+            ),
+            source_url=doc.source_url,
+        )
+
+    def has_same_source_version(self, other: "ManifestEntry") -> bool:
+        """Whether the source reports the same version and modified date for both entries. If
+        the source reports neither, the versions cannot be compared and this is False."""
+        if self.version is None and self.date_modified is None:
+            return False
+        return self.version == other.version and self.date_modified == other.date_modified
+
+
+def get_file_content_hash(filename) -> str:
+    """Returns the sha256 hex digest of a local file."""
+    content_hash = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            content_hash.update(chunk)
+    return content_hash.hexdigest()
+
+
+def _is_within_dir(path: str, directory: Path) -> bool:
+    try:
+        Path(path).resolve().relative_to(directory)
+    except ValueError:
+        return False
+    return True
+
+
+class IngestManifest:
+    """SQLite backed manifest stored in the output dir. Records the source version, modified
+    date and content hash of each doc that was processed successfully, and which docs were
+    listed by the connector in the current run so that outputs for docs that were removed at
+    the source can be deleted."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.run_started = time.time()
+        self._lock = threading.Lock()
+        self._num_pending_writes = 0
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS docs ("
+            "output_path TEXT PRIMARY KEY, "
+            "version TEXT, "
+            "date_modified TEXT, "
+            "content_hash TEXT, "
+            "record_locator TEXT, "
+            "source_url TEXT, "
+            "last_seen REAL)",
+        )
+        self._connection.commit()
+
+    @classmethod
+    def for_output_dir(cls, output_dir: str) -> "IngestManifest":
+        return cls(os.path.join(output_dir, MANIFEST_FILENAME))
+
+    def get(self, output_path: str) -> Optional[ManifestEntry]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT output_path, version, date_modified, content_hash, record_locator, "
+                "source_url FROM docs WHERE output_path = ?",
+                (output_path,),
+            ).fetchone()
+        return ManifestEntry(*row) if row is not None else None
+
+    def mark_seen(self, output_path: str):
+        """Records that the doc was listed by the connector in this run."""
+        self._write(
+            "UPDATE docs SET last_seen = ? WHERE output_path = ?",
+            (self.run_started, output_path),
+        )
+
+    def record(self, entry: ManifestEntry):
+        """Records a doc that was processed successfully in this run."""
+        self._write(
+            "INSERT OR REPLACE INTO docs (output_path, version, date_modified, content_hash, "
+            "record_locator, source_url, last_seen) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                entry.output_path,
+                entry.version,
+                entry.date_modified,
+                entry.content_hash,
+                entry.record_locator,
+                entry.source_url,
+                self.run_started,
+            ),
+        )
+
+    def delete_removed_outputs(self) -> List[str]:
+        """Deletes the outputs and entries of docs that were not listed by the connector in
+        this run, returning the deleted output paths. Outputs outside the dir of the manifest
+        are never deleted, only their entries."""
+        output_dir = Path(self.path).parent.resolve()
+        deleted_output_paths = []
+        with self._lock:
+            output_paths = [
+                row[0]
+                for row in self._connection.execute(
+                    "SELECT output_path FROM docs WHERE last_seen IS NULL OR last_seen < ?",
+                    (self.run_started,),
+                )
+            ]
+            for output_path in output_paths:
+                if not _is_within_dir(output_path, output_dir):
+                    logger.warning(
+                        f"Not deleting {output_path}, it is outside of the output dir {output_dir}",
+                    )
+                    continue
+                with contextlib.suppress(FileNotFoundError):
+                    Path(output_path).unlink()
+                deleted_output_paths.append(output_path)
+                logger.info(f"Deleted {output_path}, the doc was removed from the source")
+            self._connection.execute(
+                "DELETE FROM docs WHERE last_seen IS NULL OR last_seen < ?",
+                (self.run_started,),
+            )
+            self._connection.commit()
+            self._num_pending_writes = 0
+        return deleted_output_paths
+
+    def _write(self, sql: str, parameters: tuple):
+        with self._lock:
+            self._connection.execute(sql, parameters)
+            self._num_pending_writes += 1
+            if self._num_pending_writes >= COMMIT_EVERY:
+                self._connection.commit()
+                self._num_pending_writes = 0
+
+    def close(self):
+        with self._lock:
+            self._connection.commit()
+            self._connection.close()
@@ -1,18 +1,145 @@
+import itertools
 import logging
 import multiprocessing as mp
-from contextlib import suppress
+import queue
+import signal
+import threading
+import time
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
 from functools import partial
+from typing import Any, Dict, List, Optional, cast
 
-from unstructured.ingest.doc_processor.generalized import initialize, process_document
+from unstructured.ingest.clients import reset_clients
+from unstructured.ingest.doc_processor.generalized import (
+    initialize,
+    partition_document,
+    process_document,
+    process_document_if_changed,
+)
 from unstructured.ingest.interfaces import (
     BaseConnector,
     ProcessorConfigs,
 )
 from unstructured.ingest.logger import ingest_log_streaming_init, logger
+from unstructured.ingest.manifest import (
+    IngestManifest,
+    ManifestEntry,
+    get_file_content_hash,
+)
 
 with suppress(RuntimeError):
     mp.set_start_method("spawn")
 
+# NOTE(agent) - The number of docs per worker process that are handed to the pool before
+# the scheduler waits for one to finish. Keeps every worker busy without materializing or
+# pickling the whole doc list up front.
+MAX_PENDING_DOCS_PER_PROCESS = 2
+
+
+def init_worker(log_level: int):
+    """Initializer for the worker processes of the pool. Each worker starts with an empty
+    client registry so connectors create their clients once per worker and reuse them."""
+    ingest_log_streaming_init(log_level)
+    reset_clients()
+
+
+class DocTimeoutError(Exception):
+    """Raised in a worker process when a document takes longer than the doc timeout."""
+
+
+class DocProcessingError(Exception):
+    """Raised once the pool has drained if any of the docs failed to download, partition or
+    write, so the run fails after the other docs are processed."""
+
+
+@contextmanager
+def doc_time_limit(seconds: Optional[float]):
+    """Raises DocTimeoutError in the current process if the block runs for longer than seconds.
+    This is a no-op if seconds is None or the platform does not support SIGALRM."""
+    if not seconds or not hasattr(signal, "SIGALRM"):
+        yield
+        return
+
+    def handle_timeout(signum, frame):
+        raise DocTimeoutError(f"Processing the document took longer than {seconds} seconds.")
+
+    previous_handler = signal.signal(signal.SIGALRM, handle_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+def process_doc_with_time_limit(doc_processor_fn, doc_timeout: Optional[float], doc) -> None:
+    """Runs doc_processor_fn on doc in a worker process. The return value is discarded so the
+    elements for each doc are not pickled back to the main process."""
+    with doc_time_limit(doc_timeout):
+        doc_processor_fn(doc)
+
+
+def process_changed_doc_with_time_limit(
+    doc_processor_fn,
+    doc_timeout: Optional[float],
+    doc,
+    previous_content_hash: Optional[str],
+) -> str:
+    """Runs doc_processor_fn on doc in a worker process for an incremental run, returning the
+    content hash of the fetched doc."""
+    with doc_time_limit(doc_timeout):
+        return doc_processor_fn(doc, previous_content_hash=previous_content_hash)
+
+
+def partition_doc_with_time_limit(doc_partition_fn, doc_timeout: Optional[float], doc):
+    """Runs doc_partition_fn on an already downloaded doc in a worker process and returns the
+    doc with its results, the error if partitioning failed and how long it took."""
+    start_time = time.monotonic()
+    error = None
+    try:
+        with doc_time_limit(doc_timeout):
+            doc = doc_partition_fn(doc)
+    except Exception as e:
+        logger.error(f"Failed to process {doc}", exc_info=True)
+        error = e
+    return doc, error, time.monotonic() - start_time
+
+
+@dataclass
+class StageMetrics:
+    """Throughput counters for one stage of the pipelined processor."""
+
+    name: str
+    num_docs: int = 0
+    num_failed: int = 0
+    busy_seconds: float = 0.0
+    start_time: float = field(default_factory=time.monotonic)
+    end_time: Optional[float] = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, seconds: float, failed: bool = False):
+        with self._lock:
+            self.num_docs += 1
+            self.num_failed += int(failed)
+            self.busy_seconds += seconds
+            self.end_time = time.monotonic()
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return (self.end_time or self.start_time) - self.start_time
+
+    @property
+    def docs_per_second(self) -> float:
+        return self.num_docs / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def __str__(self):
+        return (
+            f"{self.name} stage: {self.num_docs} docs ({self.num_failed} failed) in "
+            f"{self.elapsed_seconds:.1f}s, {self.docs_per_second:.2f} docs/s, "
+            f"{self.busy_seconds:.1f}s busy"
+        )
+
 
 class Processor:
     def __init__(
@@ -23,6 +150,14 @@ class Processor:
         reprocess,
         verbose,
         max_docs,
+        max_tasks_per_child=None,
+        doc_timeout=None,
+        doc_partition_fn=None,
+        download_workers=0,
+        download_queue_depth=4,
+        write_queue_depth=4,
+        manifest=None,
+        delete_removed_outputs=False,
     ):
         # initialize the reader and writer
         self.doc_connector = doc_connector
@@ -31,6 +166,21 @@ class Processor:
         self.reprocess = reprocess
         self.verbose = verbose
         self.max_docs = max_docs
+        self.max_tasks_per_child = max_tasks_per_child
+        self.doc_timeout = doc_timeout
+        self.num_docs_skipped = 0
+        self.num_docs_listed = 0
+        # pipelined processing, used if download_workers > 0
+        self.doc_partition_fn = doc_partition_fn
+        self.download_workers = download_workers
+        self.download_queue_depth = download_queue_depth
+        self.write_queue_depth = write_queue_depth
+        self.stage_metrics: Dict[str, StageMetrics] = {}
+        # incremental processing, used if a manifest is given
+        self.manifest: Optional[IngestManifest] = manifest
+        self.delete_removed_outputs = delete_removed_outputs
+        self._previous_content_hashes: Dict[str, Optional[str]] = {}
+        self.worker_errors: List[BaseException] = []
 
     def initialize(self):
         """Slower initialization things: check connections, load things into memory, etc."""
@@ -42,65 +192,357 @@ class Processor:
         self.doc_connector.cleanup()
 
     def _filter_docs_with_outputs(self, docs):
-        num_docs_all = len(docs)
-        docs = [doc for doc in docs if not doc.has_output()]
-        if self.max_docs is not None:
-            if num_docs_all > self.max_docs:
-                num_docs_all = self.max_docs
-            docs = docs[: self.max_docs]
-        num_docs_to_process = len(docs)
-        if num_docs_to_process == 0:
+        """Lazily skips docs that already have structured outputs, stopping after max_docs."""
+        num_docs_to_process = 0
+        for doc in docs:
+            if self.max_docs is not None and num_docs_to_process >= self.max_docs:
+                return
+            if doc.has_output():
+                self.num_docs_skipped += 1
+                continue
+            num_docs_to_process += 1
+            yield doc
+
+    def _filter_unchanged_docs(self, docs):
+        """Lazily skips docs whose source version and modified date match the manifest and
+        whose structured outputs exist, stopping after max_docs. Docs whose source reports
+        neither are fetched, and only partitioned if their content hash has changed."""
+        manifest = cast(IngestManifest, self.manifest)
+        num_docs_to_process = 0
+        for doc in docs:
+            if self.max_docs is not None and num_docs_to_process >= self.max_docs:
+                return
+            self.num_docs_listed += 1
+            entry = ManifestEntry.from_doc(doc)
+            previous_entry = manifest.get(entry.output_path)
+            if previous_entry is not None:
+                manifest.mark_seen(entry.output_path)
+                if (
+                    not self.reprocess
+                    and entry.has_same_source_version(previous_entry)
+                    and doc.has_output()
+                ):
+                    self.num_docs_skipped += 1
+                    continue
+                if not self.reprocess:
+                    self._previous_content_hashes[entry.output_path] = previous_entry.content_hash
+            num_docs_to_process += 1
+            yield doc
+
+    def _pop_previous_content_hash(self, doc) -> Optional[str]:
+        return self._previous_content_hashes.pop(str(doc._output_filename), None)
+
+    def _log_skipped_docs(self, num_docs_processed):
+        if num_docs_processed == 0:
             logger.info(
                 "All docs have structured outputs, nothing to do. Use --reprocess to process all.",
             )
-            return None
-        elif num_docs_to_process != num_docs_all:
+        elif self.num_docs_skipped:
             logger.info(
-                f"Skipping processing for {num_docs_all - num_docs_to_process} docs out of "
-                f"{num_docs_all} since their structured outputs already exist, use --reprocess to "
-                "reprocess those in addition to the unprocessed ones.",
+                f"Skipped processing for {self.num_docs_skipped} docs out of "
+                f"{self.num_docs_skipped + num_docs_processed} since their structured outputs "
+                "already exist, use --reprocess to reprocess those in addition to the "
+                "unprocessed ones.",
             )
-        return docs
+
+    def _schedule_docs(
+        self,
+        pool,
+        docs,
+        process_doc,
+        on_result=None,
+        get_args=None,
+        on_error=None,
+    ):
+        """Hands docs to the pool one at a time as workers free up. At most
+        MAX_PENDING_DOCS_PER_PROCESS docs per process are pending at once, so the connector is
+        consumed lazily and a run of slow docs cannot hold back docs queued behind them.
+        process_doc is called with get_args(doc), or just the doc, and on_result with the doc
+        and the return value of process_doc. Errors that escape process_doc are logged, passed
+        to on_error with the doc and collected in worker_errors. The callbacks run on the
+        result handler thread of the pool, so they must not block."""
+        pending_docs = threading.BoundedSemaphore(
+            self.num_processes * MAX_PENDING_DOCS_PER_PROCESS,
+        )
+
+        def on_done(doc, result):
+            try:
+                if on_result is not None:
+                    on_result(doc, result)
+            finally:
+                pending_docs.release()
+
+        def on_failed(doc, error):
+            try:
+                logger.error(f"Failed to process {doc}: {error!r}")
+                self.worker_errors.append(error)
+                if on_error is not None:
+                    on_error(doc, error)
+            finally:
+                pending_docs.release()
+
+        num_docs = 0
+        for doc in docs:
+            pending_docs.acquire()
+            pool.apply_async(
+                process_doc,
+                get_args(doc) if get_args is not None else (doc,),
+                callback=partial(on_done, doc),
+                error_callback=partial(on_failed, doc),
+            )
+            num_docs += 1
+        return num_docs
+
+    def _run_pipeline(self, pool, docs):
+        """Processes docs in three stages that run concurrently: download_workers threads fetch
+        docs to the download dir, the process pool partitions them and a writer thread writes
+        the structured outputs. The download stage hands off through a bounded queue, and at most
+        write_queue_depth partitioned docs wait for the writer on top of those pending in the
+        pool, so a stage that falls behind holds back the stages feeding it rather than buffering
+        docs in memory."""
+        self.stage_metrics = {
+            name: StageMetrics(name=name) for name in ("download", "partition", "write")
+        }
+        downloaded_docs: queue.Queue = queue.Queue(maxsize=self.download_queue_depth)
+        # NOTE(agent) - Partitioned docs are put on the queue by the result handler thread of
+        # the pool, which must never block or the results of every worker stall behind a slow
+        # writer. The queue is unbounded, and its size is bounded instead by write_slots, which
+        # the scheduler acquires before handing a doc to the pool.
+        partitioned_docs: queue.SimpleQueue = queue.SimpleQueue()
+        write_slots = threading.Semaphore(
+            self.write_queue_depth + self.num_processes * MAX_PENDING_DOCS_PER_PROCESS,
+        )
+        docs_lock = threading.Lock()
+        content_hashes: Dict[str, str] = {}
+        # NOTE(agent) - Errors that stop a download thread, such as the connector failing to
+        # list docs. They are re-raised in the main thread once the pool has drained, so the run
+        # fails instead of looking complete and deleting the outputs of docs never listed.
+        download_stage_errors: List[BaseException] = []
+        num_docs_pulled = 0
+
+        def download_doc(doc):
+            start_time = time.monotonic()
+            try:
+                doc.get_file()
+                if self.manifest is not None:
+                    content_hash = get_file_content_hash(doc.filename)
+                    content_hashes[str(doc._output_filename)] = content_hash
+                    if self._pop_previous_content_hash(doc) == content_hash and doc.has_output():
+                        logger.info(f"Skipping {doc}, its content has not changed")
+                        self.manifest.record(ManifestEntry.from_doc(doc, content_hash))
+                        doc.cleanup_file()
+                        self.stage_metrics["download"].record(time.monotonic() - start_time)
+                        return
+            except Exception as error:
+                logger.error(f"Failed to download {doc}", exc_info=True)
+                self.worker_errors.append(error)
+                self.stage_metrics["download"].record(time.monotonic() - start_time, True)
+                doc.cleanup_file()
+                return
+            self.stage_metrics["download"].record(time.monotonic() - start_time)
+            downloaded_docs.put(doc)
+
+        def download_docs():
+            nonlocal num_docs_pulled
+            try:
+                while True:
+                    with docs_lock:
+                        doc = next(docs, None)
+                        if doc is None:
+                            return
+                        num_docs_pulled += 1
+                    download_doc(doc)
+            except Exception as error:
+                logger.error("The download stage failed", exc_info=True)
+                download_stage_errors.append(error)
+
+        def finish_downloads(download_threads):
+            for thread in download_threads:
+                thread.join()
+            downloaded_docs.put(None)
+
+        def write_docs():
+            for doc, succeeded in iter(partitioned_docs.get, None):
+                start_time = time.monotonic()
+                try:
+                    if succeeded:
+                        doc.write_result()
+                        if self.manifest is not None:
+                            content_hash = content_hashes.pop(str(doc._output_filename), None)
+                            self.manifest.record(ManifestEntry.from_doc(doc, content_hash))
+                except Exception as error:
+                    logger.error(f"Failed to write results for {doc}", exc_info=True)
+                    self.worker_errors.append(error)
+                    succeeded = False
+                finally:
+                    doc.cleanup_file()
+                    write_slots.release()
+                self.stage_metrics["write"].record(time.monotonic() - start_time, not succeeded)
+
+        def schedulable_docs():
+            for doc in iter(downloaded_docs.get, None):
+                write_slots.acquire()
+                yield doc
+
+        def on_partitioned(_, result):
+            doc, error, seconds = result
+            if error is not None:
+                self.worker_errors.append(error)
+            self.stage_metrics["partition"].record(seconds, error is not None)
+            partitioned_docs.put_nowait((doc, error is None))
+
+        def on_partition_error(doc, error):
+            # NOTE(agent) - The doc never reaches the writer, so its download is cleaned up here
+            self.stage_metrics["partition"].record(0.0, failed=True)
+            content_hashes.pop(str(doc._output_filename), None)
+            try:
+                doc.cleanup_file()
+            except Exception:
+                logger.error(f"Failed to clean up {doc}", exc_info=True)
+            finally:
+                write_slots.release()
+
+        download_threads = [
+            threading.Thread(target=download_docs, daemon=True)
+            for _ in range(self.download_workers)
+        ]
+        for thread in download_threads:
+            thread.start()
+        threading.Thread(target=finish_downloads, args=(download_threads,), daemon=True).start()
+        writer_thread = threading.Thread(target=write_docs, daemon=True)
+        writer_thread.start()
+
+        self._schedule_docs(
+            pool,
+            schedulable_docs(),
+            partial(partition_doc_with_time_limit, self.doc_partition_fn, self.doc_timeout),
+            on_result=on_partitioned,
+            on_error=on_partition_error,
+        )
+        pool.close()
+        pool.join()
+        partitioned_docs.put_nowait(None)
+        writer_thread.join()
+
+        for metrics in self.stage_metrics.values():
+            logger.info(metrics)
+        if download_stage_errors:
+            raise download_stage_errors[0]
+        return num_docs_pulled
 
     def run(self):
         self.initialize()
 
-        # fetch the list of lazy downloading IngestDoc obj's
-        docs = self.doc_connector.get_ingest_docs()
+        # fetch the lazy downloading IngestDoc obj's, these are consumed as workers free up
+        docs = iter(self.doc_connector.get_ingest_docs())
 
         # remove docs that have already been processed
-        if not self.reprocess:
+        if self.manifest is not None:
+            docs = self._filter_unchanged_docs(docs)
+        elif not self.reprocess:
             docs = self._filter_docs_with_outputs(docs)
-            if not docs:
-                return
 
         # Debugging tip: use the below line and comment out the mp.Pool loop
         # block to remain in single process
-        # self.doc_processor_fn(docs[0])
-        logger.info(f"Processing {len(docs)} docs")
+        # self.doc_processor_fn(next(docs))
         try:
-            with mp.Pool(
-                processes=self.num_processes,
-                initializer=ingest_log_streaming_init,
-                initargs=(logging.DEBUG if self.verbose else logging.INFO,),
-            ) as pool:
-                pool.map(self.doc_processor_fn, docs)
+            first_doc = next(docs, None)
+            if first_doc is not None:
+                num_docs = self._process_docs(itertools.chain([first_doc], docs))
+                logger.info(f"Processed {num_docs} docs")
+            else:
+                num_docs = 0
+
+            if not self.reprocess:
+                self._log_skipped_docs(num_docs)
+            if self.manifest is not None and self.delete_removed_outputs:
+                self._delete_removed_outputs()
         finally:
+            if self.manifest is not None:
+                self.manifest.close()
             self.cleanup()
 
+    def _process_docs(self, docs):
+        with mp.Pool(
+            processes=self.num_processes,
+            initializer=init_worker,
+            initargs=(logging.DEBUG if self.verbose else logging.INFO,),
+            maxtasksperchild=self.max_tasks_per_child,
+        ) as pool:
+            if self.download_workers:
+                num_docs = self._run_pipeline(pool, docs)
+            elif self.manifest is not None:
+                num_docs = self._schedule_docs(
+                    pool,
+                    docs,
+                    partial(
+                        process_changed_doc_with_time_limit,
+                        self.doc_processor_fn,
+                        self.doc_timeout,
+                    ),
+                    on_result=self._record_processed_doc,
+                    get_args=lambda doc: (doc, self._pop_previous_content_hash(doc)),
+                )
+                pool.close()
+                pool.join()
+            else:
+                num_docs = self._schedule_docs(
+                    pool,
+                    docs,
+                    partial(
+                        process_doc_with_time_limit,
+                        self.doc_processor_fn,
+                        self.doc_timeout,
+                    ),
+                )
+                pool.close()
+                pool.join()
+
+        if self.worker_errors:
+            raise DocProcessingError(
+                f"{len(self.worker_errors)} of {num_docs} docs failed, see the errors logged "
+                "above.",
+            ) from self.worker_errors[0]
+        return num_docs
+
+    def _record_processed_doc(self, doc, content_hash: str):
+        cast(IngestManifest, self.manifest).record(ManifestEntry.from_doc(doc, content_hash))
+
+    def _delete_removed_outputs(self):
+        if self.max_docs is not None:
+            logger.warning(
+                "Not deleting outputs for docs removed from the source since --max-docs "
+                "stops listing docs early.",
+            )
+            return
+        if self.num_docs_listed == 0:
+            # NOTE(agent) - A connector that lists nothing, e.g. due to a wrong path or missing
+            # permissions, would otherwise delete every output in the dir
+            logger.warning(
+                "Not deleting outputs for docs removed from the source since the connector "
+                "did not list any docs.",
+            )
+            return
+        removed_output_paths = cast(IngestManifest, self.manifest).delete_removed_outputs()
+        logger.info(f"Deleted {len(removed_output_paths)} outputs for docs removed from the source")
+
 
 def process_documents(
     doc_connector: BaseConnector,
     processor_config: ProcessorConfigs,
     verbose=bool,
 ) -> None:
+    partition_kwargs: Dict[str, Any] = {
+        "strategy": processor_config.partition_strategy,
+        "ocr_languages": processor_config.partition_ocr_languages,
+        "encoding": processor_config.partition_encoding,
+        "pdf_infer_table_structure": processor_config.partition_pdf_infer_table_structure,
+    }
     process_document_with_partition_args = partial(
-        process_document,
-        strategy=processor_config.partition_strategy,
-        ocr_languages=processor_config.partition_ocr_languages,
-        encoding=processor_config.partition_encoding,
-        pdf_infer_table_structure=processor_config.partition_pdf_infer_table_structure,
+        process_document_if_changed if processor_config.incremental else process_document,
+        **partition_kwargs,
     )
+    partition_document_with_partition_args = partial(partition_document, **partition_kwargs)
 
     Processor(
         doc_connector=doc_connector,
@@ -109,4 +551,16 @@ def process_documents(
         reprocess=processor_config.reprocess,
         verbose=verbose,
         max_docs=processor_config.max_docs,
+        max_tasks_per_child=processor_config.max_tasks_per_child,
+        doc_timeout=processor_config.doc_timeout,
+        doc_partition_fn=partition_document_with_partition_args,
+        download_workers=processor_config.download_workers,
+        download_queue_depth=processor_config.download_queue_depth,
+        write_queue_depth=processor_config.write_queue_depth,
+        manifest=(
+            IngestManifest.for_output_dir(doc_connector.standard_config.output_dir)
+            if processor_config.incremental
+            else None
+        ),
+        delete_removed_outputs=processor_config.delete_removed_outputs,
     ).run()
@@ -15,6 +15,11 @@ def elasticsearch(
     url: str,
     index_name: str,
     jq_query: Optional[str],
+    fields: Optional[str] = None,
+    fetch_mode: str = "get",
+    batch_size: int = 100,
+    num_slices: int = 1,
+    scroll_keep_alive: str = "30m",
     **kwargs,
 ):
     ingest_log_streaming_init(logging.DEBUG if verbose else logging.INFO)
@@ -41,6 +46,11 @@ def elasticsearch(
             url=url,
             index_name=index_name,
             jq_query=jq_query,
+            fields=SimpleElasticsearchConfig.parse_fields(fields) if fields else None,
+            fetch_mode=fetch_mode,
+            batch_size=batch_size,
+            num_slices=num_slices,
+            scroll_keep_alive=scroll_keep_alive,
         ),
     )
 
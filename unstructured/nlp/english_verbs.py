@@ -0,0 +1,207 @@
+import os
+import pathlib
+from typing import FrozenSet, List, Set
+
+from unstructured.nlp.english_words import ENGLISH_WORDS
+
+DIRECTORY = pathlib.Path(__file__).parent.resolve()
+# NOTE(agent) - Each line of the verb list is the base form of a common English verb,
+# followed by its past tense and past participle forms if the verb is irregular. The regular
+# inflections are generated below and kept if they are in the list of English words.
+ENGLISH_VERBS_FILE = os.path.join(DIRECTORY, "english-verbs.txt")
+
+VOWELS = "aeiou"
+
+
+def _third_person_forms(base: str) -> List[str]:
+    if base.endswith(("s", "sh", "ch", "x", "z", "o")):
+        return [base + "es"]
+    elif base.endswith("y") and base[-2:-1] not in VOWELS:
+        return [base[:-1] + "ies"]
+    return [base + "s"]
+
+
+def _past_forms(base: str) -> List[str]:
+    if base.endswith("e"):
+        return [base + "d"]
+    elif base.endswith("y") and base[-2:-1] not in VOWELS:
+        return [base[:-1] + "ied"]
+    elif base.endswith("c"):
+        return [base + "ked", base + "ed"]
+    # NOTE(agent) - Whether the final consonant is doubled depends on the stress of the
+    # word (stopped vs. visited), so both forms are generated and checked against the words
+    return [base + "ed", base + base[-1] + "ed"]
+
+
+def _gerund_forms(base: str) -> List[str]:
+    if base.endswith("ie"):
+        return [base[:-2] + "ying"]
+    elif base.endswith("e") and not base.endswith(("ee", "ye", "oe")):
+        return [base[:-1] + "ing"]
+    elif base.endswith("c"):
+        return [base + "king", base + "ing"]
+    return [base + "ing", base + base[-1] + "ing"]
+
+
+with open(ENGLISH_VERBS_FILE) as f:
+    VERB_FORMS = [line.split() for line in f.read().splitlines() if line.strip()]
+
+_base_forms: Set[str] = set()
+_third_person: Set[str] = set()
+_past: Set[str] = set()
+_gerunds: Set[str] = set()
+for forms in VERB_FORMS:
+    base, irregular_forms = forms[0], forms[1:]
+    _base_forms.add(base)
+    _third_person.update(word for word in _third_person_forms(base) if word in ENGLISH_WORDS)
+    _gerunds.update(word for word in _gerund_forms(base) if word in ENGLISH_WORDS)
+    if irregular_forms:
+        _past.update(irregular_forms)
+    else:
+        _past.update(word for word in _past_forms(base) if word in ENGLISH_WORDS)
+
+VERB_BASE_FORMS: FrozenSet[str] = frozenset(_base_forms)
+VERB_THIRD_PERSON_FORMS: FrozenSet[str] = frozenset(_third_person)
+# NOTE(agent) - Irregular past forms that are also base forms (e.g. "cut", "read",
+# "become") are ambiguous, so they are only treated as base forms
+VERB_PAST_FORMS: FrozenSet[str] = frozenset(_past - _base_forms)
+VERB_GERUND_FORMS: FrozenSet[str] = frozenset(_gerunds)
+
+# NOTE(agent) - Forms of "be", "have" and "do" are always tagged as verbs
+AUXILIARY_VERBS: FrozenSet[str] = frozenset(
+    [
+        "am",
+        "is",
+        "are",
+        "was",
+        "were",
+        "be",
+        "been",
+        "being",
+        "has",
+        "have",
+        "had",
+        "having",
+        "do",
+        "does",
+        "did",
+    ],
+)
+
+MODAL_VERBS: FrozenSet[str] = frozenset(
+    ["can", "could", "may", "might", "must", "shall", "should", "will", "would", "ought"],
+)
+
+# NOTE(agent) - Words that are followed by the base form of a verb rather than a noun,
+# e.g. "to run", "they run", "please run"
+BASE_FORM_CUES: FrozenSet[str] = MODAL_VERBS | frozenset(
+    [
+        "to",
+        "i",
+        "you",
+        "we",
+        "they",
+        "please",
+        "not",
+        "never",
+        "also",
+        "always",
+        "often",
+        "usually",
+        "sometimes",
+        "just",
+        "let",
+        "lets",
+        "let's",
+        "'ll",
+        "'d",
+    ],
+)
+
+# NOTE(agent) - Determiners and object pronouns follow imperative verbs at the start of a
+# sentence (e.g. "Ask the teacher"). Determiners also precede plural nouns (e.g. "the reports")
+DETERMINERS: FrozenSet[str] = frozenset(
+    [
+        "a",
+        "an",
+        "the",
+        "this",
+        "these",
+        "those",
+        "my",
+        "your",
+        "our",
+        "their",
+        "his",
+        "her",
+        "its",
+        "all",
+        "some",
+        "any",
+        "each",
+        "every",
+        "no",
+    ],
+)
+
+OBJECT_PRONOUNS: FrozenSet[str] = frozenset(["me", "us", "them", "him", "it"])
+
+PREPOSITIONS: FrozenSet[str] = frozenset(
+    [
+        "of",
+        "in",
+        "on",
+        "at",
+        "for",
+        "with",
+        "by",
+        "from",
+        "about",
+        "into",
+        "over",
+        "under",
+        "between",
+        "through",
+        "and",
+        "or",
+        "per",
+    ],
+)
+
+# NOTE(agent) - Pronouns that are contracted with "is" or "has" ("it's"), as opposed to
+# possessives ("John's")
+CONTRACTED_SUBJECTS: FrozenSet[str] = frozenset(
+    ["it", "he", "she", "that", "there", "here", "what", "who", "where", "how"],
+)
+
+# NOTE(agent) - Common words that end in -ing or -ed and are not usually verbs
+NON_VERB_SUFFIX_WORDS: FrozenSet[str] = frozenset(
+    [
+        "anything",
+        "ceiling",
+        "during",
+        "evening",
+        "everything",
+        "king",
+        "morning",
+        "nothing",
+        "pudding",
+        "ring",
+        "sibling",
+        "something",
+        "spring",
+        "string",
+        "thing",
+        "wedding",
+        "wing",
+        "hundred",
+        "indeed",
+        "kindred",
+        "naked",
+        "sacred",
+        "wicked",
+    ],
+)
+
+# NOTE(agent) - Suffixes of adjectives that precede plural nouns, e.g. "annual reports"
+ADJECTIVE_SUFFIXES = ("al", "ous", "ive", "ful", "less", "ic", "able", "ible", "ary")
@@ -1,6 +1,19 @@
+import os
 import sys
-from functools import lru_cache
-from typing import List, Tuple
+import threading
+from collections import OrderedDict
+from functools import lru_cache, update_wrapper
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 if sys.version_info < (3, 8):
     from typing_extensions import Final  # pragma: no cover
@@ -9,10 +22,86 @@ else:
 
 import nltk
 from nltk import pos_tag as _pos_tag
+from nltk import pos_tag_sents as _pos_tag_sents
 from nltk import sent_tokenize as _sent_tokenize
 from nltk import word_tokenize as _word_tokenize
 
-CACHE_MAX_SIZE: Final[int] = 128
+# NOTE(agent) - The caches need to hold all of the texts of a batch classified with
+# get_text_types, since the sentences and tokens computed for the text type checks are reused
+# when the batch is POS tagged
+CACHE_MAX_SIZE: Final[int] = int(os.environ.get("UNSTRUCTURED_TOKENIZE_CACHE_SIZE", 1024))
+
+CachedT = TypeVar("CachedT")
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class TokenizerCache(Generic[CachedT]):
+    """A thread safe LRU cache for a function of a single text. Works like functools.lru_cache,
+    but the max size can be changed after the function is created with resize, and cache_info
+    also counts the entries that were evicted. A maxsize of None means the cache is unbounded."""
+
+    def __init__(self, func: Callable[[str], CachedT], maxsize: Optional[int] = CACHE_MAX_SIZE):
+        update_wrapper(self, func)
+        self._func = func
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[str, CachedT]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __call__(self, text: str) -> CachedT:
+        with self._lock:
+            if text in self._entries:
+                self._entries.move_to_end(text)
+                self._hits += 1
+                return self._entries[text]
+            self._misses += 1
+
+        value = self._func(text)
+        with self._lock:
+            self._entries[text] = value
+            self._evict()
+        return value
+
+    def _evict(self):
+        if self._maxsize is None:
+            return
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def resize(self, maxsize: Optional[int]):
+        """Changes the max size of the cache, evicting the least recently used entries if the
+        cache is now over the max size."""
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._maxsize,
+                len(self._entries),
+            )
+
+    def cache_clear(self):
+        """Clears the cache and resets the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
 
 
 def _download_nltk_package_if_not_present(package_name: str, package_category: str):
@@ -23,34 +112,98 @@ def _download_nltk_package_if_not_present(package_name: str, package_category: s
         nltk.download(package_name)
 
 
-@lru_cache(maxsize=CACHE_MAX_SIZE)
+@lru_cache(maxsize=None)
+def _ensure_nltk_package(package_name: str, package_category: str):
+    """Checks for (and if needed downloads) an NLTK package once per process, rather than
+    probing the NLTK data directories on every call to the tokenizers."""
+    _download_nltk_package_if_not_present(
+        package_name=package_name,
+        package_category=package_category,
+    )
+
+
+def _ensure_punkt():
+    _ensure_nltk_package(package_category="tokenizers", package_name="punkt")
+
+
+def _ensure_pos_tagger():
+    _ensure_punkt()
+    _ensure_nltk_package(package_category="taggers", package_name="averaged_perceptron_tagger")
+
+
+@TokenizerCache
 def sent_tokenize(text: str) -> List[str]:
     """A wrapper around the NLTK sentence tokenizer with LRU caching enabled."""
-    _download_nltk_package_if_not_present(package_category="tokenizers", package_name="punkt")
+    _ensure_punkt()
     return _sent_tokenize(text)
 
 
-@lru_cache(maxsize=CACHE_MAX_SIZE)
+@TokenizerCache
 def word_tokenize(text: str) -> List[str]:
     """A wrapper around the NLTK word tokenizer with LRU caching enabled."""
-    _download_nltk_package_if_not_present(package_category="tokenizers", package_name="punkt")
+    _ensure_punkt()
     return _word_tokenize(text)
 
 
-@lru_cache(maxsize=CACHE_MAX_SIZE)
+@TokenizerCache
 def pos_tag(text: str) -> List[Tuple[str, str]]:
-    """A wrapper around the NLTK POS tagger with LRU caching enabled."""
-    _download_nltk_package_if_not_present(package_category="tokenizers", package_name="punkt")
-    _download_nltk_package_if_not_present(
-        package_category="taggers",
-        package_name="averaged_perceptron_tagger",
-    )
+    """A wrapper around the NLTK POS tagger with LRU caching enabled. The sentences and tokens
+    come from the cached tokenizers, so they are shared with other checks on the same text,
+    e.g. sentence_count."""
+    _ensure_pos_tagger()
     # NOTE(robinson) - Splitting into sentences before tokenizing. The helps with
     # situations like "ITEM 1A. PROPERTIES" where "PROPERTIES" can be mistaken
     # for a verb because it looks like it's in verb form an "ITEM 1A." looks like the subject.
-    sentences = _sent_tokenize(text)
+    sentences = sent_tokenize(text)
     parts_of_speech = []
     for sentence in sentences:
-        tokens = _word_tokenize(sentence)
+        tokens = word_tokenize(sentence)
         parts_of_speech.extend(_pos_tag(tokens))
     return parts_of_speech
+
+
+TOKENIZER_CACHES: Dict[str, TokenizerCache] = {
+    "sent_tokenize": sent_tokenize,
+    "word_tokenize": word_tokenize,
+    "pos_tag": pos_tag,
+}
+
+
+def set_cache_size(maxsize: Optional[int], *names: str):
+    """Sets the max size of the named tokenizer caches (sent_tokenize, word_tokenize and
+    pos_tag), or of all of them if no names are given. The default size is 1024 entries and can
+    also be set with the UNSTRUCTURED_TOKENIZE_CACHE_SIZE environment variable."""
+    for name in names or TOKENIZER_CACHES:
+        TOKENIZER_CACHES[name].resize(maxsize)
+
+
+def get_cache_info() -> Dict[str, CacheInfo]:
+    """Returns the hits, misses, evictions, max size and current size of each tokenizer cache."""
+    return {name: cache.cache_info() for name, cache in TOKENIZER_CACHES.items()}
+
+
+def clear_caches():
+    """Clears all of the tokenizer caches and resets their statistics."""
+    for cache in TOKENIZER_CACHES.values():
+        cache.cache_clear()
+
+
+def pos_tag_texts(texts: Sequence[str]) -> List[List[Tuple[str, str]]]:
+    """Tags the parts of speech of each text, the same as pos_tag, but tags the sentences of
+    all of the texts with a single call to the NLTK POS tagger. The sentences and tokens come
+    from the cached tokenizers, so they are shared with other checks on the same texts."""
+    _ensure_pos_tagger()
+    sentence_tokens: List[List[str]] = []
+    num_sentences: List[int] = []
+    for text in texts:
+        sentences = sent_tokenize(text)
+        num_sentences.append(len(sentences))
+        sentence_tokens.extend(word_tokenize(sentence) for sentence in sentences)
+
+    tagged_sentences = iter(_pos_tag_sents(sentence_tokens))
+    parts_of_speech: List[List[Tuple[str, str]]] = []
+    for count in num_sentences:
+        parts_of_speech.append(
+            [tag for _ in range(count) for tag in next(tagged_sentences)],
+        )
+    return parts_of_speech
@@ -1,16 +1,32 @@
 import contextlib
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import (
     IO,
+    Any,
+    Deque,
+    Iterator,
     List,
     Optional,
+    Tuple,
 )
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from unstructured.documents.elements import Element
 from unstructured.partition.common import exactly_one
 from unstructured.staging.base import dict_to_elements, elements_from_json
 
+DEFAULT_MAX_BATCH_FILES = 10
+DEFAULT_MAX_BATCH_BYTES = 20 * 1024 * 1024
+DEFAULT_MAX_IN_FLIGHT = 4
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
 
 def partition_via_api(
     filename: Optional[str] = None,
@@ -91,14 +107,19 @@ def partition_via_api(
 def partition_multiple_via_api(
     filenames: Optional[List[str]] = None,
     content_types: Optional[List[str]] = None,
-    files: Optional[List[str]] = None,
+    files: Optional[List[IO[bytes]]] = None,
     file_filenames: Optional[List[str]] = None,
     api_url: str = "https://api.unstructured.io/general/v0/general",
     api_key: str = "",
+    max_batch_files: int = DEFAULT_MAX_BATCH_FILES,
+    max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    max_retries: int = DEFAULT_MAX_RETRIES,
     **request_kwargs,
 ) -> List[List[Element]]:
-    """Partitions multiple document using the Unstructured REST API by batching
-    the documents into a single HTTP request.
+    """Partitions multiple document using the Unstructured REST API. The documents are split
+    into batches that are each sent in a single HTTP request, with up to max_in_flight requests
+    running concurrently. Use PartitionAPIClient to get the results as they arrive.
 
     See https://api.unstructured.io/general/docs for the hosted API documentation or
     https://github.com/Unstructured-IO/unstructured-api for instructions on how to run
@@ -118,69 +139,210 @@ def partition_multiple_via_api(
         The URL for the Unstructured API. Defaults to the hosted Unstructured API.
     api_key
         The API key to pass to the Unstructured API.
+    max_batch_files
+        The maximum number of documents sent in a single request.
+    max_batch_bytes
+        The maximum total size of the documents sent in a single request. Documents that are
+        larger than this are sent in a request of their own.
+    max_in_flight
+        The maximum number of requests that run concurrently.
+    max_retries
+        The number of times a request is retried after a 429 or 5xx response or a connection
+        error, with exponential backoff.
     request_kwargs
         Additional parameters to pass to the data field of the request to the Unstructured API.
         For example the `strategy` parameter.
     """
-    headers = {
-        "ACCEPT": "application/json",
-        "UNSTRUCTURED-API-KEY": api_key,
-    }
+    with PartitionAPIClient(
+        api_url=api_url,
+        api_key=api_key,
+        max_batch_files=max_batch_files,
+        max_batch_bytes=max_batch_bytes,
+        max_in_flight=max_in_flight,
+        max_retries=max_retries,
+    ) as client:
+        return list(
+            client.partition_multiple(
+                filenames=filenames,
+                content_types=content_types,
+                files=files,
+                file_filenames=file_filenames,
+                **request_kwargs,
+            ),
+        )
 
-    if filenames is not None:
-        if content_types and len(content_types) != len(filenames):
-            raise ValueError("content_types and filenames must have the same length.")
 
-        with contextlib.ExitStack() as stack:
-            files = [stack.enter_context(open(f, "rb")) for f in filenames]  # type: ignore
+class PartitionAPIClient:
+    """A client for the Unstructured REST API that reuses its connections across requests.
+    Requests that fail with a 429 or 5xx response or a connection error are retried with
+    exponential backoff, honoring the Retry-After header.
 
-            _files = []
-            for i, file in enumerate(files):
-                filename = filenames[i]
-                content_type = content_types[i] if content_types is not None else None
-                _files.append(("files", (filename, file, content_type)))
+    Example
+    -------
+    with PartitionAPIClient(api_key=api_key, max_in_flight=8) as client:
+        for filename, elements in zip(filenames, client.partition_multiple(filenames=filenames)):
+            ...
+    """
 
-            response = requests.post(
-                api_url,
-                headers=headers,
-                data=request_kwargs,
-                files=_files,  # type: ignore
-            )
+    def __init__(
+        self,
+        api_url: str = "https://api.unstructured.io/general/v0/general",
+        api_key: str = "",
+        max_batch_files: int = DEFAULT_MAX_BATCH_FILES,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+    ):
+        if max_batch_files < 1 or max_in_flight < 1:
+            raise ValueError("max_batch_files and max_in_flight must be at least 1.")
 
-    elif files is not None:
-        if content_types and len(content_types) != len(files):
-            raise ValueError("content_types and files must have the same length.")
+        self.api_url = api_url
+        self.api_key = api_key
+        self.max_batch_files = max_batch_files
+        self.max_batch_bytes = max_batch_bytes
+        self.max_in_flight = max_in_flight
 
-        if not file_filenames:
-            raise ValueError("file_filenames must be specified if files are passed")
-        elif len(file_filenames) != len(files):
-            raise ValueError("file_filenames and files must have the same length.")
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=None,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=max_in_flight,
+            pool_maxsize=max_in_flight,
+            max_retries=retry,
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(
+            {
+                "ACCEPT": "application/json",
+                "UNSTRUCTURED-API-KEY": api_key,
+            },
+        )
 
-        _files = []
-        for i, _file in enumerate(files):  # type: ignore
-            content_type = content_types[i] if content_types is not None else None
-            filename = file_filenames[i]
-            _files.append(("files", (filename, _file, content_type)))
+    def __enter__(self) -> "PartitionAPIClient":
+        return self
 
-        response = requests.post(
-            api_url,
-            headers=headers,
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    def post(self, files: list, **request_kwargs) -> requests.Response:
+        """Sends files to the API in a single request, in the format of the files parameter
+        of requests. Returns the response of the last attempt."""
+        return self.session.post(
+            self.api_url,
             data=request_kwargs,
-            files=_files,  # type: ignore
+            files=files,
         )
 
-    if response.status_code == 200:
-        documents = []
+    def partition_multiple(
+        self,
+        filenames: Optional[List[str]] = None,
+        content_types: Optional[List[str]] = None,
+        files: Optional[List[IO[bytes]]] = None,
+        file_filenames: Optional[List[str]] = None,
+        **request_kwargs,
+    ) -> Iterator[List[Element]]:
+        """Partitions multiple documents with batched, concurrent requests to the API. Yields
+        the elements of each document in the order the documents were passed in, as soon as
+        the batch that contains the document is partitioned."""
+        if filenames is not None:
+            if content_types and len(content_types) != len(filenames):
+                raise ValueError("content_types and filenames must have the same length.")
+            sizes = [os.path.getsize(filename) for filename in filenames]
+            documents: List[Tuple[str, Any, Optional[str]]] = [
+                (filename, filename, content_types[i] if content_types else None)
+                for i, filename in enumerate(filenames)
+            ]
+        elif files is not None:
+            if content_types and len(content_types) != len(files):
+                raise ValueError("content_types and files must have the same length.")
+
+            if not file_filenames:
+                raise ValueError("file_filenames must be specified if files are passed")
+            elif len(file_filenames) != len(files):
+                raise ValueError("file_filenames and files must have the same length.")
+            sizes = [_get_file_size(file) for file in files]
+            documents = [
+                (file_filenames[i], file, content_types[i] if content_types else None)
+                for i, file in enumerate(files)
+            ]
+        else:
+            raise ValueError("One of filenames or files must be specified.")
+
+        return self._partition_batches(self._get_batches(documents, sizes), request_kwargs)
+
+    def _get_batches(self, documents: list, sizes: List[int]) -> Iterator[list]:
+        """Splits the documents into batches of at most max_batch_files documents and
+        max_batch_bytes bytes."""
+        batch: list = []
+        batch_size = 0
+        for document, size in zip(documents, sizes):
+            if batch and (
+                len(batch) >= self.max_batch_files or batch_size + size > self.max_batch_bytes
+            ):
+                yield batch
+                batch, batch_size = [], 0
+            batch.append(document)
+            batch_size += size
+        if batch:
+            yield batch
+
+    def _partition_batches(
+        self,
+        batches: Iterator[list],
+        request_kwargs: dict,
+    ) -> Iterator[List[Element]]:
+        # NOTE(agent) - Batches are submitted as earlier ones finish so that at most
+        # max_in_flight requests are pending, and results are yielded in submission order
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            pending: Deque[Future] = deque()
+            for batch in batches:
+                if len(pending) >= self.max_in_flight:
+                    yield from pending.popleft().result()
+                pending.append(executor.submit(self._partition_batch, batch, request_kwargs))
+            while pending:
+                yield from pending.popleft().result()
+
+    def _partition_batch(
+        self,
+        batch: List[Tuple[str, Any, Optional[str]]],
+        request_kwargs: dict,
+    ) -> List[List[Element]]:
+        with contextlib.ExitStack() as stack:
+            _files = []
+            for filename, file, content_type in batch:
+                if isinstance(file, str):
+                    file = stack.enter_context(open(file, "rb"))
+                _files.append(("files", (filename, file, content_type)))
+
+            response = self.post(files=_files, **request_kwargs)
+
+        if response.status_code != 200:
+            raise ValueError(
+                f"Receive unexpected status code {response.status_code} from the API.",
+            )
+
         response_list = response.json()
-        # NOTE(robinson) - this check is because if only one filename is passed, the return
+        # NOTE(robinson) - this check is because if only one file is sent, the return
         # type from the API is a list of objects instead of a list of lists
-        if not isinstance(response_list[0], list):
+        if len(batch) == 1 and (not response_list or not isinstance(response_list[0], list)):
             response_list = [response_list]
 
-        for document in response_list:
-            documents.append(dict_to_elements(document))
-        return documents
-    else:
-        raise ValueError(
-            f"Receive unexpected status code {response.status_code} from the API.",
-        )
+        return [dict_to_elements(document, copy=False) for document in response_list]
+
+
+def _get_file_size(file: IO[bytes]) -> int:
+    """Returns the number of bytes left to read in a file, without moving the file position."""
+    position = file.tell()
+    size = file.seek(0, os.SEEK_END) - position
+    file.seek(position)
+    return size
@@ -1,9 +1,9 @@
 import io
-from typing import IO, Callable, Dict, List, Optional, Tuple
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, cast
 
 import requests
 
-from unstructured.documents.elements import DataSourceMetadata
+from unstructured.documents.elements import DataSourceMetadata, Element
 from unstructured.file_utils.filetype import (
     FILETYPE_TO_MIMETYPE,
     STR_TO_FILETYPE,
@@ -12,12 +12,12 @@ from unstructured.file_utils.filetype import (
     is_json_processable,
 )
 from unstructured.logger import logger
-from unstructured.partition.common import exactly_one
+from unstructured.partition.common import as_document_source, exactly_one
 from unstructured.partition.email import partition_email
-from unstructured.partition.html import partition_html
+from unstructured.partition.html import iter_partition_html, partition_html
 from unstructured.partition.json import partition_json
-from unstructured.partition.text import partition_text
-from unstructured.partition.xml import partition_xml
+from unstructured.partition.text import iter_partition_text, partition_text
+from unstructured.partition.xml import iter_partition_xml, partition_xml
 from unstructured.utils import dependency_exists
 
 if dependency_exists("pandas"):
@@ -27,7 +27,7 @@ if dependency_exists("pandas"):
 
 if dependency_exists("docx"):
     from unstructured.partition.doc import partition_doc
-    from unstructured.partition.docx import partition_docx
+    from unstructured.partition.docx import iter_partition_docx, partition_docx
 
 
 if dependency_exists("docx") and dependency_exists("pypandoc"):
@@ -51,7 +51,7 @@ if dependency_exists("msg_parser"):
 
 pdf_imports = ["pdf2image", "pdfminer", "PIL"]
 if all(dependency_exists(dep) for dep in pdf_imports):
-    from unstructured.partition.pdf import partition_pdf
+    from unstructured.partition.pdf import iter_partition_pdf, partition_pdf
 
 
 if dependency_exists("unstructured_inference"):
@@ -60,11 +60,24 @@ if dependency_exists("unstructured_inference"):
 
 if dependency_exists("pptx"):
     from unstructured.partition.ppt import partition_ppt
-    from unstructured.partition.pptx import partition_pptx
+    from unstructured.partition.pptx import iter_partition_pptx, partition_pptx
 
 
 if dependency_exists("pandas") and dependency_exists("openpyxl"):
-    from unstructured.partition.xlsx import partition_xlsx
+    from unstructured.partition.xlsx import iter_partition_xlsx, partition_xlsx
+
+
+# NOTE(agent) - The filetypes that iter_partition partitions incrementally. All other
+# filetypes are partitioned in full with partition before the elements are yielded.
+STREAMING_FILETYPES = (
+    FileType.DOCX,
+    FileType.HTML,
+    FileType.PDF,
+    FileType.PPTX,
+    FileType.TXT,
+    FileType.XLSX,
+    FileType.XML,
+)
 
 
 def partition(
@@ -133,29 +146,16 @@ def partition(
     """
     exactly_one(file=file, filename=filename, url=url)
 
-    if url is not None:
-        file, filetype = file_and_type_from_url(
-            url=url,
-            content_type=content_type,
-            headers=headers,
-            ssl_verify=ssl_verify,
-        )
-    else:
-        if headers != {}:
-            logger.warning(
-                "The headers kwarg is set but the url kwarg is not. "
-                "The headers kwarg will be ignored.",
-            )
-        filetype = detect_filetype(
-            filename=filename,
-            file=file,
-            file_filename=file_filename,
-            content_type=content_type,
-            encoding=encoding,
-        )
-
-    if file is not None:
-        file.seek(0)
+    file, filetype = _get_file_and_filetype(
+        filename=filename,
+        content_type=content_type,
+        file=file,
+        file_filename=file_filename,
+        url=url,
+        encoding=encoding,
+        headers=headers,
+        ssl_verify=ssl_verify,
+    )
 
     infer_table_structure = decide_table_extraction(
         filetype,
@@ -290,18 +290,208 @@ def partition(
         msg = "Invalid file" if not filename else f"Invalid file {filename}"
         raise ValueError(f"{msg}. The {filetype} file type is not supported in partition.")
 
+    return list(
+        _add_partition_metadata(
+            elements,
+            filetype=filetype,
+            content_type=content_type,
+            url=url,
+            data_source_metadata=data_source_metadata,
+        ),
+    )
+
+
+def iter_partition(
+    filename: Optional[str] = None,
+    content_type: Optional[str] = None,
+    file: Optional[IO[bytes]] = None,
+    file_filename: Optional[str] = None,
+    url: Optional[str] = None,
+    include_page_breaks: bool = False,
+    strategy: str = "auto",
+    encoding: Optional[str] = None,
+    paragraph_grouper: Optional[Callable[[str], str]] = None,
+    headers: Dict[str, str] = {},
+    skip_infer_table_types: List[str] = ["pdf", "jpg", "png"],
+    ssl_verify: bool = True,
+    ocr_languages: str = "eng",
+    pdf_infer_table_structure: bool = False,
+    xml_keep_tags: bool = False,
+    data_source_metadata: Optional[DataSourceMetadata] = None,
+    **kwargs,
+) -> Iterator[Element]:
+    """Partitions a document into its constituent elements and yields them as they are
+    produced rather than returning a list. Accepts the same parameters as partition.
+
+    PDF, text, HTML, DOCX, PPTX, XLSX and XML documents are partitioned incrementally, so
+    elements are yielded as each page, sheet or section finishes and can be written out and
+    freed by the caller. Other document types are partitioned in full before the first element is
+    yielded.
+    """
+    exactly_one(file=file, filename=filename, url=url)
+
+    file, filetype = _get_file_and_filetype(
+        filename=filename,
+        content_type=content_type,
+        file=file,
+        file_filename=file_filename,
+        url=url,
+        encoding=encoding,
+        headers=headers,
+        ssl_verify=ssl_verify,
+    )
+
+    elements: Iterable[Element]
+    if filetype not in STREAMING_FILETYPES:
+        elements = partition(
+            filename=filename,
+            content_type=content_type,
+            file=file,
+            file_filename=file_filename,
+            include_page_breaks=include_page_breaks,
+            strategy=strategy,
+            encoding=encoding,
+            paragraph_grouper=paragraph_grouper,
+            skip_infer_table_types=skip_infer_table_types,
+            ssl_verify=ssl_verify,
+            ocr_languages=ocr_languages,
+            pdf_infer_table_structure=pdf_infer_table_structure,
+            xml_keep_tags=xml_keep_tags,
+            **kwargs,
+        )
+        yield from _add_partition_metadata(
+            elements,
+            filetype=filetype,
+            content_type=content_type,
+            url=url,
+            data_source_metadata=data_source_metadata,
+        )
+        return
+
+    if file is not None and file_filename is not None:
+        kwargs.setdefault("metadata_filename", file_filename)
+
+    if filetype == FileType.DOCX:
+        elements = iter_partition_docx(filename=filename, file=file, **kwargs)
+    elif filetype == FileType.HTML:
+        elements = iter_partition_html(
+            filename=filename,
+            file=file,
+            include_page_breaks=include_page_breaks,
+            encoding=encoding,
+            **kwargs,
+        )
+    elif filetype == FileType.PDF:
+        elements = iter_partition_pdf(
+            filename=filename,  # type: ignore
+            file=file,  # type: ignore
+            url=None,
+            include_page_breaks=include_page_breaks,
+            infer_table_structure=decide_table_extraction(
+                filetype,
+                skip_infer_table_types,
+                pdf_infer_table_structure,
+            ),
+            strategy=strategy,
+            ocr_languages=ocr_languages,
+            **kwargs,
+        )
+    elif filetype == FileType.TXT:
+        elements = iter_partition_text(
+            filename=filename,
+            file=file,
+            encoding=encoding,
+            paragraph_grouper=paragraph_grouper,
+            **kwargs,
+        )
+    elif filetype == FileType.PPTX:
+        elements = iter_partition_pptx(
+            filename=filename,
+            file=file,
+            include_page_breaks=include_page_breaks,
+            **kwargs,
+        )
+    elif filetype == FileType.XLSX:
+        elements = iter_partition_xlsx(filename=filename, file=file, **kwargs)
+    elif filetype == FileType.XML:
+        elements = iter_partition_xml(
+            filename=filename,
+            file=file,
+            encoding=encoding,
+            xml_keep_tags=xml_keep_tags,
+            **kwargs,
+        )
+
+    yield from _add_partition_metadata(
+        elements,
+        filetype=filetype,
+        content_type=content_type,
+        url=url,
+        data_source_metadata=data_source_metadata,
+    )
+
+
+def _get_file_and_filetype(
+    filename: Optional[str] = None,
+    content_type: Optional[str] = None,
+    file: Optional[IO[bytes]] = None,
+    file_filename: Optional[str] = None,
+    url: Optional[str] = None,
+    encoding: Optional[str] = None,
+    headers: Dict[str, str] = {},
+    ssl_verify: bool = True,
+) -> Tuple[Optional[IO[bytes]], Optional[FileType]]:
+    """Downloads the document if a url is passed and detects the filetype of the document."""
+    if url is not None:
+        file, filetype = file_and_type_from_url(
+            url=url,
+            content_type=content_type,
+            headers=headers,
+            ssl_verify=ssl_verify,
+        )
+    else:
+        if headers != {}:
+            logger.warning(
+                "The headers kwarg is set but the url kwarg is not. "
+                "The headers kwarg will be ignored.",
+            )
+        filetype = detect_filetype(
+            filename=filename,
+            file=file,
+            file_filename=file_filename,
+            content_type=content_type,
+            encoding=encoding,
+        )
+
+    if file is not None:
+        file.seek(0)
+        # NOTE(agent) - The document is wrapped once in a source that shares its bytes, so the
+        # partitioners can read the document as many times as they need without copying it
+        file = cast(IO[bytes], as_document_source(file))
+
+    return file, filetype
+
+
+def _add_partition_metadata(
+    elements: Iterable[Element],
+    filetype: Optional[FileType],
+    content_type: Optional[str] = None,
+    url: Optional[str] = None,
+    data_source_metadata: Optional[DataSourceMetadata] = None,
+) -> Iterator[Element]:
+    """Adds the source url, data source metadata and filetype to each element as it is
+    consumed."""
+    if content_type is not None:
+        out_filetype = STR_TO_FILETYPE.get(content_type)
+        mimetype = FILETYPE_TO_MIMETYPE[out_filetype] if out_filetype is not None else None
+    else:
+        mimetype = FILETYPE_TO_MIMETYPE[cast(FileType, filetype)]
+
     for element in elements:
         element.metadata.url = url
         element.metadata.data_source = data_source_metadata
-        if content_type is not None:
-            out_filetype = STR_TO_FILETYPE.get(content_type)
-            element.metadata.filetype = (
-                FILETYPE_TO_MIMETYPE[out_filetype] if out_filetype is not None else None
-            )
-        else:
-            element.metadata.filetype = FILETYPE_TO_MIMETYPE[filetype]
-
-    return elements
+        element.metadata.filetype = mimetype
+        yield element
 
 
 def file_and_type_from_url(
@@ -0,0 +1,310 @@
+"""A result cache for partition, keyed by a hash of the document content and the partition
+kwargs that affect the output. Documents that are partitioned repeatedly, e.g. the same
+attachment arriving in many emails or a rerun after a config change, are only partitioned once."""
+
+import contextlib
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import IO, Any, List, Optional
+
+from unstructured.__version__ import __version__
+from unstructured.documents.elements import DataSourceMetadata, Element
+from unstructured.logger import logger
+from unstructured.partition.auto import partition
+from unstructured.partition.common import (
+    exactly_one,
+    get_last_modified_date,
+    get_last_modified_date_from_file,
+)
+from unstructured.staging.base import (
+    convert_to_dict,
+    dict_to_elements,
+    json_dumps,
+    json_loads,
+)
+
+DEFAULT_CACHE_DIRECTORY = os.path.join(
+    os.path.expanduser("~"),
+    ".cache",
+    "unstructured",
+    "partition",
+)
+DEFAULT_CACHE_MAX_SIZE_BYTES = 1024 * 1024 * 1024
+
+# NOTE(agent) - Partition kwargs that identify where a document came from rather than
+# what is in it. They are left out of the cache key so that the same bytes arriving from
+# different sources share an entry, and are stamped back onto the elements on a cache hit.
+SOURCE_KWARGS = (
+    "filename",
+    "file",
+    "file_filename",
+    "url",
+    "headers",
+    "ssl_verify",
+    "data_source_metadata",
+    "metadata_filename",
+    "metadata_last_modified",
+)
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+PARTITION_SIGNATURE = inspect.signature(partition)
+
+
+class PartitionCacheBackend(ABC):
+    """Abstract storage for serialized partition results. Subclass this to share cached
+    results through a store other than the local disk."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Returns the serialized elements stored under key, or None if there is no entry."""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: bytes):
+        """Stores the serialized elements under key."""
+        pass
+
+
+class DiskPartitionCacheBackend(PartitionCacheBackend):
+    """Stores serialized partition results as files in a local directory. Once the total size
+    of the entries exceeds max_size_bytes, the least recently used entries are evicted."""
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_CACHE_DIRECTORY,
+        max_size_bytes: int = DEFAULT_CACHE_MAX_SIZE_BYTES,
+    ):
+        self.directory = directory
+        self.max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+        # NOTE(agent) - Entries are ordered from least to most recently used. The order
+        # is restored from the file modification times, which are bumped on each read.
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(".json"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name[: -len(".json")], stat.st_size))
+        self._entries: OrderedDict = OrderedDict((key, size) for _, key, size in sorted(entries))
+        self._size = sum(self._entries.values())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                if key in self._entries:
+                    self._size -= self._entries.pop(key)
+            return None
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = len(value)
+                self._size += len(value)
+            self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes):
+        if len(value) > self.max_size_bytes:
+            logger.debug(f"Partition result for {key} is larger than the cache, skipping.")
+            return
+
+        # NOTE(agent) - Write to a temporary file and rename it so that concurrent readers
+        # never see a partially written entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(value)
+        os.replace(tmp_path, self._path(key))
+
+        with self._lock:
+            self._size -= self._entries.pop(key, 0)
+            self._entries[key] = len(value)
+            self._size += len(value)
+            self._evict()
+
+    def _evict(self):
+        while self._size > self.max_size_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._size -= size
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self._path(key))
+
+
+class PartitionCache:
+    """Wraps partition with a result cache keyed by the document content, the partition kwargs
+    that affect the output and the library version. The hits and misses attributes count
+    cache lookups.
+
+    Example
+    -------
+    cache = PartitionCache(DiskPartitionCacheBackend(max_size_bytes=512 * 1024 * 1024))
+    elements = cache.partition(filename="example-docs/fake-text.txt", strategy="fast")
+    """
+
+    def __init__(self, backend: Optional[PartitionCacheBackend] = None):
+        self.backend = backend if backend is not None else DiskPartitionCacheBackend()
+        self.hits = 0
+        self.misses = 0
+
+    def partition(
+        self,
+        filename: Optional[str] = None,
+        file: Optional[IO[bytes]] = None,
+        url: Optional[str] = None,
+        **kwargs,
+    ) -> List[Element]:
+        """Partitions a document with partition, returning the cached elements if the same
+        content was already partitioned with the same kwargs. Accepts the same parameters as
+        partition. Documents passed by url are partitioned without the cache."""
+        exactly_one(filename=filename, file=file, url=url)
+
+        if url is not None:
+            return partition(url=url, **kwargs)
+
+        key = self.get_key(filename=filename, file=file, **kwargs)
+        cached = self.backend.get(key)
+        if cached is not None:
+            self.hits += 1
+            entry = json_loads(cached)
+            return _add_source_metadata(
+                dict_to_elements(entry["elements"], copy=False),
+                cached_last_modified=entry["last_modified"],
+                filename=filename,
+                file=file,
+                **kwargs,
+            )
+
+        self.misses += 1
+        elements = partition(filename=filename, file=file, **kwargs)
+        entry = {
+            "last_modified": _get_source_last_modified(
+                filename=filename,
+                file=file,
+                metadata_last_modified=kwargs.get("metadata_last_modified"),
+            ),
+            "elements": convert_to_dict(elements),
+        }
+        self.backend.set(key, json_dumps(entry).encode("utf-8"))
+        return elements
+
+    def get_key(
+        self,
+        filename: Optional[str] = None,
+        file: Optional[IO[bytes]] = None,
+        **kwargs,
+    ) -> str:
+        """Computes the cache key for a document from its content and the partition kwargs."""
+        exactly_one(filename=filename, file=file)
+
+        content_hash = hashlib.sha256()
+        if filename is not None:
+            with open(filename, "rb") as f:
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                    content_hash.update(chunk)
+        else:
+            for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):  # type: ignore
+                content_hash.update(chunk)
+            file.seek(0)  # type: ignore
+
+        # NOTE(agent) - The file extension is part of the key because filetype detection
+        # falls back on it, so the same bytes can partition differently under another name
+        source_name = kwargs.get("metadata_filename") or kwargs.get("file_filename") or filename
+        extension = os.path.splitext(source_name)[1].lower() if source_name else ""
+
+        arguments = PARTITION_SIGNATURE.bind_partial(**kwargs)
+        arguments.apply_defaults()
+        options = {
+            name: _key_value(value)
+            for name, value in arguments.arguments.items()
+            if name not in SOURCE_KWARGS and name != "kwargs"
+        }
+        options.update(
+            {
+                name: _key_value(value)
+                for name, value in arguments.arguments.get("kwargs", {}).items()
+                if name not in SOURCE_KWARGS
+            },
+        )
+
+        key_data = json.dumps(
+            {"version": __version__, "extension": extension, "options": options},
+            sort_keys=True,
+        )
+        content_hash.update(key_data.encode("utf-8"))
+        return content_hash.hexdigest()
+
+
+def _key_value(value: Any) -> Any:
+    """Converts a partition kwarg to a JSON-serializable value for the cache key."""
+    if callable(value):
+        return f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', repr(value))}"
+    try:
+        json.dumps(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def _get_source_last_modified(
+    filename: Optional[str] = None,
+    file: Optional[IO[bytes]] = None,
+    metadata_last_modified: Optional[str] = None,
+) -> Optional[str]:
+    """Returns the last modified date that partition derives from the document source."""
+    if metadata_last_modified is not None:
+        return metadata_last_modified
+    elif filename is not None:
+        return get_last_modified_date(filename)
+    elif file is not None:
+        return get_last_modified_date_from_file(file)
+    return None
+
+
+def _add_source_metadata(
+    elements: List[Element],
+    cached_last_modified: Optional[str] = None,
+    filename: Optional[str] = None,
+    file: Optional[IO[bytes]] = None,
+    file_filename: Optional[str] = None,
+    metadata_filename: Optional[str] = None,
+    metadata_last_modified: Optional[str] = None,
+    data_source_metadata: Optional[DataSourceMetadata] = None,
+    **kwargs,
+) -> List[Element]:
+    """Replaces the source specific metadata on cached elements with the metadata for the
+    document that is being partitioned. Last modified dates are only replaced where they came
+    from the source of the cached document, since some documents (e.g. emails) carry their own."""
+    source_name = metadata_filename or (file_filename if file is not None else filename)
+    file_directory, source_filename = os.path.split(source_name) if source_name else (None, None)
+    last_modified = _get_source_last_modified(
+        filename=filename,
+        file=file,
+        metadata_last_modified=metadata_last_modified,
+    )
+
+    for element in elements:
+        if element.metadata.attached_to_filename is not None:
+            element.metadata.attached_to_filename = source_name
+        else:
+            element.metadata.filename = source_filename
+            element.metadata.file_directory = file_directory or None
+            if element.metadata.last_modified == cached_last_modified:
+                element.metadata.last_modified = last_modified
+        element.metadata.url = None
+        element.metadata.data_source = data_source_metadata
+
+    return elements
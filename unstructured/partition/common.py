@@ -1,11 +1,35 @@
 from __future__ import annotations
 
+import io
+import mmap
 import os
+import pathlib
+import queue
+import shutil
+import signal
+import socket
 import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from io import BufferedReader, BytesIO, TextIOWrapper
+from io import BufferedRandom, BufferedReader, BytesIO, FileIO, TextIOWrapper
 from tempfile import SpooledTemporaryFile
-from typing import IO, TYPE_CHECKING, Any, BinaryIO, Dict, List, Optional, Tuple, Union
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 from tabulate import tabulate
 
@@ -27,6 +51,9 @@ from unstructured.utils import dependency_exists
 if dependency_exists("docx"):
     import docx.table as docxtable
 
+if dependency_exists("unoserver"):
+    from unoserver.client import UnoClient
+
 if TYPE_CHECKING:
     from unstructured_inference.inference.layoutelement import (
         LayoutElement,
@@ -201,6 +228,50 @@ def _remove_element_metadata(
     return elements
 
 
+SOFFICE_NOT_FOUND_MESSAGE = """soffice command was not found. Please install libreoffice
+on your system and try again.
+
+- Install instructions: https://www.libreoffice.org/get-help/install-howto/
+- Mac: https://formulae.brew.sh/cask/libreoffice
+- Debian: https://wiki.debian.org/LibreOffice"""
+
+# NOTE(agent) - Starting LibreOffice takes several seconds, so convert_office_docs runs one
+# soffice process for each batch of documents instead of one for each document
+OFFICE_CONVERSION_BATCH_SIZE = 20
+# NOTE(agent) - The number of seconds soffice gets for each document in a batch before the
+# conversion is treated as hung
+OFFICE_CONVERSION_TIMEOUT = 120.0
+# NOTE(agent) - The number of seconds a LibreOffice listener gets to start accepting
+# conversions before it is treated as failed
+OFFICE_LISTENER_STARTUP_TIMEOUT = 60.0
+
+UNOSERVER_NOT_FOUND_MESSAGE = """unoserver command was not found. Please install unoserver with
+the Python interpreter that has the LibreOffice UNO bindings and try again.
+
+- Install instructions: https://github.com/unoconv/unoserver#installation"""
+
+
+def _soffice_command(
+    input_filenames: List[str],
+    output_directory: str,
+    target_format: str,
+    profile_directory: Optional[str] = None,
+) -> List[str]:
+    command = ["soffice", "--headless"]
+    if profile_directory is not None:
+        # NOTE(agent) - soffice processes that share a user profile can't run at the same
+        # time, so each worker converts with a profile of its own
+        profile_uri = pathlib.Path(profile_directory).absolute().as_uri()
+        command.append(f"-env:UserInstallation={profile_uri}")
+    return (
+        command
+        + ["--convert-to", target_format, "--outdir", output_directory]
+        + list(
+            input_filenames,
+        )
+    )
+
+
 def convert_office_doc(
     input_filename: str,
     output_directory: str,
@@ -226,22 +297,23 @@ def convert_office_doc(
     https://stackoverflow.com/questions/52277264/convert-doc-to-docx-using-soffice-not-working
     https://git.libreoffice.org/core/+/refs/heads/master/filter/source/config/fragments/filters
 
+    Within office_listeners(), the file is converted by one of the running LibreOffice
+    listeners instead of a new soffice process.
     """
+    if _office_listeners is not None:
+        base_filename, _ = os.path.splitext(os.path.basename(input_filename))
+        output_filename = os.path.join(output_directory, f"{base_filename}.{target_format}")
+        with _acquire_office_listener() as listener:
+            listener.convert(input_filename, output_filename, target_format, target_filter)
+        return
+
     if target_filter is not None:
         target_format = f"{target_format}:{target_filter}"
     # NOTE(robinson) - In the future can also include win32com client as a fallback for windows
     # users who do not have LibreOffice installed
     # ref: https://stackoverflow.com/questions/38468442/
     #       multiple-doc-to-docx-file-conversion-using-python
-    command = [
-        "soffice",
-        "--headless",
-        "--convert-to",
-        target_format,
-        "--outdir",
-        output_directory,
-        input_filename,
-    ]
+    command = _soffice_command([input_filename], output_directory, target_format)
     try:
         process = subprocess.Popen(
             command,
@@ -250,18 +322,353 @@ def convert_office_doc(
         )
         output, error = process.communicate()
     except FileNotFoundError:
-        raise FileNotFoundError(
-            """soffice command was not found. Please install libreoffice
-on your system and try again.
+        raise FileNotFoundError(SOFFICE_NOT_FOUND_MESSAGE)
 
-- Install instructions: https://www.libreoffice.org/get-help/install-howto/
-- Mac: https://formulae.brew.sh/cask/libreoffice
-- Debian: https://wiki.debian.org/LibreOffice""",
+    logger.info(output.decode().strip())
+    if error:
+        logger.error(error.decode().strip())
+
+
+def convert_office_docs(
+    input_filenames: List[str],
+    output_directory: str,
+    target_format: str = "docx",
+    target_filter: Optional[str] = None,
+    batch_size: int = OFFICE_CONVERSION_BATCH_SIZE,
+    workers: int = 1,
+    timeout: Optional[float] = OFFICE_CONVERSION_TIMEOUT,
+) -> List[Optional[str]]:
+    """Converts office documents with the libreoffice CLI, running one soffice process for
+    each batch of documents so that the LibreOffice start-up is paid once per batch rather
+    than once per document.
+
+    Parameters
+    ----------
+    input_filenames: List[str]
+        The names of the documents to convert. Documents that would be converted to the same
+        output filename can't be converted together.
+    output_directory: str
+        The output directory for the converted documents
+    target_format: str
+        The desired output format
+    target_filter: str
+        The output filter name to use when converting. See convert_office_doc for details.
+    batch_size: int
+        The number of documents each soffice process converts
+    workers: int
+        The number of soffice processes to run at the same time. Each worker keeps its own
+        LibreOffice profile for all of the batches it converts.
+    timeout: float
+        The number of seconds soffice gets for each document in a batch. If a batch times out,
+        soffice is stopped and the documents in the batch that weren't converted are retried
+        one at a time, so a hung document only fails itself.
+
+    Returns
+    -------
+    The converted filenames in the order of input_filenames, with None for documents that
+    could not be converted.
+
+    Within office_listeners(), the documents are converted one at a time by the running
+    LibreOffice listeners instead, and batch_size is ignored.
+    """
+    output_filenames: List[str] = []
+    for input_filename in input_filenames:
+        base_filename, _ = os.path.splitext(os.path.basename(input_filename))
+        output_filename = os.path.join(output_directory, f"{base_filename}.{target_format}")
+        if output_filename in output_filenames:
+            raise ValueError(
+                f"More than one document would be converted to {output_filename}. Convert "
+                "documents with the same name into different output directories.",
+            )
+        output_filenames.append(output_filename)
+
+    if _office_listeners is not None:
+
+        def convert_with_listener(filenames: Tuple[str, str]):
+            with _acquire_office_listener() as listener:
+                listener.convert(*filenames, target_format, target_filter, timeout)
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            for _ in executor.map(convert_with_listener, zip(input_filenames, output_filenames)):
+                pass
+        return [
+            output_filename if os.path.exists(output_filename) else None
+            for output_filename in output_filenames
+        ]
+
+    if target_filter is not None:
+        target_format = f"{target_format}:{target_filter}"
+
+    batches = [
+        (input_filenames[i : i + batch_size], output_filenames[i : i + batch_size])  # noqa: E203
+        for i in range(0, len(input_filenames), batch_size)
+    ]
+    profile_directories: queue.Queue = queue.Queue()
+    for _ in range(min(workers, len(batches))):
+        profile_directories.put(tempfile.mkdtemp(prefix="unstructured-soffice-"))
+
+    def convert_batch(batch: Tuple[List[str], List[str]]):
+        profile_directory = profile_directories.get()
+        try:
+            _convert_office_batch(
+                *batch,
+                output_directory=output_directory,
+                target_format=target_format,
+                profile_directory=profile_directory,
+                timeout=timeout,
+            )
+        finally:
+            profile_directories.put(profile_directory)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            for _ in executor.map(convert_batch, batches):
+                pass
+    finally:
+        while not profile_directories.empty():
+            shutil.rmtree(profile_directories.get(), ignore_errors=True)
+
+    return [
+        output_filename if os.path.exists(output_filename) else None
+        for output_filename in output_filenames
+    ]
+
+
+def _convert_office_batch(
+    input_filenames: List[str],
+    output_filenames: List[str],
+    output_directory: str,
+    target_format: str,
+    profile_directory: str,
+    timeout: Optional[float],
+):
+    """Converts a batch of documents with one soffice process. If the process hangs, it is
+    stopped and the documents that weren't converted are retried one at a time."""
+    command = _soffice_command(input_filenames, output_directory, target_format, profile_directory)
+    batch_timeout = None if timeout is None else timeout * len(input_filenames)
+    if _run_soffice(command, batch_timeout):
+        return
+
+    # NOTE(agent) - A stopped soffice can leave a lock behind in its profile, so the next
+    # soffice for this worker starts with a fresh profile
+    shutil.rmtree(profile_directory, ignore_errors=True)
+    if len(input_filenames) == 1:
+        logger.error(f"soffice timed out after {batch_timeout}s converting {input_filenames[0]}")
+        return
+
+    remaining = [
+        (input_filename, output_filename)
+        for input_filename, output_filename in zip(input_filenames, output_filenames)
+        if not os.path.exists(output_filename)
+    ]
+    logger.warning(
+        f"soffice timed out converting a batch of {len(input_filenames)} documents. Converting "
+        f"the {len(remaining)} remaining documents one at a time.",
+    )
+    for input_filename, output_filename in remaining:
+        _convert_office_batch(
+            [input_filename],
+            [output_filename],
+            output_directory=output_directory,
+            target_format=target_format,
+            profile_directory=profile_directory,
+            timeout=timeout,
         )
 
+
+def _run_soffice(command: List[str], timeout: Optional[float]) -> bool:
+    """Runs soffice, returning False if it had to be stopped because it timed out."""
+    try:
+        # NOTE(agent) - soffice runs LibreOffice in a child process, so it is started in a
+        # session of its own and the whole process group is stopped if it times out
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True,
+        )
+    except FileNotFoundError:
+        raise FileNotFoundError(SOFFICE_NOT_FOUND_MESSAGE)
+
+    try:
+        output, error = process.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        _kill_process_group(process)
+        process.communicate()
+        return False
+
     logger.info(output.decode().strip())
     if error:
         logger.error(error.decode().strip())
+    return True
+
+
+def _kill_process_group(process: subprocess.Popen):
+    """Stops a process that was started in a session of its own, along with its children."""
+    if hasattr(os, "killpg"):
+        os.killpg(process.pid, signal.SIGKILL)
+    else:
+        process.kill()
+
+
+class OfficeListener:
+    """A LibreOffice instance kept running in listener mode by unoserver, with a profile of its
+    own. Documents are sent to it over a local socket, so the LibreOffice start-up is paid once
+    for the lifetime of the listener rather than once for each document."""
+
+    def __init__(
+        self,
+        profile_directory: str,
+        startup_timeout: float = OFFICE_LISTENER_STARTUP_TIMEOUT,
+    ):
+        self.profile_directory = profile_directory
+        self.startup_timeout = startup_timeout
+        self.port: Optional[int] = None
+        self.process: Optional[subprocess.Popen] = None
+
+    def start(self):
+        self.port = _get_free_port()
+        command = [
+            "unoserver",
+            "--interface",
+            "127.0.0.1",
+            "--port",
+            str(self.port),
+            "--uno-port",
+            str(_get_free_port()),
+            "--user-installation",
+            self.profile_directory,
+        ]
+        try:
+            self.process = subprocess.Popen(
+                command,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+        except FileNotFoundError:
+            raise FileNotFoundError(UNOSERVER_NOT_FOUND_MESSAGE)
+
+        deadline = time.monotonic() + self.startup_timeout
+        while not _is_port_open(self.port):
+            if self.process.poll() is not None or time.monotonic() > deadline:
+                self.stop()
+                raise RuntimeError(f"The LibreOffice listener on port {self.port} did not start.")
+            time.sleep(0.1)
+
+    def stop(self):
+        if self.process is not None and self.process.poll() is None:
+            _kill_process_group(self.process)
+            self.process.wait()
+        self.process = None
+
+    def restart(self):
+        self.stop()
+        # NOTE(agent) - A stopped LibreOffice can leave a lock behind in its profile, so the
+        # listener restarts with a fresh profile
+        shutil.rmtree(self.profile_directory, ignore_errors=True)
+        self.start()
+
+    def convert(
+        self,
+        input_filename: str,
+        output_filename: str,
+        target_format: str,
+        target_filter: Optional[str] = None,
+        timeout: Optional[float] = OFFICE_CONVERSION_TIMEOUT,
+    ) -> bool:
+        """Converts a document, returning whether it was converted. If the conversion fails
+        because LibreOffice stopped, or takes longer than timeout seconds, the listener is
+        restarted so the next document is converted by a working LibreOffice."""
+        client = UnoClient(server="127.0.0.1", port=str(self.port))
+        errors: List[Exception] = []
+
+        def convert():
+            try:
+                client.convert(
+                    inpath=os.path.abspath(input_filename),
+                    outpath=os.path.abspath(output_filename),
+                    convert_to=target_format,
+                    filtername=target_filter,
+                )
+            except Exception as e:
+                errors.append(e)
+
+        # NOTE(agent) - The request has no timeout of its own, so it runs in a thread. Stopping
+        # the listener makes a hung request fail, which ends the thread.
+        thread = threading.Thread(target=convert, daemon=True)
+        thread.start()
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.error(f"LibreOffice timed out after {timeout}s converting {input_filename}")
+            self.restart()
+            return False
+        if errors:
+            logger.error(f"LibreOffice failed to convert {input_filename}: {errors[0]}")
+            if self.process is None or self.process.poll() is not None:
+                self.restart()
+            return False
+        return True
+
+
+_office_listeners: Optional[queue.Queue] = None
+
+
+@contextmanager
+def office_listeners(
+    workers: int = 1,
+    startup_timeout: float = OFFICE_LISTENER_STARTUP_TIMEOUT,
+) -> Iterator[List[OfficeListener]]:
+    """Keeps workers LibreOffice listeners running while the context is open. In the meantime
+    convert_office_doc and convert_office_docs, and so partition_doc and partition_ppt, convert
+    documents with the listeners instead of starting a soffice process each time. Requires the
+    unoserver package, with the unoserver command installed for the Python interpreter that has
+    the LibreOffice UNO bindings. The listeners are only used in the current process."""
+    global _office_listeners
+    if _office_listeners is not None:
+        raise ValueError("LibreOffice listeners are already running in this process.")
+
+    listeners: List[OfficeListener] = []
+    try:
+        for _ in range(max(1, workers)):
+            listener = OfficeListener(
+                tempfile.mkdtemp(prefix="unstructured-soffice-"),
+                startup_timeout=startup_timeout,
+            )
+            listeners.append(listener)
+            listener.start()
+        available_listeners: queue.Queue = queue.Queue()
+        for listener in listeners:
+            available_listeners.put(listener)
+        _office_listeners = available_listeners
+        yield listeners
+    finally:
+        _office_listeners = None
+        for listener in listeners:
+            listener.stop()
+            shutil.rmtree(listener.profile_directory, ignore_errors=True)
+
+
+@contextmanager
+def _acquire_office_listener() -> Iterator[OfficeListener]:
+    """Takes a running LibreOffice listener for one conversion, waiting until one is free."""
+    available_listeners = cast(queue.Queue, _office_listeners)
+    listener = available_listeners.get()
+    try:
+        yield listener
+    finally:
+        available_listeners.put(listener)
+
+
+def _get_free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _is_port_open(port: int) -> bool:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        return sock.connect_ex(("127.0.0.1", port)) == 0
 
 
 def exactly_one(**kwargs) -> None:
@@ -280,13 +687,160 @@ def exactly_one(**kwargs) -> None:
         raise ValueError(message)
 
 
+# NOTE(agent) - The number of bytes that DocumentSource.readline searches for a line break at
+# a time
+READLINE_CHUNK_SIZE = 8192
+
+
+class DocumentSource(io.RawIOBase):
+    """A read-only binary stream over the bytes of a document, which shares the bytes with the
+    object the document came from rather than copying them. Documents in memory are read
+    through a memoryview of their buffer and documents in files are memory-mapped, so reading
+    only copies the bytes that are read. Create a source once for a document with
+    as_document_source and give each step that reads the document its own stream with view."""
+
+    def __init__(
+        self,
+        buffer: memoryview,
+        name: Optional[Union[str, int]] = None,
+        filename: str = "",
+    ):
+        super().__init__()
+        self._buffer = buffer
+        self._position = 0
+        self.name = name
+        self.filename = filename
+
+    def view(self) -> "DocumentSource":
+        """Returns a new stream over the same bytes, starting from the beginning of the
+        document."""
+        return DocumentSource(self._buffer, name=self.name, filename=self.filename)
+
+    def getbuffer(self) -> memoryview:
+        return self._buffer
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        self._check_not_closed()
+        end = len(self._buffer)
+        if size is not None and size >= 0:
+            end = min(end, self._position + size)
+        data = bytes(self._buffer[self._position : end])  # noqa: E203
+        self._position += len(data)
+        return data
+
+    def readall(self) -> bytes:
+        return self.read()
+
+    def readinto(self, b) -> int:
+        data = self.read(len(b))
+        b[: len(data)] = data
+        return len(data)
+
+    def readline(self, size: Optional[int] = -1) -> bytes:
+        self._check_not_closed()
+        end = len(self._buffer)
+        if size is not None and size >= 0:
+            end = min(end, self._position + size)
+        line_end = self._position
+        while line_end < end:
+            chunk_end = min(line_end + READLINE_CHUNK_SIZE, end)
+            line_break = bytes(self._buffer[line_end:chunk_end]).find(b"\n")
+            if line_break >= 0:
+                line_end += line_break + 1
+                break
+            line_end = chunk_end
+        return self.read(line_end - self._position)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._check_not_closed()
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._buffer) + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        self._position = position
+        return position
+
+    def tell(self) -> int:
+        self._check_not_closed()
+        return self._position
+
+    def _check_not_closed(self):
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+
+def as_document_source(
+    file: Union[bytes, SpooledTemporaryFile, IO[bytes]],
+) -> Union[DocumentSource, IO[bytes]]:
+    """Wraps a document in a DocumentSource that shares the bytes of the document. Bytes and
+    in-memory files are read through a memoryview and files on disk are memory-mapped. Other
+    file-like objects, such as text streams, are returned as they are."""
+    if isinstance(file, DocumentSource):
+        return file
+    elif isinstance(file, bytes):
+        return DocumentSource(memoryview(file))
+    elif isinstance(file, BytesIO):
+        return _view_bytes_io(file)
+    elif isinstance(file, SpooledTemporaryFile):
+        # NOTE(agent) - A SpooledTemporaryFile keeps its contents in a BytesIO until it rolls
+        # over to a temporary file on disk
+        spooled_file = file._file  # type: ignore
+        if isinstance(spooled_file, BytesIO):
+            return _view_bytes_io(spooled_file)
+        return _map_file(spooled_file) or file
+    elif isinstance(file, (BufferedReader, BufferedRandom, FileIO)):
+        return _map_file(file) or file
+    return file
+
+
+def _view_bytes_io(file: BytesIO) -> DocumentSource:
+    # NOTE(agent) - getvalue shares the bytes of the BytesIO until it is next written to, so
+    # unlike getbuffer it doesn't stop the caller from writing to or closing the file while the
+    # source is in use
+    return DocumentSource(memoryview(file.getvalue()))
+
+
+def _map_file(file: IO[bytes]) -> Optional[DocumentSource]:
+    """Memory-maps a file on disk, returning None if the file can't be mapped."""
+    name = getattr(file, "name", None)
+    try:
+        if file.writable():
+            file.flush()
+        size = os.fstat(file.fileno()).st_size
+        buffer = (
+            memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+            if size
+            else memoryview(b"")
+        )
+    except (OSError, ValueError, io.UnsupportedOperation):
+        return None
+    filename = name if isinstance(name, str) and os.path.isfile(name) else ""
+    return DocumentSource(buffer, name=name, filename=filename)
+
+
 def spooled_to_bytes_io_if_needed(
     file_obj: Optional[Union[bytes, BinaryIO, SpooledTemporaryFile]],
 ) -> Optional[Union[bytes, BinaryIO]]:
-    if isinstance(file_obj, SpooledTemporaryFile):
+    """Returns a stream over a SpooledTemporaryFile, or over a DocumentSource starting from the
+    beginning of the document, without copying the contents. Other files are returned as they
+    are."""
+    if isinstance(file_obj, DocumentSource):
+        return file_obj.view()
+    elif isinstance(file_obj, SpooledTemporaryFile):
         file_obj.seek(0)
-        contents = file_obj.read()
-        return BytesIO(contents)
+        return cast(BinaryIO, as_document_source(file_obj))
     else:
         # Return the original file object if it's not a SpooledTemporaryFile
         return file_obj
@@ -303,6 +857,12 @@ def convert_to_bytes(
         file.seek(0)
     elif isinstance(file, BytesIO):
         f_bytes = file.getvalue()
+    elif isinstance(file, DocumentSource):
+        buffer = file.getbuffer()
+        if isinstance(buffer.obj, bytes) and len(buffer.obj) == buffer.nbytes:
+            f_bytes = buffer.obj
+        else:
+            f_bytes = bytes(buffer)
     elif isinstance(file, (TextIOWrapper, BufferedReader)):
         with open(file.name, "rb") as f:
             f_bytes = f.read()
@@ -312,6 +872,28 @@ def convert_to_bytes(
     return f_bytes
 
 
+@contextmanager
+def open_binary_stream(
+    file: Optional[Union[bytes, SpooledTemporaryFile, IO[bytes]]] = None,
+) -> Iterator[IO[bytes]]:
+    """Opens a binary stream over the same bytes as convert_to_bytes, starting from the beginning
+    of the file, so that the file can be read in chunks instead of all at once."""
+    if isinstance(file, bytes):
+        yield BytesIO(file)
+    elif isinstance(file, SpooledTemporaryFile):
+        file.seek(0)
+        yield cast(IO[bytes], file)
+    elif isinstance(file, BytesIO):
+        yield BytesIO(file.getvalue())
+    elif isinstance(file, DocumentSource):
+        yield file.view()
+    elif isinstance(file, (TextIOWrapper, BufferedReader)):
+        with open(file.name, "rb") as f:
+            yield f
+    else:
+        raise ValueError("Invalid file-like object type")
+
+
 def convert_ms_office_table_to_text(table: "docxtable.Table", as_html: bool = True) -> str:
     """
     Convert a table object from a Word document to an HTML table string using the tabulate library.
@@ -53,17 +53,17 @@ def partition_doc(
 
         last_modification_date = get_last_modified_date(filename)
 
-    elif file is not None:
-        tmp = tempfile.NamedTemporaryFile(delete=False)
-        tmp.write(file.read())
-        tmp.close()
-        filename = tmp.name
-        _, filename_no_path = os.path.split(os.path.abspath(tmp.name))
-        base_filename, _ = os.path.splitext(filename_no_path)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        if file is not None:
+            # NOTE(agent) - The file is written into the temporary directory so that it is
+            # removed along with the converted document
+            base_filename = "document"
+            filename = os.path.join(tmpdir, f"{base_filename}.doc")
+            with open(filename, "wb") as f:
+                f.write(file.read())
 
-        last_modification_date = get_last_modified_date_from_file(file)
+            last_modification_date = get_last_modified_date_from_file(file)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
         convert_office_doc(
             filename,
             tmpdir,
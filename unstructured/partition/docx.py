@@ -1,13 +1,16 @@
 import os
 import tempfile
 from tempfile import SpooledTemporaryFile
-from typing import IO, BinaryIO, List, Optional, Tuple, Union, cast
+from typing import IO, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union, cast
 
 import docx
+from docx.oxml.ns import nsmap
 from docx.oxml.shared import qn
+from docx.oxml.xmlchemy import BaseOxmlElement
 from docx.table import Table as DocxTable
 from docx.text.paragraph import Paragraph
 from docx.text.run import Run
+from lxml import etree
 
 from unstructured.cleaners.core import clean_bullets
 from unstructured.documents.elements import (
@@ -81,6 +84,16 @@ STYLE_TO_ELEMENT_MAPPING = {
     "Title": Title,
 }
 
+# NOTE(agent) - The XPath queries are compiled once and run directly on the lxml elements,
+# rather than serializing each element to an XML string and searching the string
+NUMBERED_PARAGRAPH_XPATH = etree.XPath("boolean(.//w:numPr)", namespaces=nsmap)
+# NOTE(agent) - Matches both "hard" page breaks inserted by the user and "soft" page breaks
+# inserted by the renderer
+PAGE_BREAK_XPATH = etree.XPath(
+    "boolean(.//w:br[@w:type='page'] | .//w:lastRenderedPageBreak)",
+    namespaces=nsmap,
+)
+
 
 def _get_paragraph_runs(paragraph):
     """
@@ -137,7 +150,46 @@ def partition_docx(
     metadata_last_modified
         The last modified date for the document.
     """
+    return list(
+        _iter_docx_elements(
+            filename=filename,
+            file=file,
+            metadata_filename=metadata_filename,
+            include_page_breaks=include_page_breaks,
+            metadata_last_modified=metadata_last_modified,
+        ),
+    )
 
+
+@process_metadata()
+@add_metadata_with_filetype(FileType.DOCX)
+def iter_partition_docx(
+    filename: Optional[str] = None,
+    file: Optional[Union[IO[bytes], SpooledTemporaryFile]] = None,
+    metadata_filename: Optional[str] = None,
+    include_page_breaks: bool = True,
+    include_metadata: bool = True,
+    metadata_last_modified: Optional[str] = None,
+    **kwargs,
+) -> Iterator[Element]:
+    """Partitions a Microsoft Word Document in .docx format and yields its document elements
+    one body element at a time. Accepts the same parameters as partition_docx."""
+    yield from _iter_docx_elements(
+        filename=filename,
+        file=file,
+        metadata_filename=metadata_filename,
+        include_page_breaks=include_page_breaks,
+        metadata_last_modified=metadata_last_modified,
+    )
+
+
+def _iter_docx_elements(
+    filename: Optional[str] = None,
+    file: Optional[Union[IO[bytes], SpooledTemporaryFile]] = None,
+    metadata_filename: Optional[str] = None,
+    include_page_breaks: bool = True,
+    metadata_last_modified: Optional[str] = None,
+) -> Iterator[Element]:
     # Verify that only one of the arguments was provided
     exactly_one(filename=filename, file=file)
 
@@ -156,17 +208,17 @@ def partition_docx(
             ),
         )
 
-    elements: List[Element] = []
     table_index = 0
 
     headers_and_footers = _get_headers_and_footers(document, metadata_filename)
     if len(headers_and_footers) > 0:
-        elements.extend(headers_and_footers[0][0])
+        yield from headers_and_footers[0][0]
 
     document_contains_pagebreaks = _element_contains_pagebreak(document._element)
     page_number = 1 if document_contains_pagebreaks else None
     section = 0
     is_list = False
+    style_names: Dict[Optional[str], Optional[str]] = {}
     for element_item in document.element.body:
         if element_item.tag.endswith("tbl"):
             table = document.tables[table_index]
@@ -182,14 +234,19 @@ def partition_docx(
                     last_modified=metadata_last_modified or last_modification_date,
                     emphasized_texts=emphasized_texts if emphasized_texts else None,
                 )
-                elements.append(element)
+                yield element
             table_index += 1
         elif element_item.tag.endswith("p"):
-            if "<w:numPr>" in element_item.xml:
+            if NUMBERED_PARAGRAPH_XPATH(element_item):
                 is_list = True
             paragraph = docx.text.paragraph.Paragraph(element_item, document)
-            emphasized_texts = _get_emphasized_texts_from_paragraph(paragraph)
-            para_element: Optional[Text] = _paragraph_to_element(paragraph, is_list)
+            text, emphasized_texts = _get_text_and_emphasized_texts_from_paragraph(paragraph)
+            para_element: Optional[Text] = _paragraph_to_element(
+                paragraph,
+                is_list,
+                text=text,
+                style_names=style_names,
+            )
             if para_element is not None:
                 para_element.metadata = ElementMetadata(
                     filename=metadata_filename,
@@ -197,40 +254,41 @@ def partition_docx(
                     last_modified=metadata_last_modified or last_modification_date,
                     emphasized_texts=emphasized_texts if emphasized_texts else None,
                 )
-                elements.append(para_element)
+                yield para_element
             is_list = False
         elif element_item.tag.endswith("sectPr"):
             if len(headers_and_footers) > section:
                 footers = headers_and_footers[section][1]
-                elements.extend(footers)
+                yield from footers
 
             section += 1
             if len(headers_and_footers) > section:
                 headers = headers_and_footers[section][0]
-                elements.extend(headers)
+                yield from headers
 
         if page_number is not None and _element_contains_pagebreak(element_item):
             page_number += 1
             if include_page_breaks:
-                elements.append(PageBreak(text=""))
-
-    return elements
+                yield PageBreak(text="")
 
 
 def _paragraph_to_element(
     paragraph: docx.text.paragraph.Paragraph,
     is_list=False,
+    text: Optional[str] = None,
+    style_names: Optional[Dict[Optional[str], Optional[str]]] = None,
 ) -> Optional[Text]:
     """Converts a docx Paragraph object into the appropriate unstructured document element.
     If the paragraph style is "Normal" or unknown, we try to predict the element type from the
-    raw text."""
-    text = paragraph.text
-    style_name = paragraph.style and paragraph.style.name  # .style can be None
+    raw text. The text is read from the paragraph if it is not passed in."""
+    if text is None:
+        text = paragraph.text
 
     if len(text.strip()) == 0:
         return None
 
-    element_class = STYLE_TO_ELEMENT_MAPPING.get(style_name)
+    style_name = _get_style_name(paragraph, style_names)
+    element_class = STYLE_TO_ELEMENT_MAPPING.get(style_name)  # type: ignore
 
     # NOTE(robinson) - The "Normal" style name will return None since it's in the mapping.
     # Unknown style names will also return None
@@ -242,20 +300,33 @@ def _paragraph_to_element(
         return element_class(text)
 
 
+def _get_style_name(
+    paragraph: Paragraph,
+    style_names: Optional[Dict[Optional[str], Optional[str]]] = None,
+) -> Optional[str]:
+    """Gets the name of the style of a paragraph. Looking up a style searches the styles of the
+    document, so if style_names is passed in, the names are cached there by style id."""
+    if style_names is None:
+        style = paragraph.style  # .style can be None
+        return style.name if style is not None else None
+
+    style_id = paragraph._p.style
+    if style_id not in style_names:
+        style = paragraph.style
+        style_names[style_id] = style.name if style is not None else None
+    return style_names[style_id]
+
+
 def _element_contains_pagebreak(element) -> bool:
     """Detects if an element contains a page break. Checks for both "hard" page breaks
     (page breaks inserted by the user) and "soft" page breaks, which are sometimes
     inserted by the MS Word renderer. Note that soft page breaks aren't always present.
     Whether or not pages are tracked may depend on your Word renderer."""
-    page_break_indicators = [
-        ["w:br", 'type="page"'],  # "Hard" page break inserted by user
-        ["lastRenderedPageBreak"],  # "Soft" page break inserted by renderer
-    ]
-    if hasattr(element, "xml"):
-        for indicators in page_break_indicators:
-            if all(indicator in element.xml for indicator in indicators):
-                return True
-    return False
+    # NOTE(agent) - Elements that python-docx doesn't have a class for, such as bookmarks,
+    # are not checked
+    if not isinstance(element, BaseOxmlElement):
+        return False
+    return PAGE_BREAK_XPATH(element)
 
 
 def _text_to_element(text: str, is_list=False) -> Optional[Text]:
@@ -349,16 +420,16 @@ def convert_and_partition_docx(
         base_filename, _ = os.path.splitext(filename_no_path)
         if not os.path.exists(filename):
             raise ValueError(f"The file {filename} does not exist.")
-    elif file is not None:
-        tmp = tempfile.NamedTemporaryFile(delete=False)
-        tmp.write(file.read())
-        tmp.close()
-        filename = tmp.name
-        _, filename_no_path = os.path.split(os.path.abspath(tmp.name))
-
-    base_filename, _ = os.path.splitext(filename_no_path)
 
     with tempfile.TemporaryDirectory() as tmpdir:
+        if file is not None:
+            # NOTE(agent) - The file is written into the temporary directory so that it is
+            # removed along with the converted document
+            base_filename = "document"
+            filename = os.path.join(tmpdir, f"{base_filename}.{source_format}")
+            with open(filename, "wb") as f:
+                f.write(file.read())
+
         docx_filename = os.path.join(tmpdir, f"{base_filename}.docx")
         pypandoc.convert_file(
             filename,
@@ -378,16 +449,27 @@ def convert_and_partition_docx(
 
 def _get_emphasized_texts_from_paragraph(paragraph: Paragraph) -> List[dict]:
     """Get emphasized texts with bold/italic formatting from a paragraph in MS Word"""
+    _, emphasized_texts = _get_text_and_emphasized_texts_from_paragraph(paragraph)
+    return emphasized_texts
+
+
+def _get_text_and_emphasized_texts_from_paragraph(paragraph: Paragraph) -> Tuple[str, List[dict]]:
+    """Gets the text of a paragraph along with the emphasized texts with bold/italic formatting,
+    reading the text of each run once."""
+    texts = []
     emphasized_texts = []
     for run in paragraph.runs:
-        text = run.text.strip() if run.text else None
+        run_text = run.text
+        texts.append(run_text)
+        text = run_text.strip()
         if not text:
             continue
-        if run.bold:
+        font = run.font
+        if font.bold:
             emphasized_texts.append({"text": text, "tag": "b"})
-        if run.italic:
+        if font.italic:
             emphasized_texts.append({"text": text, "tag": "i"})
-    return emphasized_texts
+    return "".join(texts), emphasized_texts
 
 
 def _get_emphasized_texts_from_table(table: DocxTable) -> List[dict]:
@@ -1,4 +1,4 @@
-from typing import IO, TYPE_CHECKING, Dict, List, Optional
+from typing import IO, TYPE_CHECKING, Dict, Iterator, List, Optional
 
 import requests
 
@@ -6,11 +6,17 @@ from unstructured.documents.elements import Element, process_metadata
 from unstructured.documents.html import HTMLDocument
 from unstructured.documents.xml import VALID_PARSERS
 from unstructured.file_utils.encoding import read_txt_file
-from unstructured.file_utils.file_conversion import convert_file_to_html_text
+from unstructured.file_utils.file_conversion import (
+    PANDOC_WORKERS,
+    convert_file_to_html_text,
+    iter_html_texts_from_files,
+)
 from unstructured.file_utils.filetype import (
+    EXT_TO_FILETYPE,
+    FILETYPE_TO_MIMETYPE,
     FileType,
     add_metadata_with_filetype,
-    document_to_element_list,
+    document_to_element_iter,
 )
 from unstructured.partition.common import (
     exactly_one,
@@ -73,8 +79,77 @@ def partition_html(
         If True, ignores any content that is within <header> or <footer> tags
 
     """
+    return list(
+        _iter_html_elements(
+            filename=filename,
+            file=file,
+            text=text,
+            url=url,
+            encoding=encoding,
+            include_page_breaks=include_page_breaks,
+            headers=headers,
+            ssl_verify=ssl_verify,
+            parser=parser,
+            html_assemble_articles=html_assemble_articles,
+            metadata_last_modified=metadata_last_modified,
+            skip_headers_and_footers=skip_headers_and_footers,
+        ),
+    )
+
+
+@process_metadata()
+@add_metadata_with_filetype(FileType.HTML)
+def iter_partition_html(
+    filename: Optional[str] = None,
+    file: Optional[IO[bytes]] = None,
+    text: Optional[str] = None,
+    url: Optional[str] = None,
+    encoding: Optional[str] = None,
+    include_page_breaks: bool = False,
+    include_metadata: bool = True,
+    headers: Dict[str, str] = {},
+    ssl_verify: bool = True,
+    parser: VALID_PARSERS = None,
+    html_assemble_articles: bool = False,
+    metadata_filename: Optional[str] = None,
+    metadata_last_modified: Optional[str] = None,
+    skip_headers_and_footers: bool = False,
+    **kwargs,
+) -> Iterator[Element]:
+    """Partitions an HTML document and yields its elements one page at a time. Accepts the
+    same parameters as partition_html."""
+    yield from _iter_html_elements(
+        filename=filename,
+        file=file,
+        text=text,
+        url=url,
+        encoding=encoding,
+        include_page_breaks=include_page_breaks,
+        headers=headers,
+        ssl_verify=ssl_verify,
+        parser=parser,
+        html_assemble_articles=html_assemble_articles,
+        metadata_last_modified=metadata_last_modified,
+        skip_headers_and_footers=skip_headers_and_footers,
+    )
+
+
+def _iter_html_elements(
+    filename: Optional[str] = None,
+    file: Optional[IO[bytes]] = None,
+    text: Optional[str] = None,
+    url: Optional[str] = None,
+    encoding: Optional[str] = None,
+    include_page_breaks: bool = False,
+    headers: Dict[str, str] = {},
+    ssl_verify: bool = True,
+    parser: VALID_PARSERS = None,
+    html_assemble_articles: bool = False,
+    metadata_last_modified: Optional[str] = None,
+    skip_headers_and_footers: bool = False,
+) -> Iterator[Element]:
     if text is not None and text.strip() == "" and not file and not filename and not url:
-        return []
+        return
     # Verify that only one of the arguments was provided
     exactly_one(filename=filename, file=file, text=text, url=url)
 
@@ -119,7 +194,7 @@ def partition_html(
     if skip_headers_and_footers:
         document = filter_footer_and_header(document)
 
-    return document_to_element_list(
+    yield from document_to_element_iter(
         document,
         include_page_breaks=include_page_breaks,
         last_modification_date=metadata_last_modified or last_modification_date,
@@ -174,6 +249,43 @@ def convert_and_partition_html(
     )
 
 
+def iter_convert_and_partition_html(
+    source_format: str,
+    filenames: List[str],
+    include_page_breaks: bool = False,
+    workers: int = PANDOC_WORKERS,
+) -> Iterator[List[Element]]:
+    """Converts a batch of documents to HTML and partitions each of them using partition_html,
+    yielding the elements of each document in the order of filenames. Up to workers documents
+    are converted with pandoc at a time while the converted documents are partitioned. The
+    elements have the same metadata as those of partition_epub, partition_rtf, etc.
+
+    Parameters
+    ----------
+    source_format
+        The format of the source documents, i.e. epub
+    filenames
+        The filenames of the documents to partition.
+    include_page_breaks
+        If True, the output will include page breaks if the filetype supports it.
+    workers
+        The number of documents to convert with pandoc at a time.
+    """
+    filetype = FILETYPE_TO_MIMETYPE[EXT_TO_FILETYPE[f".{source_format}"]]
+    html_texts = iter_html_texts_from_files(source_format, filenames, workers=workers)
+    for filename, html_text in zip(filenames, html_texts):
+        elements = partition_html(
+            text=html_text,
+            include_page_breaks=include_page_breaks,
+            encoding="unicode",
+            metadata_filename=filename,
+            metadata_last_modified=get_last_modified_date(filename),
+        )
+        for element in elements:
+            element.metadata.filetype = filetype
+        yield elements
+
+
 def filter_footer_and_header(document: "DocumentLayout") -> "DocumentLayout":
     for page in document.pages:
         page.elements = list(
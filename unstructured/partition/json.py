@@ -12,7 +12,7 @@ from unstructured.partition.common import (
     get_last_modified_date,
     get_last_modified_date_from_file,
 )
-from unstructured.staging.base import dict_to_elements
+from unstructured.staging.base import dict_to_elements, json_loads
 
 
 @process_metadata()
@@ -69,8 +69,8 @@ def partition_json(
         )
 
     try:
-        dict = json.loads(file_text)
-        elements = dict_to_elements(dict)
+        dict = json_loads(file_text)
+        elements = dict_to_elements(dict, copy=False)
     except json.JSONDecodeError:
         raise ValueError("Not a valid json")
 
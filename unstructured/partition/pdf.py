@@ -1,13 +1,32 @@
+import multiprocessing as mp
 import os
 import re
+import sys
+import tempfile
 import warnings
+from io import BytesIO
 from tempfile import SpooledTemporaryFile
-from typing import BinaryIO, Iterator, List, Optional, Union, cast
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import pdf2image
 import PIL
+from pdfminer.converter import PDFPageAggregator
 from pdfminer.high_level import extract_pages
 from pdfminer.layout import LTContainer, LTImage, LTItem, LTTextBox
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
 from pdfminer.utils import open_filename
 
 from unstructured.cleaners.core import clean_extra_whitespace
@@ -26,8 +45,11 @@ from unstructured.file_utils.filetype import (
     add_metadata_with_filetype,
     document_to_element_list,
 )
+from unstructured.logger import logger
 from unstructured.nlp.patterns import PARAGRAPH_PATTERN
 from unstructured.partition.common import (
+    DocumentSource,
+    as_document_source,
     convert_to_bytes,
     exactly_one,
     get_last_modified_date,
@@ -35,11 +57,20 @@ from unstructured.partition.common import (
     spooled_to_bytes_io_if_needed,
 )
 from unstructured.partition.strategies import determine_pdf_or_image_strategy
-from unstructured.partition.text import element_from_text, partition_text
+from unstructured.partition.text import elements_from_texts, partition_text
 from unstructured.utils import requires_dependencies
 
 RE_MULTISPACE_INCLUDING_NEWLINES = re.compile(pattern=r"\s+", flags=re.DOTALL)
 
+# NOTE(agent) - The number of leading pages that are sampled to determine whether the
+# text in a PDF is extractable. Can be overridden with UNSTRUCTURED_PDF_EXTRACTABLE_MAX_PAGES.
+# A value of 0 samples every page in the document.
+PDF_EXTRACTABLE_MAX_PAGES = 10
+
+# NOTE(agent) - Each page worker is handed several small page ranges rather than a single
+# large one so that a few slow pages don't leave the other workers idle
+PAGE_RANGES_PER_WORKER = 4
+
 
 @process_metadata()
 @add_metadata_with_filetype(FileType.PDF)
@@ -55,6 +86,7 @@ def partition_pdf(
     include_metadata: bool = True,
     metadata_filename: Optional[str] = None,
     metadata_last_modified: Optional[str] = None,
+    page_workers: int = 1,
     **kwargs,
 ) -> List[Element]:
     """Parses a pdf document into a list of interpreted elements.
@@ -90,6 +122,10 @@ def partition_pdf(
         processing text/plain content.
     metadata_last_modified
         The last modified date for the document.
+    page_workers
+        The number of worker processes used to partition ranges of pages in parallel. Only
+        applies to the "fast" and "ocr_only" strategies. The output is identical to partitioning
+        the pages serially, which is the default.
     """
     exactly_one(filename=filename, file=file)
     return partition_pdf_or_image(
@@ -102,6 +138,44 @@ def partition_pdf(
         max_partition=max_partition,
         min_partition=min_partition,
         metadata_last_modified=metadata_last_modified,
+        page_workers=page_workers,
+        **kwargs,
+    )
+
+
+@process_metadata()
+@add_metadata_with_filetype(FileType.PDF)
+def iter_partition_pdf(
+    filename: str = "",
+    file: Optional[Union[BinaryIO, SpooledTemporaryFile]] = None,
+    include_page_breaks: bool = False,
+    strategy: str = "auto",
+    infer_table_structure: bool = False,
+    ocr_languages: str = "eng",
+    max_partition: Optional[int] = 1500,
+    min_partition: Optional[int] = 0,
+    include_metadata: bool = True,
+    metadata_filename: Optional[str] = None,
+    metadata_last_modified: Optional[str] = None,
+    page_workers: int = 1,
+    **kwargs,
+) -> Iterator[Element]:
+    """Parses a pdf document and yields the interpreted elements page by page, so the
+    elements for a page can be consumed before the next page is processed. Accepts the
+    same parameters as partition_pdf. The "hi_res" strategy still processes the whole
+    document before the first element is yielded."""
+    exactly_one(filename=filename, file=file)
+    yield from iter_partition_pdf_or_image(
+        filename=filename,
+        file=file,
+        include_page_breaks=include_page_breaks,
+        strategy=strategy,
+        infer_table_structure=infer_table_structure,
+        ocr_languages=ocr_languages,
+        max_partition=max_partition,
+        min_partition=min_partition,
+        metadata_last_modified=metadata_last_modified,
+        page_workers=page_workers,
         **kwargs,
     )
 
@@ -111,15 +185,77 @@ def extractable_elements(
     file: Optional[Union[bytes, BinaryIO, SpooledTemporaryFile]] = None,
     include_page_breaks: bool = False,
     metadata_last_modified: Optional[str] = None,
-):
+    page_workers: int = 1,
+) -> List[Element]:
+    return list(
+        iter_extractable_elements(
+            filename=filename,
+            file=file,
+            include_page_breaks=include_page_breaks,
+            metadata_last_modified=metadata_last_modified,
+            page_workers=page_workers,
+        ),
+    )
+
+
+def iter_extractable_elements(
+    filename: str = "",
+    file: Optional[Union[bytes, BinaryIO, SpooledTemporaryFile]] = None,
+    include_page_breaks: bool = False,
+    metadata_last_modified: Optional[str] = None,
+    page_workers: int = 1,
+) -> Iterator[Element]:
     return _partition_pdf_with_pdfminer(
         filename=filename,
         file=file,
         include_page_breaks=include_page_breaks,
         metadata_last_modified=metadata_last_modified,
+        page_workers=page_workers,
     )
 
 
+@requires_dependencies("pdfminer")
+def is_pdf_text_extractable(
+    filename: str = "",
+    file: Optional[Union[bytes, BinaryIO, SpooledTemporaryFile]] = None,
+    max_pages: Optional[int] = None,
+) -> bool:
+    """Cheaply checks whether a PDF contains a text layer. Only the first `max_pages` pages
+    are interpreted, layout analysis and element classification are skipped and the check
+    stops at the first non-whitespace character that is found."""
+    exactly_one(filename=filename, file=file)
+    if max_pages is None:
+        max_pages = int(
+            os.environ.get("UNSTRUCTURED_PDF_EXTRACTABLE_MAX_PAGES", PDF_EXTRACTABLE_MAX_PAGES),
+        )
+
+    source = filename or spooled_to_bytes_io_if_needed(file)
+    with open_filename(source, "rb") as fp:  # type: ignore
+        fp = cast(BinaryIO, fp)
+        resource_manager = PDFResourceManager(caching=True)
+        # NOTE(agent) - laparams=None skips layout analysis, the aggregator only
+        # collects the raw characters for each page
+        device = PDFPageAggregator(resource_manager, laparams=None)
+        interpreter = PDFPageInterpreter(resource_manager, device)
+        for page in PDFPage.get_pages(fp, maxpages=max_pages):
+            interpreter.process_page(page)
+            if _contains_text(device.get_result()):
+                return True
+
+    return False
+
+
+def _contains_text(item: LTItem) -> bool:
+    """Recursively checks PDFMiner objects for non-whitespace text."""
+    if hasattr(item, "get_text"):
+        return bool(item.get_text().strip())
+
+    elif isinstance(item, LTContainer):
+        return any(_contains_text(child) for child in item)
+
+    return False
+
+
 def get_the_last_modification_date_pdf_or_img(
     file: Optional[Union[bytes, BinaryIO, SpooledTemporaryFile]] = None,
     filename: Optional[str] = "",
@@ -143,9 +279,43 @@ def partition_pdf_or_image(
     max_partition: Optional[int] = 1500,
     min_partition: Optional[int] = 0,
     metadata_last_modified: Optional[str] = None,
+    page_workers: int = 1,
     **kwargs,
 ) -> List[Element]:
     """Parses a pdf or image document into a list of interpreted elements."""
+    return list(
+        iter_partition_pdf_or_image(
+            filename=filename,
+            file=file,
+            is_image=is_image,
+            include_page_breaks=include_page_breaks,
+            strategy=strategy,
+            infer_table_structure=infer_table_structure,
+            ocr_languages=ocr_languages,
+            max_partition=max_partition,
+            min_partition=min_partition,
+            metadata_last_modified=metadata_last_modified,
+            page_workers=page_workers,
+            **kwargs,
+        ),
+    )
+
+
+def iter_partition_pdf_or_image(
+    filename: str = "",
+    file: Optional[Union[bytes, BinaryIO, SpooledTemporaryFile]] = None,
+    is_image: bool = False,
+    include_page_breaks: bool = False,
+    strategy: str = "auto",
+    infer_table_structure: bool = False,
+    ocr_languages: str = "eng",
+    max_partition: Optional[int] = 1500,
+    min_partition: Optional[int] = 0,
+    metadata_last_modified: Optional[str] = None,
+    page_workers: int = 1,
+    **kwargs,
+) -> Iterator[Element]:
+    """Parses a pdf or image document and yields the interpreted elements page by page."""
     # TODO(alan): Extract information about the filetype to be processed from the template
     # route. Decoding the routing should probably be handled by a single function designed for
     # that task so as routing design changes, those changes are implemented in a single
@@ -155,16 +325,14 @@ def partition_pdf_or_image(
         file=file,
         filename=filename,
     )
+    # NOTE(agent) - The document is wrapped once so the strategy probes and the partitioning
+    # pass all read from the same buffer instead of each taking their own copy
+    if file is not None:
+        file = cast(BinaryIO, as_document_source(file))
+    # NOTE(agent) - Only a cheap probe runs up front. The full pdfminer element pass is
+    # deferred until the "fast" strategy has actually been chosen.
     if not is_image:
-        extracted_elements = extractable_elements(
-            filename=filename,
-            file=spooled_to_bytes_io_if_needed(file),
-            include_page_breaks=include_page_breaks,
-            metadata_last_modified=metadata_last_modified or last_modification_date,
-        )
-        pdf_text_extractable = any(
-            isinstance(el, Text) and el.text.strip() for el in extracted_elements
-        )
+        pdf_text_extractable = is_pdf_text_extractable(filename=filename, file=file)
     else:
         pdf_text_extractable = False
 
@@ -191,14 +359,21 @@ def partition_pdf_or_image(
                 metadata_last_modified=metadata_last_modified or last_modification_date,
                 **kwargs,
             )
+        yield from layout_elements
 
     elif strategy == "fast":
-        return extracted_elements
+        yield from iter_extractable_elements(
+            filename=filename,
+            file=spooled_to_bytes_io_if_needed(file),
+            include_page_breaks=include_page_breaks,
+            metadata_last_modified=metadata_last_modified or last_modification_date,
+            page_workers=page_workers,
+        )
 
     elif strategy == "ocr_only":
         # NOTE(robinson): Catches file conversion warnings when running with PDFs
         with warnings.catch_warnings():
-            return _partition_pdf_or_image_with_ocr(
+            yield from _partition_pdf_or_image_with_ocr(
                 filename=filename,
                 file=file,
                 include_page_breaks=include_page_breaks,
@@ -207,8 +382,8 @@ def partition_pdf_or_image(
                 max_partition=max_partition,
                 min_partition=min_partition,
                 metadata_last_modified=metadata_last_modified or last_modification_date,
+                page_workers=page_workers,
             )
-    return layout_elements
 
 
 @requires_dependencies("unstructured_inference")
@@ -286,7 +461,8 @@ def _partition_pdf_with_pdfminer(
     file: Optional[BinaryIO] = None,
     include_page_breaks: bool = False,
     metadata_last_modified: Optional[str] = None,
-) -> List[Element]:
+    page_workers: int = 1,
+) -> Iterator[Element]:
     """Partitions a PDF using PDFMiner instead of using a layoutmodel. Used for faster
     processing or detectron2 is not available.
 
@@ -296,26 +472,156 @@ def _partition_pdf_with_pdfminer(
     ref: https://github.com/pdfminer/pdfminer.six/blob/master/pdfminer/high_level.py
     """
     exactly_one(filename=filename, file=file)
+    if page_workers > 1:
+        return _partition_page_ranges_in_parallel(
+            _partition_pdf_pages_with_pdfminer,
+            filename=filename,
+            file=file,
+            page_workers=page_workers,
+            include_page_breaks=include_page_breaks,
+            metadata_last_modified=metadata_last_modified,
+        )
+
+    return _partition_pdf_pages_with_pdfminer(
+        filename=filename,
+        file=file,
+        include_page_breaks=include_page_breaks,
+        metadata_last_modified=metadata_last_modified,
+    )
+
+
+def _partition_pdf_pages_with_pdfminer(
+    filename: str = "",
+    file: Optional[BinaryIO] = None,
+    first_page: int = 1,
+    last_page: Optional[int] = None,
+    include_page_breaks: bool = False,
+    metadata_last_modified: Optional[str] = None,
+) -> Iterator[Element]:
+    """Partitions the pages from first_page through last_page (1-indexed and inclusive)
+    with PDFMiner. All remaining pages are processed if last_page is None."""
     if filename:
         with open_filename(filename, "rb") as fp:
             fp = cast(BinaryIO, fp)
-            elements = _process_pdfminer_pages(
+            yield from _process_pdfminer_pages(
                 fp=fp,
                 filename=filename,
                 include_page_breaks=include_page_breaks,
                 metadata_last_modified=metadata_last_modified,
+                first_page=first_page,
+                last_page=last_page,
             )
 
     elif file:
         fp = cast(BinaryIO, file)
-        elements = _process_pdfminer_pages(
+        yield from _process_pdfminer_pages(
             fp=fp,
             filename=filename,
             include_page_breaks=include_page_breaks,
             metadata_last_modified=metadata_last_modified,
+            first_page=first_page,
+            last_page=last_page,
         )
 
-    return elements
+
+def _get_pdf_page_count(
+    filename: str = "",
+    file: Optional[Union[bytes, BinaryIO]] = None,
+) -> int:
+    """Counts the pages in a PDF without interpreting their contents."""
+    source = BytesIO(file) if isinstance(file, bytes) else file
+    with open_filename(filename or source, "rb") as fp:  # type: ignore
+        return sum(1 for _ in PDFPage.get_pages(cast(BinaryIO, fp)))
+
+
+def _split_page_ranges(total_pages: int, page_workers: int) -> List[Tuple[int, int]]:
+    """Splits the pages of a document into contiguous, 1-indexed and inclusive page ranges."""
+    num_ranges = page_workers * PAGE_RANGES_PER_WORKER
+    range_size = max(1, -(-total_pages // num_ranges))
+    return [
+        (first_page, min(first_page + range_size - 1, total_pages))
+        for first_page in range(1, total_pages + 1, range_size)
+    ]
+
+
+# NOTE(agent) - Populated by _init_page_worker so the document is only sent once to each
+# worker process instead of once per page range
+_page_worker_source: Dict[str, Any] = {}
+
+
+def _init_page_worker(filename: str, file_bytes: Optional[bytes], file_path: str = ""):
+    _page_worker_source["filename"] = filename
+    _page_worker_source["file_bytes"] = file_bytes
+    _page_worker_source["file_path"] = file_path
+
+
+def _partition_page_range(
+    task: Tuple[Callable[..., Iterator[Element]], int, int, Dict[str, Any]],
+) -> List[Element]:
+    partition_fn, first_page, last_page, kwargs = task
+    file_bytes = _page_worker_source["file_bytes"]
+    file_path = _page_worker_source["file_path"]
+    if file_path:
+        with open(file_path, "rb") as f:
+            return list(
+                partition_fn(
+                    filename=_page_worker_source["filename"],
+                    file=f,
+                    first_page=first_page,
+                    last_page=last_page,
+                    **kwargs,
+                ),
+            )
+    return list(
+        partition_fn(
+            filename=_page_worker_source["filename"],
+            file=None if file_bytes is None else BytesIO(file_bytes),
+            first_page=first_page,
+            last_page=last_page,
+            **kwargs,
+        ),
+    )
+
+
+def _partition_page_ranges_in_parallel(
+    partition_fn: Callable[..., Iterator[Element]],
+    filename: str = "",
+    file: Optional[Union[bytes, BinaryIO, SpooledTemporaryFile]] = None,
+    page_workers: int = 1,
+    **kwargs,
+) -> Iterator[Element]:
+    """Splits a PDF into page ranges and partitions them with partition_fn in a pool of
+    page_workers processes. The results are yielded back in page order, so the output is the
+    same as running partition_fn over the whole document. Inside a daemonic process, such as
+    a worker of the ingest pool, the page ranges are partitioned serially instead, since a
+    daemonic process can't start a pool of its own."""
+    if mp.current_process().daemon:
+        logger.warning(
+            f"page_workers={page_workers} is ignored inside a daemonic process, e.g. an ingest "
+            "worker. Partitioning the pages serially.",
+        )
+        yield from partition_fn(filename=filename, file=file, **kwargs)
+        return
+
+    # NOTE(agent) - If the document is backed by a file on disk, the workers open that file
+    # themselves rather than each receiving a pickled copy of its contents
+    file_path = file.filename if isinstance(file, DocumentSource) else ""
+    file_bytes = None if file is None or file_path else convert_to_bytes(file)
+    total_pages = _get_pdf_page_count(filename=filename or file_path, file=file_bytes)
+    tasks = [
+        (partition_fn, first_page, last_page, kwargs)
+        for first_page, last_page in _split_page_ranges(total_pages, page_workers)
+    ]
+    if not tasks:
+        return
+
+    with mp.Pool(
+        processes=min(page_workers, len(tasks)),
+        initializer=_init_page_worker,
+        initargs=(filename, file_bytes, file_path),
+    ) as pool:
+        for page_range_elements in pool.imap(_partition_page_range, tasks, chunksize=1):
+            yield from page_range_elements
 
 
 def _extract_text(item: LTItem) -> str:
@@ -342,15 +648,27 @@ def _process_pdfminer_pages(
     filename: str = "",
     include_page_breaks: bool = False,
     metadata_last_modified: Optional[str] = None,
+    first_page: int = 1,
+    last_page: Optional[int] = None,
 ):
-    """Uses PDF miner to split a document into pages and process them."""
-    elements: List[Element] = []
+    """Uses PDF miner to split a document into pages and process them. The elements are
+    yielded one page at a time."""
 
-    for i, page in enumerate(extract_pages(fp)):  # type: ignore
+    page_numbers: Optional[Sequence[int]] = None
+    if first_page > 1 or last_page is not None:
+        # NOTE(agent) - pdfminer expects zero-indexed page numbers
+        page_numbers = range(first_page - 1, sys.maxsize if last_page is None else last_page)
+
+    pages = extract_pages(fp, page_numbers=page_numbers)  # type: ignore
+    for i, page in enumerate(pages, start=first_page - 1):
         width, height = page.width, page.height
 
+        coordinate_system = PixelSpace(
+            width=width,
+            height=height,
+        )
         text_segments = []
-        page_elements = []
+        page_points = []
         for obj in page:
             x1, y2, x2, y1 = obj.bbox
             y1 = height - y1
@@ -366,27 +684,25 @@ def _process_pdfminer_pages(
                 _text = clean_extra_whitespace(_text)
                 if _text.strip():
                     text_segments.append(_text)
-                    coordinate_system = PixelSpace(
-                        width=width,
-                        height=height,
-                    )
-                    points = ((x1, y1), (x1, y2), (x2, y2), (x2, y1))
-                    element = element_from_text(
-                        _text,
-                        coordinates=points,
-                        coordinate_system=coordinate_system,
-                    )
-                    coordinates_metadata = CoordinatesMetadata(
-                        points=points,
-                        system=coordinate_system,
-                    )
-                    element.metadata = ElementMetadata(
-                        filename=filename,
-                        page_number=i + 1,
-                        coordinates=coordinates_metadata,
-                        last_modified=metadata_last_modified,
-                    )
-                    page_elements.append(element)
+                    page_points.append(((x1, y1), (x1, y2), (x2, y2), (x2, y1)))
+
+        # NOTE(agent) - The text segments of a page are classified together, which shares
+        # the text type config, tokens and POS tagging across the segments
+        page_elements = elements_from_texts(
+            text_segments,
+            coordinates=page_points,
+            coordinate_system=coordinate_system,
+        )
+        for element, points in zip(page_elements, page_points):
+            element.metadata = ElementMetadata(
+                filename=filename,
+                page_number=i + 1,
+                coordinates=CoordinatesMetadata(
+                    points=points,
+                    system=coordinate_system,
+                ),
+                last_modified=metadata_last_modified,
+            )
 
         sorted_page_elements = sorted(
             page_elements,
@@ -396,43 +712,59 @@ def _process_pdfminer_pages(
                 el.id,
             ),
         )
-        elements += sorted_page_elements
+        yield from sorted_page_elements
 
         if include_page_breaks:
-            elements.append(PageBreak(text=""))
-
-    return elements
+            yield PageBreak(text="")
 
 
 def convert_pdf_to_images(
     filename: str = "",
     file: Optional[Union[bytes, BinaryIO, SpooledTemporaryFile]] = None,
     chunk_size: int = 10,
+    first_page: int = 1,
+    last_page: Optional[int] = None,
 ) -> Iterator[PIL.Image.Image]:
     # Convert a PDF in small chunks of pages at a time (e.g. 1-10, 11-20... and so on)
     exactly_one(filename=filename, file=file)
     if file is not None:
-        f_bytes = convert_to_bytes(file)
-        info = pdf2image.pdfinfo_from_bytes(f_bytes)
-    else:
-        f_bytes = None
-        info = pdf2image.pdfinfo_from_path(filename)
-
-    total_pages = info["Pages"]
-    for start_page in range(1, total_pages + 1, chunk_size):
-        end_page = min(start_page + chunk_size - 1, total_pages)
-        if f_bytes is not None:
-            chunk_images = pdf2image.convert_from_bytes(
-                f_bytes,
-                first_page=start_page,
-                last_page=end_page,
+        # NOTE(agent) - pdf2image only reads from disk, and convert_from_bytes writes a new
+        # temporary file on every call. Documents that are already on disk are read in place
+        # and anything else is written out once for all of the page chunks.
+        source = as_document_source(file)
+        if isinstance(source, DocumentSource) and source.filename:
+            yield from convert_pdf_to_images(
+                filename=source.filename,
+                chunk_size=chunk_size,
+                first_page=first_page,
+                last_page=last_page,
             )
-        else:
-            chunk_images = pdf2image.convert_from_path(
-                filename,
-                first_page=start_page,
-                last_page=end_page,
+            return
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_filename = os.path.join(tmpdir, "document.pdf")
+            with open(tmp_filename, "wb") as tmp:
+                if isinstance(source, DocumentSource):
+                    tmp.write(source.getbuffer())
+                else:
+                    tmp.write(convert_to_bytes(source))
+            yield from convert_pdf_to_images(
+                filename=tmp_filename,
+                chunk_size=chunk_size,
+                first_page=first_page,
+                last_page=last_page,
             )
+        return
+
+    info = pdf2image.pdfinfo_from_path(filename)
+    total_pages = info["Pages"] if last_page is None else min(last_page, info["Pages"])
+    for start_page in range(first_page, total_pages + 1, chunk_size):
+        end_page = min(start_page + chunk_size - 1, total_pages)
+        chunk_images = pdf2image.convert_from_path(
+            filename,
+            first_page=start_page,
+            last_page=end_page,
+        )
 
         for image in chunk_images:
             yield image
@@ -448,9 +780,10 @@ def _partition_pdf_or_image_with_ocr(
     max_partition: Optional[int] = 1500,
     min_partition: Optional[int] = 0,
     metadata_last_modified: Optional[str] = None,
-):
+    page_workers: int = 1,
+) -> Iterator[Element]:
     """Partitions and image or PDF using Tesseract OCR. For PDFs, each page is converted
-    to an image prior to processing."""
+    to an image prior to processing and the elements are yielded one page at a time."""
     import pytesseract
 
     if is_image:
@@ -459,34 +792,71 @@ def _partition_pdf_or_image_with_ocr(
             text = pytesseract.image_to_string(image, config=f"-l '{ocr_languages}'")
         else:
             text = pytesseract.image_to_string(filename, config=f"-l '{ocr_languages}'")
-        elements = partition_text(
+        yield from partition_text(
             text=text,
             max_partition=max_partition,
             min_partition=min_partition,
             metadata_last_modified=metadata_last_modified,
         )
 
+    elif page_workers > 1:
+        yield from _partition_page_ranges_in_parallel(
+            _partition_pdf_pages_with_ocr,
+            filename=filename,
+            file=file,
+            page_workers=page_workers,
+            include_page_breaks=include_page_breaks,
+            ocr_languages=ocr_languages,
+            max_partition=max_partition,
+            min_partition=min_partition,
+            metadata_last_modified=metadata_last_modified,
+        )
+
     else:
-        elements = []
-        page_number = 0
-        for image in convert_pdf_to_images(filename, file):
-            page_number += 1
-            metadata = ElementMetadata(
-                filename=filename,
-                page_number=page_number,
-                last_modified=metadata_last_modified,
-            )
-            text = pytesseract.image_to_string(image, config=f"-l '{ocr_languages}'")
+        yield from _partition_pdf_pages_with_ocr(
+            filename=filename,
+            file=file,
+            include_page_breaks=include_page_breaks,
+            ocr_languages=ocr_languages,
+            max_partition=max_partition,
+            min_partition=min_partition,
+            metadata_last_modified=metadata_last_modified,
+        )
 
-            _elements = partition_text(
-                text=text,
-                max_partition=max_partition,
-                min_partition=min_partition,
-            )
-            for element in _elements:
-                element.metadata = metadata
-                elements.append(element)
 
-            if include_page_breaks:
-                elements.append(PageBreak(text=""))
-    return elements
+@requires_dependencies("pytesseract")
+def _partition_pdf_pages_with_ocr(
+    filename: str = "",
+    file: Optional[Union[bytes, BinaryIO, SpooledTemporaryFile]] = None,
+    first_page: int = 1,
+    last_page: Optional[int] = None,
+    include_page_breaks: bool = False,
+    ocr_languages: str = "eng",
+    max_partition: Optional[int] = 1500,
+    min_partition: Optional[int] = 0,
+    metadata_last_modified: Optional[str] = None,
+) -> Iterator[Element]:
+    """Partitions the pages from first_page through last_page (1-indexed and inclusive)
+    with Tesseract OCR. All remaining pages are processed if last_page is None."""
+    import pytesseract
+
+    images = convert_pdf_to_images(filename, file, first_page=first_page, last_page=last_page)
+    for page_number, image in enumerate(images, start=first_page):
+        metadata = ElementMetadata(
+            filename=filename,
+            page_number=page_number,
+            last_modified=metadata_last_modified,
+        )
+        text = pytesseract.image_to_string(image, config=f"-l '{ocr_languages}'")
+
+        _elements = partition_text(
+            text=text,
+            max_partition=max_partition,
+            min_partition=min_partition,
+        )
+        for element in _elements:
+            element.metadata = metadata
+            yield element
+
+        if include_page_breaks:
+            yield PageBreak(text="")
@@ -1,5 +1,5 @@
 from tempfile import SpooledTemporaryFile
-from typing import IO, BinaryIO, List, Optional, Union, cast
+from typing import IO, BinaryIO, Iterator, List, Optional, Tuple, Union, cast
 
 import pptx
 
@@ -11,8 +11,6 @@ from unstructured.documents.elements import (
     NarrativeText,
     PageBreak,
     Table,
-    Text,
-    Title,
     process_metadata,
 )
 from unstructured.file_utils.filetype import FileType, add_metadata_with_filetype
@@ -24,9 +22,8 @@ from unstructured.partition.common import (
     spooled_to_bytes_io_if_needed,
 )
 from unstructured.partition.text_type import (
+    get_text_types,
     is_email_address,
-    is_possible_narrative_text,
-    is_possible_title,
 )
 
 OPENXML_SCHEMA_NAME = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
@@ -65,7 +62,50 @@ def partition_pptx(
     include_slide_notes
         If True, includes the slide notes as element
     """
+    return list(
+        _iter_pptx_elements(
+            filename=filename,
+            file=file,
+            include_page_breaks=include_page_breaks,
+            metadata_filename=metadata_filename,
+            metadata_last_modified=metadata_last_modified,
+            include_slide_notes=include_slide_notes,
+        ),
+    )
 
+
+@process_metadata()
+@add_metadata_with_filetype(FileType.PPTX)
+def iter_partition_pptx(
+    filename: Optional[str] = None,
+    file: Optional[Union[IO[bytes], SpooledTemporaryFile]] = None,
+    include_page_breaks: bool = True,
+    metadata_filename: Optional[str] = None,
+    include_metadata: bool = True,
+    metadata_last_modified: Optional[str] = None,
+    include_slide_notes: bool = False,
+    **kwargs,
+) -> Iterator[Element]:
+    """Partitions a Microsoft PowerPoint Document in .pptx format and yields its document
+    elements one slide at a time. Accepts the same parameters as partition_pptx."""
+    yield from _iter_pptx_elements(
+        filename=filename,
+        file=file,
+        include_page_breaks=include_page_breaks,
+        metadata_filename=metadata_filename,
+        metadata_last_modified=metadata_last_modified,
+        include_slide_notes=include_slide_notes,
+    )
+
+
+def _iter_pptx_elements(
+    filename: Optional[str] = None,
+    file: Optional[Union[IO[bytes], SpooledTemporaryFile]] = None,
+    include_page_breaks: bool = True,
+    metadata_filename: Optional[str] = None,
+    metadata_last_modified: Optional[str] = None,
+    include_slide_notes: bool = False,
+) -> Iterator[Element]:
     # Verify that only one of the arguments was provided
     exactly_one(filename=filename, file=file)
     last_modification_date = None
@@ -82,20 +122,23 @@ def partition_pptx(
             ),
         )
 
-    elements: List[Element] = []
     metadata = ElementMetadata(filename=metadata_filename or filename)
     num_slides = len(presentation.slides)
     for i, slide in enumerate(presentation.slides):
         metadata = ElementMetadata.from_dict(metadata.to_dict())
         metadata.last_modified = metadata_last_modified or last_modification_date
         metadata.page_number = i + 1
+        # NOTE(agent) - The paragraphs of a slide that need to be classified as narrative
+        # text or titles are held back as (text, metadata) pairs, so that they can be
+        # classified together once the whole slide has been read
+        slide_elements: List[Union[Element, Tuple[str, ElementMetadata]]] = []
         if include_slide_notes and slide.has_notes_slide is True:
             notes_slide = slide.notes_slide
             if notes_slide.notes_text_frame is not None:
                 notes_text_frame = notes_slide.notes_text_frame
                 notes_text = notes_text_frame.text
                 if notes_text.strip() != "":
-                    elements.append(NarrativeText(text=notes_text, metadata=metadata))
+                    slide_elements.append(NarrativeText(text=notes_text, metadata=metadata))
 
         for shape in _order_shapes(slide.shapes):
             if shape.has_table:
@@ -109,7 +152,7 @@ def partition_pptx(
                         page_number=metadata.page_number,
                         last_modified=metadata_last_modified or last_modification_date,
                     )
-                    elements.append(Table(text=text_table, metadata=metadata))
+                    slide_elements.append(Table(text=text_table, metadata=metadata))
                 continue
             if not shape.has_text_frame:
                 continue
@@ -122,20 +165,26 @@ def partition_pptx(
                 if text.strip() == "":
                     continue
                 if _is_bulleted_paragraph(paragraph):
-                    elements.append(ListItem(text=text, metadata=metadata))
+                    slide_elements.append(ListItem(text=text, metadata=metadata))
                 elif is_email_address(text):
-                    elements.append(EmailAddress(text=text))
-                elif is_possible_narrative_text(text):
-                    elements.append(NarrativeText(text=text, metadata=metadata))
-                elif is_possible_title(text):
-                    elements.append(Title(text=text, metadata=metadata))
+                    slide_elements.append(EmailAddress(text=text))
                 else:
-                    elements.append(Text(text=text, metadata=metadata))
+                    slide_elements.append((text, metadata))
 
-        if include_page_breaks and i < num_slides - 1:
-            elements.append(PageBreak(text=""))
+        text_types = iter(
+            get_text_types(
+                [element[0] for element in slide_elements if isinstance(element, tuple)],
+            ),
+        )
+        for element in slide_elements:
+            if isinstance(element, tuple):
+                text, text_metadata = element
+                yield next(text_types)(text=text, metadata=text_metadata)
+            else:
+                yield element
 
-    return elements
+        if include_page_breaks and i < num_slides - 1:
+            yield PageBreak(text="")
 
 
 def _order_shapes(shapes):
@@ -1,10 +1,24 @@
+import itertools
 import re
 import textwrap
-from typing import IO, Callable, List, Optional, Tuple
+from typing import (
+    IO,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
 
 from unstructured.cleaners.core import (
+    PARAGRAPH_GROUPER_MAX_LINE_COUNT,
     auto_paragraph_grouper,
     clean_bullets,
+    group_broken_paragraphs,
+    is_blank_line_grouped,
 )
 from unstructured.documents.coordinates import CoordinateSystem
 from unstructured.documents.elements import (
@@ -13,9 +27,6 @@ from unstructured.documents.elements import (
     ElementMetadata,
     EmailAddress,
     ListItem,
-    NarrativeText,
-    Text,
-    Title,
     process_metadata,
 )
 from unstructured.file_utils.encoding import read_txt_file
@@ -28,13 +39,16 @@ from unstructured.partition.common import (
     get_last_modified_date_from_file,
 )
 from unstructured.partition.text_type import (
+    get_text_types,
     is_bulleted_text,
     is_email_address,
-    is_possible_narrative_text,
-    is_possible_title,
     is_us_city_state_zip,
 )
 
+# NOTE(agent) - The number of paragraphs that are classified together when the elements of a
+# document are yielded one at a time
+STREAMING_BATCH_SIZE = 1000
+
 
 def split_by_paragraph(
     file_text: str,
@@ -43,22 +57,21 @@ def split_by_paragraph(
 ) -> List[str]:
     paragraphs = re.split(PARAGRAPH_PATTERN, file_text.strip())
 
-    split_paragraphs = []
-    for paragraph in paragraphs:
-        split_paragraphs.extend(
-            split_content_to_fit_max(
-                content=paragraph,
-                max_partition=max_partition,
-            ),
-        )
-
-    combined_paragraphs = combine_paragraphs_less_than_min(
-        split_paragraphs=split_paragraphs,
-        max_partition=max_partition,
-        min_partition=min_partition,
+    # NOTE(agent) - The paragraphs are split and combined in a single streaming pass, so each
+    # paragraph is only visited once regardless of the length of the text
+    split_paragraphs = (
+        chunk
+        for paragraph in paragraphs
+        for chunk in _iter_content_to_fit_max(content=paragraph, max_partition=max_partition)
     )
 
-    return combined_paragraphs
+    return list(
+        _iter_combined_paragraphs(
+            split_paragraphs,
+            max_partition=max_partition,
+            min_partition=min_partition,
+        ),
+    )
 
 
 def _split_in_half_at_breakpoint(
@@ -95,31 +108,40 @@ def split_content_to_fit_max(
 ) -> List[str]:
     """Splits a paragraph or section of content so that all of the elements fit into the
     max partition window."""
+    return list(_iter_content_to_fit_max(content=content, max_partition=max_partition))
+
+
+def _iter_content_to_fit_max(
+    content: str,
+    max_partition: Optional[int] = 1500,
+) -> Iterator[str]:
     sentences = sent_tokenize(content)
-    chunks = []
-    tmp_chunk = ""
+    # NOTE(agent) - The sentences of the current chunk are joined when the chunk is complete,
+    # rather than building a new string for the chunk every time a sentence is added
+    tmp_chunk: List[str] = []
+    tmp_chunk_len = 0
     for sentence in sentences:
         if max_partition is not None and len(sentence) > max_partition:
-            if tmp_chunk:
-                chunks.append(tmp_chunk)
-                tmp_chunk = ""
+            if tmp_chunk_len:
+                yield " ".join(tmp_chunk)
             segments = _split_content_size_n(sentence, n=max_partition)
-            chunks.extend(segments[:-1])
-            tmp_chunk = segments[-1]
+            yield from segments[:-1]
+            tmp_chunk, tmp_chunk_len = [segments[-1]], len(segments[-1])
+        elif max_partition is not None and tmp_chunk_len + len(sentence) + 1 > max_partition:
+            yield " ".join(tmp_chunk)
+            tmp_chunk, tmp_chunk_len = [sentence], len(sentence)
+        elif not tmp_chunk_len:
+            tmp_chunk, tmp_chunk_len = [sentence], len(sentence)
         else:
-            if max_partition is not None and len(tmp_chunk + " " + sentence) > max_partition:
-                chunks.append(tmp_chunk)
-                tmp_chunk = sentence
-            else:
-                if not tmp_chunk:
-                    tmp_chunk = sentence
-                else:
-                    tmp_chunk += " " + sentence
-                    tmp_chunk = tmp_chunk.strip()
-    if tmp_chunk:
-        chunks.append(tmp_chunk)
-
-    return chunks
+            tmp_chunk.append(sentence)
+            tmp_chunk_len += len(sentence) + 1
+            # NOTE(agent) - The chunk is stripped after each sentence is added, which only
+            # changes the chunk if it starts or ends with whitespace
+            if not sentence or sentence[-1].isspace() or tmp_chunk[0][:1].isspace():
+                stripped_chunk = " ".join(tmp_chunk).strip()
+                tmp_chunk, tmp_chunk_len = [stripped_chunk], len(stripped_chunk)
+    if tmp_chunk_len:
+        yield " ".join(tmp_chunk)
 
 
 def combine_paragraphs_less_than_min(
@@ -128,29 +150,44 @@ def combine_paragraphs_less_than_min(
     min_partition: Optional[int] = 0,
 ) -> List[str]:
     """Combine paragraphs less than `min_partition` while not exceeding `max_partition`."""
-    min_partition = min_partition or 0
-    max_possible_partition = len(" ".join(split_paragraphs))
-    max_partition = max_partition or max_possible_partition
+    return list(
+        _iter_combined_paragraphs(
+            split_paragraphs,
+            max_partition=max_partition,
+            min_partition=min_partition,
+        ),
+    )
 
-    combined_paras = []
-    combined_idxs = []
-    for i, para in enumerate(split_paragraphs):
-        if i in combined_idxs:
-            continue
+
+def _iter_combined_paragraphs(
+    split_paragraphs: Iterable[str],
+    max_partition: Optional[int] = 1500,
+    min_partition: Optional[int] = 0,
+) -> Iterator[str]:
+    min_partition = min_partition or 0
+    # NOTE(agent) - Without a max partition, a short paragraph absorbs all of the paragraphs
+    # after it, since the combined paragraph can never be longer than all of the paragraphs
+    # joined together
+    max_partition = max_partition or None
+
+    combined_para: List[str] = []
+    combined_len = 0
+    for para in split_paragraphs:
+        if combined_para:
+            if max_partition is None or combined_len + len(para) + 1 <= max_partition:
+                combined_para.append(para)
+                combined_len += len(para) + 1
+                continue
+            yield " ".join(combined_para)
+            combined_para = []
 
         if len(para) >= min_partition:
-            combined_paras.append(para)
+            yield para
         else:
-            combined_para = para
-            for j, next_para in enumerate(split_paragraphs[i + 1 :]):  # noqa
-                if len(combined_para) + len(next_para) + 1 <= max_partition:
-                    combined_idxs.append(i + j + 1)
-                    combined_para += " " + next_para
-                else:
-                    break
-            combined_paras.append(combined_para)
+            combined_para, combined_len = [para], len(para)
 
-    return combined_paras
+    if combined_para:
+        yield " ".join(combined_para)
 
 
 @process_metadata()
@@ -194,8 +231,67 @@ def partition_text(
     metadata_last_modified
         The day of the last modification
     """
+    return list(
+        _iter_text_elements(
+            filename=filename,
+            file=file,
+            text=text,
+            encoding=encoding,
+            paragraph_grouper=paragraph_grouper,
+            metadata_filename=metadata_filename,
+            include_metadata=include_metadata,
+            max_partition=max_partition,
+            min_partition=min_partition,
+            metadata_last_modified=metadata_last_modified,
+        ),
+    )
+
+
+@process_metadata()
+@add_metadata_with_filetype(FileType.TXT)
+def iter_partition_text(
+    filename: Optional[str] = None,
+    file: Optional[IO[bytes]] = None,
+    text: Optional[str] = None,
+    encoding: Optional[str] = None,
+    paragraph_grouper: Optional[Callable[[str], str]] = None,
+    metadata_filename: Optional[str] = None,
+    include_metadata: bool = True,
+    max_partition: Optional[int] = 1500,
+    min_partition: Optional[int] = 0,
+    metadata_last_modified: Optional[str] = None,
+    **kwargs,
+) -> Iterator[Element]:
+    """Partitions an .txt document and yields its paragraph elements one at a time.
+    Accepts the same parameters as partition_text."""
+    yield from _iter_text_elements(
+        filename=filename,
+        file=file,
+        text=text,
+        encoding=encoding,
+        paragraph_grouper=paragraph_grouper,
+        metadata_filename=metadata_filename,
+        include_metadata=include_metadata,
+        max_partition=max_partition,
+        min_partition=min_partition,
+        metadata_last_modified=metadata_last_modified,
+    )
+
+
+def _iter_text_elements(
+    filename: Optional[str] = None,
+    file: Optional[IO[bytes]] = None,
+    text: Optional[str] = None,
+    encoding: Optional[str] = None,
+    paragraph_grouper: Optional[Callable[[str], str]] = None,
+    metadata_filename: Optional[str] = None,
+    include_metadata: bool = True,
+    max_partition: Optional[int] = 1500,
+    min_partition: Optional[int] = 0,
+    metadata_last_modified: Optional[str] = None,
+) -> Iterator[Element]:
     if text is not None and text.strip() == "" and not file and not filename:
-        return []
+        return
 
     if (
         min_partition is not None
@@ -235,7 +331,6 @@ def partition_text(
         max_partition=max_partition,
     )
 
-    elements: List[Element] = []
     metadata = (
         ElementMetadata(
             filename=metadata_filename or filename,
@@ -244,15 +339,133 @@ def partition_text(
         if include_metadata
         else ElementMetadata()
     )
-    for ctext in file_content:
-        ctext = ctext.strip()
+    texts = (ctext.strip() for ctext in file_content if ctext.strip())
+    yield from _iter_elements_in_batches(texts, metadata)
 
-        if ctext:
-            element = element_from_text(ctext)
+
+def iter_elements_from_lines(
+    lines: Iterable[str],
+    metadata_filename: Optional[str] = None,
+    include_metadata: bool = True,
+    max_partition: Optional[int] = 1500,
+    min_partition: Optional[int] = 0,
+    metadata_last_modified: Optional[str] = None,
+) -> Iterator[Element]:
+    """Yields the same elements as partition_text with text="\n".join(lines), reading the lines
+    one at a time. Only the lines at the start of the document that decide how its paragraphs
+    are grouped are read ahead, so the document never has to be held in memory. Since the
+    length of the grouped text is only known at the end of the document, a min_partition that
+    is longer than the document raises a ValueError after the elements have been yielded."""
+    lines = iter(lines)
+    head = list(itertools.islice(lines, PARAGRAPH_GROUPER_MAX_LINE_COUNT + 1))
+    if len(head) <= PARAGRAPH_GROUPER_MAX_LINE_COUNT:
+        yield from _iter_text_elements(
+            text="\n".join(head),
+            metadata_filename=metadata_filename,
+            include_metadata=include_metadata,
+            max_partition=max_partition,
+            min_partition=min_partition,
+            metadata_last_modified=metadata_last_modified,
+        )
+        return
+
+    if (
+        min_partition is not None
+        and max_partition is not None
+        and (min_partition > max_partition or min_partition < 0 or max_partition < 0)
+    ):
+        raise ValueError("Invalid values for min_partition and/or max_partition.")
+
+    # NOTE(agent) - Both paragraph groupers work on one paragraph at a time, so grouping each
+    # paragraph as it is read gives the same text as auto_paragraph_grouper on the whole document
+    all_lines = itertools.chain(head, lines)
+    if is_blank_line_grouped("\n".join(head[:PARAGRAPH_GROUPER_MAX_LINE_COUNT])):
+        groups = (
+            group_broken_paragraphs(paragraph)
+            for paragraph in _iter_blank_line_paragraphs(all_lines)
+        )
+    else:
+        groups = (line + "\n" for line in all_lines if line.strip())
+
+    grouped_len = -2
+
+    def iter_paragraphs() -> Iterator[str]:
+        nonlocal grouped_len
+        for group in groups:
+            grouped_len += len(group) + 2
+            yield from re.split(PARAGRAPH_PATTERN, group.strip())
+
+    split_paragraphs = (
+        chunk
+        for paragraph in iter_paragraphs()
+        for chunk in _iter_content_to_fit_max(content=paragraph, max_partition=max_partition)
+    )
+    combined_paragraphs = _iter_combined_paragraphs(
+        split_paragraphs,
+        max_partition=max_partition,
+        min_partition=min_partition,
+    )
+    texts = (ctext.strip() for ctext in combined_paragraphs if ctext.strip())
+
+    metadata = (
+        ElementMetadata(filename=metadata_filename, last_modified=metadata_last_modified)
+        if include_metadata
+        else ElementMetadata()
+    )
+    yield from _iter_elements_in_batches(texts, metadata)
+
+    if min_partition is not None and 0 <= grouped_len < min_partition:
+        raise ValueError("`min_partition` cannot be larger than the length of file contents.")
+
+
+def _iter_elements_in_batches(texts: Iterator[str], metadata: ElementMetadata) -> Iterator[Element]:
+    """Creates the elements for a stream of paragraphs, classifying STREAMING_BATCH_SIZE
+    paragraphs at a time, so only the elements of one batch are held before they are yielded."""
+    while True:
+        batch = list(itertools.islice(texts, STREAMING_BATCH_SIZE))
+        if not batch:
+            break
+        for element in elements_from_texts(batch):
             element.metadata = metadata
-            elements.append(element)
+            yield element
+
+
+def _iter_blank_line_paragraphs(lines: Iterable[str]) -> Iterator[str]:
+    """Yields the paragraphs that group_broken_paragraphs splits a document into, given the lines
+    of the document. Paragraphs are split on whitespace with at least two line breaks, which
+    strips the whitespace around each paragraph except at the start and end of the document."""
+    paragraph: List[str] = []
+    first_blank_line = ""
+    blank_line_count = 0
+    for line in lines:
+        if not line.strip():
+            if not blank_line_count:
+                first_blank_line = line
+            blank_line_count += 1
+            continue
 
-    return elements
+        if not paragraph:
+            if blank_line_count == 0:
+                paragraph = [line]
+            elif blank_line_count == 1:
+                paragraph = [first_blank_line, line]
+            else:
+                paragraph = [line.lstrip()]
+        elif not blank_line_count:
+            paragraph.append(line)
+        else:
+            yield "\n".join(paragraph).rstrip()
+            paragraph = [line.lstrip()]
+        blank_line_count = 0
+
+    if not paragraph:
+        return
+    if blank_line_count == 0:
+        yield "\n".join(paragraph)
+    elif blank_line_count == 1:
+        yield "\n".join(paragraph + [first_blank_line])
+    else:
+        yield "\n".join(paragraph).rstrip()
 
 
 def element_from_text(
@@ -260,36 +473,62 @@ def element_from_text(
     coordinates: Optional[Tuple[Tuple[float, float], ...]] = None,
     coordinate_system: Optional[CoordinateSystem] = None,
 ) -> Element:
-    if is_bulleted_text(text):
-        return ListItem(
-            text=clean_bullets(text),
-            coordinates=coordinates,
-            coordinate_system=coordinate_system,
-        )
-    elif is_email_address(text):
-        return EmailAddress(text=text)
-    elif is_us_city_state_zip(text):
-        return Address(
-            text=text,
-            coordinates=coordinates,
-            coordinate_system=coordinate_system,
-        )
-    elif is_possible_narrative_text(text):
-        return NarrativeText(
-            text=text,
-            coordinates=coordinates,
-            coordinate_system=coordinate_system,
-        )
-    elif is_possible_title(text):
-        return Title(
-            text=text,
-            coordinates=coordinates,
-            coordinate_system=coordinate_system,
-        )
-    else:
-        return Text(
-            text=text,
-            coordinates=coordinates,
-            coordinate_system=coordinate_system,
+    return _create_element(classify_texts([text])[0], text, coordinates, coordinate_system)
+
+
+def elements_from_texts(
+    texts: Sequence[str],
+    coordinates: Optional[Sequence[Optional[Tuple[Tuple[float, float], ...]]]] = None,
+    coordinate_system: Optional[CoordinateSystem] = None,
+) -> List[Element]:
+    """Converts each text to an element, the same as element_from_text, classifying all of the
+    texts together with classify_texts."""
+    if coordinates is None:
+        coordinates = [None] * len(texts)
+    return [
+        _create_element(element_type, text, text_coordinates, coordinate_system)
+        for element_type, text, text_coordinates in zip(
+            classify_texts(texts),
+            texts,
+            coordinates,
         )
+    ]
+
+
+def classify_texts(texts: Sequence[str]) -> List[Type[Element]]:
+    """Returns the element type of each text, the same as element_from_text. The text type
+    checks for all of the texts are run together with get_text_types, which reads the config
+    once, tokenizes each text once and batches the POS tagging."""
+    element_types: List[Optional[Type[Element]]] = []
+    for text in texts:
+        if is_bulleted_text(text):
+            element_types.append(ListItem)
+        elif is_email_address(text):
+            element_types.append(EmailAddress)
+        elif is_us_city_state_zip(text):
+            element_types.append(Address)
+        else:
+            element_types.append(None)
+
+    unclassified = [i for i, element_type in enumerate(element_types) if element_type is None]
+    text_types = get_text_types([texts[i] for i in unclassified])
+    for i, text_type in zip(unclassified, text_types):
+        element_types[i] = text_type
+    return element_types  # type: ignore
 
+
+def _create_element(
+    element_type: Type[Element],
+    text: str,
+    coordinates: Optional[Tuple[Tuple[float, float], ...]] = None,
+    coordinate_system: Optional[CoordinateSystem] = None,
+) -> Element:
+    if element_type is ListItem:
+        text = clean_bullets(text)
+    elif element_type is EmailAddress:
+        return EmailAddress(text=text)
+    return element_type(  # type: ignore
+        text=text,
+        coordinates=coordinates,
+        coordinate_system=coordinate_system,
+    )
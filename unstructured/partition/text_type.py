@@ -2,7 +2,8 @@
 import os
 import re
 import sys
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Type
 
 if sys.version_info < (3, 8):
     from typing_extensions import Final  # pragma: nocover
@@ -10,7 +11,22 @@ else:
     from typing import Final
 
 from unstructured.cleaners.core import remove_punctuation
+from unstructured.documents.elements import NarrativeText, Text, Title
 from unstructured.logger import trace_logger
+from unstructured.nlp.english_verbs import (
+    ADJECTIVE_SUFFIXES,
+    AUXILIARY_VERBS,
+    BASE_FORM_CUES,
+    CONTRACTED_SUBJECTS,
+    DETERMINERS,
+    NON_VERB_SUFFIX_WORDS,
+    OBJECT_PRONOUNS,
+    PREPOSITIONS,
+    VERB_BASE_FORMS,
+    VERB_GERUND_FORMS,
+    VERB_PAST_FORMS,
+    VERB_THIRD_PERSON_FORMS,
+)
 from unstructured.nlp.english_words import ENGLISH_WORDS
 from unstructured.nlp.patterns import (
     EMAIL_ADDRESS_PATTERN_RE,
@@ -19,11 +35,18 @@ from unstructured.nlp.patterns import (
     US_CITY_STATE_ZIP_RE,
     US_PHONE_NUMBERS_RE,
 )
-from unstructured.nlp.tokenize import pos_tag, sent_tokenize, word_tokenize
+from unstructured.nlp.tokenize import (
+    pos_tag,
+    pos_tag_texts,
+    sent_tokenize,
+    word_tokenize,
+)
 
 POS_VERB_TAGS: Final[List[str]] = ["VB", "VBG", "VBD", "VBN", "VBP", "VBZ"]
 ENGLISH_WORD_SPLIT_RE = re.compile(r"[\s\-,.!?_\/]+")
 NON_LOWERCASE_ALPHA_RE = re.compile(r"[^a-z]")
+VERB_HEURISTIC_TOKEN_RE = re.compile(r"[A-Za-z]+(?:['\u2019][A-Za-z]+)?|[.!?;:]")
+SENTENCE_END_TOKENS: Final[str] = ".!?;:"
 
 
 def is_possible_narrative_text(
@@ -53,42 +76,18 @@ def is_possible_narrative_text(
         If True, conducts checks that are specific to the chosen language. Turn on for more
         accurate partitioning and off for faster processing.
     """
-    _language_checks = os.environ.get("UNSTRUCTURED_LANGUAGE_CHECKS")
-    if _language_checks is not None:
-        language_checks = _language_checks.lower() == "true"
-
-    if len(text) == 0:
-        trace_logger.detail("Not narrative. Text is empty.")  # type: ignore
-        return False
-
-    if text.isnumeric():
-        trace_logger.detail(f"Not narrative. Text is all numeric:\n\n{text}")  # type: ignore
-        return False
-
-    language = os.environ.get("UNSTRUCTURED_LANGUAGE", language)
-    if language == "en" and language_checks and not contains_english_word(text):
-        return False
-
-    # NOTE(robinson): it gets read in from the environment as a string so we need to
-    # cast it to a float
-    cap_threshold = float(
-        os.environ.get("UNSTRUCTURED_NARRATIVE_TEXT_CAP_THRESHOLD", cap_threshold),
-    )
-    if exceeds_cap_ratio(text, threshold=cap_threshold):
-        trace_logger.detail(f"Not narrative. Text exceeds cap ratio {cap_threshold}:\n\n{text}")  # type: ignore # noqa: E501
-        return False
-
-    non_alpha_threshold = float(
-        os.environ.get("UNSTRUCTURED_NARRATIVE_TEXT_NON_ALPHA_THRESHOLD", non_alpha_threshold),
+    config = TextTypeConfig.from_environment(
+        language=language,
+        language_checks=language_checks,
+        narrative_cap_threshold=cap_threshold,
+        narrative_non_alpha_threshold=non_alpha_threshold,
     )
-    if under_non_alpha_ratio(text, threshold=non_alpha_threshold):
-        return False
-
-    if (sentence_count(text, 3) < 2) and (not contains_verb(text)) and language == "en":
-        trace_logger.detail(f"Not narrative. Text does not contain a verb:\n\n{text}")  # type: ignore # noqa: E501
-        return False
-
-    return True
+    is_narrative = _check_narrative_text(_TokenizedText(text), config)
+    if is_narrative is None:
+        is_narrative = contains_verb(text, verb_detector=config.verb_detector)
+        if not is_narrative:
+            trace_logger.detail(f"Not narrative. Text does not contain a verb:\n\n{text}")  # type: ignore # noqa: E501
+    return is_narrative
 
 
 def is_possible_title(
@@ -117,10 +116,143 @@ def is_possible_title(
         If True, conducts checks that are specific to the chosen language. Turn on for more
         accurate partitioning and off for faster processing.
     """
-    _language_checks = os.environ.get("UNSTRUCTURED_LANGUAGE_CHECKS")
-    if _language_checks is not None:
-        language_checks = _language_checks.lower() == "true"
+    config = TextTypeConfig.from_environment(
+        language=language,
+        language_checks=language_checks,
+        title_sentence_min_length=sentence_min_length,
+        title_max_word_length=title_max_word_length,
+        title_non_alpha_threshold=non_alpha_threshold,
+    )
+    return _check_title(_TokenizedText(text), config)
+
+
+@dataclass
+class TextTypeConfig:
+    """The thresholds and language settings used to decide whether text is narrative text or a
+    title. The UNSTRUCTURED_* environment variables take precedence over the values passed in,
+    and are read once when the config is created."""
+
+    language: str = "en"
+    language_checks: bool = False
+    narrative_cap_threshold: float = 0.5
+    narrative_non_alpha_threshold: float = 0.5
+    title_sentence_min_length: int = 5
+    title_max_word_length: int = 12
+    title_non_alpha_threshold: float = 0.5
+    verb_detector: str = "nltk"
+
+    @classmethod
+    def from_environment(cls, **kwargs) -> "TextTypeConfig":
+        config = cls(**kwargs)
+        _language_checks = os.environ.get("UNSTRUCTURED_LANGUAGE_CHECKS")
+        if _language_checks is not None:
+            config.language_checks = _language_checks.lower() == "true"
+        config.language = os.environ.get("UNSTRUCTURED_LANGUAGE", config.language)
+        # NOTE(robinson): they get read in from the environment as strings so we need to
+        # cast them to numbers
+        config.narrative_cap_threshold = float(
+            os.environ.get(
+                "UNSTRUCTURED_NARRATIVE_TEXT_CAP_THRESHOLD",
+                config.narrative_cap_threshold,
+            ),
+        )
+        config.narrative_non_alpha_threshold = float(
+            os.environ.get(
+                "UNSTRUCTURED_NARRATIVE_TEXT_NON_ALPHA_THRESHOLD",
+                config.narrative_non_alpha_threshold,
+            ),
+        )
+        config.title_max_word_length = int(
+            os.environ.get("UNSTRUCTURED_TITLE_MAX_WORD_LENGTH", config.title_max_word_length),
+        )
+        config.title_non_alpha_threshold = float(
+            os.environ.get(
+                "UNSTRUCTURED_TITLE_NON_ALPHA_THRESHOLD",
+                config.title_non_alpha_threshold,
+            ),
+        )
+        config.verb_detector = os.environ.get("UNSTRUCTURED_VERB_DETECTOR", config.verb_detector)
+        return config
+
+
+class _TokenizedText:
+    """A text along with its sentences and word tokens, which are computed at most once and
+    shared by all of the text type checks."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self._sentences: Optional[List[str]] = None
+        self._sentence_lengths: Optional[List[int]] = None
+        self._words: Optional[List[str]] = None
+
+    @property
+    def sentences(self) -> List[str]:
+        if self._sentences is None:
+            self._sentences = sent_tokenize(self.text)
+        return self._sentences
+
+    @property
+    def sentence_lengths(self) -> List[int]:
+        """The number of words in each sentence, not counting punctuation."""
+        if self._sentence_lengths is None:
+            self._sentence_lengths = []
+            for sentence in self.sentences:
+                sentence = remove_punctuation(sentence)
+                words = [word for word in word_tokenize(sentence) if word != "."]
+                self._sentence_lengths.append(len(words))
+        return self._sentence_lengths
+
+    @property
+    def words(self) -> List[str]:
+        if self._words is None:
+            self._words = word_tokenize(self.text)
+        return self._words
+
+    def sentence_count(self, min_length: Optional[int] = None) -> int:
+        count = 0
+        for sentence, length in zip(self.sentences, self.sentence_lengths):
+            if min_length and length < min_length:
+                trace_logger.detail(  # type: ignore
+                    f"Skipping sentence because does not exceed {min_length} word tokens\n"
+                    f"{sentence}",
+                )
+                continue
+            count += 1
+        return count
+
+
+def _check_narrative_text(tokens: _TokenizedText, config: TextTypeConfig) -> Optional[bool]:
+    """Runs the narrative text checks. Returns None if the text is narrative text only if it
+    contains a verb, so that the verb checks for many texts can be run in one batch."""
+    text = tokens.text
+    if len(text) == 0:
+        trace_logger.detail("Not narrative. Text is empty.")  # type: ignore
+        return False
+
+    if text.isnumeric():
+        trace_logger.detail(f"Not narrative. Text is all numeric:\n\n{text}")  # type: ignore
+        return False
+
+    language = config.language
+    if language == "en" and config.language_checks and not contains_english_word(text):
+        return False
 
+    cap_threshold = config.narrative_cap_threshold
+    if _exceeds_cap_ratio(tokens, threshold=cap_threshold):
+        trace_logger.detail(f"Not narrative. Text exceeds cap ratio {cap_threshold}:\n\n{text}")  # type: ignore # noqa: E501
+        return False
+
+    if under_non_alpha_ratio(text, threshold=config.narrative_non_alpha_threshold):
+        return False
+
+    if (tokens.sentence_count(3) < 2) and language == "en":
+        return None
+
+    return True
+
+
+def _check_title(tokens: _TokenizedText, config: TextTypeConfig) -> bool:
+    text = tokens.text
     if len(text) == 0:
         trace_logger.detail("Not a title. Text is empty.")  # type: ignore
         return False
@@ -128,26 +260,19 @@ def is_possible_title(
     if text.isupper() and ENDS_IN_PUNCT_RE.search(text) is not None:
         return False
 
-    title_max_word_length = int(
-        os.environ.get("UNSTRUCTURED_TITLE_MAX_WORD_LENGTH", title_max_word_length),
-    )
     # NOTE(robinson) - splitting on spaces here instead of word tokenizing because it
     # is less expensive and actual tokenization doesn't add much value for the length check
-    if len(text.split(" ")) > title_max_word_length:
+    if len(text.split(" ")) > config.title_max_word_length:
         return False
 
-    non_alpha_threshold = float(
-        os.environ.get("UNSTRUCTURED_TITLE_NON_ALPHA_THRESHOLD", non_alpha_threshold),
-    )
-    if under_non_alpha_ratio(text, threshold=non_alpha_threshold):
+    if under_non_alpha_ratio(text, threshold=config.title_non_alpha_threshold):
         return False
 
     # NOTE(robinson) - Prevent flagging salutations like "To My Dearest Friends," as titles
     if text.endswith(","):
         return False
 
-    language = os.environ.get("UNSTRUCTURED_LANGUAGE", language)
-    if language == "en" and not contains_english_word(text) and language_checks:
+    if config.language == "en" and not contains_english_word(text) and config.language_checks:
         return False
 
     if text.isnumeric():
@@ -157,7 +282,8 @@ def is_possible_title(
     # NOTE(robinson) - The min length is to capture content such as "ITEM 1A. RISK FACTORS"
     # that sometimes get tokenized as separate sentences due to the period, but are still
     # valid titles
-    if sentence_count(text, min_length=sentence_min_length) > 1:
+    sentence_min_length = config.title_sentence_min_length
+    if tokens.sentence_count(min_length=sentence_min_length) > 1:
         trace_logger.detail(  # type: ignore
             f"Not a title. Text is longer than {sentence_min_length} sentences:\n\n{text}",
         )
@@ -166,6 +292,54 @@ def is_possible_title(
     return True
 
 
+def get_text_types(
+    texts: Sequence[str],
+    narrative_allowed: Optional[Sequence[bool]] = None,
+    config: Optional[TextTypeConfig] = None,
+) -> List[Type[Text]]:
+    """Classifies each text as NarrativeText, Title or Text, with the same result as checking
+    is_possible_narrative_text and then is_possible_title for each text. The config is read
+    from the environment once, each text is tokenized once for all of the checks, and the verb
+    checks for all of the texts are run with a single call to the POS tagger.
+
+    Parameters
+    ----------
+    texts
+        The texts to classify
+    narrative_allowed
+        Whether each text may be classified as narrative text. Defaults to True for all texts.
+    config
+        The thresholds and language settings. Defaults to TextTypeConfig.from_environment().
+    """
+    if config is None:
+        config = TextTypeConfig.from_environment()
+
+    tokenized_texts = [_TokenizedText(text) for text in texts]
+    is_narrative: List[Optional[bool]] = [
+        _check_narrative_text(tokens, config)
+        if narrative_allowed is None or narrative_allowed[i]
+        else False
+        for i, tokens in enumerate(tokenized_texts)
+    ]
+
+    verb_check_indices = [i for i, value in enumerate(is_narrative) if value is None]
+    if verb_check_indices:
+        verb_check_texts = [texts[i] for i in verb_check_indices]
+        has_verbs = contains_verbs(verb_check_texts, verb_detector=config.verb_detector)
+        for i, has_verb in zip(verb_check_indices, has_verbs):
+            is_narrative[i] = has_verb
+
+    text_types: List[Type[Text]] = []
+    for tokens, narrative in zip(tokenized_texts, is_narrative):
+        if narrative:
+            text_types.append(NarrativeText)
+        elif _check_title(tokens, config):
+            text_types.append(Title)
+        else:
+            text_types.append(Text)
+    return text_types
+
+
 def is_bulleted_text(text: str) -> bool:
     """Checks to see if the section of text is part of a bulleted list."""
     return UNICODE_BULLETS_RE.match(text.strip()) is not None
@@ -181,14 +355,140 @@ def contains_us_phone_number(text: str) -> bool:
     return US_PHONE_NUMBERS_RE.search(text.strip()) is not None
 
 
-def contains_verb(text: str) -> bool:
+def contains_verb(text: str, verb_detector: Optional[str] = None) -> bool:
     """Use a POS tagger to check if a segment contains verbs. If the section does not have verbs,
-    that indicates that it is not narrative text."""
-    if text.isupper():
-        text = text.lower()
+    that indicates that it is not narrative text.
+
+    Parameters
+    ----------
+    text
+        The input text to check
+    verb_detector
+        The name of the verb detector in VERB_DETECTORS to use. Defaults to the
+        UNSTRUCTURED_VERB_DETECTOR environment variable, or "nltk" if it is not set.
+    """
+    return contains_verbs([text], verb_detector=verb_detector)[0]
+
+
+def contains_verbs(texts: Sequence[str], verb_detector: Optional[str] = None) -> List[bool]:
+    """Checks whether each of the texts contains a verb, the same as contains_verb. The "nltk"
+    verb detector POS tags all of the texts with a single call to the POS tagger."""
+    if verb_detector is None:
+        verb_detector = os.environ.get("UNSTRUCTURED_VERB_DETECTOR", "nltk")
+    if verb_detector not in VERB_DETECTORS:
+        raise ValueError(
+            f"Unknown verb detector {verb_detector}. "
+            f"Valid verb detectors are {', '.join(VERB_DETECTORS)}.",
+        )
+
+    texts = [text.lower() if text.isupper() else text for text in texts]
+    return VERB_DETECTORS[verb_detector](texts)
+
+
+def _contains_verbs_nltk(texts: Sequence[str]) -> List[bool]:
+    if len(texts) == 1:
+        return [any(tag in POS_VERB_TAGS for _, tag in pos_tag(texts[0]))]
+    return [any(tag in POS_VERB_TAGS for _, tag in pos_tags) for pos_tags in pos_tag_texts(texts)]
+
+
+def _contains_verbs_heuristic(texts: Sequence[str]) -> List[bool]:
+    return [_contains_verb_heuristic(text) for text in texts]
 
-    pos_tags = pos_tag(text)
-    return any(tag in POS_VERB_TAGS for _, tag in pos_tags)
+
+def _contains_verb_heuristic(text: str) -> bool:
+    """Checks for a verb with a lexicon of common verbs and their inflections, a few rules for
+    the words around ambiguous forms (e.g. "to report" vs. "the report") and suffix rules for
+    -ed and -ing words whose stem is an English word. Skips the NLTK tokenizers and tagger, at
+    the cost of disagreeing with the POS tagger on some texts."""
+    tokens = VERB_HEURISTIC_TOKEN_RE.findall(text)
+    # NOTE(agent) - previous is None at the start of a sentence
+    previous: Optional[str] = None
+    for i, token in enumerate(tokens):
+        if token in SENTENCE_END_TOKENS:
+            previous = None
+            continue
+
+        word = token.lower().replace("\u2019", "'")
+        if "'" in word:
+            if word.endswith("n't"):
+                if word[:-3] in AUXILIARY_VERBS:
+                    return True
+                # NOTE(agent) - a negated modal, e.g. "can't" or "won't"
+                previous = "not"
+                continue
+            elif word.endswith(("'re", "'ve", "'m")) or (
+                word.endswith("'s") and word[:-2] in CONTRACTED_SUBJECTS
+            ):
+                return True
+            elif word.endswith(("'ll", "'d")) or word == "let's":
+                previous = "'ll"
+                continue
+            word = word.split("'")[0]
+
+        # NOTE(agent) - capitalized words after the start of a sentence are likely proper
+        # nouns, e.g. "Will" in "Will Smith"
+        if previous is not None and token[0].isupper() and word != "i":
+            previous = word
+            continue
+
+        next_word = tokens[i + 1].lower() if i + 1 < len(tokens) else None
+        if _is_verb(word, previous, next_word):
+            return True
+        previous = word
+    return False
+
+
+def _is_verb(word: str, previous: Optional[str], next_word: Optional[str]) -> bool:
+    if word in AUXILIARY_VERBS or word in VERB_PAST_FORMS or word in VERB_GERUND_FORMS:
+        return True
+
+    if word in VERB_BASE_FORMS:
+        if previous in BASE_FORM_CUES:
+            return True
+        # NOTE(agent) - an imperative at the start of a sentence, e.g. "Ask the teacher"
+        if previous is None and (next_word in DETERMINERS or next_word in OBJECT_PRONOUNS):
+            return True
+        return False
+
+    if word in VERB_THIRD_PERSON_FORMS:
+        # NOTE(agent) - otherwise a plural noun, e.g. "the reports" or "annual reports"
+        return (
+            previous is not None
+            and previous not in DETERMINERS
+            and previous not in PREPOSITIONS
+            and not previous.endswith(ADJECTIVE_SUFFIXES)
+        )
+
+    if word in NON_VERB_SUFFIX_WORDS:
+        return False
+
+    if len(word) > 4 and word.endswith("ed"):
+        return (
+            word[:-2] in ENGLISH_WORDS
+            or word[:-1] in ENGLISH_WORDS
+            or (word[-3] == word[-4] and word[:-3] in ENGLISH_WORDS)
+            or (word.endswith("ied") and word[:-3] + "y" in ENGLISH_WORDS)
+        )
+
+    if len(word) > 5 and word.endswith("ing"):
+        stem = word[:-3]
+        return (
+            stem in VERB_BASE_FORMS
+            or stem + "e" in VERB_BASE_FORMS
+            or (len(stem) > 3 and stem in ENGLISH_WORDS)
+            or (stem[-1] == stem[-2] and stem[:-1] in ENGLISH_WORDS)
+        )
+
+    return False
+
+
+# NOTE(agent) - Functions that check whether each of a list of texts contains a verb. Add an
+# entry to use another verb detector through the verb_detector kwarg or the
+# UNSTRUCTURED_VERB_DETECTOR environment variable.
+VERB_DETECTORS: Dict[str, Callable[[Sequence[str]], List[bool]]] = {
+    "nltk": _contains_verbs_nltk,
+    "heuristic": _contains_verbs_heuristic,
+}
 
 
 def contains_english_word(text: str) -> bool:
@@ -220,19 +520,7 @@ def sentence_count(text: str, min_length: Optional[int] = None) -> int:
     min_length
         The min number of words a section needs to be for it to be considered a sentence.
     """
-    sentences = sent_tokenize(text)
-    count = 0
-    for sentence in sentences:
-        sentence = remove_punctuation(sentence)
-        words = [word for word in word_tokenize(sentence) if word != "."]
-        if min_length and len(words) < min_length:
-            trace_logger.detail(  # type: ignore
-                f"Skipping sentence because does not exceed {min_length} word tokens\n"
-                f"{sentence}",
-            )
-            continue
-        count += 1
-    return count
+    return _TokenizedText(text).sentence_count(min_length=min_length)
 
 
 def under_non_alpha_ratio(text: str, threshold: float = 0.5):
@@ -269,12 +557,16 @@ def exceeds_cap_ratio(text: str, threshold: float = 0.5) -> bool:
         If the percentage of words beginning with a capital letter exceeds this threshold,
         the function returns True
     """
+    return _exceeds_cap_ratio(_TokenizedText(text), threshold=threshold)
+
+
+def _exceeds_cap_ratio(tokens: _TokenizedText, threshold: float = 0.5) -> bool:
     # NOTE(robinson) - Currently limiting this to only sections of text with one sentence.
     # The assumption is that sections with multiple sentences are not titles.
-    if sentence_count(text, 3) > 1:
+    if tokens.sentence_count(3) > 1:
         return False
 
-    if text.isupper():
+    if tokens.text.isupper():
         return True
 
     # NOTE(jay-ylee) - The word_tokenize function also recognizes and separates special characters
@@ -283,15 +575,15 @@ def exceeds_cap_ratio(text: str, threshold: float = 0.5) -> bool:
     # ex. world_tokenize("ITEM 1. Financial Statements (Unaudited)")
     #     = ['ITEM', '1', '.', 'Financial', 'Statements', '(', 'Unaudited', ')'],
     # however, "ITEM 1. Financial Statements (Unaudited)" is Title, not NarrativeText
-    tokens = [tk for tk in word_tokenize(text) if tk.isalpha()]
+    words = [word for word in tokens.words if word.isalpha()]
 
     # NOTE(jay-ylee) - If word_tokenize(text) is empty, return must be True to
     # avoid being misclassified as Narrative Text.
-    if len(tokens) == 0:
+    if len(words) == 0:
         return True
 
-    capitalized = sum([word.istitle() or word.isupper() for word in tokens])
-    ratio = capitalized / len(tokens)
+    capitalized = sum([word.istitle() or word.isupper() for word in words])
+    ratio = capitalized / len(words)
     return ratio > threshold
 
 
@@ -1,5 +1,5 @@
 from tempfile import SpooledTemporaryFile
-from typing import IO, BinaryIO, List, Optional, Union, cast
+from typing import IO, BinaryIO, Iterator, List, Optional, Union, cast
 
 import pandas as pd
 
@@ -47,23 +47,61 @@ def partition_xlsx(
     metadata_last_modified
         The day of the last modification
     """
+    return list(
+        _iter_xlsx_elements(
+            filename=filename,
+            file=file,
+            metadata_filename=metadata_filename,
+            include_metadata=include_metadata,
+            metadata_last_modified=metadata_last_modified,
+        ),
+    )
+
+
+@process_metadata()
+@add_metadata_with_filetype(FileType.XLSX)
+def iter_partition_xlsx(
+    filename: Optional[str] = None,
+    file: Optional[Union[IO[bytes], SpooledTemporaryFile]] = None,
+    metadata_filename: Optional[str] = None,
+    include_metadata: bool = True,
+    metadata_last_modified: Optional[str] = None,
+    **kwargs,
+) -> Iterator[Element]:
+    """Partitions a Microsoft Excel Document in .xlsx format and yields one Table element
+    per sheet, reading each sheet only when it is requested. Accepts the same parameters as
+    partition_xlsx."""
+    yield from _iter_xlsx_elements(
+        filename=filename,
+        file=file,
+        metadata_filename=metadata_filename,
+        include_metadata=include_metadata,
+        metadata_last_modified=metadata_last_modified,
+    )
+
+
+def _iter_xlsx_elements(
+    filename: Optional[str] = None,
+    file: Optional[Union[IO[bytes], SpooledTemporaryFile]] = None,
+    metadata_filename: Optional[str] = None,
+    include_metadata: bool = True,
+    metadata_last_modified: Optional[str] = None,
+) -> Iterator[Element]:
     exactly_one(filename=filename, file=file)
     last_modification_date = None
     if filename:
-        sheets = pd.read_excel(filename, sheet_name=None)
+        workbook = pd.ExcelFile(filename)
         last_modification_date = get_last_modified_date(filename)
 
     elif file:
         f = spooled_to_bytes_io_if_needed(
             cast(Union[BinaryIO, SpooledTemporaryFile], file),
         )
-        sheets = pd.read_excel(f, sheet_name=None)
+        workbook = pd.ExcelFile(f)
         last_modification_date = get_last_modified_date_from_file(file)
 
-    elements: List[Element] = []
-    page_number = 0
-    for sheet_name, table in sheets.items():
-        page_number += 1
+    for page_number, sheet_name in enumerate(workbook.sheet_names, start=1):
+        table = workbook.parse(sheet_name)
         html_text = table.to_html(index=False, header=False, na_rep="")
         text = html_string_parser(html_text).text_content()
 
@@ -78,7 +116,4 @@ def partition_xlsx(
         else:
             metadata = ElementMetadata()
 
-        table = Table(text=text, metadata=metadata)
-        elements.append(table)
-
-    return elements
+        yield Table(text=text, metadata=metadata)
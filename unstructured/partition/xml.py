@@ -1,17 +1,16 @@
 import xml.etree.ElementTree as ET
 from tempfile import SpooledTemporaryFile
-from typing import IO, BinaryIO, List, Optional, Union, cast
+from typing import IO, Iterable, Iterator, List, Optional, Tuple, Union, cast
 
 from unstructured.documents.elements import Element, process_metadata
-from unstructured.file_utils.encoding import read_txt_file
+from unstructured.file_utils.encoding import iter_txt_file
 from unstructured.file_utils.filetype import FileType, add_metadata_with_filetype
 from unstructured.partition.common import (
     exactly_one,
     get_last_modified_date,
     get_last_modified_date_from_file,
-    spooled_to_bytes_io_if_needed,
 )
-from unstructured.partition.text import partition_text
+from unstructured.partition.text import iter_elements_from_lines
 
 
 def is_leaf(elem):
@@ -27,25 +26,77 @@ def get_leaf_elements(
     file: Optional[Union[IO[bytes], SpooledTemporaryFile]] = None,
     xml_path: str = ".",
 ):
+    return "\n".join(iter_leaf_texts(filename=filename, file=file, xml_path=xml_path))
+
+
+def iter_leaf_texts(
+    filename: Optional[str] = None,
+    file: Optional[Union[IO[bytes], SpooledTemporaryFile]] = None,
+    xml_path: str = ".",
+) -> Iterator[str]:
+    """Yields the text of the leaf elements under the elements that match xml_path, in document
+    order. The document is parsed incrementally, and for the default xml_path the elements are
+    removed from the tree as soon as they close, so only the open elements are held in memory."""
     if filename:
-        _, raw_text = read_txt_file(filename=filename)
+        chunks = iter_txt_file(filename=filename)
     elif file:
-        f = spooled_to_bytes_io_if_needed(
-            cast(Union[BinaryIO, SpooledTemporaryFile], file),
-        )
-        _, raw_text = read_txt_file(file=f)
+        chunks = iter_txt_file(file=_rewind_if_spooled(file))
     else:
         raise ValueError("Either 'filename' or 'file' must be provided.")
 
-    root = ET.fromstring(raw_text)
-    leaf_elements = []
+    if xml_path == ".":
+        yield from _iter_streamed_leaf_texts(chunks)
+        return
+
+    # NOTE(agent) - An xml_path can select elements by their position or their children, so
+    # the whole tree is needed before any of the matching elements are known
+    parser = ET.XMLParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+    root = parser.close()
 
     for elem in root.findall(xml_path):
         for subelem in elem.iter():
             if is_leaf(subelem) and is_string(subelem.text):
-                leaf_elements.append(subelem.text)
-
-    return "\n".join(leaf_elements)  # type: ignore
+                yield cast(str, subelem.text)
+
+
+def _iter_streamed_leaf_texts(chunks: Iterable[str]) -> Iterator[str]:
+    parser: ET.XMLPullParser = ET.XMLPullParser(events=("start", "end"))
+    # NOTE(agent) - Each open element is stored with whether it has children, since the
+    # children of an element are removed from it once they are processed
+    open_elements: List[List] = []
+
+    def process_events() -> Iterator[str]:
+        events = cast(Iterator[Tuple[str, ET.Element]], parser.read_events())
+        for event, elem in events:
+            if event == "start":
+                if open_elements:
+                    open_elements[-1][1] = True
+                open_elements.append([elem, False])
+                continue
+
+            _, has_children = open_elements.pop()
+            if not has_children and is_string(elem.text):
+                yield cast(str, elem.text)
+            # NOTE(agent) - The siblings before the element were already removed, but the
+            # parser may have added siblings after it, so the element is removed by identity
+            if open_elements:
+                open_elements[-1][0].remove(elem)
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from process_events()
+    parser.close()
+    yield from process_events()
+
+
+def _rewind_if_spooled(
+    file: Union[IO[bytes], SpooledTemporaryFile],
+) -> Union[IO[bytes], SpooledTemporaryFile]:
+    if isinstance(file, SpooledTemporaryFile):
+        file.seek(0)
+    return file
 
 
 @process_metadata()
@@ -89,20 +140,84 @@ def partition_xml(
     metadata_last_modified
         The day of the last modification
     """
+    return list(
+        _iter_xml_elements(
+            filename=filename,
+            file=file,
+            xml_keep_tags=xml_keep_tags,
+            xml_path=xml_path,
+            metadata_filename=metadata_filename,
+            include_metadata=include_metadata,
+            encoding=encoding,
+            max_partition=max_partition,
+            min_partition=min_partition,
+            metadata_last_modified=metadata_last_modified,
+        ),
+    )
+
+
+@process_metadata()
+@add_metadata_with_filetype(FileType.XML)
+def iter_partition_xml(
+    filename: Optional[str] = None,
+    file: Optional[Union[IO[bytes], SpooledTemporaryFile]] = None,
+    xml_keep_tags: bool = False,
+    xml_path: str = ".",
+    metadata_filename: Optional[str] = None,
+    include_metadata: bool = True,
+    encoding: Optional[str] = None,
+    max_partition: Optional[int] = 1500,
+    min_partition: Optional[int] = 0,
+    metadata_last_modified: Optional[str] = None,
+    **kwargs,
+) -> Iterator[Element]:
+    """Partitions an XML document and yields its elements as the document is read, without
+    loading the whole document into memory. Accepts the same parameters as partition_xml."""
+    yield from _iter_xml_elements(
+        filename=filename,
+        file=file,
+        xml_keep_tags=xml_keep_tags,
+        xml_path=xml_path,
+        metadata_filename=metadata_filename,
+        include_metadata=include_metadata,
+        encoding=encoding,
+        max_partition=max_partition,
+        min_partition=min_partition,
+        metadata_last_modified=metadata_last_modified,
+    )
+
+
+def _iter_xml_elements(
+    filename: Optional[str] = None,
+    file: Optional[Union[IO[bytes], SpooledTemporaryFile]] = None,
+    xml_keep_tags: bool = False,
+    xml_path: str = ".",
+    metadata_filename: Optional[str] = None,
+    include_metadata: bool = True,
+    encoding: Optional[str] = None,
+    max_partition: Optional[int] = 1500,
+    min_partition: Optional[int] = 0,
+    metadata_last_modified: Optional[str] = None,
+) -> Iterator[Element]:
     exactly_one(filename=filename, file=file)
 
+    lines: Iterable[str]
     if xml_keep_tags:
         if filename:
-            _, raw_text = read_txt_file(filename=filename, encoding=encoding)
+            chunks = iter_txt_file(filename=filename, encoding=encoding)
         elif file:
-            f = spooled_to_bytes_io_if_needed(
-                cast(Union[BinaryIO, SpooledTemporaryFile], file),
-            )
-            _, raw_text = read_txt_file(file=f, encoding=encoding)
+            chunks = iter_txt_file(file=_rewind_if_spooled(file), encoding=encoding)
         else:
             raise ValueError("Either 'filename' or 'file' must be provided.")
+        lines = _iter_lines(chunks)
     else:
-        raw_text = get_leaf_elements(filename=filename, file=file, xml_path=xml_path)
+        # NOTE(agent) - The leaf texts are joined with line breaks, so each line of a leaf
+        # text is a line of the document
+        lines = (
+            line
+            for text in iter_leaf_texts(filename=filename, file=file, xml_path=xml_path)
+            for line in text.split("\n")
+        )
 
     last_modification_date = None
     if filename:
@@ -110,8 +225,8 @@ def partition_xml(
     elif file:
         last_modification_date = get_last_modified_date_from_file(file)
 
-    elements = partition_text(
-        text=raw_text,
+    yield from iter_elements_from_lines(
+        lines,
         metadata_filename=metadata_filename,
         include_metadata=include_metadata,
         max_partition=max_partition,
@@ -119,4 +234,16 @@ def partition_xml(
         metadata_last_modified=metadata_last_modified or last_modification_date,
     )
 
-    return elements
+
+def _iter_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """Splits a stream of text chunks into lines, without the line breaks."""
+    partial_line: List[str] = []
+    for chunk in chunks:
+        lines = chunk.split("\n")
+        partial_line.append(lines[0])
+        if len(lines) == 1:
+            continue
+        yield "".join(partial_line)
+        yield from lines[1:-1]
+        partial_line = [lines[-1]]
+    yield "".join(partial_line)
@@ -1,7 +1,8 @@
 import csv
 import io
 import json
-from typing import Any, Dict, List, Optional
+import math
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 
 from unstructured.documents.elements import (
     TYPE_TO_TEXT_ELEMENT_MAP,
@@ -16,6 +17,9 @@ from unstructured.utils import dependency_exists, requires_dependencies
 if dependency_exists("pandas"):
     import pandas as pd
 
+if dependency_exists("orjson"):
+    import orjson
+
 
 def _get_metadata_table_fieldnames():
     metadata_fields = list(ElementMetadata.__annotations__.keys())
@@ -39,6 +43,57 @@ TABLE_FIELDNAMES: List[str] = [
 ] + _get_metadata_table_fieldnames()
 
 
+def json_dumps(obj: Any, indent: Optional[int] = None, ensure_ascii: bool = False) -> str:
+    """Serializes an object to a JSON string like the json module. With indent=None the output
+    is compact, without any whitespace. orjson is used when it is installed and indent=None or
+    indent=2, which are the indents it can write. Other indents go through the json module, since
+    reindenting the orjson output is slower than json itself. The orjson output parses to the
+    same values, but floats with an exponent are written without the sign and zero padding
+    of the exponent, e.g. 1e-7 and 1e16 where the json module writes 1e-07 and 1e+16.
+    orjson can't escape non-ASCII characters, so with ensure_ascii=True its output is only used
+    when there is nothing to escape, and it writes NaN and infinity as null, so objects that
+    contain them go through the json module."""
+    if dependency_exists("orjson") and indent in (None, 2):
+        option = orjson.OPT_INDENT_2 if indent == 2 else 0
+        try:
+            output = orjson.dumps(obj, option=option).decode("utf-8")
+        except TypeError:
+            # NOTE(agent) - orjson is stricter than the json module, e.g. about dict keys
+            # that aren't strings, so anything it can't serialize falls back to json
+            pass
+        else:
+            # NOTE(agent) - With ensure_ascii the json module also escapes DEL, which orjson
+            # writes as it is
+            if (not ensure_ascii or (output.isascii() and "\x7f" not in output)) and (
+                "null" not in output or not _contains_non_finite_float(obj)
+            ):
+                return output
+
+    separators = (",", ":") if indent is None else None
+    return json.dumps(obj, indent=indent, ensure_ascii=ensure_ascii, separators=separators)
+
+
+def _contains_non_finite_float(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_contains_non_finite_float(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_contains_non_finite_float(value) for value in obj)
+    return False
+
+
+def json_loads(text: Union[str, bytes]) -> Any:
+    """Parses a JSON string, with orjson when it is installed. Documents that orjson rejects,
+    such as ones that contain NaN, are parsed with the json module instead."""
+    if dependency_exists("orjson"):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
 def convert_to_isd(elements: List[Element]) -> List[Dict[str, Any]]:
     """Represents the document elements as an Initial Structured Document (ISD)."""
     isd: List[Dict[str, str]] = []
@@ -56,32 +111,64 @@ def convert_to_dict(elements: List[Element]) -> List[Dict[str, Any]]:
 def elements_to_json(
     elements: List[Element],
     filename: Optional[str] = None,
-    indent: int = 4,
+    indent: Optional[int] = 4,
     encoding: str = "utf-8",
+    ensure_ascii: bool = True,
 ) -> Optional[str]:
     """
     Saves a list of elements to a JSON file if filename is specified.
-    Otherwise, return the list of elements as a string.
+    Otherwise, return the list of elements as a string. Pass indent=None
+    for compact output. As with json.dumps, non-ASCII characters are
+    escaped unless ensure_ascii=False. The output is serialized with
+    orjson when it is installed and indent is None or 2, and with the
+    json module otherwise, including for the default indent=4.
     """
     element_dict = convert_to_dict(elements)
     if filename is not None:
         with open(filename, "w", encoding=encoding) as f:
-            json.dump(element_dict, f, indent=indent)
+            f.write(json_dumps(element_dict, indent=indent, ensure_ascii=ensure_ascii))
+            return None
+    else:
+        return json_dumps(element_dict, indent=indent, ensure_ascii=ensure_ascii)
+
+
+def elements_to_jsonl(
+    elements: Iterable[Union[Element, Dict[str, Any]]],
+    filename: Optional[str] = None,
+    encoding: str = "utf-8",
+) -> Optional[str]:
+    """
+    Saves elements to a JSON Lines file, with one compact JSON element per line, if filename
+    is specified. Otherwise, return the elements as a JSON Lines string. The elements are
+    serialized one at a time, so elements can be streamed from an iter_partition function
+    without holding them all in memory. Elements that are already converted to dicts, e.g.
+    with convert_to_dict, are written as they are.
+    """
+    lines = (
+        json_dumps(element if isinstance(element, dict) else element.to_dict()) + "\n"
+        for element in elements
+    )
+    if filename is not None:
+        with open(filename, "w", encoding=encoding) as f:
+            f.writelines(lines)
             return None
     else:
-        return json.dumps(element_dict, indent=indent)
+        return "".join(lines)
 
 
-def isd_to_elements(isd: List[Dict[str, Any]]) -> List[Element]:
-    """Converts an Initial Structured Data (ISD) dictionary to a list of elements."""
+def isd_to_elements(isd: List[Dict[str, Any]], copy: bool = True) -> List[Element]:
+    """Converts an Initial Structured Data (ISD) dictionary to a list of elements. Pass
+    copy=False if the ISD was just parsed and isn't used elsewhere, so the metadata doesn't
+    need to be deep copied."""
     elements: List[Element] = []
 
     for item in isd:
         element_id: str = item.get("element_id", NoID())
-        metadata = ElementMetadata()
         _metadata_dict = item.get("metadata")
         if _metadata_dict is not None:
-            metadata = ElementMetadata.from_dict(_metadata_dict)
+            metadata = ElementMetadata.from_dict(_metadata_dict, copy=copy)
+        else:
+            metadata = ElementMetadata()
 
         if item.get("type") in TYPE_TO_TEXT_ELEMENT_MAP:
             _text_class = TYPE_TO_TEXT_ELEMENT_MAP[item["type"]]
@@ -104,9 +191,9 @@ def isd_to_elements(isd: List[Dict[str, Any]]) -> List[Element]:
     return elements
 
 
-def dict_to_elements(element_dict: List[Dict[str, Any]]) -> List[Element]:
+def dict_to_elements(element_dict: List[Dict[str, Any]], copy: bool = True) -> List[Element]:
     """Converts a dictionary representation of an element list into List[Element]."""
-    return isd_to_elements(element_dict)
+    return isd_to_elements(element_dict, copy=copy)
 
 
 def elements_from_json(
@@ -119,11 +206,41 @@ def elements_from_json(
 
     if filename:
         with open(filename, encoding=encoding) as f:
-            element_dict = json.load(f)
-        return dict_to_elements(element_dict)
+            element_dict = json_loads(f.read())
     else:
-        element_dict = json.loads(text)
-        return dict_to_elements(element_dict)
+        element_dict = json_loads(text)
+    return dict_to_elements(element_dict, copy=False)
+
+
+def iter_elements_from_jsonl(
+    filename: str = "",
+    text: str = "",
+    encoding: str = "utf-8",
+) -> Iterator[Element]:
+    """Loads elements from a JSON Lines file or string one line at a time. Blank lines are
+    skipped."""
+    exactly_one(filename=filename, text=text)
+
+    if filename:
+        with open(filename, encoding=encoding) as f:
+            yield from _iter_elements_from_lines(f)
+    else:
+        yield from _iter_elements_from_lines(text.splitlines())
+
+
+def elements_from_jsonl(
+    filename: str = "",
+    text: str = "",
+    encoding: str = "utf-8",
+) -> List[Element]:
+    """Loads a list of elements from a JSON Lines file or string."""
+    return list(iter_elements_from_jsonl(filename=filename, text=text, encoding=encoding))
+
+
+def _iter_elements_from_lines(lines: Iterable[str]) -> Iterator[Element]:
+    for line in lines:
+        if line.strip():
+            yield from isd_to_elements([json_loads(line)], copy=False)
 
 
 def flatten_dict(dictionary, parent_key="", separator="_"):